@@ -10,6 +10,7 @@ Routes:
     /        — main application page (requires auth)
     /login   — email/password sign-in and sign-up
     /health  — JSON health-check for Railway
+    /metrics — JSON per-stage chart pipeline latency histograms + cache stats
 """
 from __future__ import annotations
 
@@ -20,14 +21,23 @@ from fastapi.responses import JSONResponse
 from nicegui import app, ui
 
 from src.db.supabase_client import get_supabase
+from src.chart_cache import LIVE_CHARTS
 from src.nicegui_state import ensure_state
+from src.core.combined_circuits import COMBINED_CIRCUITS
+from src.core.derived_state import DERIVED_STATES
+from src.core.positions import POSITION_CACHE
+from src.mcp.llm_clients import LLM_CLIENTS
+from src.mcp.reading_cache import READING_CACHE
+from src.rendering.render_cache import RENDER_CACHE
+from src.rendering.wheel_layers import WHEEL_BACKDROPS
+from src.stage_timing import metrics_snapshot
 from src.ui.auth import (
     clear_session, get_user_id,
     session_is_expired, try_refresh_session, do_logout,
     login_page,                 # registers @ui.page("/login")
 )
 from src.ui.chart_display import (
-    render_chart_png, display_chart_in,
+    show_chart_png,
     rerender_circuits_chart_only, rerender_active_tab,
     refresh_events,
 )
@@ -48,6 +58,23 @@ async def _health():
     return JSONResponse({"status": "ok", "version": "PHASE_A_TEST_2026"})
 
 
+@app.get("/metrics")
+async def _metrics():
+    """Per-stage chart pipeline histograms and cache hit rates (since process start)."""
+    return JSONResponse({
+        "pid": os.getpid(),
+        "stages": metrics_snapshot(),
+        "position_cache": POSITION_CACHE.stats(),
+        "combined_circuits": COMBINED_CIRCUITS.stats(),
+        "live_charts": LIVE_CHARTS.stats(),
+        "derived_states": DERIVED_STATES.stats(),
+        "render_cache": RENDER_CACHE.stats(),
+        "wheel_backdrops": WHEEL_BACKDROPS.stats(),
+        "llm_clients": LLM_CLIENTS.stats(),
+        "reading_cache": READING_CACHE.stats(),
+    })
+
+
 # ---------------------------------------------------------------------------
 # Static file mounts — MUST come before @ui.page decorators to avoid route shadowing
 # ---------------------------------------------------------------------------
@@ -196,13 +223,9 @@ body.body--dark {
         #  Python closures resolve them at call time, not definition time.)
         # ===============================================================
 
-        def _render_chart_png(mode: str) -> Optional[bytes]:
-            """Render the chart wheel as PNG bytes for the given mode."""
-            return render_chart_png(mode, state)
-
-        def _display_chart_in(container, png_bytes, *, show_info=True):
-            """Display rendered chart bytes inside a NiceGUI container."""
-            return display_chart_in(container, png_bytes, state, form, show_info=show_info)
+        def _show_chart_png(container, mode: str):
+            """Render the chart wheel for *mode* off the event loop into *container*."""
+            return show_chart_png(container, mode, state, form)
 
         def _rerender_circuits_chart_only():
             """Re-render only the circuits chart container."""
@@ -353,8 +376,7 @@ body.body--dark {
             save_name_input=save_name_input,
             is_my_chart_cb=is_my_chart_cb,
             build_circuit_toggles=_build_circuit_toggles,
-            display_chart_in=_display_chart_in,
-            render_chart_png=_render_chart_png,
+            show_chart_png=_show_chart_png,
             render_rulers_graph=_render_rulers_graph,
             refresh_specs_tab=_refresh_specs_tab,
             refresh_events=_refresh_events,
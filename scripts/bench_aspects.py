@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+scripts/bench_aspects.py
+────────────────────────
+Benchmark for the batched NumPy aspect kernel in ``calc_v2``.
+
+Times the original per-pair / per-aspect Python loops against
+``build_aspect_edges`` + ``build_aspect_table`` sharing one
+``compute_aspect_pass``, for a natal chart and for a doubled object set
+(the size of a biwheel), and checks the edges agree.
+
+Usage
+-----
+  python scripts/bench_aspects.py [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+import swisseph as swe  # noqa: E402
+
+swe.set_ephe_path(str(_ROOT / "ephe"))
+
+from src.core.calc_v2 import (  # noqa: E402
+    _ASPECTS_ALL,
+    _ASPECTS_HARMONIC,
+    _applying_or_separating,
+    _within_orb,
+    aspect_pass_for,
+    build_aspect_edges,
+    build_aspect_table,
+    calculate_chart,
+    compute_aspect_pass,
+)
+
+
+def _loop_edges(names, lons, spds, specs):
+    """The pre-kernel implementation: nested loops over pairs and aspects."""
+    out = []
+    for i in range(len(names)):
+        for j in range(i + 1, len(names)):
+            A, B = lons[i], lons[j]
+            best_delta = best_name = best_target = None
+            for name, spec in specs.items():
+                hit, delta = _within_orb(A, B, spec["angle"], spec["orb"])
+                if hit and (best_delta is None or delta < best_delta):
+                    best_delta, best_name, best_target = delta, name, spec["angle"]
+            if best_name is not None:
+                appsep = _applying_or_separating(A, spds[i], B, spds[j], best_target)
+                out.append((names[i], names[j], best_name, round(best_delta, 3), appsep))
+    return out
+
+
+def _loop_all(names, lons, spds):
+    """Old cost of one chart: edges (main + harmonic) plus a second pass for the table."""
+    _loop_edges(names, lons, spds, _ASPECTS_ALL)
+    _loop_edges(names, lons, spds, _ASPECTS_HARMONIC)
+    _loop_edges(names, lons, spds, _ASPECTS_ALL)
+
+
+def _time(fn, repeat: int) -> float:
+    """Return the best-of-*repeat* wall time of ``fn()`` in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    _df, _asp, _plot, chart = calculate_chart(
+        year=1990, month=6, day=15, hour=14, minute=30,
+        tz_offset=-5, lat=40.7128, lon=-74.0060,
+        tz_name="America/New_York",
+    )
+    df = chart.to_dataframe()
+    names = [o.object_name.name for o in chart.objects]
+    lons = [o.longitude for o in chart.objects]
+    spds = [o.speed for o in chart.objects]
+
+    # Agreement check on the natal object set
+    kernel = build_aspect_edges(chart)
+    loop_main = _loop_edges(names, lons, spds, _ASPECTS_ALL)
+    got = sorted((a, b, m["aspect"], m["orb"], m["appsep"]) for a, b, m in kernel[0] + kernel[1])
+    if got != sorted(loop_main):
+        raise SystemExit("MISMATCH: kernel edges differ from the loop implementation")
+
+    def _kernel_chart():
+        ap_ = aspect_pass_for(chart)
+        build_aspect_table(df, aspect_pass=ap_)
+        build_aspect_edges(chart, aspect_pass=ap_)
+
+    print(f"{'objects':>8}  {'loops':>10}  {'kernel':>10}  speedup")
+    t_loop = _time(lambda: _loop_all(names, lons, spds), args.repeat)
+    t_kern = _time(_kernel_chart, args.repeat)
+    print(f"{len(names):>8}  {t_loop * 1e3:8.2f}ms  {t_kern * 1e3:8.2f}ms  {t_loop / t_kern:6.1f}x")
+
+    # Biwheel-sized object set (two charts merged)
+    names2 = names + [f"{n}_2" for n in names]
+    lons2 = lons + [(x + 97.3) % 360.0 for x in lons]
+    spds2 = spds + spds
+    t_loop = _time(lambda: _loop_all(names2, lons2, spds2), args.repeat)
+    t_kern = _time(lambda: compute_aspect_pass(names2, lons2, spds2), args.repeat)
+    print(f"{len(names2):>8}  {t_loop * 1e3:8.2f}ms  {t_kern * 1e3:8.2f}ms  {t_loop / t_kern:6.1f}x  (kernel only)")
+
+
+if __name__ == "__main__":
+    main()
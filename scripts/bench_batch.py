@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+scripts/bench_batch.py
+──────────────────────
+Throughput benchmark for ``chart_adapter.compute_charts``.
+
+Computes the same batch of synthetic birth charts with an increasing
+number of worker processes and reports charts/sec and speedup over the
+in-process (``workers=1``) baseline.
+
+Usage
+-----
+  python scripts/bench_batch.py [--charts 64] [--workers 1 2 4 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from src.chart_adapter import ChartInputs, compute_charts  # noqa: E402
+
+
+def _inputs(n: int, seed: int = 7) -> list[ChartInputs]:
+    """*n* reproducible charts spread over 1900–2030 and the globe."""
+    rng = random.Random(seed)
+    return [
+        ChartInputs(
+            name=f"bench-{i}",
+            year=rng.randint(1900, 2030), month=rng.randint(1, 12),
+            day=rng.randint(1, 28), hour_24=rng.randint(0, 23),
+            minute=rng.randint(0, 59),
+            lat=rng.uniform(-60, 60), lon=rng.uniform(-180, 180),
+            tz_name="UTC",
+        )
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--charts", type=int, default=64)
+    ap.add_argument("--workers", type=int, nargs="+",
+                    default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = ap.parse_args()
+
+    inputs = _inputs(args.charts)
+    print(f"charts: {len(inputs)}   cpus: {os.cpu_count()}")
+    print(f"{'workers':>8}  {'seconds':>8}  {'charts/s':>9}  speedup  errors")
+    base = None
+    for w in args.workers:
+        t0 = time.perf_counter()
+        errors = sum(1 for _, r in compute_charts(inputs, workers=w) if r.error)
+        elapsed = time.perf_counter() - t0
+        rate = len(inputs) / elapsed
+        base = base or rate
+        print(f"{w:>8}  {elapsed:8.2f}  {rate:9.1f}  {rate / base:6.2f}x  {errors:>6}")
+
+
+if __name__ == "__main__":
+    main()
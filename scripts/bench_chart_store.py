@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+scripts/bench_chart_store.py
+────────────────────────────
+Session-storage size and latency of the packed chart format
+(``AstrologicalChart.to_compact``, src/core/chart_store.py) versus the
+full ``to_json`` blob.
+
+For a batch of synthetic natal charts (and one transit chart each) this
+reports the mean serialised size and the mean save (encode + json.dumps)
+and load (json.loads + decode) times per format.  Load of the packed form
+includes re-deriving the DataFrames, edges and circuits.
+
+Usage
+-----
+  python scripts/bench_chart_store.py [--charts 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from src.chart_adapter import ChartInputs, compute_chart, compute_transit_chart  # noqa: E402
+from src.core.models_v2 import AstrologicalChart  # noqa: E402
+
+_FORMATS = {
+    "to_json": (lambda c: c.to_json(), AstrologicalChart.from_json),
+    "compact (json)": (lambda c: c.to_compact(compress=False), AstrologicalChart.from_compact),
+    "compact (zlib)": (lambda c: c.to_compact(compress=True), AstrologicalChart.from_compact),
+}
+
+
+def _charts(n: int, seed: int = 11) -> list:
+    """*n* natal charts plus a transit chart for each location."""
+    rng = random.Random(seed)
+    charts = []
+    for i in range(n):
+        lat, lon = rng.uniform(-60, 60), rng.uniform(-180, 180)
+        natal = compute_chart(ChartInputs(
+            name=f"bench-{i}",
+            year=rng.randint(1900, 2030), month=rng.randint(1, 12),
+            day=rng.randint(1, 28), hour_24=rng.randint(0, 23),
+            minute=rng.randint(0, 59), lat=lat, lon=lon, tz_name="UTC",
+        )).chart
+        transit = compute_transit_chart(
+            lat=lat, lon=lon, tz_name="UTC",
+            transit_utc=dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+            + dt.timedelta(days=rng.uniform(0, 365)),
+        ).chart
+        charts.extend(c for c in (natal, transit) if c is not None)
+    return charts
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--charts", type=int, default=20)
+    args = ap.parse_args()
+
+    charts = _charts(args.charts)
+    print(f"charts: {len(charts)} ({args.charts} natal + transit)")
+    print(f"{'format':>16}  {'bytes':>8}  {'save ms':>8}  {'load ms':>8}")
+    base = None
+    for label, (save, load) in _FORMATS.items():
+        sizes, saves, loads = [], [], []
+        for chart in charts:
+            t0 = time.perf_counter()
+            blob = json.dumps(save(chart))
+            t1 = time.perf_counter()
+            load(json.loads(blob))
+            t2 = time.perf_counter()
+            sizes.append(len(blob))
+            saves.append((t1 - t0) * 1e3)
+            loads.append((t2 - t1) * 1e3)
+        size = statistics.mean(sizes)
+        note = f"   ({base / size:.0f}x smaller)" if base else ""
+        base = base or size
+        print(f"{label:>16}  {size:8.0f}  {statistics.mean(saves):8.2f}  "
+              f"{statistics.mean(loads):8.2f}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+scripts/bench_chat_turn.py
+──────────────────────────
+End-to-end chat turn latency (``chat_pipeline.run_pipeline``) against a
+local fake OpenAI-compatible server with injected per-call latency
+(tests/fixtures/fake_openai.py).
+
+A turn makes three LLM calls: grammar parse, comprehension, synthesis.
+With speculative comprehension (the default) the first two overlap, and
+the question-independent chart facts are built while they're in flight;
+``ROSETTA_SPECULATIVE_COMPREHENSION=0`` runs grammar → comprehension in
+sequence as before.  Both run with the reading cache off; the "cached"
+row repeats the questions with it on (comprehension served from
+``READING_CACHE``, synthesis still called).  The last line reports how
+many of the calls reused a pooled connection (src/mcp/llm_clients.py).
+
+Usage
+-----
+  python scripts/bench_chat_turn.py [--latency 0.4] [--turns 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from src.chart_adapter import ChartInputs, compute_chart  # noqa: E402
+from src.mcp.chat_pipeline import run_pipeline  # noqa: E402
+from src.mcp.comprehension import SPECULATIVE_ENV  # noqa: E402
+from src.mcp.llm_clients import LLM_CLIENTS  # noqa: E402
+from src.mcp.reading_cache import ENABLED_ENV, READING_CACHE  # noqa: E402
+from tests.fixtures.fake_openai import FakeOpenAIServer  # noqa: E402
+
+_QUESTIONS = [
+    "How does my partner affect my career?",
+    "Tell me about my career",
+    "What does my Moon say about my mother?",
+]
+
+
+def _turns(chart, n: int) -> list:
+    times = []
+    for i in range(n):
+        t0 = time.perf_counter()
+        text, meta, _ = run_pipeline(
+            _QUESTIONS[i % len(_QUESTIONS)], chart, None, "placidus",
+            uid=f"bench-{i}", api_key="bench-key", model="fake/model",
+            mode="natal", voice="Plain", agent_notes="", pending_q="",
+        )
+        times.append((time.perf_counter() - t0) * 1e3)
+        if meta.get("backend") != "openrouter":
+            raise SystemExit(f"turn failed: {text[:200]}")
+    return times
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--latency", type=float, default=0.4, help="seconds per LLM call")
+    ap.add_argument("--turns", type=int, default=5)
+    args = ap.parse_args()
+
+    chart = compute_chart(ChartInputs(
+        name="bench", year=1990, month=7, day=1, hour_24=12,
+        lat=40.71, lon=-74.01, tz_name="America/New_York",
+    )).chart
+
+    print(f"LLM latency: {args.latency * 1e3:.0f} ms per call, {args.turns} turns")
+    print(f"{'pipeline':>12}  {'median ms':>9}  {'min ms':>8}")
+    with FakeOpenAIServer(latency=args.latency) as server, server.redirect():
+        os.environ[ENABLED_ENV] = "0"
+        _turns(chart, 1)  # warm imports, term registry, SDK
+        for label, flag in (("serial", "0"), ("speculative", "1")):
+            os.environ[SPECULATIVE_ENV] = flag
+            times = _turns(chart, args.turns)
+            print(f"{label:>12}  {statistics.median(times):9.0f}  {min(times):8.0f}")
+        os.environ[ENABLED_ENV] = "1"
+        READING_CACHE.clear()
+        _turns(chart, len(_QUESTIONS))  # fill
+        times = _turns(chart, args.turns)
+        print(f"{'cached':>12}  {statistics.median(times):9.0f}  {min(times):8.0f}")
+        pool = LLM_CLIENTS.stats()
+        print(f"LLM requests: {pool['requests']}, new connections: "
+              f"{pool['new_connections']} (reuse rate {pool['reuse_rate']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
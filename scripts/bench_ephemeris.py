@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+scripts/bench_ephemeris.py
+──────────────────────────
+Benchmark for the managed Swiss Ephemeris session.
+
+Runs back-to-back ``calculate_chart`` calls two ways: the old behaviour
+(``swe.close()`` after every chart, so the next one re-opens and re-reads
+the ``.se1`` files) and the session (files stay open, bounded by the
+handle guard).  Also times the raw position loop alone, where the reopen
+cost is not diluted by the rest of the pipeline.
+
+Usage
+-----
+  python scripts/bench_ephemeris.py [--charts 40]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+import swisseph as swe  # noqa: E402
+
+from src.core.calc_v2 import MAJOR_OBJECTS, calculate_chart  # noqa: E402
+from src.core.ephemeris import EPHEMERIS  # noqa: E402
+
+_BODIES = [v for v in MAJOR_OBJECTS.values() if isinstance(v, int) and v >= 0]
+
+
+def _chart(i: int) -> None:
+    calculate_chart(1900 + (i * 7) % 130, 1 + i % 12, 1 + i % 28, i % 24, 0,
+                    0, 40.7128, -74.006, input_is_ut=True)
+
+
+def _positions(i: int) -> None:
+    jd = swe.julday(1900 + (i * 7) % 130, 1 + i % 12, 1 + i % 28, 12.0)
+    EPHEMERIS.ensure()
+    for body in _BODIES:
+        swe.calc_ut(jd, body)
+        swe.calc_ut(jd, body, swe.FLG_EQUATORIAL)
+
+
+def _run(fn, n: int, close_each: bool) -> float:
+    """Mean seconds per call of ``fn(i)`` over *n* calls."""
+    EPHEMERIS.release()
+    t0 = time.perf_counter()
+    for i in range(n):
+        fn(i)
+        if close_each:
+            EPHEMERIS.release()
+    return (time.perf_counter() - t0) / n
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--charts", type=int, default=40)
+    args = ap.parse_args()
+
+    _chart(0)  # warm imports / caches
+    print(f"{'workload':<18}  {'close each':>11}  {'session':>9}  speedup")
+    for label, fn in (("calculate_chart", _chart), ("positions only", _positions)):
+        t_close = _run(fn, args.charts, close_each=True)
+        t_sess = _run(fn, args.charts, close_each=False)
+        print(f"{label:<18}  {t_close * 1e3:9.2f}ms  {t_sess * 1e3:7.2f}ms  {t_close / t_sess:6.2f}x")
+    print(f"session: {EPHEMERIS.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+scripts/bench_events.py
+───────────────────────
+Lookups/sec for ``event_lookup_v2.find_nearby_events``: the legacy
+linear scan over JSONL-style dicts (timestamps re-parsed per call) versus
+windowed binary search on an :class:`EventCatalogue` holding the same
+events.  Results of both paths are checked for equality.
+
+Usage
+-----
+  python scripts/bench_events.py [--start 1950] [--end 2050] [--queries 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from src.core.event_lookup_v2 import find_nearby_events  # noqa: E402
+from src.core.events_catalogue import EventCatalogue  # noqa: E402
+
+
+def _rate(fn, targets) -> float:
+    t0 = time.perf_counter()
+    for t in targets:
+        fn(t)
+    return len(targets) / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--start", type=int, default=1950)
+    ap.add_argument("--end", type=int, default=2050)
+    ap.add_argument("--queries", type=int, default=2000)
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    cat = EventCatalogue.generate(args.start, args.end)
+    records = [cat.record(i) for i in range(len(cat))]
+    print(f"{len(cat)} events {args.start}-{args.end} generated in {time.perf_counter() - t0:.1f}s")
+
+    rng = random.Random(0)
+    base = datetime(args.start, 1, 1, tzinfo=timezone.utc)
+    span = (datetime(args.end, 1, 1, tzinfo=timezone.utc) - base).total_seconds()
+    targets = [base + timedelta(seconds=rng.uniform(0, span)) for _ in range(args.queries)]
+
+    for t in targets[:200]:
+        a = [(r[0], r[1], r[3]) for r in find_nearby_events(t, records)]
+        b = [(r[0], r[1], r[3]) for r in find_nearby_events(t, cat)]
+        assert a == b, t
+
+    legacy_n = max(20, args.queries // 50)
+    legacy = _rate(lambda t: find_nearby_events(t, records), targets[:legacy_n])
+    indexed = _rate(lambda t: find_nearby_events(t, cat), targets)
+    print(f"legacy list scan : {legacy:10.1f} lookups/s")
+    print(f"catalogue search : {indexed:10.1f} lookups/s  ({indexed / legacy:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
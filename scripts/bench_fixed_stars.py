@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+scripts/bench_fixed_stars.py
+────────────────────────────
+Benchmark for fixed-star conjunction lookups on a full chart.
+
+Compares the original per-object ``iterrows()`` catalogue scan against the
+precompiled :class:`~src.rendering.profiles_v2.FixedStarIndex` (single
+lookups and the batched ``query_many`` used by ``calculate_chart``) for every
+object of a ``MAJOR_OBJECTS`` chart, and checks that all three agree.
+
+Usage
+-----
+  python scripts/bench_fixed_stars.py [--repeat 20] [--orb 1.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+import swisseph as swe  # noqa: E402
+
+swe.set_ephe_path(str(_ROOT / "ephe"))
+
+from src.core.calc_v2 import calculate_chart  # noqa: E402
+from src.rendering.profiles_v2 import (  # noqa: E402
+    STAR_CATALOG,
+    STAR_INDEX,
+    _sep_deg,
+)
+
+
+def _scan(lon_abs: float, catalog, orb: float) -> list[dict]:
+    """The pre-index implementation: walk the whole catalogue per object."""
+    hits = []
+    for _, r in catalog.iterrows():
+        sep = _sep_deg(lon_abs, float(r["Longitude"]))
+        if sep <= orb:
+            hits.append({"Name": str(r["Name"]), "sep": float(sep), "orb": float(orb)})
+    hits.sort(key=lambda x: x["sep"])
+    return hits
+
+
+def _time(fn, repeat: int) -> float:
+    """Return the best-of-*repeat* wall time of ``fn()`` in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--orb", type=float, default=1.0)
+    args = ap.parse_args()
+
+    _df, _asp, _plot, chart = calculate_chart(
+        year=1990, month=6, day=15, hour=14, minute=30,
+        tz_offset=-5, lat=40.7128, lon=-74.0060,
+        tz_name="America/New_York",
+    )
+    lons = [obj.longitude for obj in chart.objects]
+
+    scanned = [_scan(lon, STAR_CATALOG, args.orb) for lon in lons]
+    single = [STAR_INDEX.query(lon, orb=args.orb) for lon in lons]
+    batched = STAR_INDEX.query_many(lons, orb=args.orb)
+    if not (scanned == single == batched):
+        raise SystemExit("MISMATCH: index results differ from the catalogue scan")
+
+    t_scan = _time(lambda: [_scan(lon, STAR_CATALOG, args.orb) for lon in lons], max(1, args.repeat // 5))
+    t_single = _time(lambda: [STAR_INDEX.query(lon, orb=args.orb) for lon in lons], args.repeat)
+    t_batch = _time(lambda: STAR_INDEX.query_many(lons, orb=args.orb), args.repeat)
+
+    print(f"objects: {len(lons)}   stars: {len(STAR_INDEX)}   orb: {args.orb}°")
+    print(f"  iterrows scan   {t_scan * 1e3:10.3f} ms")
+    print(f"  index.query     {t_single * 1e3:10.3f} ms   ({t_scan / t_single:6.1f}x)")
+    print(f"  index.batch     {t_batch * 1e3:10.3f} ms   ({t_scan / t_batch:6.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+scripts/bench_render.py
+───────────────────────
+Single-wheel PNG render latency: full matplotlib figure versus the layered
+renderer (cached static backdrop + dynamic overlay, src/rendering/wheel_layers.py).
+
+For one natal chart this times ``render_chart_image`` in Standard and
+Circuits mode (light and dark) with and without layering.  The layered
+"cold" column includes rasterising the backdrop; "warm" is the steady state
+when a user flips toggles on the same chart.
+
+Usage
+-----
+  python scripts/bench_render.py [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from src.chart_adapter import (  # noqa: E402
+    ChartInputs, RenderToggles, compute_chart, render_chart_image,
+)
+from src.rendering.wheel_layers import WHEEL_BACKDROPS  # noqa: E402
+
+
+def _ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1e3)
+    return statistics.median(times)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    result = compute_chart(ChartInputs(
+        name="bench", year=1990, month=7, day=1, hour_24=12,
+        lat=40.71, lon=-74.01, tz_name="America/New_York",
+    ))
+    render_chart_image(result, RenderToggles(), layered=False)  # warm imports / fonts
+
+    print(f"{'mode':>16} {'dark':>5}  {'full ms':>8}  {'cold ms':>8}  {'warm ms':>8}")
+    for mode in ("Standard Chart", "Circuits"):
+        for dark in (False, True):
+            toggles = RenderToggles(chart_mode=mode, dark_mode=dark)
+            full = _ms(lambda: render_chart_image(result, toggles, layered=False), args.repeat)
+            WHEEL_BACKDROPS.clear()
+            cold = _ms(lambda: render_chart_image(result, toggles), 1)
+            warm = _ms(lambda: render_chart_image(result, toggles), args.repeat)
+            print(f"{mode:>16} {str(dark):>5}  {full:8.1f}  {cold:8.1f}  {warm:8.1f}"
+                  f"   ({full / warm:.1f}x)")
+    print(f"backdrops: {WHEEL_BACKDROPS.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+scripts/bench_shapes.py
+───────────────────────
+Scaling benchmark for the indexed shape matcher in ``patterns_v2``.
+
+Builds one synthetic connected component of 20 / 40 / 80 bodies (planted
+Envelope, Grand Cross, Mystic Rectangle, Kite and Yod skeletons with a
+little jitter, aspects found the way ``compute_combined_circuits`` finds
+them) and times ``_detect_shapes_for_members`` against the frozen
+``combinations()`` brute force from tests/fixtures/legacy_shapes.py.
+Where both run, their output is checked for equality.
+
+The brute force grows like C(n, 5); it is skipped above ``--legacy-max``
+bodies.
+
+Usage
+-----
+  python scripts/bench_shapes.py [--sizes 20 40 80] [--legacy-max 40] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from src.core.patterns_v2 import (  # noqa: E402
+    _cluster_conjunctions_for_detection,
+    _detect_shapes_for_members,
+    aspect_match,
+    connected_components_from_edges,
+)
+from tests.fixtures.legacy_shapes import detect_shapes_for_members_bruteforce  # noqa: E402
+
+_TEMPLATES = [
+    [0, 60, 120, 180, 240], [0, 90, 180, 270], [0, 60, 180, 240],
+    [0, 120, 240, 180], [0, 150, 210],
+]
+_ASPECTS = ("Conjunction", "Sextile", "Square", "Trine", "Opposition",
+            "Quincunx", "Sesquisquare", "Semisextile")
+
+
+def _planted(n: int, rng: random.Random, jitter: float):
+    pos = {}
+    while len(pos) < n:
+        base = rng.uniform(0, 360)
+        for off in rng.choice(_TEMPLATES)[: n - len(pos)]:
+            pos[f"B{len(pos)}"] = (base + off + rng.uniform(-jitter, jitter)) % 360
+    names = list(pos)
+    edges = []
+    for i, p1 in enumerate(names):
+        for p2 in names[i + 1:]:
+            for asp in _ASPECTS:
+                if aspect_match(pos, p1, p2, asp):
+                    edges.append(((p1, p2), asp))
+                    break
+    return pos, connected_components_from_edges(names, edges), edges
+
+
+def _component(n: int, seed: int, jitter: float = 1.5):
+    """Return (pos, members, edges) with all *n* planted bodies in one component."""
+    rng = random.Random(seed)
+    for _ in range(200):
+        pos, comps, edges = _planted(n, rng, jitter)
+        if len(comps) == 1:
+            break
+    return pos, max(comps, key=len), edges
+
+
+def _time(fn, repeat: int) -> float:
+    """Return the best-of-*repeat* wall time of ``fn()`` in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[20, 40, 80])
+    ap.add_argument("--legacy-max", type=int, default=40)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    print(f"{'bodies':>6}  {'members':>7}  {'reps':>5}  {'shapes':>6}  "
+          f"{'indexed':>10}  {'brute':>10}  speedup")
+    for n in args.sizes:
+        pos, members, edges = _component(n, args.seed)
+        reps = len(_cluster_conjunctions_for_detection(pos, list(members))[0])
+        shapes, _ = _detect_shapes_for_members(pos, members, 0, 0, edges)
+        t_new = _time(lambda: _detect_shapes_for_members(pos, members, 0, 0, edges), args.repeat)
+        line = (f"{n:>6}  {len(members):>7}  {reps:>5}  {len(shapes):>6}  "
+                f"{t_new * 1e3:8.2f}ms")
+        if n <= args.legacy_max:
+            want, _ = detect_shapes_for_members_bruteforce(pos, members, 0, 0, edges)
+            if want != shapes:
+                raise SystemExit(f"MISMATCH at {n} bodies: indexed output differs from brute force")
+            t_old = _time(lambda: detect_shapes_for_members_bruteforce(pos, members, 0, 0, edges), 1)
+            line += f"  {t_old * 1e3:8.1f}ms  {t_old / t_new:6.0f}x"
+        else:
+            line += f"  {'skipped':>10}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+scripts/build_events_catalogue.py
+─────────────────────────────────
+Build the events catalogue used by ``src.core.event_lookup_v2``.
+
+Computes ingresses, stations, lunations, eclipses and lunar perigees /
+apogees from Swiss Ephemeris over the requested span and writes
+``ephe_tables/<name>.npz``.  Reports event counts per type and file size.
+
+Usage
+-----
+  python scripts/build_events_catalogue.py [--start 1900] [--end 2100] [--name events]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from src.core.ephe_tables import EPHE_TABLE_DIR  # noqa: E402
+from src.core.events_catalogue import (  # noqa: E402
+    DEFAULT_CATALOGUE_NAME,
+    DEFAULT_SPAN,
+    EventCatalogue,
+)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--start", type=int, default=DEFAULT_SPAN[0], help="first year (Jan 1)")
+    ap.add_argument("--end", type=int, default=DEFAULT_SPAN[1], help="last year (Jan 1)")
+    ap.add_argument("--name", default=DEFAULT_CATALOGUE_NAME)
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    cat = EventCatalogue.generate(args.start, args.end)
+    path = os.path.join(EPHE_TABLE_DIR, args.name)
+    cat.save(path)
+    counts = Counter(cat.kinds[k] for k in cat.kind)
+    print(f"built {path}.npz in {time.perf_counter() - t0:.1f}s  "
+          f"({len(cat)} events, {os.path.getsize(path + '.npz') / 1e3:.0f} kB)")
+    for kind, n in sorted(counts.items()):
+        print(f"  {kind:<9} {n}")
+
+
+if __name__ == "__main__":
+    main()
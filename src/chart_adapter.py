@@ -14,6 +14,10 @@ Usage:
                          lat=40.7128, lon=-74.006, tz_name="America/New_York")
     result = compute_chart(inputs)
     png = render_chart_image(result)
+
+    # Many charts at once (process pool, streamed back):
+    for idx, res in compute_charts(inputs_list, workers=4):
+        ...
 """
 from __future__ import annotations
 
@@ -21,12 +25,13 @@ import io
 import os
 import datetime as dt
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from src.core.static_data import STANDARD_BASE_BODIES
+from src.stage_timing import StageRecorder, StageTiming, maybe_profile
 
-import swisseph as swe
+from src.core.ephemeris import EPHEMERIS
 
 
 # ---------------------------------------------------------------------------
@@ -37,7 +42,7 @@ _EPHE_PATH = os.environ.get(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "ephe")).replace("\\", "/"),
 )
 os.environ.setdefault("SE_EPHE_PATH", _EPHE_PATH)
-swe.set_ephe_path(_EPHE_PATH)
+EPHEMERIS.ensure(_EPHE_PATH)
 
 
 # ---------------------------------------------------------------------------
@@ -87,6 +92,7 @@ class ChartResult:
     utc_datetime: Optional[dt.datetime] = None
     local_datetime: Optional[dt.datetime] = None
     error: Optional[str] = None
+    stage_timings: Dict[str, StageTiming] = field(default_factory=dict)
 
 
 # ---------------------------------------------------------------------------
@@ -98,14 +104,29 @@ def compute_chart(inputs: ChartInputs) -> ChartResult:
 
     Calls:
       - calc_v2.calculate_chart()       (positions, aspects, house cusps)
-      - calc_v2.build_aspect_edges()    (major/minor aspect edges)
+      - calc_v2.build_aspect_edges()    (major/minor aspect edges — served
+                                         from chart.derived, already filled
+                                         by calculate_chart)
       - calc_v2.annotate_chart()        (mutual receptions)
       - calc_v2.chart_sect_from_chart() (sect)
       - calc_v2.build_conjunction_clusters()
       - calc_v2.build_dispositor_tables()
       - patterns_v2.prepare_pattern_inputs / detect_shapes / detect_minor_links_from_chart
-      - circuit_sim.simulate_and_attach()
+      - circuit_sim.simulate_and_attach()  (result seeds derived_state.DERIVED_STATES)
+
+    Each stage's wall/CPU time lands in ``result.stage_timings`` and the
+    process-wide histogram served at ``/metrics`` (see src/stage_timing.py).
+    With ``ROSETTA_PROFILE_DIR`` set, a cProfile dump is written per call.
     """
+    rec = StageRecorder("compute_chart")
+    with maybe_profile("compute_chart"):
+        result = _compute_chart_stages(inputs, rec)
+    result.stage_timings = rec.timings
+    return result
+
+
+def _compute_chart_stages(inputs: ChartInputs, rec: StageRecorder) -> ChartResult:
+    """Body of compute_chart(); each stage is timed by *rec*."""
     from src.core.calc_v2 import (
         calculate_chart,
         build_aspect_edges,
@@ -121,6 +142,7 @@ def compute_chart(inputs: ChartInputs) -> ChartResult:
         generate_combo_groups,
     )
     from src.core.circuit_sim import simulate_and_attach
+    from src.core.derived_state import DERIVED_STATES
 
     result = ChartResult()
 
@@ -154,54 +176,58 @@ def compute_chart(inputs: ChartInputs) -> ChartResult:
 
     # --- Core calculation ---
     try:
-        df_positions, aspect_df, plot_data, chart = calculate_chart(
-            year=utc_dt.year,
-            month=utc_dt.month,
-            day=utc_dt.day,
-            hour=utc_dt.hour,
-            minute=utc_dt.minute,
-            tz_offset=tz_offset,
-            lat=inputs.lat,
-            lon=inputs.lon,
-            input_is_ut=input_is_ut,
-            tz_name=tz_name_for_calc,
-            house_system=inputs.house_system,
-            include_aspects=True,
-            unknown_time=inputs.unknown_time,
-            display_name=inputs.name,
-            city=inputs.city,
-            display_datetime=local_dt,
-        )
-        chart.plot_data = plot_data
-        result.chart = chart
-        result.df_positions = df_positions
-        result.aspect_df = aspect_df
-        result.plot_data = plot_data
+        with rec.stage("calculate_chart"):
+            df_positions, aspect_df, plot_data, chart = calculate_chart(
+                year=utc_dt.year,
+                month=utc_dt.month,
+                day=utc_dt.day,
+                hour=utc_dt.hour,
+                minute=utc_dt.minute,
+                tz_offset=tz_offset,
+                lat=inputs.lat,
+                lon=inputs.lon,
+                input_is_ut=input_is_ut,
+                tz_name=tz_name_for_calc,
+                house_system=inputs.house_system,
+                include_aspects=True,
+                unknown_time=inputs.unknown_time,
+                display_name=inputs.name,
+                city=inputs.city,
+                display_datetime=local_dt,
+            )
+            chart.plot_data = plot_data
+            result.chart = chart
+            result.df_positions = df_positions
+            result.aspect_df = aspect_df
+            result.plot_data = plot_data
     except Exception as exc:
         result.error = f"Chart calculation failed: {exc}"
         return result
 
     # --- Post-processing: aspect edges ---
     try:
-        edges_major, edges_minor, edges_harmonic = build_aspect_edges(chart, compass_rose=False)
-        result.edges_major = [tuple(e) for e in edges_major]
-        result.edges_minor = [tuple(e) for e in edges_minor]
-        result.edges_harmonic = [tuple(e) for e in edges_harmonic]
+        with rec.stage("aspect_edges"):
+            edges_major, edges_minor, edges_harmonic = build_aspect_edges(chart, compass_rose=False)
+            result.edges_major = [tuple(e) for e in edges_major]
+            result.edges_minor = [tuple(e) for e in edges_minor]
+            result.edges_harmonic = [tuple(e) for e in edges_harmonic]
     except Exception as exc:
         result.error = f"Aspect edge computation failed: {exc}"
         return result
 
     # --- Annotate mutual receptions ---
     try:
-        annotate_chart(chart, edges_major)
+        with rec.stage("receptions"):
+            annotate_chart(chart, edges_major)
     except Exception:
         pass
 
     # --- Sect ---
     try:
-        chart.sect = chart_sect_from_chart(chart)
-        chart.sect_error = None
-        result.sect = chart.sect
+        with rec.stage("sect"):
+            chart.sect = chart_sect_from_chart(chart)
+            chart.sect_error = None
+            result.sect = chart.sect
     except Exception as exc:
         chart.sect = None
         chart.sect_error = str(exc)
@@ -209,29 +235,34 @@ def compute_chart(inputs: ChartInputs) -> ChartResult:
 
     # --- Conjunction clusters ---
     try:
-        clusters_rows, _, _ = build_conjunction_clusters(chart, edges_major)
-        chart.conj_clusters_rows = clusters_rows
-        result.conj_clusters_rows = clusters_rows
+        with rec.stage("conj_clusters"):
+            clusters_rows, _, _ = build_conjunction_clusters(chart, edges_major)
+            chart.conj_clusters_rows = clusters_rows
+            result.conj_clusters_rows = clusters_rows
     except Exception:
         pass
 
     # --- Dispositors ---
     try:
-        dispositor_summary_rows, dispositor_chains_rows = build_dispositor_tables(chart)
-        result.dispositor_summary_rows = dispositor_summary_rows
-        result.dispositor_chains_rows = dispositor_chains_rows
+        with rec.stage("dispositors"):
+            dispositor_summary_rows, dispositor_chains_rows = build_dispositor_tables(chart)
+            result.dispositor_summary_rows = dispositor_summary_rows
+            result.dispositor_chains_rows = dispositor_chains_rows
     except Exception:
         pass
 
     # --- Circuit / shape / singleton detection ---
     try:
-        pos_chart, patterns_sets, major_edges_all = prepare_pattern_inputs(
-            df_positions, edges_major
-        )
-        patterns = [sorted(list(s)) for s in patterns_sets]
-        shapes = detect_shapes(pos_chart, patterns_sets, major_edges_all)
-        filaments, singleton_map = detect_minor_links_from_chart(chart, edges_major)
-        combos = generate_combo_groups(filaments)
+        with rec.stage("pattern_inputs"):
+            pos_chart, patterns_sets, major_edges_all = prepare_pattern_inputs(
+                chart, edges_major
+            )
+            patterns = [sorted(list(s)) for s in patterns_sets]
+        with rec.stage("shapes"):
+            shapes = detect_shapes(pos_chart, patterns_sets, major_edges_all)
+        with rec.stage("minor_links"):
+            filaments, singleton_map = detect_minor_links_from_chart(chart, edges_major)
+            combos = generate_combo_groups(filaments)
 
         result.patterns = patterns
         result.shapes = shapes
@@ -265,13 +296,117 @@ def compute_chart(inputs: ChartInputs) -> ChartResult:
 
     # --- Circuit power simulation ---
     try:
-        simulate_and_attach(chart)
+        with rec.stage("circuit_sim"):
+            simulate_and_attach(chart)
+        # Charts rebuilt from storage pick these up instead of re-scoring
+        DERIVED_STATES.remember(chart)
     except Exception:
         pass
 
     return result
 
 
+# ---------------------------------------------------------------------------
+# Batch computation (process pool)
+# ---------------------------------------------------------------------------
+
+def _batch_worker_init(ephe_path: str) -> None:
+    """Per-worker setup: open a fresh ephemeris session and warm imports once."""
+    os.environ["SE_EPHE_PATH"] = ephe_path
+    # Never share file descriptors (and their offsets) with the parent
+    EPHEMERIS.release()
+    EPHEMERIS.ensure(ephe_path)
+    import src.core.calc_v2  # noqa: F401
+    import src.core.patterns_v2  # noqa: F401
+    import src.core.circuit_sim  # noqa: F401
+
+
+def _compute_chart_isolated(inputs: ChartInputs) -> ChartResult:
+    """compute_chart() that never raises — batch items fail independently."""
+    try:
+        return compute_chart(inputs)
+    except Exception as exc:
+        return ChartResult(error=f"Chart computation failed: {exc}")
+
+
+def compute_charts(
+    inputs: Iterable[ChartInputs],
+    workers: Optional[int] = None,
+    *,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+) -> Iterator[Tuple[int, ChartResult]]:
+    """Compute many charts, yielding ``(index, ChartResult)`` as they finish.
+
+    *index* is the position of the item in *inputs*.  With ``ordered=True``
+    results come back in input order; with ``ordered=False`` in completion
+    order.  A failing item yields a ChartResult with ``error`` set — the
+    batch carries on.
+
+    *workers* is the process count (default: ``os.cpu_count()``); ``workers
+    <= 1`` computes in-process without a pool.  Each worker initialises
+    swisseph once.  At most *max_pending* items (default ``4 * workers``)
+    are submitted or buffered at a time, so *inputs* may be a lazy
+    iterable of any length.
+    """
+    items = enumerate(inputs)
+
+    n_workers = workers if workers is not None else (os.cpu_count() or 1)
+    if n_workers <= 1:
+        for idx, ci in items:
+            yield idx, _compute_chart_isolated(ci)
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    limit = max(1, max_pending or 4 * n_workers)
+    # Forked workers must not inherit open ephemeris files from this process
+    EPHEMERIS.release()
+    pool = ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_batch_worker_init,
+        initargs=(_EPHE_PATH,),
+    )
+    pending: Dict[Any, int] = {}            # future -> input index
+    finished: Dict[int, ChartResult] = {}   # completed, not yet yielded
+    next_out = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) + len(finished) < limit:
+                try:
+                    idx, ci = next(items)
+                except StopIteration:
+                    exhausted = True
+                    break
+                try:
+                    pending[pool.submit(_compute_chart_isolated, ci)] = idx
+                except Exception as exc:  # e.g. BrokenProcessPool
+                    finished[idx] = ChartResult(error=f"Chart computation failed: {exc}")
+
+            if pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    idx = pending.pop(fut)
+                    try:
+                        finished[idx] = fut.result()
+                    except Exception as exc:
+                        finished[idx] = ChartResult(error=f"Chart computation failed: {exc}")
+
+            if ordered:
+                while next_out in finished:
+                    yield next_out, finished.pop(next_out)
+                    next_out += 1
+            else:
+                for idx in sorted(finished):
+                    yield idx, finished.pop(idx)
+
+            if exhausted and not pending and not finished:
+                return
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 # ---------------------------------------------------------------------------
 # Transit chart computation
 # ---------------------------------------------------------------------------
@@ -287,12 +422,15 @@ def compute_transit_chart(
     """Compute a transit chart (current or specified time) at a location.
 
     This is a lighter version of compute_chart() intended for Chart-2 usage.
+    Body positions come from the process-wide ``POSITION_CACHE``, so users
+    looking at the same moment share them; only houses are per location.
     """
     from src.core.calc_v2 import (
         calculate_chart,
         build_aspect_edges,
         annotate_chart,
     )
+    from src.core.positions import POSITION_CACHE
     from src.core.patterns_v2 import (
         prepare_pattern_inputs,
         detect_shapes,
@@ -325,6 +463,7 @@ def compute_transit_chart(
             display_name="Transits",
             city=city,
             display_datetime=transit_utc,
+            position_cache=POSITION_CACHE,
         )
         chart.plot_data = plot_data
         result.chart = chart
@@ -353,7 +492,7 @@ def compute_transit_chart(
     # Circuit detection for Chart 2
     try:
         pos_chart2, patterns_sets2, major_edges_all2 = prepare_pattern_inputs(
-            df_positions, edges_major
+            chart, edges_major
         )
         patterns2 = [sorted(list(s)) for s in patterns_sets2]
         shapes2 = detect_shapes(pos_chart2, patterns_sets2, major_edges_all2)
@@ -388,59 +527,16 @@ def compute_combined_circuits(chart_1, chart_2):
 
     Merges positions from both charts (Chart 2 names get '_2' suffix),
     computes all cross-chart aspects, and detects patterns/shapes.
+    Delegates to the process-wide incremental engine, which reuses chart-1
+    edges, components and unchanged per-component shapes between calls
+    (see ``src.core.combined_circuits``).
 
     Returns a dict with keys:
         pos_combined, patterns_combined, shapes_combined,
         singleton_map_combined, combined_edges
     """
-    from src.core.models_v2 import static_db
-    ASPECTS = {k: v for k, v in static_db.ASPECTS.items()
-               if v.get("aspect_type") in ("Major", "Minor")}
-    from src.core.patterns_v2 import connected_components_from_edges, detect_shapes
-
-    pos_1 = {obj.object_name.name: obj.longitude
-             for obj in chart_1.objects if obj.object_name}
-    pos_2 = {obj.object_name.name: obj.longitude
-             for obj in chart_2.objects if obj.object_name}
-
-    # Merge positions: Chart 1 names plain, Chart 2 names with "_2" suffix
-    pos_combined = dict(pos_1)
-    for name, deg in pos_2.items():
-        pos_combined[f"{name}_2"] = deg
-
-    # Compute ALL pairwise aspects in the merged chart
-    bodies = list(pos_combined.keys())
-    combined_edges = []
-    for i in range(len(bodies)):
-        for j in range(i + 1, len(bodies)):
-            p1, p2 = bodies[i], bodies[j]
-            ang = abs(pos_combined[p1] - pos_combined[p2]) % 360
-            if ang > 180:
-                ang = 360 - ang
-            for aname, adata in ASPECTS.items():
-                if abs(ang - adata["angle"]) <= adata["orb"]:
-                    combined_edges.append(((p1, p2), aname))
-                    break
-
-    # Detect connected components (combined circuits)
-    patterns = connected_components_from_edges(bodies, combined_edges)
-    shapes = detect_shapes(pos_combined, patterns, combined_edges)
-
-    # Singletons: bodies not in any aspect
-    connected_objs = set()
-    for (p1, p2), _ in combined_edges:
-        connected_objs.add(p1)
-        connected_objs.add(p2)
-    singleton_map = {n: {"deg": d} for n, d in pos_combined.items()
-                     if n not in connected_objs}
-
-    return {
-        "pos_combined": pos_combined,
-        "patterns_combined": patterns,
-        "shapes_combined": shapes,
-        "singleton_map_combined": singleton_map,
-        "combined_edges": combined_edges,
-    }
+    from src.core.combined_circuits import COMBINED_CIRCUITS
+    return COMBINED_CIRCUITS.compute(chart_1, chart_2)
 
 
 # ---------------------------------------------------------------------------
@@ -509,17 +605,25 @@ class RenderToggles:
 def render_chart_image(
     chart_result: ChartResult,
     toggles: Optional[RenderToggles] = None,
+    *,
+    layered: bool = True,
 ) -> bytes:
     """Render a chart wheel as a PNG byte buffer.
 
     Returns raw PNG bytes that can be displayed via ui.image() or st.image().
+    With *layered* (the default) the static wheel comes from the cached
+    backdrop in :mod:`src.rendering.wheel_layers` and only the toggle-
+    dependent layer is drawn; ``layered=False`` draws the full figure.
     """
+    import functools
+
     import matplotlib
     matplotlib.use("Agg")  # non-interactive backend
     import matplotlib.pyplot as plt
 
     from src.rendering.drawing_v2 import render_chart as _render_chart_standard
     from src.rendering.drawing_v2 import render_chart_with_shapes as _render_chart_circuits
+    from src.rendering.wheel_layers import render_layered_png
 
     if toggles is None:
         toggles = RenderToggles()
@@ -545,7 +649,8 @@ def render_chart_image(
             for planet in chart_result.singleton_map
         }
 
-        rr = _render_chart_circuits(
+        render = functools.partial(
+            _render_chart_circuits,
             pos=chart_result.positions,
             patterns=chart_result.patterns,
             pattern_labels=pattern_labels,
@@ -595,7 +700,8 @@ def render_chart_image(
             and (isinstance(e[2], dict) and e[2].get("aspect") in enabled_harmonics)
         ]
 
-        rr = _render_chart_standard(
+        render = functools.partial(
+            _render_chart_standard,
             chart=chart,
             edges_major=filtered_major,
             edges_minor=filtered_minor,
@@ -611,9 +717,15 @@ def render_chart_image(
             singleton_map=chart_result.singleton_map,
         )
 
+    rr = render(draw_backdrop=not layered)
     # Convert matplotlib figure → PNG bytes
     buf = io.BytesIO()
     try:
+        if layered:
+            return render_layered_png(
+                rr, dark_mode=toggles.dark_mode,
+                figsize=toggles.figsize, dpi=toggles.dpi,
+            )
         rr.fig.savefig(buf, format="png", bbox_inches="tight",
                        facecolor=rr.fig.get_facecolor(), edgecolor="none")
         buf.seek(0)
@@ -0,0 +1,173 @@
+# src/chart_cache.py
+"""
+Server-side cache of live AstrologicalChart objects per NiceGUI session.
+
+NiceGUI user storage only holds the serialised chart
+(``state["last_chart_json"]`` / ``state["last_chart_2_json"]``), and every
+renderer, tab and chat handler asks ``nicegui_state.get_chart_object`` for
+a live object — often several times per click.  :class:`LiveChartCache`
+keeps the rebuilt objects so only the first of those calls pays for
+deserialisation.
+
+Entries are keyed by ``(session, digest)``: *session* identifies the
+per-user state dict and *digest* is a content hash of the stored dict.
+Assigning a new chart to ``last_chart_json`` therefore changes the digest
+and can never return a stale object.  Each session keeps at most
+``per_session`` charts (most recently used first), so a swap or a
+back-and-forth toggle between two charts stays warm while superseded
+charts are dropped.  Across sessions the cache is LRU with an idle TTL
+and a cap on the estimated memory held.
+
+Objects are shared by every caller in a session, just as the stored dict
+is; callers that change a chart must store it again (``to_compact()``),
+which re-keys it.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from cachetools import TTLCache
+
+# Rough per-ChartObject overhead (dataclass, dicts, strings) in bytes.
+_OBJECT_BYTES = 4096
+
+
+def chart_digest(raw: Dict[str, Any]) -> str:
+    """Content hash of a stored chart dict (packed or legacy ``to_json``)."""
+    blob = json.dumps(raw, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def chart_fingerprint(chart) -> str:
+    """Content hash of a live chart's positions, for caches keyed by chart.
+
+    Covers every object's longitude and retrograde flag, the house cusps
+    and the unknown-time flag, so a chart rebuilt from storage fingerprints
+    the same as the one it was stored from.  Display fields (name, city)
+    are left out.
+    """
+    retro = {str(o.object_name): bool(o.retrograde)
+             for o in getattr(chart, "objects", None) or []}
+    blob = json.dumps(
+        {
+            "positions": {str(k): round(float(v), 6)
+                          for k, v in (getattr(chart, "positions", None) or {}).items()},
+            "retrograde": retro,
+            "cusps": [(c.house_system, c.cusp_number, round(float(c.absolute_degree), 6))
+                      for c in getattr(chart, "house_cusps", None) or []],
+            "unknown_time": bool(getattr(chart, "unknown_time", False)),
+        },
+        sort_keys=True, separators=(",", ":"),
+    )
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def estimate_chart_bytes(chart) -> int:
+    """Approximate resident size of a live chart, for the memory cap."""
+    total = _OBJECT_BYTES * len(getattr(chart, "objects", None) or [])
+    for attr in ("df_positions", "aspect_df"):
+        df = getattr(chart, attr, None)
+        if df is not None:
+            try:
+                total += int(df.memory_usage(deep=True).sum())
+            except Exception:
+                pass
+    return max(total, 1)
+
+
+class LiveChartCache:
+    """Thread-safe LRU/TTL cache of live charts with a memory cap.
+
+    ``max_bytes`` bounds the summed :func:`estimate_chart_bytes` of all
+    entries; ``ttl`` evicts charts idle for that many seconds (sessions that
+    went away).
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, ttl: float = 1800.0,
+                 per_session: int = 4, max_sessions: int = 10000,
+                 timer: Callable[[], float] = time.monotonic) -> None:
+        self._charts: TTLCache = TTLCache(maxsize=max_bytes, ttl=ttl, timer=timer,
+                                          getsizeof=lambda entry: entry[1])
+        self._sessions: TTLCache = TTLCache(maxsize=max_sessions, ttl=ttl, timer=timer)
+        self._per_session = per_session
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "misses": 0, "evicted_superseded": 0}
+
+    def get(self, session: Hashable, raw: Dict[str, Any],
+            build: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Return the live chart for *raw*, building it with *build* on a miss."""
+        digest = chart_digest(raw)
+        key = (session, digest)
+        with self._lock:
+            entry: Optional[Tuple[Any, int]] = self._charts.get(key)
+            if entry is not None:
+                self._counts["hits"] += 1
+                self._touch(session, digest)
+                return entry[0]
+            self._counts["misses"] += 1
+        chart = build(raw)
+        if chart is None:
+            return None
+        nbytes = estimate_chart_bytes(chart)
+        with self._lock:
+            if nbytes <= self._charts.maxsize:
+                self._charts[key] = (chart, nbytes)
+                self._touch(session, digest)
+        return chart
+
+    def put(self, session: Hashable, raw: Dict[str, Any], chart: Any) -> None:
+        """Cache an already-live *chart* for the stored dict *raw*."""
+        digest = chart_digest(raw)
+        nbytes = estimate_chart_bytes(chart)
+        with self._lock:
+            if nbytes <= self._charts.maxsize:
+                self._charts[(session, digest)] = (chart, nbytes)
+                self._touch(session, digest)
+
+    def _touch(self, session: Hashable, digest: str) -> None:
+        """Mark *digest* most recent for *session*; drop charts beyond the cap."""
+        recent = self._sessions.get(session)
+        if recent is None:
+            recent = OrderedDict()
+        recent[digest] = None
+        recent.move_to_end(digest, last=False)
+        while len(recent) > self._per_session:
+            old, _ = recent.popitem()
+            if self._charts.pop((session, old), None) is not None:
+                self._counts["evicted_superseded"] += 1
+        self._sessions[session] = recent
+
+    def invalidate(self, session: Hashable) -> None:
+        """Drop every chart cached for *session*."""
+        with self._lock:
+            recent = self._sessions.pop(session, None) or {}
+            for digest in recent:
+                self._charts.pop((session, digest), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._charts.clear()
+            self._sessions.clear()
+            for k in self._counts:
+                self._counts[k] = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Hit/miss counters, hit rate and current size."""
+        with self._lock:
+            out: Dict[str, object] = dict(self._counts)
+            total = out["hits"] + out["misses"]
+            out["hit_rate"] = round(out["hits"] / total, 4) if total else None
+            out["entries"] = len(self._charts)
+            out["sessions"] = len(self._sessions)
+            out["bytes"] = self._charts.currsize
+            out["max_bytes"] = self._charts.maxsize
+            return out
+
+
+# Shared by every NiceGUI session in the process.
+LIVE_CHARTS = LiveChartCache()
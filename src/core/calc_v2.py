@@ -9,7 +9,9 @@ delegated to *pyswisseph*; this module turns the raw positions into the
 rest of the application.
 """
 import re
+from dataclasses import dataclass
 from functools import lru_cache
+import numpy as np
 import swisseph as swe
 import networkx as nx
 import datetime
@@ -19,7 +21,7 @@ import matplotlib.patheffects as pe
 import matplotlib.gridspec as gridspec
 from zoneinfo import ZoneInfo
 from collections import defaultdict, deque
-from src.rendering.profiles_v2 import sabian_for, find_fixed_star_conjunctions, STAR_CATALOG, glyph_for
+from src.rendering.profiles_v2 import sabian_for, STAR_INDEX, glyph_for
 from .models_v2 import static_db
 
 SIGNS = static_db.SIGNS
@@ -27,8 +29,13 @@ PLANETARY_RULERS = static_db.PLANETARY_RULERS
 ABREVIATED_PLANET_NAMES = static_db.ABREVIATED_PLANET_NAMES
 DIGNITIES = static_db.DIGNITIES
 MAJOR_OBJECTS = static_db.MAJOR_OBJECTS
-from .models_v2 import ChartObject, HouseCusp, AstrologicalChart, ReceptionLink, static_db
+from .models_v2 import ChartObject, HouseCusp, AstrologicalChart, ChartDerivedCache, ReceptionLink, static_db
 from .dignity_calc import score_and_attach
+from .ephemeris import EPHEMERIS
+from .positions import BodyPositionCache, PositionProvider
+from .houses import (
+	HOUSE_SYSTEM_LABELS, LEGACY_SYSTEMS, assign_houses, canonical_house_system, compute_cusps,
+)
 
 OOB_LIMIT = 23.44  # degrees declination
 
@@ -58,24 +65,26 @@ def _sign_from_degree(deg: float) -> str:
 	"""Return sign name from absolute degree."""
 	return SIGNS[_sign_index(deg)]
 
-def _calc_vertex(jd, lat, lon):
+def _calc_vertex(jd, lat, lon, provider: PositionProvider | None = None):
 	"""Return the Vertex longitude (and zero lat/dist/speed) via Placidus houses."""
-	cusps, ascmc = swe.houses_ex(jd, lat, lon, b'P')
+	provider = provider or PositionProvider(jd)
+	cusps, ascmc = provider.houses(lat, lon, b'P')
 	if cusps is None or ascmc is None:      
 		raise ValueError("Swiss Ephemeris could not calculate Placidus houses")
 
 	return ascmc[3], 0.0, 0.0, 0.0  # lon, lat, dist, speed
 
-def _calc_pof(jd, lat, lon):
+def _calc_pof(jd, lat, lon, provider: PositionProvider | None = None):
 	"""Calculate the Part of Fortune longitude using the day/night formula."""
+	provider = provider or PositionProvider(jd)
 	# Asc & Desc from Swiss Ephemeris
-	cusps, ascmc = swe.houses_ex(jd, lat, lon, b'P')
+	cusps, ascmc = provider.houses(lat, lon, b'P')
 	asc = ascmc[0] % 360.0
 	desc = (asc + 180.0) % 360.0
 
 	# Sun & Moon ecliptic longitudes
-	sun = swe.calc_ut(jd, swe.SUN)[0][0] % 360.0
-	moon = swe.calc_ut(jd, swe.MOON)[0][0] % 360.0
+	sun = provider.ecliptic(swe.SUN)[0] % 360.0
+	moon = provider.ecliptic(swe.MOON)[0] % 360.0
 
 	def on_arc(start, end, x):
 		"""True if x lies on the circular arc going CCW from start to end."""
@@ -108,80 +117,29 @@ def get_utc_datetime(year, month, day, hour, minute, input_is_ut, tz_offset, tz_
 	local_dt = datetime.datetime(year, month, day, hour, minute, tzinfo=tz)
 	return local_dt.astimezone(datetime.timezone.utc)
 
-def calculate_house_cusps(jd, lat, lon, asc_val, house_system=None):
+def calculate_house_cusps(jd, lat, lon, asc_val, house_system=None, provider: PositionProvider | None = None):
 	"""
 	Return house cusp rows.
 
-	- If house_system in {"placidus","equal","whole"}: returns 12 rows for that system.
+	- If house_system names one system (placidus, equal, whole, koch, campanus,
+	  regiomontanus, porphyry or an alias): returns 12 rows for that system.
 	- If house_system is None or "all": returns 36 rows (Placidus, Equal, Whole), each labeled.
 	"""
-	# Normalise display-name aliases to canonical single-word keys
-	_HS_ALIASES = {
-		"whole sign": "whole",
-		"wholesign": "whole",
-		"equal house": "equal",
-	}
-	def _one_system_rows(sys: str) -> list[dict]:
-		"""Compute the 12 house-cusp rows for a single house system."""
-		rows = []
-		sys_lc = sys.lower()
-
-		if sys_lc == "placidus":
-			cusps, _ = swe.houses_ex(jd, lat, lon, b'P')
-			if cusps is None:
-				raise ValueError("Swiss Ephemeris could not calculate Placidus houses")
-			for i, deg in enumerate(cusps[:12], start=1):
-				rows.append({
-					"Object": f"{i}H Cusp",
-					"Computed Absolute Degree": round(deg % 360.0, 6),
-					"House System": "placidus",
-				})
-
-		elif sys_lc == "equal":
-			asc_for_equal = asc_val
-			if asc_for_equal is None:
-				_, ascmc = swe.houses_ex(jd, lat, lon, b'E')
-				if ascmc is None:
-					raise ValueError("Swiss Ephemeris could not calculate Equal houses")
-				asc_for_equal = ascmc[0]
-			for i in range(12):
-				deg = (asc_for_equal + i * 30.0) % 360.0
-				rows.append({
-					"Object": f"{i+1}H Cusp",
-					"Computed Absolute Degree": round(deg, 6),
-					"House System": "equal",
-				})
-
-		elif sys_lc == "whole":
-			asc_for_whole = asc_val
-			if asc_for_whole is None:
-				_, ascmc = swe.houses_ex(jd, lat, lon, b'P')
-				if ascmc is None:
-					raise ValueError("Swiss Ephemeris could not calculate Placidus houses (for Whole sign ASC)")
-				asc_for_whole = ascmc[0]
-			asc_sign = int(asc_for_whole // 30) * 30.0
-			for i in range(12):
-				deg = (asc_sign + i * 30.0) % 360.0
-				rows.append({
-					"Object": f"{i+1}H Cusp",
-					"Computed Absolute Degree": round(deg, 6),
-					"House System": "whole",
-				})
-
-		else:
-			raise ValueError(f"Unknown house system: {sys}")
-		return rows
-
-	# All systems
+	provider = provider or PositionProvider(jd)
 	if house_system is None or str(house_system).lower() in ("all", "*"):
-		out = []
-		for sys in ("placidus", "equal", "whole"):
-			out.extend(_one_system_rows(sys))
-		return out
+		systems = LEGACY_SYSTEMS
+	else:
+		systems = (canonical_house_system(str(house_system)),)
 
-	# Single system
-	hs_norm = str(house_system).lower().strip()
-	return _one_system_rows(_HS_ALIASES.get(hs_norm, hs_norm))
+	rows = []
+	for sys, cusps in compute_cusps(provider, lat, lon, systems, asc=asc_val).items():
+		for i, deg in enumerate(cusps.tolist(), start=1):
+			rows.append({
+				"Object": f"{i}H Cusp",
+				"Computed Absolute Degree": round(deg, 6),
+				"House System": sys,
+			})
+	return rows
 
 def calculate_chart(
 	year, month, day, hour, minute,
@@ -195,6 +153,7 @@ def calculate_chart(
 	display_name: str = "",
 	city: str = "",
 	display_datetime: "datetime.datetime | None" = None,
+	position_cache: "BodyPositionCache | None" = None,
 ):
 	"""
 	Build the chart using Swiss Ephemeris.
@@ -203,6 +162,9 @@ def calculate_chart(
 	- Computes house cusps for ALL systems (Placidus, Equal, Whole) and appends all cusp rows.
 	- Assigns per-object House / House Sign / House Rulers for EACH system in separate columns.
 	- Returns a single DataFrame.
+
+	*position_cache* (e.g. ``positions.POSITION_CACHE``) shares body
+	positions and house tables with other charts for the same moment.
 	"""
 
 	# -------- Time -> UTC --------
@@ -243,9 +205,14 @@ def calculate_chart(
 		swe.GREG_CAL,
 	)
 
+	# Ephemeris files stay open across charts; only (re)set on path change
+	EPHEMERIS.ensure()
+	# One ecliptic fetch per body / one house table per system for this chart
+	provider = PositionProvider(jd, cache=position_cache)
+
 	# -------- Precompute ASC & MC (Placidus) --------
 	asc_val = mc_val = None
-	cusps, ascmc = swe.houses_ex(jd, lat, lon, b'P')
+	cusps, ascmc = provider.houses(lat, lon, b'P')
 	if ascmc and not unknown_time:
 		asc_val = ascmc[0]
 		mc_val = ascmc[1]
@@ -292,6 +259,7 @@ def calculate_chart(
 
 	rows = []
 	pos_for_dispositors = {}  # object -> longitude (exclude cusps)
+	star_lons = []  # unrounded longitudes, one per row, for the fixed-star batch
 
 	# --- Main loop (object rows) ---
 	for name, ident in loop_objects:
@@ -303,31 +271,27 @@ def calculate_chart(
 			lon_, lat_, dist, speed = mc_val, 0.0, 0.0, 0.0
 			decl = 0.0
 		elif ident == "VERTEX":
-			lon_, lat_, dist, speed = _calc_vertex(jd, lat, lon)
+			lon_, lat_, dist, speed = _calc_vertex(jd, lat, lon, provider)
 			decl = 0.0
 		elif ident == "POF":
-			lon_, lat_, dist, speed = _calc_pof(jd, lat, lon)
+			lon_, lat_, dist, speed = _calc_pof(jd, lat, lon, provider)
 			decl = 0.0
 		elif ident == -1:  # South Node
-			north_pos, _ = swe.calc_ut(jd, swe.TRUE_NODE)
-			lon_ = (north_pos[0] + 180) % 360
+			lon_ = (provider.ecliptic(swe.TRUE_NODE)[0] + 180) % 360
 			lat_, dist, speed = 0.0, 0.0, 0.0
 			decl = 0.0
 		elif name in ("DC", "IC"):
 			obj = extra_objects[name]
 			lon_, lat_, dist, speed, decl = obj["lon"], obj["lat"], obj["dist"], obj["speed"], obj["decl"]
 		else:
-			pos, _ = swe.calc_ut(jd, ident)
-			lon_, lat_, dist, speed = pos[:4]
-			eq, _ = swe.calc_ut(jd, ident, swe.FLG_EQUATORIAL)
-			decl = eq[1]
+			lon_, lat_, dist, speed = provider.ecliptic(ident)[:4]
+			decl = provider.declination(ident)
 
 		# --- common calculations ---
 		glyph = glyph_for(name)
 		sign, dms, sabian_index = deg_to_sign(lon_)
 		sabian_symbol = sabian_for(sign, lon_)
-		star_hits = find_fixed_star_conjunctions(lon_, STAR_CATALOG, orb=1.0)
-		star_names = ", ".join(h["Name"] for h in star_hits)
+		star_lons.append(lon_)
 		degree_in_sign = int(lon_ % 30)
 		minute_in_sign = int(((lon_ % 30) - degree_in_sign) * 60)
 		second_in_sign = int(((((lon_ % 30) - degree_in_sign) * 60) - minute_in_sign) * 60)
@@ -355,7 +319,7 @@ def calculate_chart(
 			"DMS": dms,
 			"Sabian Index": sabian_index,
 			"Sabian Symbol": sabian_symbol,
-			"Fixed Star Conj": star_names,
+			"Fixed Star Conj": "",          # filled in one batch below
 			"Retrograde Bool": retro_bool,
 			"OOB Status": oob,
 			"Latitude": round(lat_, 6),
@@ -372,62 +336,28 @@ def calculate_chart(
 			"Whole Sign House Rulers": None,
 		})
 
-	# --- House cusps (ALL systems appended to DF) ---
-	systems = ("placidus", "equal", "whole")
-	# Note the exact labels to match your reference sheet
-	system_label = {"placidus": "Placidus", "equal": "Equal", "whole": "Whole Sign"}
-
-	cusps_by_system: dict[str, list[float]] = {}
-	all_cusp_rows: list[dict] = []
-
-	for sys in systems:
-		rows_sys = calculate_house_cusps(jd, lat, lon, asc_val, sys)
-		lbl = system_label[sys]
-
-		# Normalize cusp rows:
-		# - "Object" -> "<System Label> #H cusp"
-		# - Move "Computed Absolute Degree" -> "Longitude"
-		# - DROP "House System" and "Computed Absolute Degree"
-		normalized = []
-		for r in rows_sys:
-			obj = str(r.get("Object", ""))  # e.g., "1H Cusp"
-			m = re.match(r"^\s*(\d+)\s*H", obj, flags=re.IGNORECASE)
-			if m:
-				num = m.group(1)
-				new_obj = f"{lbl} {num}H cusp"
-			else:
-				new_obj = f"{lbl} {obj}".replace("Cusp", "cusp")
-
-			r2 = {}
-			r2["Object"] = new_obj
-			cad = r.get("Computed Absolute Degree")
-			if cad is not None:
-				r2["Longitude"] = round(cad, 6)  # keep your 6-dec rounding
-
-			# Intentionally NOT copying "House System" (dropped)
-
-			normalized.append(r2)
-
-		all_cusp_rows.extend(normalized)
-
-		# keep raw degrees for per-system lookups
-		cusps_by_system[sys] = [row["Computed Absolute Degree"] for row in rows_sys]
+	# --- Fixed-star conjunctions (one batched index lookup for all rows) ---
+	for r, star_hits in zip(rows, STAR_INDEX.query_many(star_lons, orb=1.0)):
+		r["Fixed Star Conj"] = ", ".join(h["Name"] for h in star_hits)
+
+	# --- House cusps: every system as a (12,) array from one provider ---
+	# Legacy systems go to house_cusps / the DataFrame; all of them (incl.
+	# Koch, Campanus, Regiomontanus, Porphyry) are kept on chart.cusp_arrays.
+	systems = LEGACY_SYSTEMS
+	system_label = HOUSE_SYSTEM_LABELS
+	cusp_arrays = {
+		sys: np.array([round(float(c), 6) for c in arr])
+		for sys, arr in compute_cusps(provider, lat, lon, asc=asc_val).items()
+	}
+	cusps_by_system: dict[str, list[float]] = {sys: cusp_arrays[sys].tolist() for sys in systems}
 
 	# --- Enrich object rows with per-system House / Sign / Rulers ---
 	cusp_signs_maps = {sys: _compute_cusp_signs(cusps_by_system[sys]) for sys in systems}
+	row_lons = np.array([r["Longitude"] for r in rows], dtype=np.float64)
 
-	for r in rows:
-		lon_ = r.get("Longitude")
-		if lon_ is None:
-			continue
-		for sys in systems:
-			cusps = cusps_by_system.get(sys)
-			if not cusps or len(cusps) < 12:
-				continue
-			h = _house_of_degree(lon_, cusps)
-			if not h:
-				continue
-			sys_lbl = system_label[sys]   # "Placidus", "Equal", "Whole Sign"
+	for sys in systems:
+		sys_lbl = system_label[sys]   # "Placidus", "Equal", "Whole Sign"
+		for r, h in zip(rows, assign_houses(row_lons, cusp_arrays[sys]).tolist()):
 			r[f"{sys_lbl} House"] = h
 			house_sign = cusp_signs_maps[sys].get(h)
 			if house_sign:
@@ -464,25 +394,11 @@ def calculate_chart(
 
 	# --- Build AstrologicalChart from rows and cusps ---
 	chart_objects = [ChartObject.from_dict(r, static=static_db) for r in rows]
-	house_cusps = []
-	for r in all_cusp_rows:
-		obj = str(r.get("Object", "")).strip()
-		lon = r.get("Longitude") or r.get("Computed Absolute Degree", 0.0)
-		try:
-			lon = float(lon)
-		except Exception:
-			lon = 0.0
-		m = re.match(r"^\s*(?:Placidus|Equal|Whole\s*Sign)\s*(\d+)\s*H\s*cusp", obj, re.I)
-		num = int(m.group(1)) if m else 1
-		if "Placidus" in obj:
-			sys_key = "placidus"
-		elif "Equal" in obj:
-			sys_key = "equal"
-		elif "Whole" in obj:
-			sys_key = "whole"
-		else:
-			sys_key = r.get("House System", "placidus")
-		house_cusps.append(HouseCusp(cusp_number=num, absolute_degree=lon, house_system=sys_key))
+	house_cusps = [
+		HouseCusp(cusp_number=i, absolute_degree=deg, house_system=sys)
+		for sys in systems
+		for i, deg in enumerate(cusps_by_system[sys], start=1)
+	]
 
 	chart_datetime_str = utc_dt.strftime("%Y-%m-%d %H:%M:%S") if utc_dt else ""
 	tz_str = tz_name or "UTC"
@@ -497,6 +413,7 @@ def calculate_chart(
 		city=city,
 		unknown_time=unknown_time,
 		display_datetime=display_datetime if display_datetime is not None else _display_dt,
+		cusp_arrays=cusp_arrays,
 	)
 	
 	# Populate chart_signs, chart_houses, and rules_houses
@@ -514,7 +431,9 @@ def calculate_chart(
 	]
 	combined_df = combined_df[[c for c in cols_to_keep if c in combined_df.columns]]
 
-	aspect_df = build_aspect_table(combined_df)
+	# One vectorised aspect pass (cached on the chart) feeds both the table
+	# and every later consumer of the chart's aspect edges
+	aspect_df = build_aspect_table(combined_df, aspect_pass=chart_aspect_pass(chart))
 
 	# --- Build ruler → children map from analyze_dispositors ---
 	ruler_map = {}
@@ -573,17 +492,14 @@ def calculate_chart(
 		}
 
 	# --- Planetary Strength Scoring ---
-	try:
-		chart_sect = chart_sect_from_chart(chart) if not unknown_time else "Diurnal"
-	except (ValueError, Exception):
-		chart_sect = "Diurnal"
 	_strength_edges, _, _ = build_aspect_edges(chart)
-	score_and_attach(chart, sect=chart_sect, house_system="placidus", edges_major=_strength_edges)
+	score_and_attach(chart, sect=strength_sect(chart), house_system="placidus", edges_major=_strength_edges)
 
 	# --- Return values ---
 	# chart is AstrologicalChart for session storage (chart_core stores as last_chart)
-	# Release Swiss Ephemeris file handles so they don't accumulate across reruns
-	swe.close()
+	# Keep Swiss Ephemeris files open for the next chart; the session only
+	# releases them if the open-handle count runs past its bound
+	EPHEMERIS.checkpoint()
 	if include_aspects:
 		return combined_df, aspect_df, plot_data, chart
 	return combined_df, None, plot_data, chart
@@ -629,6 +545,18 @@ def chart_sect_from_chart(chart: AstrologicalChart) -> str:
 	dc = (ac + 180.0) % 360.0
 	return "Diurnal" if _in_forward_arc(dc, ac, sun) else "Nocturnal"
 
+def strength_sect(chart: AstrologicalChart) -> str:
+	"""
+	Sect used for planetary strength scoring: the chart's own sect, or
+	'Diurnal' when the birth time is unknown or the sect can't be found.
+	"""
+	if chart is None or chart.unknown_time:
+		return "Diurnal"
+	try:
+		return chart_sect_from_chart(chart)
+	except Exception:
+		return "Diurnal"
+
 def _house_of_degree(deg: float, cusps: list[float]) -> int | None:
 	"""
 	Given absolute degree and a 12-cusp list (1..12), return the house number (1..12).
@@ -752,10 +680,14 @@ def analyze_dispositors(pos: dict, cusps: list[float] = None) -> dict:
 		"""Build a dispositor graph for one scope (sign- or house-based) and return raw links."""
 		edges = []
 		mode = "HOUSE-BASED" if cusps_scope else "SIGN-BASED"
-		for obj, deg in pos.items():
+		# All houses in one vectorised pass (None when the cusp list is incomplete)
+		houses = (
+			assign_houses(list(pos.values()), cusps_scope[:12]).tolist()
+			if cusps_scope and len(cusps_scope) >= 12 else [None] * len(pos)
+		)
+		for (obj, deg), h in zip(pos.items(), houses):
 			# Use house rulership if cusps provided, else sign rulership
 			if cusps_scope:
-				h = _house_of_degree(deg, cusps_scope)
 				if h:
 					cusp_sign = SIGNS[_sign_index(cusps_scope[h - 1])]
 					rulers = _ensure_list(PLANETARY_RULERS.get(cusp_sign, []))
@@ -1092,7 +1024,159 @@ def _extract_object_rows(df: pd.DataFrame) -> pd.DataFrame:
 	objs = df[~df["Object"].str.contains("cusp", case=False, na=False)].copy()
 	return objs
 
-def build_aspect_table(df: pd.DataFrame) -> pd.DataFrame:
+# === Batched aspect kernel ===
+# One NumPy pass computes the pairwise separation matrix for every object and
+# tests it against all aspect targets of a family by broadcasting.  The edge
+# lists and the triangular aspect table are both derived from that pass.
+
+@dataclass
+class AspectHits:
+	"""Best in-orb aspect for every object pair of one aspect family (n×n, symmetric)."""
+	aspect_names: list[str]
+	best: np.ndarray        # int index into aspect_names; -1 where nothing is in orb
+	delta: np.ndarray       # |separation - target| of the best aspect; nan where none
+	applying: np.ndarray    # bool; True where the best aspect is applying
+
+@dataclass
+class AspectPass:
+	"""Result of :func:`compute_aspect_pass` for one set of objects."""
+	names: list[str]
+	sep: np.ndarray         # pairwise separations 0..180
+	main: AspectHits        # Major + Minor (``_ASPECTS_ALL``)
+	harmonic: AspectHits    # ``_ASPECTS_HARMONIC``
+
+def separation_matrix(lons) -> np.ndarray:
+	"""Pairwise unsigned separations 0..180 (smallest arc) — vector form of ``_sep_deg``."""
+	x = np.mod(np.asarray(lons, dtype=float), 360.0)
+	d = np.mod(np.abs(x[:, None] - x[None, :]), 360.0)
+	return np.where(d <= 180.0, d, 360.0 - d)
+
+def _best_aspects(sep: np.ndarray, sep_next: np.ndarray, specs: dict) -> AspectHits:
+	"""
+	Pick the closest in-orb aspect of *specs* for every pair.
+
+	Ties resolve to the first aspect in *specs* order (``np.argmin``), which is
+	what the old per-aspect loop did.  Applying/Separating compares the orb now
+	with the orb one day ahead, as in :func:`_applying_or_separating`.
+	"""
+	names = list(specs.keys())
+	n = sep.shape[0]
+	if not names:
+		return AspectHits(
+			aspect_names=names,
+			best=np.full((n, n), -1, dtype=int),
+			delta=np.full((n, n), np.nan),
+			applying=np.zeros((n, n), dtype=bool),
+		)
+	targets = np.array([specs[a]["angle"] for a in names], dtype=float)
+	orbs = np.array([specs[a]["orb"] for a in names], dtype=float)
+
+	delta = np.abs(sep[..., None] - targets)                     # (n, n, A)
+	masked = np.where(delta <= orbs, delta, np.inf)
+	best = np.argmin(masked, axis=-1)
+	best_delta = np.take_along_axis(masked, best[..., None], axis=-1)[..., 0]
+	hit = np.isfinite(best_delta)
+
+	best = np.where(hit, best, -1)
+	best_delta = np.where(hit, best_delta, np.nan)
+	target = targets[np.where(hit, best, 0)]
+	applying = hit & (np.abs(sep_next - target) < best_delta)
+	return AspectHits(aspect_names=names, best=best, delta=best_delta, applying=applying)
+
+def compute_aspect_pass(names: list[str], lons, speeds) -> AspectPass:
+	"""Run the aspect kernel once for *names* with longitudes *lons* and daily *speeds*."""
+	lons = np.asarray(lons, dtype=float)
+	speeds = np.asarray(speeds, dtype=float)
+	sep = separation_matrix(lons)
+	sep_next = separation_matrix(np.mod(lons + speeds, 360.0))   # ~1 day ahead
+	return AspectPass(
+		names=list(names),
+		sep=sep,
+		main=_best_aspects(sep, sep_next, _ASPECTS_ALL),
+		harmonic=_best_aspects(sep, sep_next, _ASPECTS_HARMONIC),
+	)
+
+def _object_columns(chart) -> tuple[list[str], dict, dict, dict]:
+	"""Return ``(names, lons, speeds, decls)`` from a chart or a positions DataFrame."""
+	if isinstance(chart, pd.DataFrame):
+		objs  = _extract_object_rows(chart)
+		names = list(objs["Object"])
+		lons  = dict(zip(objs["Object"], objs["Longitude"]))
+		spds  = dict(zip(objs["Object"], objs["Speed"]))
+		decls = dict(zip(objs["Object"], objs["Declination"])) if "Declination" in objs else {}
+	else:
+		names = [obj.object_name.name for obj in chart.objects if obj.object_name]
+		lons = {obj.object_name.name: obj.longitude for obj in chart.objects if obj.object_name}
+		spds = {obj.object_name.name: obj.speed for obj in chart.objects if obj.object_name}
+		decls = {obj.object_name.name: obj.declination for obj in chart.objects if obj.object_name}
+	return names, lons, spds, decls
+
+def aspect_pass_for(chart) -> AspectPass:
+	"""Compute the aspect pass for an AstrologicalChart (or positions DataFrame)."""
+	names, lons, spds, _decls = _object_columns(chart)
+	return compute_aspect_pass(names, [lons[n] for n in names], [spds[n] for n in names])
+
+def _resolve_pass(aspect_pass: AspectPass | None, names: list[str], lons: dict, spds: dict) -> AspectPass:
+	"""Reuse *aspect_pass* when it was computed for exactly *names*; else compute one."""
+	if aspect_pass is not None and aspect_pass.names == names:
+		return aspect_pass
+	return compute_aspect_pass(names, [lons[n] for n in names], [spds[n] for n in names])
+
+# === Per-chart derived data (memoised in AstrologicalChart.derived) ===
+
+def _derived(chart) -> ChartDerivedCache | None:
+	"""Return the chart's derived-data cache, or None for DataFrames / other inputs."""
+	if not isinstance(chart, AstrologicalChart):
+		return None
+	cache = chart.derived
+	if not isinstance(cache, ChartDerivedCache):  # instance predating the field
+		cache = ChartDerivedCache()
+		chart.derived = cache
+	return cache
+
+def chart_aspect_pass(chart: AstrologicalChart) -> AspectPass:
+	"""The chart's aspect kernel pass (separation matrix + best aspects), computed once."""
+	cache = _derived(chart)
+	if cache is None:
+		return aspect_pass_for(chart)
+	return cache.get(chart, "aspect_pass", lambda: aspect_pass_for(chart))
+
+def chart_separation_matrix(chart: AstrologicalChart) -> tuple[list[str], np.ndarray]:
+	"""Return ``(names, sep)`` — the cached pairwise separation matrix and its row labels."""
+	ap = chart_aspect_pass(chart)
+	return ap.names, ap.sep
+
+def chart_object_names(chart) -> list[str]:
+	"""Object names in chart order (no cusps); a fresh list each call."""
+	if isinstance(chart, pd.DataFrame):
+		return list(_extract_object_rows(chart)["Object"])
+	cache = _derived(chart)
+	if cache is None:
+		return [obj.object_name.name for obj in chart.objects if obj.object_name]
+	return list(cache.get(
+		chart, "names",
+		lambda: [obj.object_name.name for obj in chart.objects if obj.object_name],
+	))
+
+def chart_positions(chart) -> dict[str, float]:
+	"""``{name: longitude % 360}`` for the chart's objects; a fresh dict each call."""
+	def _compute():
+		names, lons, _spds, _decls = _object_columns(chart)
+		pos = {}
+		for name in names:
+			lon = lons[name]
+			try:
+				if lon is not None:
+					pos[str(name)] = float(lon) % 360.0
+			except (TypeError, ValueError):
+				continue
+		return pos
+	cache = _derived(chart)
+	if cache is None:
+		return _compute()
+	return dict(cache.get(chart, "positions", _compute))
+
+def build_aspect_table(df: pd.DataFrame, aspect_pass: AspectPass | None = None) -> pd.DataFrame:
 	"""
 	Build a top-left triangular aspect matrix:
 	  - Rows & columns are the object names (no cusps)
@@ -1103,62 +1187,61 @@ def build_aspect_table(df: pd.DataFrame) -> pd.DataFrame:
 
 	Cells show: "<AspectName> (<orb°>)" or blank if no aspect in orb.
 	Applying/separating is not printed here to keep the matrix compact.
+	Pass *aspect_pass* to reuse a kernel result already computed for the same objects.
 	"""
 	objs = _extract_object_rows(df)
 	names = list(objs["Object"])
 	lons  = dict(zip(objs["Object"], objs["Longitude"]))
-	spds  = dict(zip(objs["Object"], objs["Speed"]))  # for edges helper
+	spds  = dict(zip(objs["Object"], objs["Speed"]))
+	hits = _resolve_pass(aspect_pass, names, lons, spds).main
 
 	n = len(names)
+	best = hits.best.tolist()
+	delta = hits.delta.tolist()
 	data = []
 
 	# We'll fill only cells where (j <= n - i - 1) in 0-based indexing
 	# (i.e., upper-left triangle relative to the anti-diagonal).
-	for i, rname in enumerate(names):
+	for i in range(n):
 		row_vals = []
-		for j, cname in enumerate(names):
-			# "X" on diagonal only if we're inside the filled half; otherwise blank
-			if i == j:
-				# Check anti-diagonal rule: j <= n - i - 1
-				if j <= (n - i - 1):
-					row_vals.append("X")
-				else:
-					row_vals.append("")
-				continue
-
-			# Enforce top-left half fill:
+		for j in range(n):
 			if j > (n - i - 1):
 				row_vals.append("")  # bottom-right kept blank
-				continue
-
-			A = lons[rname]
-			B = lons[cname]
-			best_hit = ""
-			best_delta = None
-			best_name = None
-
-			# Scan all aspects & pick the closest that lands within its orb
-			for name, spec in _ASPECTS_ALL.items():
-				target = spec["angle"]
-				orb    = spec["orb"]
-				hit, delta = _within_orb(A, B, target, orb)
-				if not hit:
-					continue
-				if best_delta is None or delta < best_delta:
-					best_delta = delta
-					best_name  = name
-
-			if best_name is None:
+			elif i == j:
+				row_vals.append("X")
+			elif best[i][j] < 0:
 				row_vals.append("")
 			else:
-				row_vals.append(f"{best_name} ({_fmt_orb(best_delta)})")
-
+				row_vals.append(f"{hits.aspect_names[best[i][j]]} ({_fmt_orb(delta[i][j])})")
 		data.append(row_vals)
 
 	return pd.DataFrame(data, index=names, columns=names)
 
-
-def build_aspect_edges(chart: AstrologicalChart, compass_rose: bool = False) -> tuple[list[tuple], list[tuple], list[tuple]]:
+def _edges_from_hits(names: list[str], hits: AspectHits, decls: dict) -> list[tuple]:
+	"""Turn the upper triangle of *hits* into ``(a, b, meta)`` edges in pair order."""
+	edges = []
+	ii, jj = np.nonzero(np.triu(hits.best >= 0, k=1))
+	for i, j in zip(ii.tolist(), jj.tolist()):
+		a = names[i]; b = names[j]
+		applying = bool(hits.applying[i, j])
+		# Declination difference (absolute degrees), if both present
+		dA = decls.get(a); dB = decls.get(b)
+		decl_diff = float(f"{abs(float(dA) - float(dB)):.3f}") if dA is not None and dB is not None else None
+		meta = {
+			"aspect": hits.aspect_names[hits.best[i, j]],
+			"orb": float(f"{float(hits.delta[i, j]):.3f}"),
+			"appsep": "Applying" if applying else "Separating",
+			"applying": applying,
+			"decl_diff": decl_diff,
+		}
+		edges.append((a, b, meta))
+	return edges
+
+def build_aspect_edges(
+	chart: AstrologicalChart,
+	compass_rose: bool = False,
+	aspect_pass: AspectPass | None = None,
+) -> tuple[list[tuple], list[tuple], list[tuple]]:
 	"""
 	Return (edges_major, edges_minor, edges_harmonic), each as a list of tuples:
 	  (obj1, obj2, {
@@ -1169,67 +1252,40 @@ def build_aspect_edges(chart: AstrologicalChart, compass_rose: bool = False) ->
 		  "decl_diff": <float|None>,      # |decl1 - decl2| in deg
 	  })
 	Pairs are de-duplicated (A,B) only once (A < B by index).
-	Harmonic edges are detected in a separate independent pass.
+	Major/minor and harmonic edges come from one :func:`compute_aspect_pass`.
+	For an AstrologicalChart the result is memoised in ``chart.derived`` so
+	later pipeline stages get the same edges without recomputing; pass
+	*aspect_pass* to bypass the cache with an explicit kernel result.
 	"""
+	cache = _derived(chart) if aspect_pass is None else None
+	if cache is None:
+		return _compute_aspect_edges(chart, compass_rose, aspect_pass)
+	major, minor, harmonic = cache.get(
+		chart, ("edges", compass_rose),
+		lambda: _compute_aspect_edges(chart, compass_rose, chart_aspect_pass(chart)),
+	)
+	# Fresh lists so callers can't grow the cached ones
+	return list(major), list(minor), list(harmonic)
+
+def _compute_aspect_edges(
+	chart: AstrologicalChart,
+	compass_rose: bool = False,
+	aspect_pass: AspectPass | None = None,
+) -> tuple[list[tuple], list[tuple], list[tuple]]:
+	"""Uncached body of :func:`build_aspect_edges`."""
 	if chart is None:
 		return [], [], []
 	# Backward-compatible: accept a DataFrame if passed accidentally
-	if isinstance(chart, pd.DataFrame):
-		objs  = _extract_object_rows(chart)
-		names = list(objs["Object"])
-		lons  = dict(zip(objs["Object"], objs["Longitude"]))
-		spds  = dict(zip(objs["Object"], objs["Speed"]))
-		decls = dict(zip(objs["Object"], objs["Declination"]))
-	else:
-		names = [obj.object_name.name for obj in chart.objects if obj.object_name]
-		lons = {obj.object_name.name: obj.longitude for obj in chart.objects if obj.object_name}
-		spds = {obj.object_name.name: obj.speed for obj in chart.objects if obj.object_name}
-		decls = {obj.object_name.name: obj.declination for obj in chart.objects if obj.object_name}
+	names, lons, spds, decls = _object_columns(chart)
+	ap = _resolve_pass(aspect_pass, names, lons, spds)
 
 	edges_major: list[tuple] = []
 	edges_minor: list[tuple] = []
-
-	for i in range(len(names)):
-		for j in range(i + 1, len(names)):  # de-duplicate: only upper pairs
-			a = names[i]; b = names[j]
-			A, B   = lons[a], lons[b]
-			sA, sB = spds[a], spds[b]
-
-			best_delta = None
-			best_name  = None
-			best_target = None
-
-			for name, spec in _ASPECTS_ALL.items():
-				hit, delta = _within_orb(A, B, spec["angle"], spec["orb"])
-				if not hit:
-					continue
-				if best_delta is None or delta < best_delta:
-					best_delta  = delta
-					best_name   = name
-					best_target = spec["angle"]
-
-			if best_name is None:
-				continue
-
-			appsep = _applying_or_separating(A, sA, B, sB, best_target)
-
-			# Declination difference (absolute degrees), if both present
-			dA = decls.get(a); dB = decls.get(b)
-			decl_diff = float(f"{abs(float(dA) - float(dB)):.3f}") if dA is not None and dB is not None else None
-
-			meta = {
-				"aspect": best_name,
-				"orb": float(f"{best_delta:.3f}"),
-				"appsep": appsep,                        # "Applying" or "Separating"
-				"applying": (appsep == "Applying"),     # NEW boolean
-				"decl_diff": decl_diff,                 # NEW declination difference
-			}
-			record = (a, b, meta)
-
-			if best_name in _MAJOR_NAMES:
-				edges_major.append(record)
-			else:
-				edges_minor.append(record)
+	for record in _edges_from_hits(names, ap.main, decls):
+		if record[2]["aspect"] in _MAJOR_NAMES:
+			edges_major.append(record)
+		else:
+			edges_minor.append(record)
 
 	# Add AC-DC opposition if compass_rose is toggled on
 	if compass_rose:
@@ -1256,47 +1312,13 @@ def build_aspect_edges(chart: AstrologicalChart, compass_rose: bool = False) ->
 					"decl_diff": decl_diff,
 				}
 				edges_major.append((ac, dc, meta))
-	# --- Harmonic aspect pass (independent of major/minor) -----------
-	edges_harmonic: list[tuple] = []
-	for i in range(len(names)):
-		for j in range(i + 1, len(names)):
-			a = names[i]; b = names[j]
-			A, B   = lons[a], lons[b]
-			sA, sB = spds[a], spds[b]
-
-			best_delta = None
-			best_name  = None
-			best_target = None
-
-			for name, spec in _ASPECTS_HARMONIC.items():
-				hit, delta = _within_orb(A, B, spec["angle"], spec["orb"])
-				if not hit:
-					continue
-				if best_delta is None or delta < best_delta:
-					best_delta  = delta
-					best_name   = name
-					best_target = spec["angle"]
-
-			if best_name is None:
-				continue
-
-			appsep = _applying_or_separating(A, sA, B, sB, best_target)
-			dA = decls.get(a); dB = decls.get(b)
-			decl_diff = float(f"{abs(float(dA) - float(dB)):.3f}") if dA is not None and dB is not None else None
 
-			meta = {
-				"aspect": best_name,
-				"orb": float(f"{best_delta:.3f}"),
-				"appsep": appsep,
-				"applying": (appsep == "Applying"),
-				"decl_diff": decl_diff,
-			}
-			edges_harmonic.append((a, b, meta))
+	# --- Harmonic aspects (independent of major/minor, same kernel pass) ---
+	edges_harmonic = _edges_from_hits(names, ap.harmonic, decls)
 
 	return edges_major, edges_minor, edges_harmonic
 
 
-
 def _sign_to_index(sign_name: str) -> int | None:
 	"""Return 0..11 for Aries..Pisces using your SIGNS list."""
 	try:
@@ -1482,11 +1504,7 @@ def build_conjunction_clusters(chart: AstrologicalChart, edges_major: list[tuple
 	Also returns a mapping: object_name → cluster_id, and a list of clusters (each as a set of names).
 	"""
 	# Objects in chart order
-	if isinstance(chart, pd.DataFrame):
-		objs = _extract_object_rows(chart)
-		names = list(objs["Object"])
-	else:
-		names = [obj.object_name.name for obj in chart.objects if obj.object_name]
+	names = chart_object_names(chart)
 	order_ix = {name: i for i, name in enumerate(names)}
 
 	# Build undirected adjacency from conjunction pairs
@@ -1550,11 +1568,7 @@ def build_clustered_aspect_edges(chart: AstrologicalChart, edges_major: list[tup
 	Output: list of tuples (A, B, meta), where A and B are either cluster names (comma-joined) or singleton names.
 	"""
 	clusters, cluster_map, cluster_sets = build_conjunction_clusters(chart, edges_major)
-	if isinstance(chart, pd.DataFrame):
-		objs = _extract_object_rows(chart)
-		names = list(objs["Object"])
-	else:
-		names = [obj.object_name.name for obj in chart.objects if obj.object_name]
+	names = chart_object_names(chart)
 	# Build reverse: cluster_id → list of members
 	cluster_id_to_members = {}
 	for obj, cid in cluster_map.items():
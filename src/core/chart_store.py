@@ -0,0 +1,243 @@
+"""
+Compact, versioned chart storage for per-user session state.
+
+``AstrologicalChart.to_json`` carries everything the chart pipeline ever
+produced — the ``df_positions`` records, the n×n ``aspect_df`` grid, three
+edge lists, shapes, filaments, dispositor rows — and NiceGUI keeps one such
+blob per chart per user.  Almost all of it is a pure function of the
+object rows and house cusps.
+
+:func:`pack_chart` stores only that canonical core:
+
+- chart inputs and display metadata (datetime, location, names, sect);
+- the object rows as a column list plus value rows (no repeated keys);
+- the cusp arrays for every house system (``house_cusps`` is rebuilt from
+  them);
+- profile metadata (``circuit_names``, ``group_id``).
+
+The payload is JSON, optionally zlib-compressed and base64-encoded, inside
+an envelope tagged with :data:`STORE_FORMAT` / :data:`STORE_VERSION` so
+the layout can change without breaking stored sessions.
+
+:func:`unpack_chart` rebuilds the chart and re-derives the DataFrames,
+aspect edges, receptions, clusters, dispositor tables, circuits, shapes
+and minor links with the same calc_v2 / patterns_v2 calls that
+``chart_adapter.compute_chart`` makes.  Charts packed from a transit
+chart (which never had the natal-only artifacts) are rebuilt the same
+lighter way.
+"""
+from __future__ import annotations
+
+import base64
+import datetime as dt
+import json
+import logging
+import zlib
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .houses import LEGACY_SYSTEMS
+
+STORE_FORMAT = "rosetta.chart"
+STORE_VERSION = 1
+
+_ENC_JSON = "json"
+_ENC_ZLIB = "zlib+b64"
+
+_log = logging.getLogger(__name__)
+
+# AstrologicalChart scalars carried verbatim.
+_META_FIELDS = (
+    "display_name", "city", "chart_datetime", "timezone", "latitude",
+    "longitude", "unknown_time", "sect", "sect_error", "group_id",
+)
+
+
+class ChartStoreError(ValueError):
+    """Raised for payloads that are not packed charts or have an unknown version."""
+
+
+def is_packed(raw: Any) -> bool:
+    """True if *raw* is a :func:`pack_chart` envelope."""
+    return isinstance(raw, dict) and raw.get("format") == STORE_FORMAT
+
+
+def _native(value):
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+def _iso(value: Optional[dt.datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _parse_dt(value: Optional[str]) -> Optional[dt.datetime]:
+    if not value:
+        return None
+    try:
+        return dt.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _has_natal_artifacts(chart) -> bool:
+    return bool(chart.dispositor_summary_rows or chart.dispositor_chains_rows
+                or chart.conj_clusters_rows or chart.filaments or chart.singleton_map)
+
+
+# ── pack ──────────────────────────────────────────────────────────────────
+
+def chart_payload(chart) -> Dict[str, Any]:
+    """The canonical, uncompressed content of a packed chart."""
+    rows = [obj.to_dict() for obj in (chart.objects or [])]
+    columns: List[str] = list(rows[0]) if rows else []
+    payload: Dict[str, Any] = {
+        "meta": {f: _native(getattr(chart, f)) for f in _META_FIELDS},
+        "display_datetime": _iso(chart.display_datetime),
+        "utc_datetime": _iso(chart.utc_datetime),
+        "columns": columns,
+        "rows": [[_native(r.get(c)) for c in columns] for r in rows],
+        "cusps": {k: [float(x) for x in v] for k, v in (chart.cusp_arrays or {}).items()},
+        "circuit_names": dict(chart.circuit_names or {}),
+        "natal": _has_natal_artifacts(chart),
+    }
+    if not all(sys in payload["cusps"] for sys in LEGACY_SYSTEMS):
+        # Charts that predate cusp_arrays: keep the raw cusp rows.
+        payload["house_cusps"] = [c.to_json() for c in (chart.house_cusps or [])]
+    return payload
+
+
+def pack_chart(chart, compress: bool = True) -> Dict[str, Any]:
+    """Encode *chart* as a small JSON-safe envelope for session storage."""
+    payload = chart_payload(chart)
+    if compress:
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        data: Any = base64.b64encode(zlib.compress(raw, 6)).decode("ascii")
+        encoding = _ENC_ZLIB
+    else:
+        data, encoding = payload, _ENC_JSON
+    return {"format": STORE_FORMAT, "version": STORE_VERSION,
+            "encoding": encoding, "data": data}
+
+
+# ── unpack ────────────────────────────────────────────────────────────────
+
+def _decode(envelope: Dict[str, Any]) -> Dict[str, Any]:
+    if not is_packed(envelope):
+        raise ChartStoreError("not a packed chart")
+    if envelope.get("version") != STORE_VERSION:
+        raise ChartStoreError(f"unsupported chart store version {envelope.get('version')}")
+    encoding = envelope.get("encoding")
+    if encoding == _ENC_JSON:
+        return envelope["data"]
+    if encoding == _ENC_ZLIB:
+        return json.loads(zlib.decompress(base64.b64decode(envelope["data"])))
+    raise ChartStoreError(f"unknown chart store encoding {encoding!r}")
+
+
+def unpack_chart(envelope: Dict[str, Any], derive: bool = True):
+    """Rebuild an AstrologicalChart from :func:`pack_chart` output.
+
+    With *derive* False only objects, cusps and metadata are restored.
+    """
+    from .models_v2 import AstrologicalChart, ChartObject, HouseCusp, static_db
+
+    payload = _decode(envelope)
+    columns = payload["columns"]
+    objects = [ChartObject.from_dict(dict(zip(columns, row)), static=static_db)
+               for row in payload["rows"]]
+    cusp_arrays = {k: np.asarray(v, dtype=np.float64) for k, v in payload["cusps"].items()}
+    if "house_cusps" in payload:
+        house_cusps = [HouseCusp.from_json(c) for c in payload["house_cusps"]]
+    else:
+        house_cusps = [
+            HouseCusp(cusp_number=i, absolute_degree=float(deg), house_system=sys)
+            for sys in LEGACY_SYSTEMS
+            for i, deg in enumerate(cusp_arrays[sys], start=1)
+        ]
+    meta = payload["meta"]
+    chart = AstrologicalChart(
+        objects=objects,
+        house_cusps=house_cusps,
+        cusp_arrays=cusp_arrays,
+        chart_datetime=meta.get("chart_datetime") or "",
+        timezone=meta.get("timezone") or "",
+        latitude=float(meta.get("latitude") or 0.0),
+        longitude=float(meta.get("longitude") or 0.0),
+        display_name=meta.get("display_name") or "",
+        city=meta.get("city") or "",
+        unknown_time=bool(meta.get("unknown_time")),
+        display_datetime=_parse_dt(payload.get("display_datetime")),
+        utc_datetime=_parse_dt(payload.get("utc_datetime")),
+        sect=meta.get("sect"),
+        sect_error=meta.get("sect_error"),
+        circuit_names=payload.get("circuit_names") or {},
+        group_id=meta.get("group_id"),
+    )
+    if derive:
+        derive_chart_data(chart, natal=payload.get("natal", True))
+    return chart
+
+
+def derive_chart_data(chart, natal: bool = True):
+    """Fill the DataFrames, edges and circuit fields of *chart* from its objects.
+
+    Mirrors the post-processing in ``chart_adapter.compute_chart``
+    (``compute_transit_chart`` when *natal* is False).  Stages that fail
+    leave their fields empty, as there.
+    """
+    from .calc_v2 import (
+        annotate_chart,
+        build_aspect_edges,
+        build_aspect_table,
+        build_conjunction_clusters,
+        build_dispositor_tables,
+        chart_aspect_pass,
+    )
+    from .models_v2 import static_db
+    from .patterns_v2 import (
+        detect_minor_links_from_chart,
+        detect_shapes,
+        generate_combo_groups,
+        prepare_pattern_inputs,
+    )
+
+    chart.populate_chart_structure(static=static_db, house_system="placidus")
+    chart.df_positions = chart.to_dataframe()
+    chart.aspect_df = build_aspect_table(chart.df_positions, aspect_pass=chart_aspect_pass(chart))
+
+    edges_major, edges_minor, edges_harmonic = build_aspect_edges(chart, compass_rose=False)
+    chart.edges_major = [tuple(e) for e in edges_major]
+    chart.edges_minor = [tuple(e) for e in edges_minor]
+    chart.edges_harmonic = [tuple(e) for e in edges_harmonic]
+    try:
+        annotate_chart(chart, edges_major)
+    except Exception:
+        pass
+
+    if natal:
+        try:
+            chart.conj_clusters_rows, _, _ = build_conjunction_clusters(chart, edges_major)
+        except Exception:
+            pass
+        try:
+            chart.dispositor_summary_rows, chart.dispositor_chains_rows = build_dispositor_tables(chart)
+        except Exception:
+            pass
+
+    try:
+        pos_chart, patterns_sets, major_edges_all = prepare_pattern_inputs(chart, edges_major)
+        chart.aspect_groups = [sorted(list(s)) for s in patterns_sets]
+        chart.shapes = detect_shapes(pos_chart, patterns_sets, major_edges_all)
+        chart.positions = pos_chart
+        chart.major_edges_all = major_edges_all
+        if natal:
+            chart.filaments, chart.singleton_map = detect_minor_links_from_chart(chart, edges_major)
+            chart.combos = generate_combo_groups(chart.filaments)
+    except Exception as exc:
+        _log.warning("Circuit detection failed while unpacking chart: %s", exc)
+    return chart
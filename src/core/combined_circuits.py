@@ -0,0 +1,288 @@
+"""
+Incremental combined-circuit engine for biwheels.
+
+In transit / synastry mode every step of the transit date used to rebuild
+the merged chart from scratch: all pairwise aspects (including the
+chart-1 × chart-1 pairs that never change), connected components, and
+shape detection.  :class:`CombinedCircuitEngine` keeps per-chart-1 state
+between calls:
+
+- chart-1 internal edges, stored per body in the order the full pairwise
+  scan emits them, so merged edge lists are identical to a rebuild;
+- a union-find snapshot of the chart-1 components, which each call copies
+  and extends with only the chart-2 × chart-1 and chart-2 × chart-2
+  edges;
+- an LRU of per-component shape results handed to
+  :func:`patterns_v2.detect_shapes`, so components whose members,
+  positions and edges are unchanged (typically the chart-1-only ones) are
+  not re-detected.
+
+The global passes of ``detect_shapes`` (Yod / Lightning Bolt,
+remainders, suppression) still run every call; they are cheap next to
+the per-component matcher.
+
+``chart_adapter.compute_combined_circuits`` delegates to the process-wide
+:data:`COMBINED_CIRCUITS`.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from cachetools import LRUCache
+
+from .patterns_v2 import detect_shapes
+
+
+def _default_aspects() -> Dict[str, dict]:
+    from .models_v2 import static_db
+    return {k: v for k, v in static_db.ASPECTS.items()
+            if v.get("aspect_type") in ("Major", "Minor")}
+
+
+def _positions(chart) -> Dict[str, float]:
+    return {obj.object_name.name: obj.longitude
+            for obj in chart.objects if obj.object_name}
+
+
+class _ComponentCache(LRUCache):
+    """LRU of per-component shape results that counts lookups.
+
+    Has its own lock: ``detect_shapes`` reads and fills it from whichever
+    thread is computing, outside the engine lock.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__(maxsize=maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = super().get(key, default)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def __setitem__(self, key, value) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+
+    def reset(self) -> None:
+        """Drop every entry and zero the counters."""
+        with self._lock:
+            self.clear()
+            self.hits = self.misses = 0
+
+    def counts(self) -> Tuple[int, int, int]:
+        """(hits, misses, entries) read together."""
+        with self._lock:
+            return self.hits, self.misses, len(self)
+
+
+class _UnionFind:
+    """Array-backed union-find with path halving."""
+
+    def __init__(self, parent: List[int]) -> None:
+        self.parent = parent
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            # keep the lower index as root so roots are stable across copies
+            if ri < rj:
+                self.parent[rj] = ri
+            else:
+                self.parent[ri] = rj
+
+
+class _Chart1State:
+    """Chart-1 edges, union-find snapshot and degree flags."""
+
+    def __init__(self, names: List[str], lons: List[float], aspect_matrix,
+                 aspect_names: List[str]) -> None:
+        n = len(names)
+        self.names = names
+        self.lons = lons
+        self.edges_from: List[List[tuple]] = [[] for _ in range(n)]
+        self.connected = [False] * n
+        uf = _UnionFind(list(range(n)))
+        hits = aspect_matrix(lons, lons)
+        for i, j in zip(*np.nonzero(np.triu(hits >= 0, k=1))):
+            i, j = int(i), int(j)
+            self.edges_from[i].append(((names[i], names[j]), aspect_names[hits[i, j]]))
+            self.connected[i] = self.connected[j] = True
+            uf.union(i, j)
+        self.parent = uf.parent
+
+
+class CombinedCircuitEngine:
+    """Incremental merged-chart edges, components and shapes for biwheels.
+
+    Thread-safe; one instance is shared per process.  The engine lock only
+    covers the chart-1 base lookup and the counters, so concurrent biwheels
+    run their pairwise and shape work in parallel.  *max_bases* bounds how
+    many distinct chart 1s are kept warm, *max_components* the
+    per-component shape cache.
+    """
+
+    def __init__(self, aspects: Optional[Dict[str, dict]] = None,
+                 max_bases: int = 8, max_components: int = 512) -> None:
+        self._aspects = aspects
+        self._bases: "OrderedDict[tuple, _Chart1State]" = OrderedDict()
+        self._max_bases = max_bases
+        self._shape_cache = _ComponentCache(max_components)
+        self._lock = threading.Lock()
+        self._counts = {"calls": 0, "base_hits": 0, "base_misses": 0,
+                        "pairs_computed": 0, "pairs_reused": 0}
+
+    @property
+    def aspects(self) -> Dict[str, dict]:
+        if self._aspects is None:
+            self._aspects = _default_aspects()
+        return self._aspects
+
+    @property
+    def aspect_names(self) -> List[str]:
+        return list(self.aspects)
+
+    def _aspect_matrix(self, lons_a, lons_b) -> np.ndarray:
+        """Index into ``aspect_names`` per (a, b) pair, or -1: the first aspect
+        (in ``aspects`` order) within orb, exactly as the scalar pairwise scan
+        decides it.
+
+        Float ``%``, ``abs`` and comparisons are elementwise identical in
+        NumPy, so the vectorised result matches the Python loop bit for bit.
+        """
+        a = np.asarray(lons_a, dtype=np.float64)[:, None]
+        b = np.asarray(lons_b, dtype=np.float64)[None, :]
+        ang = np.abs(a - b) % 360
+        ang = np.where(ang > 180, 360 - ang, ang)
+        out = np.full(ang.shape, -1, dtype=np.int64)
+        for k, adata in enumerate(self.aspects.values()):
+            hit = (out == -1) & (np.abs(ang - adata["angle"]) <= adata["orb"])
+            out[hit] = k
+        return out
+
+    def _base(self, pos_1: Dict[str, float]) -> _Chart1State:
+        key = tuple(pos_1.items())
+        with self._lock:
+            self._counts["calls"] += 1
+            base = self._bases.get(key)
+            if base is not None:
+                self._bases.move_to_end(key)
+                self._counts["base_hits"] += 1
+                return base
+            self._counts["base_misses"] += 1
+        # Built outside the lock; if two threads race, the first insert wins.
+        base = _Chart1State(list(pos_1), list(pos_1.values()), self._aspect_matrix,
+                            self.aspect_names)
+        with self._lock:
+            base = self._bases.setdefault(key, base)
+            self._bases.move_to_end(key)
+            while len(self._bases) > self._max_bases:
+                self._bases.popitem(last=False)
+        return base
+
+    def compute(self, chart_1, chart_2) -> dict:
+        """Combined circuits for *chart_1* + *chart_2*.
+
+        Returns the dict documented on
+        ``chart_adapter.compute_combined_circuits``.
+        """
+        pos_1 = _positions(chart_1)
+        pos_2 = _positions(chart_2)
+        return self._compute(self._base(pos_1), pos_1, pos_2)
+
+    def _compute(self, base: _Chart1State, pos_1, pos_2) -> dict:
+        pos_combined = dict(pos_1)
+        for name, deg in pos_2.items():
+            pos_combined[f"{name}_2"] = deg
+
+        n1 = len(base.names)
+        names_2 = [f"{name}_2" for name in pos_2]
+        lons_2 = list(pos_2.values())
+        n2 = len(names_2)
+        bodies = base.names + names_2
+        lons_1 = base.lons
+
+        uf = _UnionFind(base.parent + list(range(n1, n1 + n2)))
+        connected = base.connected + [False] * n2
+        combined_edges: List[Tuple[tuple, str]] = []
+
+        names = self.aspect_names
+        cross = self._aspect_matrix(lons_1, lons_2)
+        inner = self._aspect_matrix(lons_2, lons_2)
+
+        # Same order as the full i<j scan over chart-1 then chart-2 names.
+        for i in range(n1):
+            combined_edges.extend(base.edges_from[i])
+            for j in np.flatnonzero(cross[i] != -1):
+                j = int(j)
+                combined_edges.append(((bodies[i], names_2[j]), names[cross[i, j]]))
+                connected[i] = connected[n1 + j] = True
+                uf.union(i, n1 + j)
+        for i, j in zip(*np.nonzero(np.triu(inner != -1, k=1))):
+            i, j = int(i), int(j)
+            combined_edges.append(((names_2[i], names_2[j]), names[inner[i, j]]))
+            connected[n1 + i] = connected[n1 + j] = True
+            uf.union(n1 + i, n1 + j)
+        with self._lock:
+            self._counts["pairs_computed"] += n1 * n2 + n2 * (n2 - 1) // 2
+            self._counts["pairs_reused"] += n1 * (n1 - 1) // 2
+
+        # Components in order of their first body, as the DFS produced them.
+        by_root: Dict[int, set] = {}
+        for idx, name in enumerate(bodies):
+            if connected[idx]:
+                by_root.setdefault(uf.find(idx), set()).add(name)
+        patterns = list(by_root.values())
+
+        shapes = detect_shapes(pos_combined, patterns, combined_edges,
+                               component_cache=self._shape_cache)
+
+        singleton_map = {bodies[idx]: {"deg": pos_combined[bodies[idx]]}
+                         for idx in range(n1 + n2) if not connected[idx]}
+
+        return {
+            "pos_combined": pos_combined,
+            "patterns_combined": patterns,
+            "shapes_combined": shapes,
+            "singleton_map_combined": singleton_map,
+            "combined_edges": combined_edges,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bases.clear()
+            self._shape_cache.reset()
+            for k in self._counts:
+                self._counts[k] = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Call / reuse counters and cache sizes."""
+        with self._lock:
+            out: Dict[str, object] = dict(self._counts)
+            hits, misses, entries = self._shape_cache.counts()
+            out["component_hits"] = hits
+            out["component_misses"] = misses
+            out["component_hit_rate"] = round(hits / (hits + misses), 4) if hits + misses else None
+            out["bases"] = len(self._bases)
+            out["component_entries"] = entries
+            return out
+
+
+# Shared by every biwheel request in the process.
+COMBINED_CIRCUITS = CombinedCircuitEngine()
@@ -0,0 +1,208 @@
+"""
+Memoised planetary strength and circuit simulation for live charts.
+
+``AstrologicalChart.to_json`` and ``to_compact`` leave out
+``planetary_states``, ``mutual_receptions`` and ``circuit_simulation``, so
+a chart rebuilt from storage — every chart the chat and the renderers get
+from ``nicegui_state.get_chart_object`` — arrives without them.
+:func:`ensure_derived_state` fills them in on first access:
+
+- dignity scoring with the sect and major edges ``calculate_chart`` uses
+  (``calc_v2.strength_sect`` / ``build_aspect_edges``), unless the chart
+  still carries its states;
+- ``circuit_sim.simulate_circuit`` over the chart's shapes.
+
+Results live in the process-wide :data:`DERIVED_STATES`, keyed by the
+chart fingerprint (see src/chart_cache.py), the sect and the detected
+shapes, so every rebuilt copy of a chart — in another session, or after
+``LIVE_CHARTS`` evicted it — reuses them.  ``chart_adapter.compute_chart``
+seeds the cache with what it computed.  Once attached, the chart's own
+fields answer later calls without a lookup.
+
+Attached ``PlanetaryState`` and ``CircuitSimulation`` objects are shared
+by every chart with the same key; treat them as read-only.  They are not
+serialised: rebuilding them takes a few milliseconds, a fraction of
+unpacking the chart.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from cachetools import LRUCache
+
+from .models_v2 import AstrologicalChart, CircuitSimulation, PlanetaryState
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DerivedState:
+    """Strength scores, receptions and circuit simulation of one chart."""
+
+    planetary_states: Dict[str, PlanetaryState] = field(default_factory=dict)
+    mutual_receptions: list = field(default_factory=list)
+    circuit_simulation: Optional[CircuitSimulation] = None
+
+
+def _shapes_digest(chart: AstrologicalChart) -> str:
+    # Edges go through JSON first: from_json turns their tuples into lists.
+    shapes = sorted(
+        [s.shape_id, s.shape_type, sorted(s.members),
+         sorted(json.dumps(e, default=str) for e in s.edges or [])]
+        for s in chart.shapes or []
+    )
+    blob = json.dumps(shapes, separators=(",", ":"))
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def derived_key(chart: AstrologicalChart) -> Tuple[str, str, str]:
+    """Cache key: chart fingerprint, scoring sect and shapes digest."""
+    from src.chart_cache import chart_fingerprint
+    from .calc_v2 import strength_sect
+
+    return chart_fingerprint(chart), strength_sect(chart), _shapes_digest(chart)
+
+
+def _has_states(chart: AstrologicalChart) -> bool:
+    return bool(chart.planetary_states) or any(
+        obj.planetary_state is not None for obj in chart.objects or [])
+
+
+def _attached(chart: AstrologicalChart) -> bool:
+    return chart.circuit_simulation is not None and _has_states(chart)
+
+
+def _current(chart: AstrologicalChart) -> DerivedState:
+    return DerivedState(chart.planetary_states, list(chart.mutual_receptions or []),
+                        chart.circuit_simulation)
+
+
+def _compute(chart: AstrologicalChart) -> Optional[DerivedState]:
+    """Score and simulate *chart* where it lacks either; None on failure."""
+    from .calc_v2 import build_aspect_edges, strength_sect
+    from .circuit_sim import simulate_circuit
+    from .dignity_calc import score_and_attach
+
+    try:
+        if not _has_states(chart):
+            edges_major, _, _ = build_aspect_edges(chart)
+            score_and_attach(chart, sect=strength_sect(chart), house_system="placidus",
+                             edges_major=edges_major)
+        simulation = chart.circuit_simulation
+        if simulation is None:
+            simulation = simulate_circuit(chart)
+    except Exception:
+        _log.warning("Could not rebuild strength / circuit state for chart %r",
+                     chart.display_name, exc_info=True)
+        return None
+    return DerivedState(dict(chart.planetary_states), list(chart.mutual_receptions or []),
+                        simulation)
+
+
+def _attach(chart: AstrologicalChart, state: DerivedState) -> None:
+    """Fill whichever of the fields *chart* is missing; keep what it has."""
+    from .dignity_calc import attach_states
+
+    if not _has_states(chart):
+        attach_states(chart, state.planetary_states, state.mutual_receptions)
+    if chart.circuit_simulation is None:
+        chart.circuit_simulation = state.circuit_simulation
+
+
+class DerivedStateCache:
+    """Thread-safe LRU of :class:`DerivedState` keyed by :func:`derived_key`.
+
+    The cache lock only guards lookups, inserts and counters.  The first
+    caller for a missing key computes it outside the lock; concurrent
+    callers for the same key wait on its future, so it is computed once
+    while other charts proceed in parallel.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+        self._pending: Dict[Tuple[str, str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "misses": 0, "seeded": 0, "failures": 0}
+
+    def ensure(self, chart) -> Optional[DerivedState]:
+        """Attach and return *chart*'s derived state, computing it once.
+
+        Returns None for objects that are not AstrologicalCharts and when
+        scoring or simulation fails (logged).
+        """
+        if not isinstance(chart, AstrologicalChart):
+            return None
+        if _attached(chart):
+            return _current(chart)
+        key = derived_key(chart)
+        owner = None
+        with self._lock:
+            state = self._entries.get(key)
+            pending = self._pending.get(key)
+            if state is not None:
+                self._counts["hits"] += 1
+            elif pending is None:
+                self._counts["misses"] += 1
+                owner = self._pending[key] = Future()
+        if owner is not None:
+            try:
+                state = _compute(chart)
+            finally:
+                with self._lock:
+                    del self._pending[key]
+                    if state is None:
+                        self._counts["failures"] += 1
+                    else:
+                        self._entries[key] = state
+                owner.set_result(state)
+        elif pending is not None:
+            state = pending.result()
+            if state is not None:
+                with self._lock:
+                    self._counts["hits"] += 1
+        if state is None:
+            return None
+        with self._lock:
+            if not _attached(chart):
+                _attach(chart, state)
+        return _current(chart)
+
+    def remember(self, chart: AstrologicalChart) -> None:
+        """Seed the cache with the state a freshly computed *chart* already carries."""
+        if not _attached(chart):
+            return
+        key = derived_key(chart)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = _current(chart)
+                self._counts["seeded"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for k in self._counts:
+                self._counts[k] = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Hit/miss counters, hit rate and current size."""
+        with self._lock:
+            out: Dict[str, object] = dict(self._counts)
+            total = out["hits"] + out["misses"]
+            out["hit_rate"] = round(out["hits"] / total, 4) if total else None
+            out["entries"] = len(self._entries)
+            return out
+
+
+# Shared by every chart in the process.
+DERIVED_STATES = DerivedStateCache()
+
+
+def ensure_derived_state(chart) -> Optional[DerivedState]:
+    """Give *chart* its planetary states and circuit simulation; see module docstring."""
+    return DERIVED_STATES.ensure(chart)
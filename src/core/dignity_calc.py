@@ -55,6 +55,12 @@ STATION_SPEED_THRESHOLDS = {
 }
 DEFAULT_STATION_THRESHOLD = 0.02
 
+# ChartObject.station text for the stationary motion labels of classify_motion()
+STATION_LABELS = {
+	"stationary_direct": "Stationing direct",
+	"stationary_retrograde": "Stationing retrograde",
+}
+
 # House angularity scores by house number
 # Angular (1, 4, 7, 10) = 5; Succedent (2, 5, 8, 11) = 3; Cadent (3, 6, 9, 12) = 1
 HOUSE_ANGULARITY = {
@@ -869,10 +875,8 @@ def score_chart(
 		obj.planetary_state = state
 
 		# Update station field on ChartObject (was always None before)
-		if motion_label == "stationary_direct":
-			obj.station = "Stationing direct"
-		elif motion_label == "stationary_retrograde":
-			obj.station = "Stationing retrograde"
+		if motion_label in STATION_LABELS:
+			obj.station = STATION_LABELS[motion_label]
 
 	# ─────────────────────────────────────────────────────────────────
 	# Phase 2: Conjunction bonuses (fixed stars + asteroids)
@@ -960,5 +964,28 @@ def score_and_attach(
 	states = score_chart(
 		chart, sect=sect, house_system=house_system, edges_major=edges_major
 	)
-	chart.planetary_states = states
-	chart.mutual_receptions = detect_mutual_receptions(chart.objects)
+	attach_states(chart, states, detect_mutual_receptions(chart.objects))
+
+
+def attach_states(
+	chart: AstrologicalChart,
+	states: Dict[str, PlanetaryState],
+	mutual_receptions: list,
+) -> None:
+	"""
+	Attach already-computed strength results to *chart*.
+
+	Fills the same fields as score_and_attach(), so states scored on one
+	chart can be reused for another chart with the same positions (see
+	derived_state.py).  The PlanetaryState objects are shared, not copied.
+	"""
+	chart.planetary_states = dict(states)
+	chart.mutual_receptions = list(mutual_receptions)
+	for obj in chart.objects:
+		name = obj.object_name.name if obj.object_name else None
+		state = states.get(name)
+		if state is None:
+			continue
+		obj.planetary_state = state
+		if state.motion_label in STATION_LABELS:
+			obj.station = STATION_LABELS[state.motion_label]
@@ -0,0 +1,245 @@
+"""
+Precomputed ephemeris tables with cubic Hermite interpolation.
+
+Transit animation and timeline features need longitudes at many instants;
+calling ``swe.calc_ut`` per step (let alone ``calculate_chart``) is far too
+slow for that.  An :class:`EphemerisTable` samples longitude and daily
+speed for every ``EPHE_MAJOR_OBJECTS`` body on a fixed grid, stores them
+as a memory-mapped ``.npy`` (plus a small ``.json`` header) in
+``ephe_tables/`` next to ``ephe/``, and answers arbitrary-time queries by
+cubic Hermite interpolation between the two bracketing samples (position
+and speed at both ends).
+
+Error bound (checked against swisseph in tests/test_ephe_tables.py):
+
+- 1-day step:  ≤ 0.002° (7″) for every body; worst cases are Mercury
+  near inferior conjunction and the Moon (~1.5e-4°).
+- 6-hour step: ≤ 0.0002°; the True Node's short-period wobble dominates.
+
+The South Node is served as North Node + 180°.  Outside the table span,
+:func:`longitudes_at` falls back to Swiss Ephemeris.
+
+Build a table with ``python scripts/build_ephe_tables.py``.
+"""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from .static_data import EPHE_MAJOR_OBJECTS
+
+TABLE_VERSION = 1
+
+EPHE_TABLE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "ephe_tables")
+)
+DEFAULT_TABLE_NAME = "major_daily"
+
+# Documented maximum interpolation error (degrees) by step size (days).
+ERROR_BOUND_DEG = {1.0: 2e-3, 0.25: 2e-4}
+
+_SOUTH_NODE = "South Node"
+_NORTH_NODE = "North Node"
+
+
+def _table_bodies() -> Dict[str, int]:
+    """Bodies stored in a table (South Node is derived, not stored)."""
+    return {n: b for n, b in EPHE_MAJOR_OBJECTS.items() if b >= 0}
+
+
+def error_bound(step_days: float) -> float:
+    """Documented interpolation error bound (degrees) for a table step.
+
+    Steps between the documented ones use the next coarser bound; the
+    Hermite error scales with ``step**4``, so finer steps are conservative.
+    """
+    for step in sorted(ERROR_BOUND_DEG):
+        if step_days <= step:
+            return ERROR_BOUND_DEG[step]
+    coarsest = max(ERROR_BOUND_DEG)
+    return ERROR_BOUND_DEG[coarsest] * (step_days / coarsest) ** 4
+
+
+@dataclass(frozen=True)
+class TableMeta:
+    """Header stored alongside the sample array."""
+    version: int
+    jd_start: float
+    step_days: float
+    n_steps: int
+    bodies: Tuple[str, ...]
+    body_ids: Tuple[int, ...]
+
+    @property
+    def jd_end(self) -> float:
+        return self.jd_start + (self.n_steps - 1) * self.step_days
+
+
+class EphemerisTable:
+    """Sampled ``(longitude, speed)`` per body on a regular JD grid.
+
+    ``data`` has shape ``(n_bodies, n_steps, 2)``: longitude in [0, 360)
+    and longitude speed in degrees/day.
+    """
+
+    def __init__(self, data: np.ndarray, meta: TableMeta) -> None:
+        if data.shape != (len(meta.bodies), meta.n_steps, 2):
+            raise ValueError(f"table shape {data.shape} does not match header")
+        self.data = data
+        self.meta = meta
+        self._index = {name: i for i, name in enumerate(meta.bodies)}
+
+    # ── construction / IO ────────────────────────────────────────────────
+
+    @classmethod
+    def build(
+        cls,
+        jd_start: float,
+        jd_end: float,
+        step_days: float = 1.0,
+        bodies: Optional[Dict[str, int]] = None,
+    ) -> "EphemerisTable":
+        """Sample *bodies* (default: all table bodies) from *jd_start* to *jd_end*."""
+        bodies = dict(bodies) if bodies is not None else _table_bodies()
+        n_steps = int(np.floor((jd_end - jd_start) / step_days + 1e-9)) + 1
+        if n_steps < 2:
+            raise ValueError("table span must cover at least two steps")
+        data = np.empty((len(bodies), n_steps, 2), dtype=np.float64)
+        jds = jd_start + step_days * np.arange(n_steps)
+        for i, ident in enumerate(bodies.values()):
+            for k, jd in enumerate(jds):
+                pos, _ = swe.calc_ut(float(jd), ident)
+                data[i, k, 0] = pos[0]
+                data[i, k, 1] = pos[3]
+        meta = TableMeta(TABLE_VERSION, float(jd_start), float(step_days), n_steps,
+                         tuple(bodies), tuple(bodies.values()))
+        return cls(data, meta)
+
+    def save(self, path: str) -> None:
+        """Write ``<path>.npy`` and ``<path>.json``."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.save(f"{path}.npy", np.ascontiguousarray(self.data))
+        with open(f"{path}.json", "w", encoding="utf-8") as fh:
+            json.dump(asdict(self.meta), fh, indent=2)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "EphemerisTable":
+        """Open a table written by :meth:`save` (memory-mapped by default)."""
+        with open(f"{path}.json", encoding="utf-8") as fh:
+            raw = json.load(fh)
+        if raw.get("version") != TABLE_VERSION:
+            raise ValueError(f"unsupported ephemeris table version {raw.get('version')}")
+        meta = TableMeta(
+            version=raw["version"], jd_start=raw["jd_start"], step_days=raw["step_days"],
+            n_steps=raw["n_steps"], bodies=tuple(raw["bodies"]),
+            body_ids=tuple(raw["body_ids"]),
+        )
+        data = np.load(f"{path}.npy", mmap_mode="r" if mmap else None)
+        return cls(data, meta)
+
+    # ── queries ──────────────────────────────────────────────────────────
+
+    @property
+    def bodies(self) -> Tuple[str, ...]:
+        return self.meta.bodies + ((_SOUTH_NODE,) if _NORTH_NODE in self._index else ())
+
+    def covers(self, jd) -> bool:
+        """True if every JD in *jd* lies inside the sampled span."""
+        arr = np.asarray(jd, dtype=np.float64)
+        return bool(arr.size) and bool(
+            (arr.min() >= self.meta.jd_start) and (arr.max() <= self.meta.jd_end)
+        )
+
+    def interpolate(self, name: str, jd) -> Tuple[np.ndarray, np.ndarray]:
+        """Longitude and speed of *name* at *jd* (scalar or array).
+
+        Raises ``KeyError`` for unknown bodies and ``ValueError`` when *jd*
+        falls outside the table.
+        """
+        if name == _SOUTH_NODE:
+            lon, spd = self.interpolate(_NORTH_NODE, jd)
+            return (lon + 180.0) % 360.0, spd
+        row = self.data[self._index[name]]
+        jd_arr = np.atleast_1d(np.asarray(jd, dtype=np.float64))
+        if not self.covers(jd_arr):
+            raise ValueError("JD outside ephemeris table span")
+
+        h = self.meta.step_days
+        x = (jd_arr - self.meta.jd_start) / h
+        k = np.minimum(np.floor(x).astype(np.int64), self.meta.n_steps - 2)
+        t = x - k
+
+        p0, v0 = row[k, 0], row[k, 1]
+        p1, v1 = row[k + 1, 0], row[k + 1, 1]
+        p1 = p0 + ((p1 - p0 + 180.0) % 360.0 - 180.0)   # unwrap across 0°
+
+        t2 = t * t
+        t3 = t2 * t
+        h00 = 2 * t3 - 3 * t2 + 1
+        h10 = t3 - 2 * t2 + t
+        h01 = -2 * t3 + 3 * t2
+        h11 = t3 - t2
+        lon = (h00 * p0 + h10 * h * v0 + h01 * p1 + h11 * h * v1) % 360.0
+        # derivative of the Hermite basis → speed in deg/day
+        d00 = (6 * t2 - 6 * t) / h
+        d10 = 3 * t2 - 4 * t + 1
+        d01 = (-6 * t2 + 6 * t) / h
+        d11 = 3 * t2 - 2 * t
+        spd = d00 * p0 + d10 * v0 + d01 * p1 + d11 * v1
+        if np.ndim(jd) == 0:
+            return lon[0], spd[0]
+        return lon, spd
+
+    def longitudes(self, jd: float, names: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """``{name: longitude}`` for *names* (default: all bodies) at one JD."""
+        return {n: float(self.interpolate(n, jd)[0]) for n in (names or self.bodies)}
+
+
+@lru_cache(maxsize=4)
+def _load_table(path: str) -> EphemerisTable:
+    return EphemerisTable.load(path)
+
+
+def load_table(path: Optional[str] = None) -> Optional[EphemerisTable]:
+    """Memory-map the table at *path* (default: ``ephe_tables/major_daily``).
+
+    Returns None if it has not been built.  Loaded tables are cached per
+    process; a missing one is looked for again on the next call, so a
+    table built while the process runs is picked up without a restart.
+    """
+    path = path or os.path.join(EPHE_TABLE_DIR, DEFAULT_TABLE_NAME)
+    if not os.path.exists(f"{path}.npy"):
+        return None
+    return _load_table(path)
+
+
+def longitudes_at(
+    jd: float,
+    names: Optional[Sequence[str]] = None,
+    table: Optional[EphemerisTable] = None,
+) -> Dict[str, float]:
+    """Longitudes at *jd* from the table, falling back to Swiss Ephemeris.
+
+    *names* defaults to every ``EPHE_MAJOR_OBJECTS`` body.
+    """
+    table = table if table is not None else load_table()
+    names = list(names or EPHE_MAJOR_OBJECTS)
+    if table is not None and table.covers(jd):
+        return table.longitudes(jd, names)
+    out: Dict[str, float] = {}
+    for name in names:
+        ident = EPHE_MAJOR_OBJECTS[name]
+        if ident == -1:
+            pos, _ = swe.calc_ut(jd, swe.TRUE_NODE)
+            out[name] = (pos[0] + 180.0) % 360.0
+        else:
+            pos, _ = swe.calc_ut(jd, ident)
+            out[name] = pos[0]
+    return out
+
@@ -0,0 +1,156 @@
+"""
+Managed Swiss Ephemeris session.
+
+pyswisseph keeps ``sepl_18.se1`` / ``semo_18.se1`` / ``seas_18.se1`` and
+the most recent numbered asteroid file open between calls, and re-reading
+them is the dominant fixed cost of a chart.  Instead of ``swe.close()``
+after every chart, :data:`EPHEMERIS` keeps one session per process:
+
+- :meth:`EphemerisSession.ensure` sets the ephemeris path once and only
+  closes/reopens when the configured path changes;
+- :meth:`EphemerisSession.checkpoint` (called at the end of
+  ``calculate_chart``) counts the ephemeris files the process holds open
+  and releases them only when that exceeds ``max_handles``.  Counting
+  lists and readlinks every descriptor in ``/proc/self/fd``, so it runs
+  at most once per ``check_every`` charts or ``check_interval`` seconds,
+  whichever comes first.
+
+Swiss Ephemeris state is process-global (pyswisseph is not thread-safe),
+so a single session per process is the right granularity; a lock guards
+path switches.  Process-pool workers each get their own.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+import swisseph as swe
+
+# Repo-bundled ephemeris directory (same default as chart_adapter).
+DEFAULT_EPHE_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "ephe")
+).replace("\\", "/")
+
+# pyswisseph holds ~4 ephemeris files at steady state; anything well past
+# that means handles are leaking and should be released.
+DEFAULT_MAX_HANDLES = 16
+
+# Scan open descriptors after this many charts, or once this many seconds
+# have passed since the last scan.
+DEFAULT_CHECK_EVERY = 32
+DEFAULT_CHECK_INTERVAL_S = 30.0
+
+_FD_DIR = "/proc/self/fd"
+
+
+def configured_ephe_path() -> str:
+    """Return the ephemeris path from ``SE_EPHE_PATH`` or the bundled default."""
+    return os.environ.get("SE_EPHE_PATH") or DEFAULT_EPHE_PATH
+
+
+class EphemerisSession:
+    """Process-wide owner of the Swiss Ephemeris path and file handles."""
+
+    def __init__(self, max_handles: int = DEFAULT_MAX_HANDLES,
+                 check_every: int = DEFAULT_CHECK_EVERY,
+                 check_interval: float = DEFAULT_CHECK_INTERVAL_S) -> None:
+        self.max_handles = max_handles
+        self.check_every = check_every
+        self.check_interval = check_interval
+        self._path: Optional[str] = None
+        self._lock = threading.Lock()
+        self._since_scan = 0
+        self._last_scan: Optional[float] = None
+        self._last_count = 0
+        self.opens = 0
+        self.releases = 0
+        self.scans = 0
+        self.handle_high_water = 0
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    def ensure(self, path: Optional[str] = None) -> str:
+        """Make sure swisseph is pointed at *path* (default: configured path).
+
+        A no-op when the path is unchanged; otherwise closes the old files
+        and sets the new path.
+        """
+        path = path or configured_ephe_path()
+        if path == self._path:
+            return path
+        with self._lock:
+            if path != self._path:
+                if self._path is not None:
+                    swe.close()
+                    self.releases += 1
+                swe.set_ephe_path(path)
+                self._path = path
+                self.opens += 1
+        return path
+
+    def open_handles(self) -> int:
+        """Number of ephemeris (``.se1``) files this process has open.
+
+        Returns -1 where open descriptors cannot be listed (non-Linux).
+        """
+        try:
+            fds = os.listdir(_FD_DIR)
+        except OSError:
+            return -1
+        n = 0
+        for fd in fds:
+            try:
+                if os.readlink(f"{_FD_DIR}/{fd}").endswith(".se1"):
+                    n += 1
+            except OSError:
+                continue
+        return n
+
+    def checkpoint(self, force: bool = False) -> int:
+        """Release handles if more than ``max_handles`` are open.
+
+        Only scans descriptors when ``check_every`` charts or
+        ``check_interval`` seconds have passed since the last scan (or
+        *force* is set); otherwise returns the previous count.
+
+        Returns the handle count observed before any release.
+        """
+        self._since_scan += 1
+        now = time.monotonic()
+        if not (force or self._last_scan is None
+                or self._since_scan >= self.check_every
+                or now - self._last_scan >= self.check_interval):
+            return self._last_count
+        self._since_scan = 0
+        self._last_scan = now
+        self.scans += 1
+        n = self._last_count = self.open_handles()
+        if n > self.handle_high_water:
+            self.handle_high_water = n
+        if n > self.max_handles:
+            self.release()
+        return n
+
+    def release(self) -> None:
+        """Close all ephemeris files; the next :meth:`ensure` reopens them."""
+        with self._lock:
+            swe.close()
+            self._path = None
+            self.releases += 1
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "path": self._path,
+            "opens": self.opens,
+            "releases": self.releases,
+            "scans": self.scans,
+            "handle_high_water": self.handle_high_water,
+            "max_handles": self.max_handles,
+        }
+
+
+EPHEMERIS = EphemerisSession()
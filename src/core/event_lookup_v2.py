@@ -1,14 +1,22 @@
 """
 event_lookup_v2 — Ingress, station, eclipse, and lunation event search.
 
-Loads a JSONL event catalogue and provides :func:`find_nearby_events` to
-locate astrological events within configurable time windows around a
-given date, plus :func:`build_events_html` for display-ready output.
+Provides :func:`find_nearby_events` to locate astrological events within
+configurable time windows around a given date, plus
+:func:`build_events_html` for display-ready output.  Events come from the
+generated :class:`~src.core.events_catalogue.EventCatalogue` (sorted
+epoch-second columns, queried by binary search); a JSONL catalogue at
+*events_path* is still honoured and is indexed once on load.
 """
 
 import functools
 import json
-from datetime import datetime
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+
+from .events_catalogue import EventCatalogue, catalogue_for, epoch_to_datetime
 
 
 @functools.lru_cache(maxsize=1)
@@ -51,11 +59,50 @@ def _format_delta(delta_seconds: float, exact: bool) -> str:
     sign = "after" if delta_seconds > 0 else "before"
     return f"{days} day{'s' if days != 1 else ''} {sign} chart"
 
+@functools.lru_cache(maxsize=4)
+def _jsonl_catalogue(path: str) -> EventCatalogue:
+    """Index the JSONL catalogue at *path* (timestamps parsed once)."""
+    return EventCatalogue.from_records(load_events(path))
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def _window_seconds(kinds) -> np.ndarray:
+    """Per-kind window in seconds; 0 for excluded / unwindowed kinds."""
+    return np.array([0 if k in EXCLUDED else WINDOWS.get(k, 0) * 86400 for k in kinds],
+                    dtype=np.int64)
+
+def _find_in_catalogue(target_dt: datetime, cat: EventCatalogue):
+    if target_dt.tzinfo is None:
+        target_dt = target_dt.replace(tzinfo=timezone.utc)
+    # Whole seconds + microseconds, so deltas equal timedelta.total_seconds().
+    offset = target_dt - _EPOCH
+    target = offset.days * 86400 + offset.seconds
+    reach = max(WINDOWS.values()) * 86400
+    sl = cat.window(target - reach, target + reach + 1)
+    idx = np.arange(sl.start, sl.stop)
+    delta = ((cat.ts[sl] - target) * 10**6 - offset.microseconds) / 10**6
+    win = _window_seconds(cat.kinds)[cat.kind[sl]]
+    keep = (win > 0) & (np.abs(delta) <= win)
+    idx, delta = idx[keep], delta[keep]
+    order = np.argsort(np.abs(delta), kind="stable")
+    results = []
+    for i, d in zip(idx[order], delta[order]):
+        i = int(i)
+        results.append((epoch_to_datetime(int(cat.ts[i])), cat.kinds[cat.kind[i]],
+                        cat.record(i), float(d), bool(cat.exact[i])))
+    return results
+
 def find_nearby_events(target_dt: datetime, events):
-    """Return events within type-specific day windows of *target_dt*, sorted by proximity."""
+    """Return events within type-specific day windows of *target_dt*, sorted by proximity.
+
+    *events* is an :class:`EventCatalogue` (windowed binary search) or a
+    list of JSONL-style dicts (linear scan).
+    """
     results = []
     if not target_dt:
         return results
+    if isinstance(events, EventCatalogue):
+        return _find_in_catalogue(target_dt, events)
     for ev in events:
         etype = (ev.get("type") or "").lower()
         if etype in EXCLUDED:
@@ -72,10 +119,17 @@ def find_nearby_events(target_dt: datetime, events):
     return results
 
 def build_events_html(target_dt: datetime, events_path: str = "events.jsonl", show_no_events: bool = False) -> str:
-    """Render nearby astrological events as HTML paragraphs for display."""
+    """Render nearby astrological events as HTML paragraphs for display.
+
+    Reads the JSONL catalogue at *events_path* when it exists, otherwise the
+    generated events catalogue.
+    """
     if not target_dt:
         return ""
-    events = load_events(events_path)
+    if events_path and os.path.exists(events_path):
+        events = _jsonl_catalogue(events_path)
+    else:
+        events = catalogue_for(target_dt, margin_days=max(WINDOWS.values()))
     matches = find_nearby_events(target_dt, events)
     if not matches:
         return "<p><em>No major events in the nearby window.</em></p>" if show_no_events else ""
@@ -0,0 +1,329 @@
+"""
+Generated, columnar catalogue of ingresses, stations, lunations, eclipses
+and lunar perigees / apogees.
+
+The old ``events.jsonl`` lookup parsed every record's ``timestamp_ut`` on
+every call and scanned the whole list per transit step.  An
+:class:`EventCatalogue` instead holds parallel NumPy columns sorted by
+time:
+
+- ``ts``    — int64 epoch seconds (UT);
+- ``kind``  — uint8 index into ``kinds`` (``"ingress"``, ``"eclipse"`` …);
+- ``label`` — uint16 index into ``labels`` ("Sun enters Aries" …);
+- ``exact`` — bool, False for date-only records.
+
+Window queries are two ``np.searchsorted`` calls.  Catalogues are computed
+from Swiss Ephemeris for a span of years (ingresses and stations via
+:mod:`transit_timeline`, lunations and perigees by bracketing and
+root-finding, eclipses with ``swe.sol_eclipse_when_glob`` /
+``swe.lun_eclipse_when``) and saved as a single compressed ``.npz``.
+
+Build the default catalogue with ``python scripts/build_events_catalogue.py``
+(the Docker image does this at build time).  Without it, or outside its
+span, :func:`catalogue_for` falls back to computing the needed years on
+demand and logs a warning once.
+"""
+from __future__ import annotations
+
+import datetime as dt
+import json
+import logging
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from .ephe_tables import EPHE_TABLE_DIR
+from .ephemeris import EPHEMERIS
+from .transit_timeline import _crossings, _refine, _wrap180, iter_transit_events
+
+_log = logging.getLogger(__name__)
+
+CATALOGUE_VERSION = 1
+DEFAULT_CATALOGUE_NAME = "events"
+DEFAULT_SPAN = (1900, 2100)
+
+EVENT_TYPES = ("ingress", "station", "lunation", "eclipse", "perigee", "apogee")
+
+# The Moon changes sign every ~2.5 days; its ingresses would drown the rest.
+INGRESS_BODIES = ("Sun", "Mercury", "Venus", "Mars", "Jupiter", "Saturn",
+                  "Uranus", "Neptune", "Pluto")
+STATION_BODIES = ("Mercury", "Venus", "Mars", "Jupiter", "Saturn",
+                  "Uranus", "Neptune", "Pluto")
+
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+_JD_EPOCH = 2440587.5
+_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+_SOLAR_KINDS = (
+    (swe.ECL_ANNULAR_TOTAL, "Hybrid Solar Eclipse"),
+    (swe.ECL_TOTAL, "Total Solar Eclipse"),
+    (swe.ECL_ANNULAR, "Annular Solar Eclipse"),
+    (swe.ECL_PARTIAL, "Partial Solar Eclipse"),
+)
+_LUNAR_KINDS = (
+    (swe.ECL_TOTAL, "Total Lunar Eclipse"),
+    (swe.ECL_PARTIAL, "Partial Lunar Eclipse"),
+    (swe.ECL_PENUMBRAL, "Penumbral Lunar Eclipse"),
+)
+
+
+def jd_to_epoch(jd: float) -> int:
+    """Epoch seconds (UT) for a Julian day, rounded to the second."""
+    return int(round((jd - _JD_EPOCH) * 86400.0))
+
+
+def epoch_to_datetime(ts: int) -> dt.datetime:
+    return _EPOCH + dt.timedelta(seconds=int(ts))
+
+
+def datetime_to_epoch(value: dt.datetime) -> int:
+    """Epoch seconds for *value* (naive datetimes are UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt.timezone.utc)
+    return int(round((value - _EPOCH).total_seconds()))
+
+
+class EventCatalogue:
+    """Time-sorted event columns with windowed binary-search queries."""
+
+    def __init__(self, ts: np.ndarray, kind: np.ndarray, label: np.ndarray,
+                 exact: np.ndarray, kinds: Sequence[str], labels: Sequence[str]) -> None:
+        order = np.argsort(ts, kind="stable")
+        self.ts = np.ascontiguousarray(np.asarray(ts, dtype=np.int64)[order])
+        self.kind = np.asarray(kind, dtype=np.uint8)[order]
+        self.label = np.asarray(label, dtype=np.uint16)[order]
+        self.exact = np.asarray(exact, dtype=bool)[order]
+        self.kinds: Tuple[str, ...] = tuple(kinds)
+        self.labels: Tuple[str, ...] = tuple(labels)
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    # ── construction ─────────────────────────────────────────────────────
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[int, str, str, bool]]) -> "EventCatalogue":
+        """Build from ``(epoch_seconds, type, label, exact)`` rows."""
+        kinds: Dict[str, int] = {k: i for i, k in enumerate(EVENT_TYPES)}
+        labels: Dict[str, int] = {}
+        ts, kind, label, exact = [], [], [], []
+        for t, k, lab, ex in rows:
+            ts.append(t)
+            kind.append(kinds.setdefault(k, len(kinds)))
+            label.append(labels.setdefault(lab, len(labels)))
+            exact.append(ex)
+        return cls(np.array(ts, dtype=np.int64), np.array(kind, dtype=np.uint8),
+                   np.array(label, dtype=np.uint16), np.array(exact, dtype=bool),
+                   list(kinds), list(labels))
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "EventCatalogue":
+        """Build from ``events.jsonl``-style dicts (parsed once, here)."""
+        from .event_lookup_v2 import _is_exact_time, _parse_ts
+        rows = []
+        for ev in records:
+            etype = (ev.get("type") or "").lower()
+            label = ev.get("meta", {}).get("subtype", "") or etype.title()
+            rows.append((datetime_to_epoch(_parse_ts(ev["timestamp_ut"])), etype,
+                         label, _is_exact_time(ev)))
+        return cls.from_rows(rows)
+
+    @classmethod
+    def generate(cls, start_year: int, end_year: int) -> "EventCatalogue":
+        """Compute every event from Jan 1 *start_year* to Jan 1 *end_year* (UT)."""
+        EPHEMERIS.ensure()
+        jd0 = swe.julday(start_year, 1, 1, 0.0)
+        jd1 = swe.julday(end_year, 1, 1, 0.0)
+        rows: List[Tuple[int, str, str, bool]] = []
+        rows.extend(_ingress_station_rows(jd0, jd1))
+        rows.extend(_lunation_rows(jd0, jd1))
+        rows.extend(_perigee_rows(jd0, jd1))
+        rows.extend(_eclipse_rows(jd0, jd1))
+        return cls.from_rows(rows)
+
+    @classmethod
+    def concat(cls, parts: Sequence["EventCatalogue"]) -> "EventCatalogue":
+        rows = []
+        for part in parts:
+            rows.extend(part.rows())
+        return cls.from_rows(rows)
+
+    # ── IO ───────────────────────────────────────────────────────────────
+
+    def save(self, path: str) -> None:
+        """Write ``<path>.npz``."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        header = {"version": CATALOGUE_VERSION, "kinds": self.kinds, "labels": self.labels}
+        np.savez_compressed(f"{path}.npz", ts=self.ts, kind=self.kind, label=self.label,
+                            exact=self.exact, header=np.array(json.dumps(header)))
+
+    @classmethod
+    def load(cls, path: str) -> "EventCatalogue":
+        """Read a catalogue written by :meth:`save`."""
+        with np.load(f"{path}.npz", allow_pickle=False) as npz:
+            header = json.loads(str(npz["header"]))
+            if header.get("version") != CATALOGUE_VERSION:
+                raise ValueError(f"unsupported events catalogue version {header.get('version')}")
+            return cls(npz["ts"], npz["kind"], npz["label"], npz["exact"],
+                       header["kinds"], header["labels"])
+
+    # ── queries ──────────────────────────────────────────────────────────
+
+    def covers(self, ts: int) -> bool:
+        return bool(len(self.ts)) and int(self.ts[0]) <= ts <= int(self.ts[-1])
+
+    def window(self, ts_from: int, ts_to: int) -> slice:
+        """Row slice with ``ts_from <= ts <= ts_to``."""
+        lo = int(np.searchsorted(self.ts, ts_from, side="left"))
+        hi = int(np.searchsorted(self.ts, ts_to, side="right"))
+        return slice(lo, hi)
+
+    def rows(self, sl: slice = slice(None)) -> List[Tuple[int, str, str, bool]]:
+        return [(int(t), self.kinds[k], self.labels[lab], bool(ex))
+                for t, k, lab, ex in zip(self.ts[sl], self.kind[sl],
+                                         self.label[sl], self.exact[sl])]
+
+    def record(self, i: int) -> dict:
+        """Row *i* as an ``events.jsonl``-style dict."""
+        ts = epoch_to_datetime(int(self.ts[i]))
+        return {
+            "type": self.kinds[self.kind[i]],
+            "timestamp_ut": ts.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "meta": {"subtype": self.labels[self.label[i]],
+                     "time_listed": bool(self.exact[i])},
+        }
+
+
+# ── generators ───────────────────────────────────────────────────────────
+
+def _ingress_station_rows(jd0: float, jd1: float):
+    for ev in iter_transit_events(None, jd0, jd1, bodies=INGRESS_BODIES, kinds=["ingress"]):
+        suffix = " (retrograde)" if ev.retrograde else ""
+        yield jd_to_epoch(ev.jd_ut), "ingress", f"{ev.body} enters {ev.sign}{suffix}", True
+    for ev in iter_transit_events(None, jd0, jd1, bodies=STATION_BODIES, kinds=["station"]):
+        direction = "retrograde" if ev.retrograde else "direct"
+        yield jd_to_epoch(ev.jd_ut), "station", f"{ev.body} stations {direction}", True
+
+
+def _daily_grid(jd0: float, jd1: float, step: float = 1.0) -> np.ndarray:
+    n = max(1, int(np.ceil((jd1 - jd0) / step)))
+    return np.linspace(jd0, jd1, n + 1)
+
+
+def _elongation(jd: float) -> float:
+    moon, _ = swe.calc_ut(jd, swe.MOON, _FLAGS)
+    sun, _ = swe.calc_ut(jd, swe.SUN, _FLAGS)
+    return (moon[0] - sun[0]) % 360.0
+
+
+def _lunation_rows(jd0: float, jd1: float):
+    grid = _daily_grid(jd0, jd1)
+    elong = np.array([_elongation(float(t)) for t in grid])
+    for target, label in ((0.0, "New Moon"), (180.0, "Full Moon")):
+        f = _wrap180(elong - target)
+        for k in np.flatnonzero(_crossings(f)):
+            t = _refine(lambda x, c=target: _wrap180(_elongation(x) - c),
+                        float(grid[k]), float(grid[k + 1]), float(f[k]), float(f[k + 1]))
+            if jd0 < t <= jd1:
+                yield jd_to_epoch(t), "lunation", label, True
+
+
+def _moon_distance_speed(jd: float) -> float:
+    pos, _ = swe.calc_ut(jd, swe.MOON, _FLAGS)
+    return pos[5]
+
+
+def _perigee_rows(jd0: float, jd1: float):
+    # Half-day grid: the distance-speed curve has sharp turns near perigee.
+    grid = _daily_grid(jd0, jd1, 0.5)
+    spd = np.array([_moon_distance_speed(float(t)) for t in grid])
+    f0, f1 = spd[:-1], spd[1:]
+    for k in np.flatnonzero(((f0 < 0) & (f1 >= 0)) | ((f0 > 0) & (f1 <= 0))):
+        t = _refine(_moon_distance_speed, float(grid[k]), float(grid[k + 1]),
+                    float(f0[k]), float(f1[k]))
+        if jd0 < t <= jd1:
+            if f0[k] < 0:
+                yield jd_to_epoch(t), "perigee", "Lunar Perigee", True
+            else:
+                yield jd_to_epoch(t), "apogee", "Lunar Apogee", True
+
+
+def _eclipse_label(flags: int, table) -> str:
+    for bit, label in table:
+        if flags & bit:
+            return label
+    return table[-1][1]
+
+
+def _eclipse_rows(jd0: float, jd1: float):
+    t = jd0
+    while True:
+        flags, tret = swe.sol_eclipse_when_glob(t, swe.FLG_SWIEPH, 0, False)
+        if tret[0] > jd1:
+            break
+        yield jd_to_epoch(tret[0]), "eclipse", _eclipse_label(flags, _SOLAR_KINDS), True
+        t = tret[0] + 1.0
+    t = jd0
+    while True:
+        flags, tret = swe.lun_eclipse_when(t, swe.FLG_SWIEPH, 0, False)
+        if tret[0] > jd1:
+            break
+        yield jd_to_epoch(tret[0]), "eclipse", _eclipse_label(flags, _LUNAR_KINDS), True
+        t = tret[0] + 1.0
+
+
+# ── loading ──────────────────────────────────────────────────────────────
+
+# Catalogue paths already reported missing (warned once each).
+_MISSING: set = set()
+
+
+@lru_cache(maxsize=4)
+def _load_catalogue(path: str) -> EventCatalogue:
+    return EventCatalogue.load(path)
+
+
+def load_catalogue(path: Optional[str] = None) -> Optional[EventCatalogue]:
+    """Load the catalogue at *path* (default: ``ephe_tables/events``).
+
+    Returns None if it has not been built.  Loaded catalogues are cached
+    per process; a missing one is looked for again on the next call.
+    """
+    path = path or os.path.join(EPHE_TABLE_DIR, DEFAULT_CATALOGUE_NAME)
+    if not os.path.exists(f"{path}.npz"):
+        if path not in _MISSING:
+            _MISSING.add(path)
+            _log.warning("No events catalogue at %s.npz; generating years on demand "
+                         "(build it with scripts/build_events_catalogue.py)", path)
+        return None
+    return _load_catalogue(path)
+
+
+@lru_cache(maxsize=16)
+def _year_catalogue(year: int) -> EventCatalogue:
+    return EventCatalogue.generate(year, year + 1)
+
+
+@lru_cache(maxsize=8)
+def _span_catalogue(first: int, last: int) -> EventCatalogue:
+    if first == last:
+        return _year_catalogue(first)
+    return EventCatalogue.concat([_year_catalogue(y) for y in range(first, last + 1)])
+
+
+def catalogue_for(when: dt.datetime, margin_days: float = 7.0) -> EventCatalogue:
+    """Catalogue covering *when* ± *margin_days*.
+
+    Uses the prebuilt catalogue when it spans that window, otherwise
+    computes (and caches) the calendar years involved.
+    """
+    ts = datetime_to_epoch(when)
+    margin = int(margin_days * 86400)
+    built = load_catalogue()
+    if built is not None and built.covers(ts - margin) and built.covers(ts + margin):
+        return built
+    return _span_catalogue(epoch_to_datetime(ts - margin).year,
+                           epoch_to_datetime(ts + margin).year)
@@ -0,0 +1,104 @@
+"""
+Vectorised house engine.
+
+Computes cusps for every supported house system as ``(12,)`` NumPy arrays
+and assigns houses for many longitudes at once with ``np.searchsorted``
+on the unwrapped cusp circle, replacing per-object linear scans.
+
+Placidus, Koch, Campanus, Regiomontanus and Porphyry come from
+``swe.houses_ex`` (memoised per chart by the :class:`PositionProvider`);
+Equal and Whole Sign are derived from the Ascendant in-process.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from .positions import PositionProvider
+
+# Canonical key → Swiss Ephemeris house-system code.
+HOUSE_SYSTEM_CODES: Dict[str, bytes] = {
+    "placidus": b"P",
+    "equal": b"E",
+    "whole": b"W",
+    "koch": b"K",
+    "campanus": b"C",
+    "regiomontanus": b"R",
+    "porphyry": b"O",
+}
+
+HOUSE_SYSTEM_LABELS: Dict[str, str] = {
+    "placidus": "Placidus",
+    "equal": "Equal",
+    "whole": "Whole Sign",
+    "koch": "Koch",
+    "campanus": "Campanus",
+    "regiomontanus": "Regiomontanus",
+    "porphyry": "Porphyry",
+}
+
+# Systems written to chart.house_cusps / the positions DataFrame.
+LEGACY_SYSTEMS = ("placidus", "equal", "whole")
+
+_ALIASES = {
+    "whole sign": "whole",
+    "wholesign": "whole",
+    "equal house": "equal",
+}
+
+
+def canonical_house_system(name: Optional[str]) -> str:
+    """Normalise a display name / alias ("Whole Sign", "Koch") to its key."""
+    key = (name or "placidus").strip().lower()
+    return _ALIASES.get(key, key)
+
+
+def compute_cusps(
+    provider: PositionProvider,
+    lat: float,
+    lon: float,
+    systems: Iterable[str] = tuple(HOUSE_SYSTEM_CODES),
+    asc: Optional[float] = None,
+) -> Dict[str, np.ndarray]:
+    """Return ``{system: cusps}`` with 12 cusp longitudes in [0, 360) per system.
+
+    *asc* (the Placidus Ascendant) is reused for Equal / Whole Sign when
+    given; otherwise it is read from the Placidus table.
+    """
+    out: Dict[str, np.ndarray] = {}
+    for sys in systems:
+        sys = canonical_house_system(sys)
+        code = HOUSE_SYSTEM_CODES.get(sys)
+        if code is None:
+            raise ValueError(f"Unknown house system: {sys}")
+        if sys in ("equal", "whole"):
+            if asc is None:
+                _, ascmc = provider.houses(lat, lon, b"P")
+                if ascmc is None:
+                    raise ValueError("Swiss Ephemeris could not calculate the Ascendant")
+                asc = ascmc[0]
+            start = asc if sys == "equal" else int(asc // 30) * 30.0
+            out[sys] = (start + 30.0 * np.arange(12)) % 360.0
+        else:
+            cusps, _ = provider.houses(lat, lon, code)
+            if cusps is None:
+                raise ValueError(f"Swiss Ephemeris could not calculate {HOUSE_SYSTEM_LABELS[sys]} houses")
+            out[sys] = np.asarray(cusps[:12], dtype=np.float64) % 360.0
+    return out
+
+
+def assign_houses(lons, cusps) -> np.ndarray:
+    """House numbers (1..12) for each longitude in *lons* given 12 *cusps*.
+
+    Cusps are unwrapped to a monotone run starting at cusp 1; each
+    longitude is mapped onto the same run and located with
+    ``np.searchsorted``.  A longitude exactly on a cusp belongs to the house
+    that cusp opens, matching ``calc_v2._house_of_degree``.
+    """
+    cusps = np.asarray(cusps, dtype=np.float64)
+    lons = np.atleast_1d(np.asarray(lons, dtype=np.float64))
+    c0 = cusps[0]
+    unwrapped = c0 + (cusps - c0) % 360.0
+    offsets = c0 + (lons - c0) % 360.0
+    return np.searchsorted(unwrapped, offsets, side="right").astype(np.int64)
@@ -14,6 +14,7 @@ import json
 import os
 from dataclasses import dataclass, field
 from typing import Union, List, Optional, Any, Dict, Literal, ClassVar  # Added Literal here
+import numpy as np
 import pandas as pd
 from .static_data import GLYPHS, SHAPES, MAJOR_OBJECTS, EPHE_MAJOR_OBJECTS, ALL_MAJOR_PLACEMENTS, ASPECTS, ASPECT_INTERP, DIGNITIES, RECEPTION_SYMBOLS, ELEMENT, MODE, SIGNS, SIGN_ANATOMY, LUMINARIES_AND_PLANETS, PLANETS_PLUS, ABREVIATED_PLANET_NAMES, PLANETARY_RULERS, DIGNITY_MEANINGS, DIGNITIES, _RECEPTION_ASPECTS, ALIASES_MEANINGS, ABREVIATED_PLANET_NAMES, OBJECT_MEANINGS, OBJECT_MEANINGS_SHORT, LONG_OBJECT_MEANINGS, ASPECTS_BY_SIGN, SIGN_MEANINGS, HOUSE_MEANINGS, ASPECT_INTERP, SIGN_AXIS_INTERP, HOUSE_AXIS_INTERP, COMPASS_AXIS_INTERP, HOUSE_SYSTEM_INTERP, HOUSE_INTERP, SIGN_GLYPH, ZODIAC_NUMBERS, POLARITY, SHORT_ASPECT_MEANINGS, SENTENCE_ASPECT_MEANINGS, CATEGORY_MAP, CATEGORY_INSTRUCTIONS, LONG_HOUSE_MEANINGS, MALEFICS, BENEFICS, OBJECT_TYPE, SYNASTRY_COLORS_1, SYNASTRY_COLORS_2, ZODIAC_SIGNS, ZODIAC_COLORS, GROUP_COLORS, GROUP_COLORS_LIGHT, SUBSHAPE_COLORS, SUBSHAPE_COLORS_LIGHT, TOGGLE_ASPECTS, ORDERED_OBJECTS_FOCUS, SETNENCE_ASPECT_NAMES, ASPECT_CONDUCTANCE, DIGNITY_SCORES, TRIPLICITY_RULERS, TERMS, FACES, SIGN_ELEMENT
 
@@ -646,6 +647,10 @@ class HouseCusp:
             "whole": "Whole Sign",
             "whole sign": "Whole Sign",
             "wholesign": "Whole Sign",
+            "koch": "Koch",
+            "campanus": "Campanus",
+            "regiomontanus": "Regiomontanus",
+            "porphyry": "Porphyry",
         }
         label = system_map.get(sys_key, "Placidus")
         return {
@@ -1190,6 +1195,102 @@ class DetectedShape:
             return default
 
 
+# Process-wide ChartDerivedCache counters: {artifact key: {"hits": n, "recomputes": n}}
+_DERIVED_CACHE_STATS: Dict[str, Dict[str, int]] = {}
+
+
+def _stat_key(key: Any) -> str:
+    """Flatten a cache key such as ``("edges", False)`` to a stats label."""
+    if isinstance(key, tuple):
+        return ":".join(str(k) for k in key)
+    return str(key)
+
+
+class ChartDerivedCache:
+    """Per-chart memo of artifacts derived from object positions.
+
+    Holds the values every pipeline stage would otherwise recompute from the
+    same longitudes — the aspect kernel pass (separation matrix), aspect
+    edges, the ``{name: degree}`` positions dict.  Each entry is stored with
+    a signature of the chart's objects (name, longitude, speed, declination)
+    and is transparently recomputed if the objects have changed since.
+
+    Never serialised: ``to_json`` / ``from_json`` ignore it and a rehydrated
+    chart starts with an empty cache.
+    """
+
+    __slots__ = ("_entries", "hits", "recomputes")
+
+    def __init__(self) -> None:
+        self._entries: Dict[Any, tuple] = {}
+        self.hits = 0
+        self.recomputes = 0
+
+    @staticmethod
+    def signature(chart: "AstrologicalChart") -> tuple:
+        """Cheap fingerprint of everything the cached artifacts depend on."""
+        return tuple(
+            (o.object_name.name, o.longitude, o.speed, o.declination)
+            for o in (chart.objects or [])
+            if o.object_name
+        )
+
+    def get(self, chart: "AstrologicalChart", key: Any, compute, signature: Optional[tuple] = None):
+        """Return the artifact *key* for *chart*, calling ``compute()`` on a miss."""
+        sig = self.signature(chart) if signature is None else signature
+        stats = _DERIVED_CACHE_STATS.setdefault(_stat_key(key), {"hits": 0, "recomputes": 0})
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == sig:
+            self.hits += 1
+            stats["hits"] += 1
+            return entry[1]
+        value = compute()
+        self._entries[key] = (sig, value)
+        self.recomputes += 1
+        stats["recomputes"] += 1
+        return value
+
+    def peek(self, chart: "AstrologicalChart", key: Any):
+        """Return the cached artifact *key* if present and still valid, else None."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == self.signature(chart):
+            return entry[1]
+        return None
+
+    def invalidate(self, key: Any = None) -> None:
+        """Drop one artifact, or everything when *key* is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return this chart's hit/recompute counts and cached keys."""
+        return {
+            "hits": self.hits,
+            "recomputes": self.recomputes,
+            "keys": sorted(_stat_key(k) for k in self._entries),
+        }
+
+    def __deepcopy__(self, memo):
+        # Cached arrays are re-derivable; a copied chart starts cold.
+        return ChartDerivedCache()
+
+    def __reduce__(self):
+        # Same for pickling (process pools, session stores): ship it empty.
+        return (ChartDerivedCache, ())
+
+
+def derived_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Snapshot of process-wide ChartDerivedCache hits / recomputes per artifact."""
+    return {k: dict(v) for k, v in _DERIVED_CACHE_STATS.items()}
+
+
+def reset_derived_cache_stats() -> None:
+    """Zero the process-wide ChartDerivedCache counters."""
+    _DERIVED_CACHE_STATS.clear()
+
+
 @dataclass
 class AstrologicalChart:
     """Complete astrological chart with all celestial objects and house cusps."""
@@ -1246,12 +1347,45 @@ class AstrologicalChart:
     circuit_names: dict = field(default_factory=dict)       # {"circuit_name_0": "...", ...}
     group_id: Optional[str] = field(default=None)           # UUID of user_profile_groups row
 
+    # Cusps for every supported house system (incl. Koch, Campanus,
+    # Regiomontanus, Porphyry) as 12-element arrays; see src/core/houses.py.
+    # house_cusps only carries the Placidus / Equal / Whole Sign rows.
+    cusp_arrays: Dict[str, np.ndarray] = field(default_factory=dict, repr=False, compare=False)
+
+    # Memoised position-derived artifacts (aspect pass, edges, positions);
+    # see ChartDerivedCache.  Not part of equality or serialisation.
+    derived: ChartDerivedCache = field(default_factory=ChartDerivedCache, repr=False, compare=False)
+
     def __getattr__(self, name: str):
         """Gracefully return None for fields missing on cached / older instances."""
         # Gracefully return None for fields that don't exist on cached instances
         # (e.g. after schema additions between hot-reloads / session resumes).
+        # Dunder lookups (pickle's __setstate__, copy's __deepcopy__, …) must
+        # still raise so protocol probing falls back to the defaults.
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
         return None
 
+    def cusps_for(self, house_system: Optional[str] = "placidus") -> Optional[np.ndarray]:
+        """Return the 12 cusp longitudes for *house_system* as an array, or None.
+
+        Reads ``cusp_arrays`` (all systems, filled by calculate_chart) and
+        falls back to the ``house_cusps`` rows for charts that predate it.
+        """
+        from .houses import canonical_house_system
+        key = canonical_house_system(house_system)
+        arr = (self.cusp_arrays or {}).get(key)
+        if arr is not None:
+            return arr
+        rows = sorted(
+            (c for c in (self.house_cusps or [])
+             if canonical_house_system(c.house_system) == key),
+            key=lambda c: c.cusp_number,
+        )
+        if len(rows) != 12:
+            return None
+        return np.array([float(c.absolute_degree) for c in rows])
+
     def to_dataframe(self) -> pd.DataFrame:
         """
         Convert the chart to a pandas DataFrame.
@@ -1272,7 +1406,8 @@ class AstrologicalChart:
         """Serialise the chart to a JSON-safe dict for Supabase storage.
 
         Heavy computed fields (planetary_states, circuit_simulation,
-        mutual_receptions) are omitted — they are recomputed on demand.
+        mutual_receptions) are omitted — they are recomputed on demand,
+        once per chart, by ``derived_state.ensure_derived_state``.
         """
         import json
         import math
@@ -1362,6 +1497,7 @@ class AstrologicalChart:
             # ── Objects & cusps ─────────────────────────────────────────
             "objects": [obj.to_dict() for obj in (self.objects or [])],
             "house_cusps": [c.to_json() for c in (self.house_cusps or [])],
+            "cusp_arrays": {k: [float(x) for x in v] for k, v in (self.cusp_arrays or {}).items()},
             # ── DataFrames ───────────────────────────────────────────────
             "df_positions": _df_to_records(self.df_positions),
             "aspect_df": _df_to_records(self.aspect_df),
@@ -1452,6 +1588,11 @@ class AstrologicalChart:
         chart = cls(
             objects=objects,
             house_cusps=house_cusps,
+            cusp_arrays={
+                k: np.asarray(v, dtype=np.float64)
+                for k, v in (d.get("cusp_arrays") or {}).items()
+                if isinstance(v, list) and len(v) == 12
+            },
             chart_datetime=d.get("chart_datetime", ""),
             timezone=d.get("timezone", ""),
             latitude=float(d.get("latitude") or 0.0),
@@ -1483,6 +1624,21 @@ class AstrologicalChart:
         )
         return chart
 
+    def to_compact(self, compress: bool = True) -> Dict[str, Any]:
+        """Slim, versioned session-storage form; see src/core/chart_store.py.
+
+        Keeps only objects, cusps and metadata — derived data is rebuilt by
+        :meth:`from_compact`.
+        """
+        from .chart_store import pack_chart
+        return pack_chart(self, compress=compress)
+
+    @classmethod
+    def from_compact(cls, d: Dict[str, Any]) -> "AstrologicalChart":
+        """Reconstruct a chart (with derived data) from :meth:`to_compact` output."""
+        from .chart_store import unpack_chart
+        return unpack_chart(d)
+
     def get_object(self, name: str) -> Optional[ChartObject]:
         """Return the ChartObject with the given name, or None."""
         for obj in self.objects:
@@ -8,14 +8,15 @@ component grouping, and parent-shape assignment.
 """
 from __future__ import annotations
 
-from itertools import combinations, permutations
+from bisect import bisect_left, bisect_right
+from itertools import combinations
 from typing import Sequence
 
 import networkx as nx
 
 import src.rendering.profiles_v2 as _profiles_mod
 from . import calc_v2 as _calc_mod
-from .models_v2 import DetectedShape
+from .models_v2 import AstrologicalChart, DetectedShape
 
 
 # Mirror the ASPECTS dict structure expected by the legacy pattern logic.
@@ -83,11 +84,18 @@ def build_patterns_from_edges(pos: dict[str, float], edges_major: Sequence[tuple
     return connected_components_from_edges(nodes, formatted_edges)
 
 def prepare_pattern_inputs(df, edges_major: Sequence[tuple] | None = None):
-    """Return (pos, patterns, major_edges_all) ready for shape detection."""
+    """Return (pos, patterns, major_edges_all) ready for shape detection.
+
+    *df* may also be an AstrologicalChart; positions and default edges then
+    come from the chart's derived-data cache instead of a DataFrame scan.
+    """
 
     if edges_major is None:
         edges_major, _, _ = build_aspect_edges(df)
-    pos = positions_from_dataframe(df)
+    if isinstance(df, AstrologicalChart):
+        pos = _calc_mod.chart_positions(df)
+    else:
+        pos = positions_from_dataframe(df)
     formatted_edges = edges_from_major_list(edges_major)
     patterns = connected_components_from_edges(list(pos.keys()), formatted_edges)
     return pos, patterns, formatted_edges
@@ -168,6 +176,250 @@ def _cluster_conjunctions_for_detection(pos, members, orb=None):
 
     return rep_pos, rep_map, rep_anchor
 
+# -------------------------------
+# Typed adjacency index for shape matching
+# -------------------------------
+# Candidate generation is deliberately a little looser than the real checks
+# (angle tests carry this tolerance) so the index never misses a shape the
+# exact has_edge / aspect_ok predicates would accept; those predicates still
+# make the final call.
+_INDEX_EPS = 1e-9
+
+
+def _iter_bits(mask):
+    """Yield the set bit positions of *mask* in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _angle(d1, d2):
+    angle = abs((d1 - d2) % 360)
+    return 360 - angle if angle > 180 else angle
+
+
+class _ShapeIndex:
+    """Per-aspect neighbour bitsets over the representatives of one component.
+
+    ``has[aspect][i]`` is a bitset of the representatives *j* for which
+    ``has_edge(R[i], R[j], aspect)`` may hold; ``ok[aspect][i]`` does the same
+    for ``aspect_ok``.  Each ``*_candidates`` method expands one shape template
+    along only the edges it needs and returns the candidate node tuples in
+    the order the old ``combinations`` / ``permutations`` scan visited them,
+    so the detection loops below produce identical output.
+    """
+
+    HAS_ASPECTS = ("Sextile", "Square", "Trine", "Opposition")
+    OK_ASPECTS = ("Trine", "Opposition")
+
+    def __init__(self, R, rep_pos, pos, edge_lookup, widen_orb=False, slack=0.75):
+        self.R = R
+        n = len(R)
+        idx = {r: i for i, r in enumerate(R)}
+        has = {asp: [0] * n for asp in self.HAS_ASPECTS}
+        ok = {asp: [0] * n for asp in self.OK_ASPECTS}
+
+        for key, asps in edge_lookup.items():
+            u, v = tuple(key)
+            i, j = idx[u], idx[v]
+            for asp in asps:
+                if asp in has:
+                    has[asp][i] |= 1 << j
+                    has[asp][j] |= 1 << i
+
+        for i in range(n):
+            for j in range(i + 1, n):
+                a, b = R[i], R[j]
+                if widen_orb:
+                    d1, d2 = pos.get(a), pos.get(b)
+                    if d1 is not None and d2 is not None:
+                        angle = _angle(d1, d2)
+                        for asp in self.HAS_ASPECTS:
+                            data = ASPECTS[asp]
+                            if abs(angle - data["angle"]) <= data["orb"] * 1.5 + _INDEX_EPS:
+                                has[asp][i] |= 1 << j
+                                has[asp][j] |= 1 << i
+                da, db = rep_pos.get(a, pos.get(a)), rep_pos.get(b, pos.get(b))
+                if da is None or db is None:
+                    continue
+                angle = _angle(da, db)
+                for asp in self.OK_ASPECTS:
+                    data = ASPECTS[asp]
+                    if abs(angle - data["angle"]) <= data["orb"] + slack + _INDEX_EPS:
+                        ok[asp][i] |= 1 << j
+                        ok[asp][j] |= 1 << i
+        for asp in self.OK_ASPECTS:
+            ok[asp] = [o | h for o, h in zip(ok[asp], has[asp])]
+
+        self.has = has
+        self.ok = ok
+
+    def _names(self, found):
+        return [tuple(self.R[i] for i in t) for t in sorted(found)]
+
+    def _above(self, mask, i):
+        """Bits of *mask* strictly above position *i*."""
+        return mask >> (i + 1) << (i + 1)
+
+    def envelope_candidates(self):
+        """Sextile chain a-b-c-d-e with a/d, b/e opposed and a/e, b/d trine."""
+        sex = self.has["Sextile"]
+        opp, tri = self.ok["Opposition"], self.ok["Trine"]
+        found = set()
+        for c in range(len(self.R)):
+            for b in _iter_bits(sex[c]):
+                for d in _iter_bits(self._above(sex[c], b)):
+                    if not (tri[b] >> d) & 1:
+                        continue
+                    used = (1 << b) | (1 << c) | (1 << d)
+                    for a in _iter_bits(sex[b] & opp[d] & ~used):
+                        for e in _iter_bits(sex[d] & opp[b] & tri[a] & ~used & ~(1 << a)):
+                            found.add(tuple(sorted((a, b, c, d, e))))
+        return self._names(found)
+
+    def grand_cross_candidates(self):
+        """Two oppositions whose four endpoints are squared all round."""
+        sq, opp = self.has["Square"], self.has["Opposition"]
+        found = set()
+        for a in range(len(self.R)):
+            for c in _iter_bits(self._above(opp[a], a)):
+                both = sq[a] & sq[c]
+                for b in _iter_bits(both):
+                    for d in _iter_bits(self._above(both & opp[b], b)):
+                        if len({a, b, c, d}) == 4:
+                            found.add(tuple(sorted((a, b, c, d))))
+        return self._names(found)
+
+    def mystic_rectangle_candidates(self):
+        """Two sextiles a-b, c-d with a/c, b/d opposed and a/d, b/c trine."""
+        sex = self.has["Sextile"]
+        opp, tri = self.ok["Opposition"], self.ok["Trine"]
+        found = set()
+        for a in range(len(self.R)):
+            for b in _iter_bits(sex[a]):
+                for c in _iter_bits(opp[a] & tri[b]):
+                    for d in _iter_bits(sex[c] & opp[b] & tri[a]):
+                        if len({a, b, c, d}) == 4:
+                            found.add(tuple(sorted((a, b, c, d))))
+        return self._names(found)
+
+    def cradle_candidates(self):
+        """Ordered sextile chain a-b-c-d with a/d opposed and a/c, b/d trine."""
+        sex, tri, opp = self.has["Sextile"], self.has["Trine"], self.has["Opposition"]
+        found = set()
+        for a in range(len(self.R)):
+            for d in _iter_bits(opp[a]):
+                for b in _iter_bits(sex[a] & tri[d]):
+                    for c in _iter_bits(sex[b] & sex[d] & tri[a]):
+                        if len({a, b, c, d}) == 4:
+                            found.add((a, b, c, d))
+        return self._names(found)
+
+    def _trine_triangles(self, tri):
+        for a in range(len(self.R)):
+            for b in _iter_bits(self._above(tri[a], a)):
+                for c in _iter_bits(self._above(tri[a] & tri[b], b)):
+                    yield a, b, c
+
+    def kite_candidates(self):
+        """Grand trine plus a fourth body opposing one of its corners."""
+        tri, opp = self.has["Trine"], self.has["Opposition"]
+        found = set()
+        for a, b, c in self._trine_triangles(tri):
+            trio = (1 << a) | (1 << b) | (1 << c)
+            for apex in _iter_bits((opp[a] | opp[b] | opp[c]) & ~trio):
+                found.add(tuple(sorted((a, b, c, apex))))
+        return self._names(found)
+
+    def grand_trine_candidates(self):
+        return self._names(set(self._trine_triangles(self.ok["Trine"])))
+
+    def t_square_candidates(self):
+        """Opposition a-b with an apex squaring both ends."""
+        sq, opp = self.has["Square"], self.has["Opposition"]
+        found = set()
+        for a in range(len(self.R)):
+            for b in _iter_bits(self._above(opp[a], a)):
+                for apex in _iter_bits(sq[a] & sq[b] & ~((1 << a) | (1 << b))):
+                    found.add(tuple(sorted((a, b, apex))))
+        return self._names(found)
+
+    def wedge_candidates(self):
+        """Opposition x-y plus a third body trine or sextile to either end.
+
+        Wedge and Sextile Wedge are decided by per-aspect pair counts, and a
+        representative pair can carry several aspects once conjunction
+        clusters are merged, so these two templates stay deliberately wide.
+        """
+        sex, tri, opp = self.has["Sextile"], self.has["Trine"], self.has["Opposition"]
+        everyone = (1 << len(self.R)) - 1
+        found = set()
+        for x in range(len(self.R)):
+            for y in _iter_bits(self._above(opp[x], x)):
+                third = tri[x] | sex[x] | tri[y] | sex[y]
+                if (tri[x] >> y) & 1 and (sex[x] >> y) & 1:
+                    third = everyone
+                for z in _iter_bits(third & ~((1 << x) | (1 << y))):
+                    found.add(tuple(sorted((x, y, z))))
+        return self._names(found)
+
+    def sextile_wedge_candidates(self):
+        """Trine x-y plus a third body sextile to at least one end."""
+        sex, tri = self.has["Sextile"], self.has["Trine"]
+        found = set()
+        for x in range(len(self.R)):
+            for y in _iter_bits(self._above(tri[x], x)):
+                for z in _iter_bits((sex[x] | sex[y]) & ~((1 << x) | (1 << y))):
+                    found.add(tuple(sorted((x, y, z))))
+        return self._names(found)
+
+
+class _LongitudeIndex:
+    """Sorted-longitude lookup for "which bodies sit at ±angle from x".
+
+    ``near(x, aspect)`` answers with two ``bisect`` range queries instead of
+    a scan over every position.  Windows are widened by ``_INDEX_EPS`` so the
+    result is a superset of what ``aspect_match`` accepts; callers still run
+    the exact check, in ``order`` (the original ``pos`` key order).
+    """
+
+    def __init__(self, pos):
+        self.order = {name: i for i, name in enumerate(pos)}
+        ranked = sorted((lon % 360.0, name) for name, lon in pos.items())
+        self.lons = [lon for lon, _ in ranked]
+        self.names = [name for _, name in ranked]
+        self.pos = pos
+        self._near = {}
+
+    def _window(self, center, width):
+        lo = (center - width) % 360.0
+        hi = lo + 2 * width
+        i = bisect_left(self.lons, lo)
+        j = bisect_right(self.lons, hi)
+        out = set(self.names[i:j])
+        if hi >= 360.0:
+            out.update(self.names[:bisect_right(self.lons, hi - 360.0)])
+        return out
+
+    def near(self, name, aspect):
+        """Names whose longitude may lie within orb of *aspect* from *name*."""
+        key = (name, aspect)
+        out = self._near.get(key)
+        if out is None:
+            data = ASPECTS[aspect]
+            x = self.pos[name] % 360.0
+            width = data["orb"] + _INDEX_EPS
+            out = self._window(x + data["angle"], width)
+            if data["angle"] not in (0, 180):
+                out |= self._window(x - data["angle"], width)
+            self._near[key] = out
+        return out
+
+    def in_order(self, names):
+        return sorted(names, key=self.order.__getitem__)
+
+
 # -------------------------------
 # Shape detection - FIXED VERSION
 # -------------------------------
@@ -299,25 +551,12 @@ def _detect_shapes_for_members(pos, members, parent_idx, sid_start, major_edges_
         data = ASPECTS[aspect]
         return abs(angle - data["angle"]) <= (data["orb"] + slack)
 
-    def aspect_ok(a, b, aspect, slack=0.75):
-        """Return True if the aspect exists or is very close within slack degrees."""
-        if has_edge(a, b, aspect):
-            return True
-
-        da = rep_pos.get(a, pos.get(a))
-        db = rep_pos.get(b, pos.get(b))
-        if da is None or db is None:
-            return False
-
-        angle = abs((da - db) % 360)
-        if angle > 180:
-            angle = 360 - angle
-
-        data = ASPECTS[aspect]
-        return abs(angle - data["angle"]) <= (data["orb"] + slack)
+    # Candidate node sets come from typed adjacency bitsets rather than
+    # combinations(R, k); the checks below still decide each candidate.
+    index = _ShapeIndex(R, rep_pos, pos, edge_lookup, widen_orb=widen_orb)
 
     # Envelope (5 nodes, chain of 4 Sextiles, with Oppositions and Trines)
-    for quint in combinations(R, 5):
+    for quint in index.envelope_candidates():
         opp_pairs = [
             pair
             for pair in combinations(quint, 2)
@@ -399,7 +638,7 @@ def _detect_shapes_for_members(pos, members, parent_idx, sid_start, major_edges_
                 break
 
     # Grand Cross
-    for quad in combinations(R, 4):
+    for quad in index.grand_cross_candidates():
         a, b, c, d = quad
         if (has_edge(a, c, "Opposition") and has_edge(b, d, "Opposition") and
             has_edge(a, b, "Square") and has_edge(b, c, "Square") and
@@ -418,7 +657,7 @@ def _detect_shapes_for_members(pos, members, parent_idx, sid_start, major_edges_
                      {"suppress": suppresses})
 
     # Mystic Rectangle
-    for quad in combinations(R, 4):
+    for quad in index.mystic_rectangle_candidates():
         a, b, c, d = quad
         sextile_specs = [
             ((a, b), "Sextile"),
@@ -453,7 +692,7 @@ def _detect_shapes_for_members(pos, members, parent_idx, sid_start, major_edges_
                  {"suppress": suppresses})
 
     # Cradle
-    for quad in permutations(R, 4):
+    for quad in index.cradle_candidates():
         a, b, c, d = quad
         if (has_edge(a, b, "Sextile") and has_edge(b, c, "Sextile") and
             has_edge(c, d, "Sextile") and has_edge(a, d, "Opposition") and
@@ -472,7 +711,7 @@ def _detect_shapes_for_members(pos, members, parent_idx, sid_start, major_edges_
             break
 
     # Kite
-    for quad in combinations(R, 4):
+    for quad in index.kite_candidates():
         for trio in combinations(quad, 3):
             a, b, c = trio
             apex = list(set(quad) - set(trio))[0]
@@ -507,7 +746,7 @@ def _detect_shapes_for_members(pos, members, parent_idx, sid_start, major_edges_
                         break
 
     # Grand Trine
-    for trio in combinations(R, 3):
+    for trio in index.grand_trine_candidates():
         a, b, c = trio
         tri_specs = [
             ((a, b), "Trine"),
@@ -529,7 +768,7 @@ def _detect_shapes_for_members(pos, members, parent_idx, sid_start, major_edges_
         add_once("Grand Trine", (a, b, c), candidate_edges)
 
     # T-Square
-    for trio in combinations(R, 3):
+    for trio in index.t_square_candidates():
         for apex in trio:
             a, b = [n for n in trio if n != apex]
             if (has_edge(a, b, "Opposition") and
@@ -543,7 +782,7 @@ def _detect_shapes_for_members(pos, members, parent_idx, sid_start, major_edges_
                 break
 
     # Wedge
-    for trio in combinations(R, 3):
+    for trio in index.wedge_candidates():
         pairs = list(combinations(trio, 2))
         opp = [p for p in pairs if has_edge(p[0], p[1], "Opposition")]
         tri = [p for p in pairs if has_edge(p[0], p[1], "Trine")]
@@ -553,7 +792,7 @@ def _detect_shapes_for_members(pos, members, parent_idx, sid_start, major_edges_
             add_once("Wedge", trio, candidate_edges)
 
     # Sextile Wedge
-    for trio in combinations(R, 3):
+    for trio in index.sextile_wedge_candidates():
         pairs = list(combinations(trio, 2))
         tri = [p for p in pairs if has_edge(p[0], p[1], "Trine")]
         sex = [p for p in pairs if has_edge(p[0], p[1], "Sextile")]
@@ -567,8 +806,40 @@ def _detect_shapes_for_members(pos, members, parent_idx, sid_start, major_edges_
 # -------------------------------
 # Detect shapes (public API)
 # -------------------------------
-def detect_shapes(pos, patterns, major_edges_all):
-    """Detect geometric aspect patterns across all connected components."""
+def _component_pass(cache, pos, mems, parent_idx, sid_start, major_edges_all, widen_orb):
+    """Run _detect_shapes_for_members, reusing *cache* for unchanged components.
+
+    The key covers everything the per-component pass reads: the members in
+    iteration order (ties in longitude are broken by that order), their
+    positions, and the major edges between them.  Cached shapes are stored
+    with ids from 0 and parent 0, then relabelled for this call.
+    """
+    if cache is None:
+        return _detect_shapes_for_members(
+            pos, mems, parent_idx, sid_start, major_edges_all, widen_orb=widen_orb
+        )
+    members = tuple(mems)
+    members_set = set(members)
+    comp_edges = frozenset(
+        ((u, v), asp) for (u, v), asp in major_edges_all
+        if u in members_set and v in members_set
+    )
+    key = (widen_orb, tuple((m, pos.get(m)) for m in members), comp_edges)
+    hit = cache.get(key)
+    if hit is None:
+        hit, _ = _detect_shapes_for_members(pos, members, 0, 0, major_edges_all, widen_orb=widen_orb)
+        cache[key] = hit
+    shapes = [dict(sh, id=sh["id"] + sid_start, parent=parent_idx) for sh in hit]
+    return shapes, sid_start + len(hit)
+
+def detect_shapes(pos, patterns, major_edges_all, component_cache=None):
+    """Detect geometric aspect patterns across all connected components.
+
+    *component_cache* (any mapping, e.g. a ``cachetools.LRUCache``) lets
+    callers that re-run detection on mostly unchanged inputs — the combined
+    biwheel engine — skip the per-component passes for components whose
+    members, positions and edges are the same as last time.
+    """
     shapes = []
     sid = 0
     used_members = set()
@@ -579,8 +850,8 @@ def detect_shapes(pos, patterns, major_edges_all):
     # strict pass
     # -------------------------------
     for parent_idx, mems in enumerate(patterns):
-        s_here, sid = _detect_shapes_for_members(
-            pos, mems, parent_idx, sid, major_edges_all, widen_orb=False
+        s_here, sid = _component_pass(
+            component_cache, pos, mems, parent_idx, sid, major_edges_all, widen_orb=False
         )
         shapes.extend(s_here)
         for sh in s_here:
@@ -605,16 +876,23 @@ def detect_shapes(pos, patterns, major_edges_all):
         data = ASPECTS[target_aspect]
         return abs(angle - data["angle"]) <= data["orb"]
 
+    # member → indices of the patterns containing it
+    member_patterns = {}
+    for idx, mems in enumerate(patterns):
+        for m in set(mems):
+            member_patterns.setdefault(m, []).append(idx)
+
     def assign_parent_for_special(members, fallback=0):
         """Find the connected-component index that best contains *members*."""
-        for idx, mems in enumerate(patterns):
-            if all(m in mems for m in members):
-                return idx
-        for idx, mems in enumerate(patterns):
-            hits = sum(1 for m in members if m in mems)
-            if hits >= 2:
-                return idx
-        return fallback
+        hits = {}
+        for m in members:
+            for idx in member_patterns.get(m, ()):
+                hits[idx] = hits.get(idx, 0) + 1
+        full = [idx for idx, n in hits.items() if n == len(members)]
+        if full:
+            return min(full)
+        partial = [idx for idx, n in hits.items() if n >= 2]
+        return min(partial) if partial else fallback
 
     def add_special(sh_type, members, edges, suppresses=None):
         """Register a special-pass shape (Yod, Lightning Bolt, etc.) with dedup."""
@@ -648,33 +926,44 @@ def detect_shapes(pos, patterns, major_edges_all):
         for (u, v), asp in edges:
             used_edges.add((tuple(sorted((u, v))), asp))
 
-    # loop edges → add special shapes
+    # loop edges → add special shapes; third vertices come from range
+    # queries on the longitude index, visited in the original pos order
+    lon_index = _LongitudeIndex(pos)
+
+    def third_candidates(*pairs):
+        """Bodies that may complete ``(x, aspect_x, y, aspect_y)`` for any pair."""
+        found = set()
+        for x, asp_x, y, asp_y in pairs:
+            found |= lon_index.near(x, asp_x) & lon_index.near(y, asp_y)
+        return lon_index.in_order(found)
+
     for (a, b), asp in major_edges_all:
         # Yod
         if aspect_match(a, b, "Sextile"):
-            for c in pos.keys():
+            for c in third_candidates((a, "Quincunx", b, "Quincunx")):
                 if c not in (a, b) and aspect_match(a, c, "Quincunx") and aspect_match(b, c, "Quincunx"):
                     edges = [((a, b), "Sextile"), ((a, c), "Quincunx"), ((b, c), "Quincunx")]
                     add_special("Yod", [a, b, c], edges)
 
+        if not aspect_match(a, b, "Square"):
+            continue
+
         # Wide Yod
-        if aspect_match(a, b, "Square"):
-            for c in pos.keys():
-                if c not in (a, b) and aspect_match(a, c, "Sesquisquare") and aspect_match(b, c, "Sesquisquare"):
-                    edges = [((a, b), "Square"), ((a, c), "Sesquisquare"), ((b, c), "Sesquisquare")]
-                    add_special("Wide Yod", [a, b, c], edges)
+        for c in third_candidates((a, "Sesquisquare", b, "Sesquisquare")):
+            if c not in (a, b) and aspect_match(a, c, "Sesquisquare") and aspect_match(b, c, "Sesquisquare"):
+                edges = [((a, b), "Square"), ((a, c), "Sesquisquare"), ((b, c), "Sesquisquare")]
+                add_special("Wide Yod", [a, b, c], edges)
 
         # Unnamed
-        if aspect_match(a, b, "Square"):
-            for c in pos.keys():
-                if c in (a, b):
-                    continue
-                if aspect_match(a, c, "Trine") and aspect_match(b, c, "Quincunx"):
-                    edges = [((a, b), "Square"), ((a, c), "Trine"), ((b, c), "Quincunx")]
-                    add_special("Unnamed", [a, b, c], edges)
-                elif aspect_match(b, c, "Trine") and aspect_match(a, c, "Quincunx"):
-                    edges = [((a, b), "Square"), ((b, c), "Trine"), ((a, c), "Quincunx")]
-                    add_special("Unnamed", [a, b, c], edges)
+        for c in third_candidates((a, "Trine", b, "Quincunx"), (b, "Trine", a, "Quincunx")):
+            if c in (a, b):
+                continue
+            if aspect_match(a, c, "Trine") and aspect_match(b, c, "Quincunx"):
+                edges = [((a, b), "Square"), ((a, c), "Trine"), ((b, c), "Quincunx")]
+                add_special("Unnamed", [a, b, c], edges)
+            elif aspect_match(b, c, "Trine") and aspect_match(a, c, "Quincunx"):
+                edges = [((a, b), "Square"), ((b, c), "Trine"), ((a, c), "Quincunx")]
+                add_special("Unnamed", [a, b, c], edges)
 
     # ⚡ Lightning Bolt collapse (after Unnameds exist)
     unnamed_info = []
@@ -760,8 +1049,8 @@ def detect_shapes(pos, patterns, major_edges_all):
         leftovers = set(mems) - used_members
         if not leftovers:
             continue
-        s_here_approx, sid = _detect_shapes_for_members(
-            pos, leftovers, parent_idx, sid, major_edges_all, widen_orb=True
+        s_here_approx, sid = _component_pass(
+            component_cache, pos, leftovers, parent_idx, sid, major_edges_all, widen_orb=True
         )
         for sh in s_here_approx:
             sh["approx"] = True
@@ -882,34 +1171,31 @@ def apply_suppression(shapes):
         "Unnamed": 0,
     }
 
-    for i, s_big in enumerate(shapes):
+    # Shapes by (type, member set), and every (type, member set) that some
+    # shape's "keep" map protects; both are fixed for the whole pass.
+    by_key = {}
+    for j, sh in enumerate(shapes):
+        by_key.setdefault((sh["type"], frozenset(sh["members"])), []).append(j)
+    kept = set()
+    for sh in shapes:
+        for s_type, sets in sh.get("suppresses", {}).get("keep", {}).items():
+            kept.update((s_type, members) for members in sets)
+
+    for s_big in shapes:
         if "suppresses" not in s_big:
             continue
-        sup_data = s_big["suppresses"]
-        sup_sets = sup_data.get("suppress", {})
-        keep_sets = sup_data.get("keep", {})
+        sup_sets = s_big["suppresses"].get("suppress", {})
+        big_priority = priority.get(s_big["type"], 0)
 
         for s_type, sub_sets in sup_sets.items():
+            # Only suppress if big shape has >= priority than small one
+            if big_priority < priority.get(s_type, 0):
+                continue
             for sub_members in sub_sets:
-                for j, s_small in enumerate(shapes):
-                    if j in suppressed:
-                        continue
-                    if s_small["type"] != s_type:
-                        continue
-                    if frozenset(s_small["members"]) == sub_members:
-                        # Only suppress if big shape has >= priority than small one
-                        if priority.get(s_big["type"], 0) >= priority.get(s_small["type"], 0):
-                            # Check keep rules
-                            keep_hit = False
-                            for env in [sh for sh in shapes if "keep" in sh.get("suppresses", {})]:
-                                keep_map = env["suppresses"]["keep"]
-                                if (s_small["type"] in keep_map and
-                                    frozenset(s_small["members"]) in keep_map[s_small["type"]]):
-                                    keep_hit = True
-                                    break
-                            if keep_hit:
-                                continue
-                            suppressed.add(j)
+                key = (s_type, sub_members)
+                if key in kept:
+                    continue
+                suppressed.update(by_key.get(key, ()))
 
         # Never suppress Lightning Bolt
     return [s for i, s in enumerate(shapes) if i not in suppressed or s["type"] == "Lightning Bolt"]
@@ -955,15 +1241,17 @@ def detect_minor_links_from_dataframe(df, edges_major: Sequence[tuple] | None =
 def detect_minor_links_from_chart(chart, edges_major: Sequence[tuple] | None = None):
     """Wrapper for Chart objects analogous to the dataframe variant.
 
-    The chart object is converted to a DataFrame via ``to_dataframe()`` so that
-    :func:`prepare_pattern_inputs` (which expects a DataFrame) works correctly.
-    Returns the same ``(connections, singleton_map)`` tuple produced by
+    An AstrologicalChart is handed straight to :func:`prepare_pattern_inputs`,
+    which reads its cached positions; other objects exposing
+    ``to_dataframe()`` are converted first.  Returns the same
+    ``(connections, singleton_map)`` tuple produced by
     :func:`detect_minor_links_with_singletons`.
     """
-    # Convert AstrologicalChart to DataFrame so positions_from_dataframe can
-    # process it; fall back to using the object as-is if it is already a
-    # DataFrame (backward-compatible).
-    if hasattr(chart, "to_dataframe"):
+    # Fall back to using the object as-is if it is already a DataFrame
+    # (backward-compatible).
+    if isinstance(chart, AstrologicalChart):
+        df = chart
+    elif hasattr(chart, "to_dataframe"):
         df = chart.to_dataframe()
     else:
         df = chart  # assume it is already a DataFrame
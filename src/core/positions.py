@@ -0,0 +1,172 @@
+"""
+Per-instant position provider over Swiss Ephemeris.
+
+:class:`PositionProvider` wraps one Julian day and fetches each body's
+ecliptic coordinates with a single ``swe.calc_ut`` call, memoised for the
+life of the provider.  Declination / right ascension are derived
+in-process from those coordinates and the true obliquity of date, rather
+than a second ``calc_ut(..., FLG_EQUATORIAL)`` call — Swiss Ephemeris
+performs the same rotation internally, so results agree to float
+rounding.  House tables are memoised per (lat, lon, system) the same way.
+
+``calculate_chart`` creates one provider per chart, so North/South Node,
+the Sun/Moon used by the Part of Fortune, and the Placidus table used for
+angles, Vertex and cusps are each computed once.
+
+Providers may also share a process-wide :class:`BodyPositionCache`
+(:data:`POSITION_CACHE`, used by the transit path): body positions are
+location-independent and keyed by quantised JD + flags, so every user
+asking for the same moment shares them; only house tables are keyed by
+lat/lon as well.
+"""
+from __future__ import annotations
+
+import math
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+import swisseph as swe
+from cachetools import TTLCache
+
+# Flags used for ecliptic positions (calc_ut's own default).
+DEFAULT_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+def ecliptic_to_equatorial(lon: float, lat: float, eps: float) -> Tuple[float, float]:
+    """Rotate ecliptic ``(lon, lat)`` by obliquity *eps* (all degrees) → ``(ra, decl)``."""
+    lam, beta, e = math.radians(lon), math.radians(lat), math.radians(eps)
+    sin_l, cos_b, sin_b = math.sin(lam), math.cos(beta), math.sin(beta)
+    cos_e, sin_e = math.cos(e), math.sin(e)
+    decl = math.asin(max(-1.0, min(1.0, sin_b * cos_e + cos_b * sin_e * sin_l)))
+    ra = math.atan2(sin_l * cos_e - math.tan(beta) * sin_e, math.cos(lam))
+    return math.degrees(ra) % 360.0, math.degrees(decl)
+
+
+# JD quantum for cache keys: one second of time.  Inputs are minute-resolution,
+# so this only absorbs float noise in julday() results.
+JD_QUANTUM = 1.0 / 86400.0
+
+
+def _jd_key(jd: float) -> int:
+    return int(round(jd / JD_QUANTUM))
+
+
+class BodyPositionCache:
+    """Thread-safe LRU/TTL cache of body positions and house tables.
+
+    Body entries are keyed by ``(jd_q, body, flags)`` and shared across all
+    locations; house entries by ``(jd_q, lat, lon, hsys)``.  Positions are
+    deterministic, so the TTL only bounds how long idle moments hold memory.
+    """
+
+    def __init__(self, maxsize: int = 20000, ttl: float = 3600.0,
+                 house_maxsize: int = 4096) -> None:
+        self._bodies: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._houses: TTLCache = TTLCache(maxsize=house_maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._counts = {"body_hits": 0, "body_misses": 0,
+                        "house_hits": 0, "house_misses": 0}
+
+    def _get(self, cache: TTLCache, kind: str, key, compute: Callable[[], tuple]):
+        with self._lock:
+            hit = cache.get(key)
+            if hit is not None:
+                self._counts[f"{kind}_hits"] += 1
+                return hit
+            self._counts[f"{kind}_misses"] += 1
+        value = compute()
+        with self._lock:
+            cache[key] = value
+        return value
+
+    def body(self, jd: float, body: int, flags: int, compute: Callable[[], tuple]) -> tuple:
+        return self._get(self._bodies, "body", (_jd_key(jd), body, flags), compute)
+
+    def houses(self, jd: float, lat: float, lon: float, hsys: bytes,
+               compute: Callable[[], tuple]) -> tuple:
+        return self._get(self._houses, "house", (_jd_key(jd), lat, lon, hsys), compute)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bodies.clear()
+            self._houses.clear()
+            for k in self._counts:
+                self._counts[k] = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Hit/miss counters, hit rates and current sizes."""
+        with self._lock:
+            c = dict(self._counts)
+            out: Dict[str, object] = dict(c)
+            for kind in ("body", "house"):
+                total = c[f"{kind}_hits"] + c[f"{kind}_misses"]
+                out[f"{kind}_hit_rate"] = round(c[f"{kind}_hits"] / total, 4) if total else None
+            out["body_entries"] = len(self._bodies)
+            out["house_entries"] = len(self._houses)
+            return out
+
+
+# Shared by every transit chart in the process.
+POSITION_CACHE = BodyPositionCache()
+
+
+class PositionProvider:
+    """Memoised body positions and house tables for a single Julian day (UT)."""
+
+    def __init__(self, jd: float, flags: int = DEFAULT_FLAGS,
+                 cache: Optional[BodyPositionCache] = None) -> None:
+        self.jd = jd
+        self.flags = flags
+        self.cache = cache
+        self._ecl: Dict[int, Tuple[float, ...]] = {}
+        self._houses: Dict[Tuple[float, float, bytes], Tuple[tuple, tuple]] = {}
+        self._eps: Optional[float] = None
+        self.swe_calls = 0
+
+    @property
+    def obliquity(self) -> float:
+        """True obliquity of the ecliptic (degrees) at this JD."""
+        if self._eps is None:
+            self._eps = self.ecliptic(swe.ECL_NUT)[0]
+        return self._eps
+
+    def _calc(self, body: int) -> tuple:
+        pos, _ = swe.calc_ut(self.jd, body, self.flags)
+        self.swe_calls += 1
+        return pos
+
+    def ecliptic(self, body: int) -> Tuple[float, ...]:
+        """``(lon, lat, dist, lon_speed, lat_speed, dist_speed)`` for *body*."""
+        pos = self._ecl.get(body)
+        if pos is None:
+            if self.cache is not None:
+                pos = self.cache.body(self.jd, body, self.flags, lambda: self._calc(body))
+            else:
+                pos = self._calc(body)
+            self._ecl[body] = pos
+        return pos
+
+    def equatorial(self, body: int) -> Tuple[float, float]:
+        """``(ra, decl)`` in degrees for *body*, derived from its ecliptic position."""
+        pos = self.ecliptic(body)
+        return ecliptic_to_equatorial(pos[0], pos[1], self.obliquity)
+
+    def declination(self, body: int) -> float:
+        return self.equatorial(body)[1]
+
+    def houses(self, lat: float, lon: float, hsys: bytes = b'P') -> Tuple[tuple, tuple]:
+        """Memoised ``swe.houses_ex`` → ``(cusps, ascmc)``."""
+        key = (lat, lon, hsys)
+        out = self._houses.get(key)
+        if out is None:
+            if self.cache is not None:
+                out = self.cache.houses(self.jd, lat, lon, hsys,
+                                        lambda: self._calc_houses(lat, lon, hsys))
+            else:
+                out = self._calc_houses(lat, lon, hsys)
+            self._houses[key] = out
+        return out
+
+    def _calc_houses(self, lat: float, lon: float, hsys: bytes) -> Tuple[tuple, tuple]:
+        self.swe_calls += 1
+        return swe.houses_ex(self.jd, lat, lon, hsys)
@@ -0,0 +1,290 @@
+"""
+Streaming transit timeline: aspect hits, sign ingresses and stations.
+
+:func:`iter_transit_events` walks a date range in :data:`CHUNK_DAYS`
+chunks and yields :class:`TransitEvent` objects in time order, computing
+each chunk only when the consumer asks for it.  Callers page through
+years of transits with ``itertools.islice`` (or by restarting at the last
+event's ``jd_ut``) without paying for the whole range up front.
+
+Events are found by bracketing and root-finding rather than sampling:
+
+1. every transiting body is sampled once a day with ``swe.calc_ut``;
+2. stations are bracketed by a sign change in longitude speed and solved
+   on the speed;
+3. station times are added to the daily grid as breakpoints, so
+   longitude is monotonic on every segment and each target offset can be
+   crossed at most once per segment;
+4. aspect hits (``wrap(lon - natal - angle)``) and ingresses
+   (``wrap(lon - 30k)``) are bracketed by sign changes on those segments
+   and solved by Illinois false position against Swiss Ephemeris.
+
+Times are exact to :data:`ROOT_TOL_DAYS` (about one second).
+"""
+from __future__ import annotations
+
+import datetime as dt
+import math
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import swisseph as swe
+
+from .calc_v2 import _ASPECTS_ALL, chart_positions
+from .ephemeris import EPHEMERIS
+from .models_v2 import AstrologicalChart
+from .static_data import EPHE_MAJOR_OBJECTS, SIGNS
+
+# Transiting bodies used when the caller does not choose.
+TIMELINE_BODIES = (
+    "Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter",
+    "Saturn", "Uranus", "Neptune", "Pluto", "North Node", "Chiron",
+)
+TIMELINE_ASPECTS = ("Conjunction", "Sextile", "Square", "Trine", "Opposition")
+# Natal points aspected by default besides the ephemeris bodies.
+TIMELINE_ANGLES = ("AC", "MC")
+EVENT_KINDS = ("aspect", "ingress", "station")
+
+# Bodies whose stations are not reported (never retrograde, or the True
+# Node's daily wobble, which is not a station in the usual sense).
+_NO_STATIONS = {"Sun", "Moon", "North Node", "South Node", "Black Moon Lilith (Mean)"}
+
+CHUNK_DAYS = 30.0
+SAMPLE_DAYS = 1.0
+ROOT_TOL_DAYS = 1.0 / 86400.0
+
+_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+TimeLike = Union[float, dt.datetime]
+
+
+@dataclass(frozen=True)
+class TransitEvent:
+    """One exact transit event.
+
+    ``kind`` is ``"aspect"`` (``target`` / ``aspect`` set), ``"ingress"``
+    (``sign`` is the sign entered) or ``"station"`` (``retrograde`` True
+    for a station retrograde).  For aspects and ingresses ``retrograde``
+    is the transiting body's motion at the event.
+    """
+    kind: str
+    jd_ut: float
+    body: str
+    longitude: float
+    target: Optional[str] = None
+    aspect: Optional[str] = None
+    sign: Optional[str] = None
+    retrograde: bool = False
+
+    @property
+    def when(self) -> dt.datetime:
+        """UTC datetime of the event (rounded to the second)."""
+        return jd_to_datetime(self.jd_ut)
+
+    def to_dict(self) -> Dict[str, object]:
+        d = asdict(self)
+        d["timestamp_ut"] = self.when.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return d
+
+
+# ── time helpers ──────────────────────────────────────────────────────────
+
+def to_jd(value: TimeLike) -> float:
+    """Julian day (UT) for a JD or a datetime (naive datetimes are UTC)."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    hour = value.hour + value.minute / 60.0 + (value.second + value.microsecond / 1e6) / 3600.0
+    return swe.julday(value.year, value.month, value.day, hour)
+
+
+def jd_to_datetime(jd: float) -> dt.datetime:
+    """UTC datetime for a Julian day, rounded to the second."""
+    y, m, d, hour = swe.revjul(jd)
+    base = dt.datetime(y, m, d, tzinfo=dt.timezone.utc)
+    return base + dt.timedelta(seconds=round(hour * 3600.0))
+
+
+def _wrap180(x):
+    """Map degrees to [-180, 180)."""
+    return (x + 180.0) % 360.0 - 180.0
+
+
+# ── ephemeris access ─────────────────────────────────────────────────────
+
+def _lon_speed(jd: float, name: str) -> Tuple[float, float]:
+    ident = EPHE_MAJOR_OBJECTS[name]
+    if ident == -1:
+        pos, _ = swe.calc_ut(jd, swe.TRUE_NODE, _FLAGS)
+        return (pos[0] + 180.0) % 360.0, pos[3]
+    pos, _ = swe.calc_ut(jd, ident, _FLAGS)
+    return pos[0], pos[3]
+
+
+def _refine(g: Callable[[float], float], a: float, b: float, ga: float, gb: float,
+            tol: float = ROOT_TOL_DAYS, max_iter: int = 60) -> float:
+    """Root of *g* in ``[a, b]`` (``ga``/``gb`` of opposite sign) by Illinois false position."""
+    if ga == 0.0:
+        return a
+    if gb == 0.0:
+        return b
+    c = b
+    for _ in range(max_iter):
+        c = b - gb * (b - a) / (gb - ga)
+        gc = g(c)
+        if gc == 0.0 or abs(b - a) < tol:
+            return c
+        if (gc < 0) != (gb < 0):
+            a, ga = b, gb
+        else:
+            ga *= 0.5
+        b, gb = c, gc
+    return c
+
+
+def _crossings(f: np.ndarray) -> np.ndarray:
+    """Segment indices *k* where ``f`` crosses zero in ``(t_k, t_k+1]``.
+
+    ``f`` has shape ``(n,)`` or ``(n, m)``.  Jumps of 180° or more are
+    wrap-around discontinuities, not roots.
+    """
+    f0, f1 = f[:-1], f[1:]
+    cross = ((f0 < 0) & (f1 >= 0)) | ((f0 > 0) & (f1 <= 0))
+    return cross & (np.abs(f1 - f0) < 180.0)
+
+
+# ── per-chunk search ─────────────────────────────────────────────────────
+
+def _sample(name: str, grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    lons = np.empty(len(grid))
+    spds = np.empty(len(grid))
+    for k, jd in enumerate(grid):
+        lons[k], spds[k] = _lon_speed(float(jd), name)
+    return lons, spds
+
+
+def _body_events(
+    name: str,
+    grid: np.ndarray,
+    targets: Sequence[Tuple[str, float]],
+    aspects: Sequence[Tuple[str, float]],
+    kinds: Iterable[str],
+) -> List[TransitEvent]:
+    events: List[TransitEvent] = []
+    lons, spds = _sample(name, grid)
+
+    def lon_at(t: float) -> float:
+        return _lon_speed(t, name)[0]
+
+    # Stations → also breakpoints that make longitude monotonic per segment.
+    times, longs, speeds = list(grid), list(lons), list(spds)
+    if name not in _NO_STATIONS:
+        f0, f1 = spds[:-1], spds[1:]
+        for k in np.flatnonzero(((f0 > 0) & (f1 <= 0)) | ((f0 < 0) & (f1 >= 0))):
+            t = _refine(lambda x: _lon_speed(x, name)[1],
+                        float(grid[k]), float(grid[k + 1]), float(f0[k]), float(f1[k]))
+            lon, spd = _lon_speed(t, name)
+            times.append(t)
+            longs.append(lon)
+            speeds.append(spd)
+            if "station" in kinds:
+                events.append(TransitEvent("station", t, name, lon,
+                                           retrograde=bool(spds[k] > 0)))
+    order = np.argsort(times, kind="stable")
+    T = np.asarray(times)[order]
+    L = np.asarray(longs)[order]
+    S = np.asarray(speeds)[order]
+
+    if "ingress" in kinds:
+        signs = np.floor(L / 30.0).astype(int) % 12
+        for k in np.flatnonzero(signs[:-1] != signs[1:]):
+            s0, s1 = signs[k], signs[k + 1]
+            boundary = 30.0 * (s1 if (s1 - s0) % 12 == 1 else s0)
+            g = lambda x, c=boundary: _wrap180(lon_at(x) - c)  # noqa: E731
+            t = _refine(g, float(T[k]), float(T[k + 1]),
+                        float(_wrap180(L[k] - boundary)), float(_wrap180(L[k + 1] - boundary)))
+            lon, spd = _lon_speed(t, name)
+            entered = SIGNS[int(s1)]
+            events.append(TransitEvent("ingress", t, name, lon, sign=entered,
+                                       retrograde=spd < 0))
+
+    if "aspect" in kinds and targets and aspects:
+        offsets = []
+        for target, t_lon in targets:
+            for asp, angle in aspects:
+                for off in {angle % 360.0, (-angle) % 360.0}:
+                    offsets.append((target, asp, (t_lon + off) % 360.0))
+        centers = np.array([c for _, _, c in offsets])
+        F = _wrap180(L[:, None] - centers[None, :])
+        for k, j in zip(*np.nonzero(_crossings(F))):
+            target, asp, center = offsets[j]
+            g = lambda x, c=center: _wrap180(lon_at(x) - c)  # noqa: E731
+            t = _refine(g, float(T[k]), float(T[k + 1]), float(F[k, j]), float(F[k + 1, j]))
+            lon, spd = _lon_speed(t, name)
+            events.append(TransitEvent("aspect", t, name, lon, target=target,
+                                       aspect=asp, retrograde=spd < 0))
+    return events
+
+
+def _default_targets(natal: AstrologicalChart) -> Dict[str, float]:
+    pos = chart_positions(natal)
+    keep = set(EPHE_MAJOR_OBJECTS) | set(TIMELINE_ANGLES)
+    return {n: lon for n, lon in pos.items() if n in keep}
+
+
+# ── public API ───────────────────────────────────────────────────────────
+
+def iter_transit_events(
+    natal: Optional[AstrologicalChart],
+    start: TimeLike,
+    end: TimeLike,
+    *,
+    bodies: Sequence[str] = TIMELINE_BODIES,
+    aspects: Sequence[str] = TIMELINE_ASPECTS,
+    targets: Optional[Union[Sequence[str], Dict[str, float]]] = None,
+    kinds: Iterable[str] = EVENT_KINDS,
+    chunk_days: float = CHUNK_DAYS,
+) -> Iterator[TransitEvent]:
+    """Yield transit events with ``start < jd_ut <= end`` in time order.
+
+    *natal* supplies the aspect targets (its planets/points plus AC and MC
+    by default); pass *targets* as names to restrict them, or as a
+    ``{name: longitude}`` dict to aspect arbitrary points.  *natal* may be
+    None when only ingresses and stations are wanted.
+
+    The generator is lazy: each :data:`CHUNK_DAYS` chunk is computed when
+    the consumer reaches it.
+    """
+    kinds = set(kinds)
+    unknown = kinds - set(EVENT_KINDS)
+    if unknown:
+        raise ValueError(f"Unknown transit event kind(s): {sorted(unknown)}")
+    for name in bodies:
+        if name not in EPHE_MAJOR_OBJECTS:
+            raise ValueError(f"Unknown transiting body: {name}")
+    aspect_angles = [(a, float(_ASPECTS_ALL[a]["angle"])) for a in aspects]
+
+    if isinstance(targets, dict):
+        target_pos = dict(targets)
+    else:
+        available = _default_targets(natal) if natal is not None else {}
+        if targets is not None:
+            pos = chart_positions(natal) if natal is not None else {}
+            available = {n: pos[n] for n in targets if n in pos}
+        target_pos = available
+    target_list = [(n, float(lon) % 360.0) for n, lon in target_pos.items()]
+
+    jd0, jd1 = to_jd(start), to_jd(end)
+    EPHEMERIS.ensure()
+    while jd0 < jd1:
+        chunk_end = min(jd0 + chunk_days, jd1)
+        n = max(1, int(math.ceil((chunk_end - jd0) / SAMPLE_DAYS)))
+        grid = np.linspace(jd0, chunk_end, n + 1)
+        events: List[TransitEvent] = []
+        for name in bodies:
+            events.extend(_body_events(name, grid, target_list, aspect_angles, kinds))
+        events.sort(key=lambda e: e.jd_ut)
+        yield from events
+        jd0 = chunk_end
@@ -4,11 +4,16 @@ Chat pipeline — the blocking LLM call extracted from app.py.
 
 This module contains zero UI dependencies.  All NiceGUI state values are
 passed as arguments so the function never touches ``app.storage.user``.
+
+:class:`PipelineStream` runs the same turn in a worker thread and yields
+the reply's text deltas as they are generated, for the chat bubble.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-from typing import Any
+from typing import Any, AsyncIterator, Callable, Optional
 
 _log = logging.getLogger(__name__)
 
@@ -64,12 +69,17 @@ def run_pipeline(
     voice: str,
     agent_notes: str,
     pending_q: str,
+    on_delta: Optional[Callable[[str], None]] = None,
 ) -> tuple[str, dict, dict]:
     """Blocking call — run from ``run.io_bound`` thread.
 
     All NiceGUI state values are passed as arguments so that this function
     never touches ``app.storage.user``.
 
+    If *on_delta* is given, the synthesis is streamed and each text delta
+    is passed to it (on this thread) as it arrives; the return value is
+    the same either way.
+
     Returns ``(response_text, meta, state_updates)`` where *state_updates*
     is a dict of keys to write back into the per-user state.
     """
@@ -77,6 +87,8 @@ def run_pipeline(
     from src.mcp.prose_synthesizer import synthesize, SynthesisResult
     from src.mcp.agent_memory import AgentMemory
     from src.mcp.comprehension_models import PersonProfile, Location, LocationLink
+    from src.mcp.reading_cache import READING_CACHE, synthesis_key
+    from src.chart_cache import chart_fingerprint
 
     state_updates: dict = {}
 
@@ -192,6 +204,12 @@ def run_pipeline(
             },
             "step3_circuit": getattr(packet, "debug_circuit_summary", {}),
             "step5_synthesis": {},
+            "reading_cache": {
+                "comprehension": (
+                    "hit" if getattr(packet, "debug_comprehension_cached", False) is True
+                    else "miss"),
+                "synthesis": "off",
+            },
         }
 
     except Exception as exc:
@@ -222,16 +240,44 @@ def run_pipeline(
             state_updates,
         )
 
+    # Opt-in: a cached reading ignores this session's conversation so far.
+    synth_key = cached = None
+    if READING_CACHE.synthesis_enabled and not pending_q:
+        fingerprints = [chart_fingerprint(chart)]
+        if chart_b is not None:
+            fingerprints.append(chart_fingerprint(chart_b))
+        synth_key = synthesis_key(fingerprints, actual_question,
+                                  mode=_synth_mode, voice=voice, model=model,
+                                  house_system=house_system, agent_notes=agent_notes,
+                                  known_persons=_persons, known_locations=_locations)
+        cached = READING_CACHE.get("synthesis", synth_key)
+        _dev["reading_cache"]["synthesis"] = "hit" if cached is not None else "miss"
+
     try:
-        result: SynthesisResult = synthesize(
-            packet,
-            backend="openrouter",
-            model=model,
-            mode=_synth_mode,
-            voice=voice.lower(),
-            api_key=api_key,
-            agent_memory=mem,
-        )
+        if cached is not None:
+            result: SynthesisResult = cached
+            meta["cached"] = True
+            if on_delta is not None:
+                on_delta(result.text)
+        else:
+            synthesis = synthesize(
+                packet,
+                backend="openrouter",
+                model=model,
+                mode=_synth_mode,
+                voice=voice.lower(),
+                api_key=api_key,
+                agent_memory=mem,
+                stream=on_delta is not None,
+            )
+            if on_delta is None:
+                result = synthesis
+            else:
+                for delta in synthesis:
+                    on_delta(delta)
+                result = synthesis.result
+            if synth_key is not None:
+                READING_CACHE.put("synthesis", synth_key, result)
         meta.update(
             model=result.model,
             backend=result.backend,
@@ -245,11 +291,13 @@ def run_pipeline(
             "prompt_tokens": result.prompt_tokens,
             "completion_tokens": result.completion_tokens,
         }
+        _dev["reading_cache"]["stats"] = READING_CACHE.stats()
         CHAT_DEV_TRACE[uid] = _dev
         return result.text, meta, state_updates
 
     except Exception as exc:
         meta.update(backend="fallback", model="none", llm_error=str(exc))
+        _dev["reading_cache"]["stats"] = READING_CACHE.stats()
         CHAT_DEV_TRACE[uid] = _dev
         return (
             f"OpenRouter call failed: {exc}\n\n"
@@ -257,3 +305,42 @@ def run_pipeline(
             meta,
             state_updates,
         )
+
+
+_END = object()
+
+
+class PipelineStream:
+    """Async iterator over the text deltas of one :func:`run_pipeline` turn.
+
+    The pipeline runs in a worker thread; deltas are handed back to the
+    event loop as the synthesis streams.  Once iteration ends,
+    :attr:`outcome` holds ``run_pipeline``'s usual
+    ``(response_text, meta, state_updates)``.  Turns that stop before
+    synthesis (clarification, no API key, errors) yield nothing.
+    Exceptions raised by ``run_pipeline`` propagate from the iteration.
+
+    Usage:
+        stream = PipelineStream(question, chart, None, "placidus", uid=..., ...)
+        async for delta in stream:
+            ...
+        text, meta, state_updates = stream.outcome
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._call = functools.partial(run_pipeline, *args, **kwargs)
+        self.outcome: Optional[tuple[str, dict, dict]] = None
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def on_delta(delta: str) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, delta)
+
+        # Deltas are queued before the future resolves, so _END comes last.
+        turn = loop.run_in_executor(None, functools.partial(self._call, on_delta=on_delta))
+        turn.add_done_callback(lambda _: queue.put_nowait(_END))
+        while (item := await queue.get()) is not _END:
+            yield item
+        self.outcome = turn.result()
@@ -157,11 +157,17 @@ def _node_to_dict(node) -> Dict[str, Any]:
 # ═══════════════════════════════════════════════════════════════════════
 
 def _get_simulation(chart: "AstrologicalChart"):
-    """Safely retrieve the CircuitSimulation from a chart."""
+    """Safely retrieve the CircuitSimulation from a chart.
+
+    Charts rebuilt from storage have none attached; it is rebuilt once per
+    chart (see src/core/derived_state.py).
+    """
     sim = getattr(chart, "circuit_simulation", None)
-    if sim is None:
-        return None
-    return sim
+    if sim is not None:
+        return sim
+    from src.core.derived_state import ensure_derived_state
+    state = ensure_derived_state(chart)
+    return state.circuit_simulation if state else None
 
 
 def _factors_to_planet_names(
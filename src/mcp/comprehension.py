@@ -48,9 +48,13 @@ _PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".
 if _PROJECT_ROOT not in sys.path:
     sys.path.insert(0, _PROJECT_ROOT)
 
+from src.chart_cache import chart_fingerprint
 from src.mcp.topic_maps import resolve_factors, TopicMatch
 from src.mcp.term_registry import load_terms, match_terms, TermIntent
 from src.mcp.grammar_parse import parse_grammar, GrammarDiagram, grammar_summary_line
+from src.mcp.llm_clients import LLM_CLIENTS
+from src.mcp.pipeline_pool import submit
+from src.mcp.reading_cache import READING_CACHE, graph_key
 from src.mcp.comprehension_models import (
     AimType, Depth, Urgency, Specificity,
     EmotionalTone, CertaintyLevel, GuidanceOpenness,
@@ -787,40 +791,19 @@ Respond with ONLY valid JSON matching this schema:
 """
 
 
-def _comprehend_llm(
+def _comprehension_prompt(
     question: str,
-    chart: "AstrologicalChart",
-    api_key: str,
-    model: str = "google/gemini-2.0-flash-001",
     matched_term: Optional["Term"] = None,  # type: ignore[name-defined]
-    known_persons: Optional[List[PersonProfile]] = None,
-    known_locations: Optional[List[Location]] = None,
     pending_clarification: Optional[str] = None,
     grammar: Optional[GrammarDiagram] = None,
-) -> Optional[QuestionGraph]:
-    """
-    Hybrid comprehension: deterministic 5W+H from grammar + LLM for
-    subjective fields (WHY, HOW, aim, paraphrase, domain).
+    grammar_5wh: Optional[Dict[str, Any]] = None,
+) -> str:
+    """User message for the comprehension LLM call.
 
-    Phase A: ``_extract_5wh_from_grammar()`` — deterministic WHO/WHAT/WHEN/WHERE
-    Phase B: Slimmed LLM call — WHY, HOW, AnswerAim, domain, paraphrase
-
-    Returns None on any failure (caller should fall back to keyword path).
+    *grammar* / *grammar_5wh* are optional context; the speculative call
+    in :func:`comprehend` is sent before the grammar parse is back and
+    omits them.
     """
-    try:
-        import openai
-    except ImportError:
-        return None
-
-    # ── Phase A: deterministic extraction from grammar ───────────────
-    grammar_5wh = _extract_5wh_from_grammar(
-        grammar or GrammarDiagram(),
-        question,
-        known_persons=known_persons,
-        known_locations=known_locations,
-    )
-
-    # ── Phase B: LLM call for subjective fields ──────────────────────
     from src.mcp.topic_maps import list_domains
     domain_names = [d["name"] for d in list_domains()]
 
@@ -860,22 +843,23 @@ def _comprehend_llm(
 
     # Inject the deterministic 5W+H extractions so the LLM can see them
     pre_5wh_summary: Dict[str, Any] = {}
-    if grammar_5wh["persons"]:
-        pre_5wh_summary["WHO"] = [
-            {"name": p.name, "relationship": p.relationship_to_querent}
-            for p in grammar_5wh["persons"]
-        ]
-    if grammar_5wh["story_objects"]:
-        pre_5wh_summary["WHAT"] = [
-            {"name": o.name, "significance": o.significance}
-            for o in grammar_5wh["story_objects"]
-        ]
-    if grammar_5wh["setting_time"]:
-        pre_5wh_summary["WHEN"] = grammar_5wh["setting_time"]
-    if grammar_5wh["locations"]:
-        pre_5wh_summary["WHERE"] = [loc.name for loc in grammar_5wh["locations"]]
-    if grammar_5wh["dilemma"]:
-        pre_5wh_summary["DILEMMA_DETECTED"] = True
+    if grammar_5wh:
+        if grammar_5wh["persons"]:
+            pre_5wh_summary["WHO"] = [
+                {"name": p.name, "relationship": p.relationship_to_querent}
+                for p in grammar_5wh["persons"]
+            ]
+        if grammar_5wh["story_objects"]:
+            pre_5wh_summary["WHAT"] = [
+                {"name": o.name, "significance": o.significance}
+                for o in grammar_5wh["story_objects"]
+            ]
+        if grammar_5wh["setting_time"]:
+            pre_5wh_summary["WHEN"] = grammar_5wh["setting_time"]
+        if grammar_5wh["locations"]:
+            pre_5wh_summary["WHERE"] = [loc.name for loc in grammar_5wh["locations"]]
+        if grammar_5wh["dilemma"]:
+            pre_5wh_summary["DILEMMA_DETECTED"] = True
     if pre_5wh_summary:
         parts.append(
             f"PRE_EXTRACTED_5WH (from grammar — do NOT re-extract these):\n"
@@ -883,26 +867,31 @@ def _comprehend_llm(
         )
 
     parts.append(f"Question: {question}")
-    user_msg = "\n\n".join(parts)
+    return "\n\n".join(parts)
+
+
+def _request_comprehension(
+    user_msg: str,
+    api_key: str,
+    model: str = "google/gemini-2.0-flash-001",
+) -> Optional[Dict[str, Any]]:
+    """Send the comprehension prompt; the parsed JSON reply, or None on any failure."""
+    try:
+        client = LLM_CLIENTS.openrouter(api_key)
+    except ImportError:
+        return None
 
     try:
-        client = openai.OpenAI(
-            api_key=api_key,
-            base_url="https://openrouter.ai/api/v1",
-            default_headers={
-                "HTTP-Referer": "https://github.com/theonionqueen13/Rosetta",
-                "X-Title": "Rosetta Astrology",
-            },
-        )
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": _COMPREHENSION_SYSTEM.strip()},
-                {"role": "user", "content": user_msg},
-            ],
-            temperature=0.0,
-            max_tokens=1200,
-        )
+        with LLM_CLIENTS.timed("comprehension"):
+            response = client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": _COMPREHENSION_SYSTEM.strip()},
+                    {"role": "user", "content": user_msg},
+                ],
+                temperature=0.0,
+                max_tokens=1200,
+            )
         raw = response.choices[0].message.content or ""
     except Exception:
         return None
@@ -917,7 +906,54 @@ def _comprehend_llm(
         data = json.loads(raw)
     except (json.JSONDecodeError, ValueError):
         return None
+    return data if isinstance(data, dict) else None
+
+
+def _comprehend_llm(
+    question: str,
+    chart: "AstrologicalChart",
+    api_key: str,
+    model: str = "google/gemini-2.0-flash-001",
+    matched_term: Optional["Term"] = None,  # type: ignore[name-defined]
+    known_persons: Optional[List[PersonProfile]] = None,
+    known_locations: Optional[List[Location]] = None,
+    pending_clarification: Optional[str] = None,
+    grammar: Optional[GrammarDiagram] = None,
+) -> Optional[QuestionGraph]:
+    """
+    Hybrid comprehension: deterministic 5W+H from grammar + LLM for
+    subjective fields (WHY, HOW, aim, paraphrase, domain).
+
+    Phase A: ``_extract_5wh_from_grammar()`` — deterministic WHO/WHAT/WHEN/WHERE
+    Phase B: Slimmed LLM call — WHY, HOW, AnswerAim, domain, paraphrase
+
+    Returns None on any failure (caller should fall back to keyword path).
+    """
+    # ── Phase A: deterministic extraction from grammar ───────────────
+    grammar_5wh = _extract_5wh_from_grammar(
+        grammar or GrammarDiagram(),
+        question,
+        known_persons=known_persons,
+        known_locations=known_locations,
+    )
+
+    # ── Phase B: LLM call for subjective fields ──────────────────────
+    user_msg = _comprehension_prompt(
+        question, matched_term, pending_clarification, grammar, grammar_5wh,
+    )
+    data = _request_comprehension(user_msg, api_key, model)
+    if data is None:
+        return None
+    return _graph_from_comprehension(data, question, matched_term, grammar_5wh)
 
+
+def _graph_from_comprehension(
+    data: Dict[str, Any],
+    question: str,
+    matched_term: Optional["Term"],  # type: ignore[name-defined]
+    grammar_5wh: Dict[str, Any],
+) -> QuestionGraph:
+    """Merge the LLM's subjective fields with the grammar's deterministic 5W+H."""
     # ── Parse LLM-only fields ───────────────────────────────────────
 
     q_type = data.get("question_type", "single_focus")
@@ -1193,6 +1229,14 @@ def _check_sufficiency(graph: QuestionGraph) -> Optional[ClarificationRequest]:
 # Public API
 # ═══════════════════════════════════════════════════════════════════════
 
+# Env var that turns speculative comprehension off ("0" / "false" / "no").
+SPECULATIVE_ENV = "ROSETTA_SPECULATIVE_COMPREHENSION"
+
+
+def _speculative_from_env() -> bool:
+    return os.environ.get(SPECULATIVE_ENV, "1").strip().lower() not in ("0", "false", "no")
+
+
 def comprehend(
     question: str,
     chart: "AstrologicalChart",
@@ -1202,6 +1246,7 @@ def comprehend(
     known_persons: Optional[List[PersonProfile]] = None,
     known_locations: Optional[List[Location]] = None,
     pending_clarification: Optional[str] = None,
+    speculative: Optional[bool] = None,
 ) -> ComprehensionResult:
     """
     Decompose *question* into a ``QuestionGraph`` anchored to *chart*.
@@ -1212,8 +1257,10 @@ def comprehend(
 
     Resolution order
     ----------------
-    1. Term registry — always runs first; stamps ``question_intent`` when a
-       canonical astrological concept is recognised.
+    0. Grammar parse (requires ``api_key``) — sent first and runs in the
+       background while the steps below proceed.
+    1. Term registry — stamps ``question_intent`` when a canonical
+       astrological concept is recognised.
     2. LLM path — full 5W+H extraction (requires ``api_key``).
        Receives any matched term and session context as input.
     3. Term-only fallback — when a term was matched but no API key is
@@ -1233,11 +1280,36 @@ def comprehend(
         Accumulated locations from prior turns in the session.
     pending_clarification : str, optional
         The user's answer to a prior ClarificationRequest.
+    speculative : bool, optional
+        With an API key, send the comprehension call at the same time as
+        the grammar parse (without the grammar context in its prompt) and
+        merge the grammar's deterministic WHO/WHAT/WHEN/WHERE when both
+        are back — one round trip of latency instead of two.  False runs
+        them one after the other, feeding the parse into the prompt.
+        Defaults to on unless ``ROSETTA_SPECULATIVE_COMPREHENSION=0``.
+
+    LLM-built graphs are kept in ``READING_CACHE`` (see
+    ``src/mcp/reading_cache.py``), so asking the same question of the
+    same chart again skips both LLM calls; ``from_cache`` on the result
+    says so.  Answers to a clarification are never cached.
     """
-    # ── Step 0: Grammar diagram — always runs first when key avail ──
+    if speculative is None:
+        speculative = _speculative_from_env()
+
+    # ── Reading cache: same chart, same question, same session context ──
+    cache_key: Optional[str] = None
+    if api_key and not pending_clarification:
+        cache_key = graph_key(chart_fingerprint(chart), question, llm_model,
+                              known_persons, known_locations)
+        cached = READING_CACHE.get("graph", cache_key)
+        if cached is not None:
+            return ComprehensionResult(graph=cached, clarification=None, from_cache=True)
+
+    # ── Step 0: Grammar diagram — in flight while the rest runs ────
     grammar_diagram: Optional[GrammarDiagram] = None
+    grammar_future = None
     if api_key:
-        grammar_diagram = parse_grammar(question, api_key, model=llm_model)
+        grammar_future = submit(parse_grammar, question, api_key, model=llm_model)
 
     # ── Step 1: Term registry ─────────────────────────────────────
     _terms = load_terms()
@@ -1246,7 +1318,24 @@ def comprehend(
     graph: Optional[QuestionGraph] = None
 
     # ── Step 2: LLM path (if key available) ──────────────────────
-    if api_key:
+    if api_key and speculative:
+        llm_future = submit(
+            _request_comprehension,
+            _comprehension_prompt(question, _matched_term, pending_clarification),
+            api_key, llm_model,
+        )
+        grammar_diagram = grammar_future.result()
+        data = llm_future.result()
+        if data is not None:
+            grammar_5wh = _extract_5wh_from_grammar(
+                grammar_diagram or GrammarDiagram(),
+                question,
+                known_persons=known_persons,
+                known_locations=known_locations,
+            )
+            graph = _graph_from_comprehension(data, question, _matched_term, grammar_5wh)
+    elif api_key:
+        grammar_diagram = grammar_future.result()
         graph = _comprehend_llm(
             question, chart, api_key,
             model=llm_model,
@@ -1317,4 +1406,8 @@ def comprehend(
         + grammar_fragment
     )
 
+    # Only LLM graphs: a fallback after a failed call shouldn't stick.
+    if cache_key is not None and graph.source == "llm":
+        READING_CACHE.put("graph", cache_key, graph)
+
     return ComprehensionResult(graph=graph, clarification=None)
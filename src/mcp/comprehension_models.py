@@ -394,6 +394,7 @@ class ComprehensionResult:
     """
     graph: Optional[Any] = None               # Optional[QuestionGraph]
     clarification: Optional[ClarificationRequest] = None
+    from_cache: bool = False                  # graph came from the reading cache
 
     @property
     def needs_clarification(self) -> bool:
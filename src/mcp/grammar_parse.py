@@ -23,6 +23,8 @@ import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from src.mcp.llm_clients import LLM_CLIENTS
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # Data structures
@@ -220,28 +222,21 @@ def parse_grammar(
         return _fallback
 
     try:
-        import openai
+        client = LLM_CLIENTS.openrouter(api_key)
     except ImportError:
         return _fallback
 
     try:
-        client = openai.OpenAI(
-            api_key=api_key,
-            base_url="https://openrouter.ai/api/v1",
-            default_headers={
-                "HTTP-Referer": "https://github.com/theonionqueen13/Rosetta",
-                "X-Title": "Rosetta Astrology",
-            },
-        )
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": _GRAMMAR_SYSTEM.strip()},
-                {"role": "user", "content": question},
-            ],
-            temperature=0.0,
-            max_tokens=400,
-        )
+        with LLM_CLIENTS.timed("grammar"):
+            response = client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": _GRAMMAR_SYSTEM.strip()},
+                    {"role": "user", "content": question},
+                ],
+                temperature=0.0,
+                max_tokens=400,
+            )
         raw = response.choices[0].message.content or ""
     except Exception:
         return _fallback
@@ -0,0 +1,249 @@
+# src/mcp/llm_clients.py
+"""
+Shared, pooled OpenAI-SDK clients for the chat pipeline's LLM calls.
+
+Grammar parse, comprehension and prose synthesis used to build a fresh
+``openai.OpenAI(...)`` per call: a new connection pool, and with it a new
+TCP connect and TLS handshake to openrouter.ai, three times per chat turn.
+:class:`LLMClientRegistry` hands out one client per
+``(base_url, api_key hash, headers)`` instead.  The clients share a keep-alive
+httpx pool, so later calls reuse the open connections.
+
+Async clients (``openai.AsyncOpenAI``) are kept per event loop, because
+an httpx ``AsyncClient`` pool can't be shared across loops.
+
+Every request is traced through httpcore's ``trace`` extension.
+:meth:`LLMClientRegistry.stats` reports how many requests opened a new
+connection (and TLS session) versus reused one.  Wrap a call in
+:meth:`LLMClientRegistry.timed` to feed its latency into the ``"llm"``
+histograms in :mod:`src.stage_timing`.  Both show up at ``/metrics``.
+
+Configuration (read when a client is first built):
+
+    ROSETTA_LLM_BASE_URL     override the OpenRouter endpoint (proxies, tests)
+    ROSETTA_LLM_TIMEOUT      read/write/pool timeout in seconds (default 60)
+    ROSETTA_LLM_MAX_RETRIES  SDK retries on connection errors / 429 / 5xx (default 2)
+
+Usage:
+    client = LLM_CLIENTS.openrouter(api_key)
+    with LLM_CLIENTS.timed("grammar"):
+        response = client.chat.completions.create(...)
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import os
+import threading
+import weakref
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+from src.stage_timing import StageRecorder
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+OPENROUTER_HEADERS = {
+    "HTTP-Referer": "https://github.com/theonionqueen13/Rosetta",
+    "X-Title": "Rosetta Astrology",
+}
+
+BASE_URL_ENV = "ROSETTA_LLM_BASE_URL"
+TIMEOUT_ENV = "ROSETTA_LLM_TIMEOUT"
+RETRIES_ENV = "ROSETTA_LLM_MAX_RETRIES"
+
+_CONNECT_TIMEOUT = 10.0
+_MAX_CONNECTIONS = 32
+_MAX_KEEPALIVE = 16
+_KEEPALIVE_EXPIRY = 90.0
+
+ClientKey = Tuple[Optional[str], str, Tuple[Tuple[str, str], ...]]
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.environ.get(name, "") or default))
+    except ValueError:
+        return default
+
+
+def openrouter_base_url() -> str:
+    """The OpenRouter endpoint, unless ``ROSETTA_LLM_BASE_URL`` overrides it."""
+    return os.environ.get(BASE_URL_ENV, "").strip() or OPENROUTER_BASE_URL
+
+
+def client_key(base_url: Optional[str], api_key: str,
+               headers: Optional[Mapping[str, str]] = None) -> ClientKey:
+    """Registry key; the API key is hashed so it never sits in a dict key."""
+    digest = hashlib.blake2b(api_key.encode("utf-8"), digest_size=12).hexdigest()
+    return (base_url, digest, tuple(sorted((headers or {}).items())))
+
+
+class LLMClientRegistry:
+    """Process-wide registry of pooled sync / async OpenAI-SDK clients."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: Dict[ClientKey, Any] = {}
+        self._async: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[ClientKey, Any]]" = (
+            weakref.WeakKeyDictionary())
+        self._counts = {"clients": 0, "requests": 0,
+                        "new_connections": 0, "tls_handshakes": 0}
+
+    # ── connection tracing ────────────────────────────────────────────
+
+    def _on_trace(self, event: str) -> None:
+        if event == "connection.connect_tcp.started":
+            with self._lock:
+                self._counts["new_connections"] += 1
+        elif event == "connection.start_tls.started":
+            with self._lock:
+                self._counts["tls_handshakes"] += 1
+
+    def _on_request(self, request: Any) -> None:
+        with self._lock:
+            self._counts["requests"] += 1
+        request.extensions["trace"] = lambda event, info: self._on_trace(event)
+
+    async def _on_request_async(self, request: Any) -> None:
+        with self._lock:
+            self._counts["requests"] += 1
+
+        async def trace(event: str, info: Dict[str, Any]) -> None:
+            self._on_trace(event)
+
+        request.extensions["trace"] = trace
+
+    # ── construction ──────────────────────────────────────────────────
+
+    @staticmethod
+    def _options() -> Dict[str, Any]:
+        import httpx
+
+        return {
+            "timeout": httpx.Timeout(_env_float(TIMEOUT_ENV, 60.0),
+                                     connect=_CONNECT_TIMEOUT),
+            "max_retries": _env_int(RETRIES_ENV, 2),
+        }
+
+    @staticmethod
+    def _limits() -> Any:
+        import httpx
+
+        return httpx.Limits(max_connections=_MAX_CONNECTIONS,
+                            max_keepalive_connections=_MAX_KEEPALIVE,
+                            keepalive_expiry=_KEEPALIVE_EXPIRY)
+
+    def _build(self, base_url: Optional[str], api_key: str,
+               headers: Optional[Mapping[str, str]]) -> Any:
+        import openai
+
+        http_client = openai.DefaultHttpxClient(
+            limits=self._limits(), event_hooks={"request": [self._on_request]})
+        return openai.OpenAI(api_key=api_key, base_url=base_url,
+                             default_headers=dict(headers or {}),
+                             http_client=http_client, **self._options())
+
+    def _build_async(self, base_url: Optional[str], api_key: str,
+                     headers: Optional[Mapping[str, str]]) -> Any:
+        import openai
+
+        http_client = openai.DefaultAsyncHttpxClient(
+            limits=self._limits(), event_hooks={"request": [self._on_request_async]})
+        return openai.AsyncOpenAI(api_key=api_key, base_url=base_url,
+                                  default_headers=dict(headers or {}),
+                                  http_client=http_client, **self._options())
+
+    # ── public API ────────────────────────────────────────────────────
+
+    def get(self, api_key: str, base_url: Optional[str] = None,
+            headers: Optional[Mapping[str, str]] = None) -> Any:
+        """Shared ``openai.OpenAI`` for this endpoint and key (built on first use).
+
+        *base_url* None means the SDK default (api.openai.com).  Raises
+        ImportError if the ``openai`` package isn't installed.
+        """
+        key = client_key(base_url, api_key, headers)
+        with self._lock:
+            client = self._clients.get(key)
+        if client is not None:
+            return client
+        client = self._build(base_url, api_key, headers)
+        with self._lock:
+            existing = self._clients.setdefault(key, client)
+            if existing is client:
+                self._counts["clients"] += 1
+        if existing is not client:      # lost a construction race
+            client.close()
+        return existing
+
+    def get_async(self, api_key: str, base_url: Optional[str] = None,
+                  headers: Optional[Mapping[str, str]] = None) -> Any:
+        """Shared ``openai.AsyncOpenAI`` for the running event loop.
+
+        Must be called from a coroutine; each loop gets its own pool.
+        """
+        loop = asyncio.get_running_loop()
+        key = client_key(base_url, api_key, headers)
+        with self._lock:
+            per_loop = self._async.setdefault(loop, {})
+            client = per_loop.get(key)
+            if client is None:
+                client = per_loop[key] = self._build_async(base_url, api_key, headers)
+                self._counts["clients"] += 1
+        return client
+
+    def openrouter(self, api_key: str) -> Any:
+        """Shared sync client for OpenRouter (or ``ROSETTA_LLM_BASE_URL``)."""
+        return self.get(api_key, openrouter_base_url(), OPENROUTER_HEADERS)
+
+    def openrouter_async(self, api_key: str) -> Any:
+        """Shared async client for OpenRouter (or ``ROSETTA_LLM_BASE_URL``)."""
+        return self.get_async(api_key, openrouter_base_url(), OPENROUTER_HEADERS)
+
+    @contextlib.contextmanager
+    def timed(self, label: str) -> Iterator[None]:
+        """Record the enclosed call's latency as ``llm/<label>`` in /metrics.
+
+        Includes SDK retries. Exceptions propagate and are recorded as errors.
+        """
+        with StageRecorder("llm").stage(label):
+            yield
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+            live = len(self._clients) + sum(len(c) for c in self._async.values())
+        requests = counts["requests"]
+        reused = max(0, requests - counts["new_connections"])
+        return {
+            **counts,
+            "live_clients": live,
+            "reused_connections": reused,
+            "reuse_rate": round(reused / requests, 4) if requests else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Close every sync client and reset the counters.
+
+        Async clients are dropped without closing; their loop may be gone.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._async.clear()
+            for k in self._counts:
+                self._counts[k] = 0
+        for client in clients:
+            with contextlib.suppress(Exception):
+                client.close()
+
+
+# Process-wide singleton.
+LLM_CLIENTS = LLMClientRegistry()
@@ -0,0 +1,42 @@
+# src/mcp/pipeline_pool.py
+"""
+Shared thread pool for overlapping the chat pipeline's network waits.
+
+A chat turn makes several OpenRouter round trips (grammar parse,
+comprehension, synthesis) and builds chart facts that don't depend on
+them.  The pipeline runs in a ``run.io_bound`` thread with blocking SDK
+calls, so independent steps are overlapped by submitting them here.
+
+Only *leaf* work may be submitted — a task must never wait on another
+pool task, so a saturated pool can delay but never deadlock a turn.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+# Env var overriding the worker count (default 16).
+WORKERS_ENV = "ROSETTA_CHAT_WORKERS"
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def _workers() -> int:
+    try:
+        return max(1, int(os.environ.get(WORKERS_ENV, "16")))
+    except ValueError:
+        return 16
+
+
+def submit(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Run ``fn(*args, **kwargs)`` on the shared pool."""
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_workers(), thread_name_prefix="chat-pipeline")
+    return _executor.submit(fn, *args, **kwargs)
@@ -10,11 +10,13 @@ lives in the reading engine and topic maps — the LLM only synthesizes.
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Generator, Iterator, List, Optional, Union
 
+from src.mcp.llm_clients import LLM_CLIENTS, OPENROUTER_BASE_URL  # noqa: F401  (re-export)
 from src.mcp.prompt_templates import build_prompt, estimate_prompt_tokens
 from src.mcp.reading_packet import ReadingPacket
 
@@ -24,7 +26,6 @@ if TYPE_CHECKING:
     from src.mcp.agent_memory import AgentMemory
 
 
-OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 DEFAULT_OPENROUTER_MODEL = "google/gemini-2.0-flash-001"
 
 
@@ -48,6 +49,38 @@ class SynthesisResult:
         }
 
 
+class SynthesisStream:
+    """Text deltas of a synthesis, as the model generates them.
+
+    Iterate it to receive ``str`` deltas; once exhausted, :attr:`result`
+    holds the complete :class:`SynthesisResult` (full text and token usage).
+    A stream can be consumed once.
+    """
+
+    def __init__(self, chunks: Generator[str, None, SynthesisResult]) -> None:
+        self._chunks = chunks
+        self.result: Optional[SynthesisResult] = None
+
+    def __iter__(self) -> Iterator[str]:
+        self.result = yield from self._chunks
+
+    @classmethod
+    def of(cls, result: SynthesisResult) -> "SynthesisStream":
+        """A single-delta stream, for backends that don't stream."""
+        def chunks() -> Generator[str, None, SynthesisResult]:
+            if result.text:
+                yield result.text
+            return result
+        return cls(chunks())
+
+    def collect(self) -> SynthesisResult:
+        """Drain the stream and return the final result."""
+        for _ in self:
+            pass
+        assert self.result is not None
+        return self.result
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Backend: structured-text fallback (no LLM)
 # ═══════════════════════════════════════════════════════════════════════
@@ -158,6 +191,81 @@ def _fallback_synthesize(packet: ReadingPacket) -> SynthesisResult:
     )
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# OpenAI-compatible chat completions (OpenAI, OpenRouter)
+# ═══════════════════════════════════════════════════════════════════════
+
+def _chat_complete(
+    client: Any,
+    messages: List[Dict],
+    *,
+    model: str,
+    backend: str,
+    stream: bool = False,
+) -> Union[SynthesisResult, SynthesisStream]:
+    """Run one chat completion on a pooled client, optionally streamed.
+
+    A streamed call sends the request here (so auth and connection errors
+    still raise before the first delta) and reads the server-sent events
+    lazily; usage totals arrive in the final event.
+    """
+    params: Dict[str, Any] = dict(
+        model=model, messages=messages, temperature=0.7, max_tokens=1024,
+    )
+    if not stream:
+        with LLM_CLIENTS.timed("synthesis"):
+            response = client.chat.completions.create(**params)
+        choice = response.choices[0]
+        usage = response.usage
+        return SynthesisResult(
+            text=choice.message.content or "",
+            model=model,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0,
+            total_tokens=usage.total_tokens if usage else 0,
+            backend=backend,
+        )
+
+    # Raw SSE rather than the SDK's Stream: that stops reading at [DONE]
+    # and closes the response before the end of the chunked body, which
+    # throws the pooled keep-alive connection away after every reading.
+    exits = contextlib.ExitStack()
+    with LLM_CLIENTS.timed("synthesis_first_byte"):
+        response = exits.enter_context(
+            client.chat.completions.with_streaming_response.create(
+                **params, stream=True, stream_options={"include_usage": True}))
+
+    def chunks() -> Generator[str, None, SynthesisResult]:
+        parts: List[str] = []
+        usage: Dict[str, int] = {}
+        with exits, LLM_CLIENTS.timed("synthesis_stream"):
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue            # blank separators, ": keep-alive" comments
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    continue            # read on to the end of the body
+                event = json.loads(data)
+                if event.get("error"):
+                    raise RuntimeError(f"stream error: {event['error']}")
+                usage = event.get("usage") or usage
+                for choice in event.get("choices") or []:
+                    delta = (choice.get("delta") or {}).get("content")
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+        return SynthesisResult(
+            text="".join(parts),
+            model=model,
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0),
+            backend=backend,
+        )
+
+    return SynthesisStream(chunks())
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Backend: OpenAI
 # ═══════════════════════════════════════════════════════════════════════
@@ -172,18 +280,17 @@ def _openai_synthesize(
     api_key: Optional[str] = None,
     conversation_history: Optional[List[Dict]] = None,
     agent_memory: Optional["AgentMemory"] = None,
-) -> SynthesisResult:
+    stream: bool = False,
+) -> Union[SynthesisResult, SynthesisStream]:
     """Call OpenAI's chat completion API."""
-    try:
-        import openai
-    except ImportError:
-        raise RuntimeError("openai package not installed. Run: pip install openai")
-
     key = api_key or os.environ.get("OPENAI_API_KEY", "")
     if not key:
         raise RuntimeError("OPENAI_API_KEY not set")
 
-    client = openai.OpenAI(api_key=key)
+    try:
+        client = LLM_CLIENTS.get(key)
+    except ImportError:
+        raise RuntimeError("openai package not installed. Run: pip install openai")
     messages = build_prompt(
         packet, mode=mode, voice=voice,
         extra_instructions=extra_instructions,
@@ -191,24 +298,8 @@ def _openai_synthesize(
         agent_memory=agent_memory,
     )
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=messages,
-        temperature=0.7,
-        max_tokens=1024,
-    )
-
-    choice = response.choices[0]
-    usage = response.usage
-
-    return SynthesisResult(
-        text=choice.message.content or "",
-        model=model,
-        prompt_tokens=usage.prompt_tokens if usage else 0,
-        completion_tokens=usage.completion_tokens if usage else 0,
-        total_tokens=usage.total_tokens if usage else 0,
-        backend="openai",
-    )
+    return _chat_complete(client, messages, model=model, backend="openai",
+                          stream=stream)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -225,25 +316,17 @@ def _openrouter_synthesize(
     api_key: Optional[str] = None,
     conversation_history: Optional[List[Dict]] = None,
     agent_memory: Optional["AgentMemory"] = None,
-) -> SynthesisResult:
+    stream: bool = False,
+) -> Union[SynthesisResult, SynthesisStream]:
     """Call OpenRouter via the OpenAI SDK with a base_url override."""
-    try:
-        import openai
-    except ImportError:
-        raise RuntimeError("openai package not installed. Run: pip install openai")
-
     key = api_key or os.environ.get("OPENROUTER_API_KEY", "")
     if not key:
         raise RuntimeError("OPENROUTER_API_KEY not set")
 
-    client = openai.OpenAI(
-        api_key=key,
-        base_url=OPENROUTER_BASE_URL,
-        default_headers={
-            "HTTP-Referer": "https://github.com/theonionqueen13/Rosetta",
-            "X-Title": "Rosetta Astrology",
-        },
-    )
+    try:
+        client = LLM_CLIENTS.openrouter(key)
+    except ImportError:
+        raise RuntimeError("openai package not installed. Run: pip install openai")
     messages = build_prompt(
         packet, mode=mode, voice=voice,
         extra_instructions=extra_instructions,
@@ -251,24 +334,8 @@ def _openrouter_synthesize(
         agent_memory=agent_memory,
     )
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=messages,
-        temperature=0.7,
-        max_tokens=1024,
-    )
-
-    choice = response.choices[0]
-    usage = response.usage
-
-    return SynthesisResult(
-        text=choice.message.content or "",
-        model=model,
-        prompt_tokens=usage.prompt_tokens if usage else 0,
-        completion_tokens=usage.completion_tokens if usage else 0,
-        total_tokens=usage.total_tokens if usage else 0,
-        backend="openrouter",
-    )
+    return _chat_complete(client, messages, model=model, backend="openrouter",
+                          stream=stream)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -346,7 +413,8 @@ def synthesize(
     api_key: Optional[str] = None,
     conversation_history: Optional[List[Dict]] = None,
     agent_memory: Optional["AgentMemory"] = None,
-) -> SynthesisResult:
+    stream: bool = False,
+) -> Union[SynthesisResult, SynthesisStream]:
     """Synthesize prose from a ReadingPacket.
 
     Parameters
@@ -371,6 +439,12 @@ def synthesize(
         current user message.  This is the primary multi-turn memory
         mechanism — the LLM sees the prior exchange and knows it offered
         a keystone deep dive, so a follow-up "yes" is handled correctly.
+    stream : bool
+        Return a :class:`SynthesisStream` of text deltas instead of a
+        finished :class:`SynthesisResult`.  OpenAI and OpenRouter stream
+        token by token; Anthropic and the fallback yield their text as a
+        single delta.  In "auto" mode a backend is only skipped if it
+        fails before its first delta.
     """
     def _kwargs(**extra):
         """Build the common keyword arguments for the LLM call."""
@@ -387,39 +461,43 @@ def synthesize(
         kw.update(extra)
         return kw
 
+    def _done(result: SynthesisResult) -> Union[SynthesisResult, SynthesisStream]:
+        """Wrap a finished result as a stream when one was asked for."""
+        return SynthesisStream.of(result) if stream else result
+
     if backend == "fallback":
-        return _fallback_synthesize(packet)
+        return _done(_fallback_synthesize(packet))
 
     if backend == "openrouter":
-        return _openrouter_synthesize(**_kwargs())
+        return _openrouter_synthesize(**_kwargs(stream=stream))
 
     if backend == "anthropic":
-        return _anthropic_synthesize(**_kwargs())
+        return _done(_anthropic_synthesize(**_kwargs()))
 
     if backend == "openai":
-        return _openai_synthesize(**_kwargs())
+        return _openai_synthesize(**_kwargs(stream=stream))
 
     # Auto mode: try backends in order of preference
     if backend == "auto":
         if os.environ.get("OPENROUTER_API_KEY") or (api_key and backend == "openrouter"):
             try:
-                return _openrouter_synthesize(**_kwargs())
+                return _openrouter_synthesize(**_kwargs(stream=stream))
             except Exception:
                 pass
 
         if os.environ.get("ANTHROPIC_API_KEY"):
             try:
-                return _anthropic_synthesize(**_kwargs())
+                return _done(_anthropic_synthesize(**_kwargs()))
             except Exception:
                 pass
 
         if os.environ.get("OPENAI_API_KEY"):
             try:
-                return _openai_synthesize(**_kwargs())
+                return _openai_synthesize(**_kwargs(stream=stream))
             except Exception:
                 pass
 
-        return _fallback_synthesize(packet)
+        return _done(_fallback_synthesize(packet))
 
     # Unknown backend — use fallback
-    return _fallback_synthesize(packet)
+    return _done(_fallback_synthesize(packet))
@@ -0,0 +1,305 @@
+# src/mcp/reading_cache.py
+"""
+Cache of chat reading work for repeated questions about the same chart.
+
+Users ask near-identical questions ("tell me about my career", "Tell me
+about my career?") about the same chart, and each one costs a grammar
+parse, a comprehension call and a synthesis call.  :class:`ReadingCache`
+keeps:
+
+* ``"graph"`` — the anchored ``QuestionGraph`` from ``comprehend``, keyed
+  by :func:`graph_key`: chart fingerprint, normalised question, LLM model
+  and the session's known persons / locations.
+* ``"synthesis"`` — the final ``SynthesisResult``, keyed by
+  :func:`synthesis_key`: chart fingerprint(s), normalised question,
+  mode, voice, model, house system, agent notes and the known persons /
+  locations.  A cached reading ignores the conversation so far,
+  so this tier is opt-in: ``ROSETTA_READING_CACHE_SYNTHESIS=1``.
+
+Entries are stored pickled, so each hit returns a fresh copy that callers
+may mutate.  The in-memory tier is LRU with a TTL.  Setting
+``ROSETTA_READING_CACHE_PATH`` adds a SQLite tier at that path, which is
+shared across restarts and worker processes.  The file is a private cache.
+Entries that no longer unpickle (e.g. after a model change) count as
+misses and are dropped.
+
+Other switches:
+
+    ROSETTA_READING_CACHE       "0" turns the cache off (default on)
+    ROSETTA_READING_CACHE_TTL   entry lifetime in seconds (default 86400)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from cachetools import TTLCache
+
+_log = logging.getLogger(__name__)
+
+ENABLED_ENV = "ROSETTA_READING_CACHE"
+PATH_ENV = "ROSETTA_READING_CACHE_PATH"
+SYNTHESIS_ENV = "ROSETTA_READING_CACHE_SYNTHESIS"
+TTL_ENV = "ROSETTA_READING_CACHE_TTL"
+
+# Bump when the cached objects change shape; old entries then never match.
+_VERSION = 1
+
+KINDS = ("graph", "synthesis")
+
+_QUOTES = str.maketrans({"‘": "'", "’": "'", "“": '"', "”": '"'})
+_EDGE_PUNCT = re.compile(r"^[\s\"'.,!?;:…-]+|[\s\"'.,!?;:…-]+$")
+
+
+def normalize_question(question: str) -> str:
+    """Case-, spacing- and edge-punctuation-insensitive form of *question*.
+
+    ``"  Tell me about my CAREER?! "`` and ``"tell me about my career"``
+    normalise alike; inner punctuation and word order are kept, since
+    they can change the meaning.
+    """
+    text = unicodedata.normalize("NFKC", question or "").translate(_QUOTES).lower()
+    text = " ".join(text.split())
+    return _EDGE_PUNCT.sub("", text)
+
+
+def _digest(parts: Any) -> str:
+    blob = json.dumps([_VERSION, parts], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _context(items: Optional[Iterable[Any]]) -> list:
+    return sorted(json.dumps(i.to_dict() if hasattr(i, "to_dict") else i,
+                             sort_keys=True, default=str)
+                  for i in items or [])
+
+
+def graph_key(fingerprint: str, question: str, model: str,
+              known_persons: Optional[Sequence[Any]] = None,
+              known_locations: Optional[Sequence[Any]] = None) -> str:
+    """Key for a comprehension graph (the persons / locations feed its WHO / WHERE)."""
+    return _digest(["graph", fingerprint, normalize_question(question), model,
+                    _context(known_persons), _context(known_locations)])
+
+
+def synthesis_key(fingerprints: Sequence[str], question: str, *,
+                  mode: str, voice: str, model: str,
+                  house_system: str = "placidus", agent_notes: str = "",
+                  known_persons: Optional[Sequence[Any]] = None,
+                  known_locations: Optional[Sequence[Any]] = None) -> str:
+    """Key for a synthesized reading of *question* on the given chart(s).
+
+    *house_system*, *agent_notes* and the known persons / locations change
+    the reading packet and the prompt, so they are part of the key.
+    """
+    return _digest(["synthesis", list(fingerprints), normalize_question(question),
+                    mode, voice.lower(), model, (house_system or "placidus").lower(),
+                    agent_notes or "", _context(known_persons), _context(known_locations)])
+
+
+def _flag(name: str, default: bool) -> bool:
+    raw = os.environ.get(name, "").strip().lower()
+    if not raw:
+        return default
+    return raw in ("1", "true", "yes")
+
+
+class ReadingCache:
+    """Thread-safe two-tier (memory LRU/TTL + optional SQLite) reading cache.
+
+    *enabled*, *synthesis* and *path* default to the environment, read on
+    each call so they can be flipped without a restart; *ttl* is fixed
+    when the cache is built.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None,
+                 path: Optional[str] = None, enabled: Optional[bool] = None,
+                 synthesis: Optional[bool] = None,
+                 max_disk_rows: int = 50_000) -> None:
+        self._ttl = ttl
+        self._memory: TTLCache = TTLCache(maxsize=maxsize, ttl=self.ttl)
+        self._path = path
+        self._enabled = enabled
+        self._synthesis = synthesis
+        self._max_disk_rows = max_disk_rows
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_path: Optional[str] = None
+        self._puts_since_prune = 0
+        self._counts = {f"{kind}_{what}": 0 for kind in KINDS
+                        for what in ("hits", "disk_hits", "misses", "stores")}
+
+    # ── configuration ─────────────────────────────────────────────────
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is not None:
+            return self._ttl
+        try:
+            return float(os.environ.get(TTL_ENV, "") or 86400)
+        except ValueError:
+            return 86400.0
+
+    @property
+    def enabled(self) -> bool:
+        return _flag(ENABLED_ENV, True) if self._enabled is None else self._enabled
+
+    @property
+    def synthesis_enabled(self) -> bool:
+        if not self.enabled:
+            return False
+        return _flag(SYNTHESIS_ENV, False) if self._synthesis is None else self._synthesis
+
+    def _disk(self) -> Optional[sqlite3.Connection]:
+        """The SQLite connection for the configured path (caller holds the lock)."""
+        path = self._path if self._path is not None else os.environ.get(PATH_ENV, "").strip()
+        if not path:
+            return None
+        if self._db is not None and self._db_path == path:
+            return self._db
+        if self._db is not None:
+            self._db.close()
+        try:
+            db = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS readings ("
+                " key TEXT PRIMARY KEY, kind TEXT NOT NULL,"
+                " created REAL NOT NULL, payload BLOB NOT NULL)")
+            db.execute("CREATE INDEX IF NOT EXISTS readings_created ON readings(created)")
+            db.commit()
+        except sqlite3.Error:
+            _log.warning("Reading cache disk tier unavailable at %s", path, exc_info=True)
+            self._db = self._db_path = None
+            return None
+        self._db, self._db_path = db, path
+        return db
+
+    # ── get / put ─────────────────────────────────────────────────────
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """A fresh copy of the cached *kind* object for *key*, or None."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            payload = self._memory.get(key)
+            tier = "hits"
+            if payload is None:
+                payload = self._disk_get(key)
+                tier = "disk_hits"
+                if payload is not None:
+                    self._memory[key] = payload
+            if payload is None:
+                self._counts[f"{kind}_misses"] += 1
+                return None
+        try:
+            value = pickle.loads(payload)
+        except Exception:
+            _log.info("Dropping unreadable reading cache entry %s", key)
+            self.discard(key)
+            with self._lock:
+                self._counts[f"{kind}_misses"] += 1
+            return None
+        with self._lock:
+            self._counts[f"{kind}_{tier}"] += 1
+        return value
+
+    def put(self, kind: str, key: str, value: Any) -> None:
+        """Store a snapshot of *value*; later mutations don't reach the cache."""
+        if not self.enabled:
+            return
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._memory[key] = payload
+            self._counts[f"{kind}_stores"] += 1
+            self._disk_put(kind, key, payload)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+            db = self._disk()
+            if db is not None:
+                try:
+                    db.execute("DELETE FROM readings WHERE key = ?", (key,))
+                    db.commit()
+                except sqlite3.Error:
+                    pass
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        db = self._disk()
+        if db is None:
+            return None
+        try:
+            row = db.execute(
+                "SELECT payload FROM readings WHERE key = ? AND created >= ?",
+                (key, time.time() - self.ttl)).fetchone()
+        except sqlite3.Error:
+            return None
+        return bytes(row[0]) if row else None
+
+    def _disk_put(self, kind: str, key: str, payload: bytes) -> None:
+        db = self._disk()
+        if db is None:
+            return
+        try:
+            db.execute("INSERT OR REPLACE INTO readings VALUES (?, ?, ?, ?)",
+                       (key, kind, time.time(), payload))
+            self._puts_since_prune += 1
+            if self._puts_since_prune >= 100:
+                self._puts_since_prune = 0
+                self._prune(db)
+            db.commit()
+        except sqlite3.Error:
+            _log.warning("Reading cache disk write failed", exc_info=True)
+
+    def _prune(self, db: sqlite3.Connection) -> None:
+        db.execute("DELETE FROM readings WHERE created < ?", (time.time() - self.ttl,))
+        db.execute(
+            "DELETE FROM readings WHERE key NOT IN ("
+            " SELECT key FROM readings ORDER BY created DESC LIMIT ?)",
+            (self._max_disk_rows,))
+
+    # ── metrics ───────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+            entries = len(self._memory)
+            disk_rows = None
+            db = self._disk()
+            if db is not None:
+                try:
+                    disk_rows = db.execute("SELECT COUNT(*) FROM readings").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+        out: Dict[str, Any] = dict(counts, entries=entries, disk_entries=disk_rows)
+        for kind in KINDS:
+            hits = counts[f"{kind}_hits"] + counts[f"{kind}_disk_hits"]
+            lookups = hits + counts[f"{kind}_misses"]
+            out[f"{kind}_hit_rate"] = round(hits / lookups, 4) if lookups else 0.0
+        return out
+
+    def clear(self, disk: bool = False) -> None:
+        """Empty the memory tier and reset counters (and the disk tier if *disk*)."""
+        with self._lock:
+            self._memory.clear()
+            for k in self._counts:
+                self._counts[k] = 0
+            if disk:
+                db = self._disk()
+                if db is not None:
+                    db.execute("DELETE FROM readings")
+                    db.commit()
+
+
+# Process-wide singleton.
+READING_CACHE = ReadingCache()
@@ -31,6 +31,7 @@ from src.mcp.comprehension_models import ComprehensionResult, PersonProfile, Loc
 from src.mcp.circuit_query import query_circuit, CircuitReading
 from src.mcp.term_registry import TermIntent, assign_potency_tiers
 from src.mcp.agent_memory import AgentMemory
+from src.mcp.pipeline_pool import submit
 from src.mcp.reading_packet import (
     AspectFact,
     CircuitFlowFact,
@@ -123,6 +124,82 @@ def _combo_key(obj_name: str) -> str:
 # Core engine
 # ═══════════════════════════════════════════════════════════════════════
 
+def _build_chart_context(
+    chart: "AstrologicalChart",
+    chart_b: Optional["AstrologicalChart"],
+    house_system: str,
+    max_aspects: int,
+    edges_inter_chart: Optional[List],
+) -> Dict[str, Any]:
+    """ReadingPacket fields that don't depend on the question.
+
+    Sect, switch points, full placements and the second chart's parity
+    facts — safe to build concurrently with comprehension, which only
+    reads the chart.
+    """
+    sect_fact = _build_sect(chart)
+    switch_points = _build_switch_points(chart, house_system)
+
+    # ── Full chart context — ALL objects, always included ─────────────────
+    # This gives the LLM complete chart awareness regardless of what the
+    # user has toggled on or what the question's relevance filter captured.
+    full_chart_placements = _build_full_placements(chart, house_system)
+
+    # ── Second chart (biwheel) full placements + full parity facts ────────────
+    chart_b_name = ""
+    chart_b_date = ""
+    chart_b_city = ""
+    chart_b_full_placements: List[PlacementFact] = []
+    chart_b_aspects: List[AspectFact] = []
+    chart_b_patterns: List[PatternFact] = []
+    chart_b_dignities: List[DignityFact] = []
+    chart_b_dispositors: List[DispositorFact] = []
+    chart_b_sect: Optional[SectFact] = None
+    if chart_b is not None:
+        chart_b_full_placements = _build_full_placements(chart_b, house_system)
+        b_hdr = chart_b.header_lines() if hasattr(chart_b, "header_lines") else ("", "", "", "", "")
+        chart_b_name = b_hdr[0] if b_hdr else ""
+        chart_b_date = b_hdr[1] if len(b_hdr) > 1 else ""
+        chart_b_city = b_hdr[3] if len(b_hdr) > 3 else ""
+        # Build full parity classical facts for chart_b
+        _b_all_names: Set[str] = {
+            cobj.object_name.name
+            for cobj in chart_b.objects
+            if cobj.object_name
+        }
+        chart_b_aspects = _build_aspects(chart_b, _b_all_names, max_aspects)
+        chart_b_patterns = _build_patterns(chart_b, _b_all_names)
+        chart_b_dignities = _build_dignities(list(chart_b.objects))
+        chart_b_dispositors = _build_dispositors(chart_b, _b_all_names)
+        chart_b_sect = _build_sect(chart_b)
+
+    # Convert pre-computed inter-chart aspect tuples → serialisable dicts
+    inter_chart_aspects_raw: List[Dict[str, str]] = []
+    for _record in (edges_inter_chart or []):
+        if isinstance(_record, (list, tuple)) and len(_record) >= 3:
+            inter_chart_aspects_raw.append({
+                "planet_1": str(_record[0]),
+                "planet_2": str(_record[1]),
+                "aspect": str(_record[2]),
+            })
+
+    return {
+        "switch_points": switch_points,
+        "sect": sect_fact,
+        "full_chart_placements": full_chart_placements,
+        "chart_b_name": chart_b_name,
+        "chart_b_date": chart_b_date,
+        "chart_b_city": chart_b_city,
+        "chart_b_full_placements": chart_b_full_placements,
+        "chart_b_aspects": chart_b_aspects,
+        "chart_b_patterns": chart_b_patterns,
+        "chart_b_dignities": chart_b_dignities,
+        "chart_b_dispositors": chart_b_dispositors,
+        "chart_b_sect": chart_b_sect,
+        "inter_chart_aspects": inter_chart_aspects_raw,
+    }
+
+
 def build_reading(
     question: str,
     chart: "AstrologicalChart",
@@ -191,6 +268,14 @@ def build_reading(
         _uq_id = _uq.id
 
     # ── 1. Comprehend the question ───────────────────────────────────
+    # Question-independent chart facts are built on the pipeline pool
+    # while comprehension waits on the LLM.
+    context_future = None
+    if api_key:
+        context_future = submit(
+            _build_chart_context, chart, chart_b, house_system,
+            max_aspects, edges_inter_chart,
+        )
     comp_result: ComprehensionResult = comprehend(
         question, chart, api_key=api_key,
         known_persons=known_persons,
@@ -223,6 +308,13 @@ def build_reading(
         )
 
     q_graph: QuestionGraph = comp_result.graph  # type: ignore[assignment]
+    # Join before anything below may mutate the chart (ensure_derived_state).
+    if context_future is not None:
+        chart_context = context_future.result()
+    else:
+        chart_context = _build_chart_context(
+            chart, chart_b, house_system, max_aspects, edges_inter_chart,
+        )
     # ── 1b. Potency-ranking branch ──────────────────────────
     # When the question is about planetary power / influence, bypass the
     # circuit-focus filter and instead rank ALL chart planets by their
@@ -231,12 +323,9 @@ def build_reading(
     if q_graph.question_intent == TermIntent.POTENCY_RANKING:
         _ps = getattr(chart, "planetary_states", None)
         if not _ps:
-            try:
-                from src.core.dignity_calc import score_and_attach
-                score_and_attach(chart)
-                _ps = getattr(chart, "planetary_states", None)
-            except Exception:
-                pass
+            from src.core.derived_state import ensure_derived_state
+            _state = ensure_derived_state(chart)
+            _ps = _state.planetary_states if _state else None
         if _ps:
             _tier_map = assign_potency_tiers(_ps)
             _sorted_ps = sorted(
@@ -324,9 +413,6 @@ def build_reading(
     if include_sabians:
         sabians = _build_sabians(relevant_objects)
 
-    sect_fact = _build_sect(chart)
-    switch_points = _build_switch_points(chart, house_system)
-
     # ── Optional NatalInterpreter text ────────────────────────────
     interp_text = ""
     if include_interp_text and relevant_names:
@@ -361,49 +447,6 @@ def build_reading(
     visible_objects: List[str] = []
     if render_result and hasattr(render_result, "visible_objects"):
         visible_objects = list(render_result.visible_objects or [])
-    # ── Full chart context — ALL objects, always included ─────────────────
-    # This gives the LLM complete chart awareness regardless of what the
-    # user has toggled on or what the question's relevance filter captured.
-    full_chart_placements = _build_full_placements(chart, house_system)
-
-    # ── Second chart (biwheel) full placements + full parity facts ────────────
-    chart_b_name = ""
-    chart_b_date = ""
-    chart_b_city = ""
-    chart_b_full_placements: List[PlacementFact] = []
-    chart_b_aspects: List[AspectFact] = []
-    chart_b_patterns: List[PatternFact] = []
-    chart_b_dignities: List[DignityFact] = []
-    chart_b_dispositors: List[DispositorFact] = []
-    chart_b_sect: Optional[SectFact] = None
-    if chart_b is not None:
-        chart_b_full_placements = _build_full_placements(chart_b, house_system)
-        b_hdr = chart_b.header_lines() if hasattr(chart_b, "header_lines") else ("", "", "", "", "")
-        chart_b_name = b_hdr[0] if b_hdr else ""
-        chart_b_date = b_hdr[1] if len(b_hdr) > 1 else ""
-        chart_b_city = b_hdr[3] if len(b_hdr) > 3 else ""
-        # Build full parity classical facts for chart_b
-        _b_all_names: Set[str] = {
-            cobj.object_name.name
-            for cobj in chart_b.objects
-            if cobj.object_name
-        }
-        chart_b_aspects = _build_aspects(chart_b, _b_all_names, max_aspects)
-        chart_b_patterns = _build_patterns(chart_b, _b_all_names)
-        chart_b_dignities = _build_dignities(list(chart_b.objects))
-        chart_b_dispositors = _build_dispositors(chart_b, _b_all_names)
-        chart_b_sect = _build_sect(chart_b)
-
-    # Convert pre-computed inter-chart aspect tuples → serialisable dicts
-    inter_chart_aspects_raw: List[Dict[str, str]] = []
-    for _record in (edges_inter_chart or []):
-        if isinstance(_record, (list, tuple)) and len(_record) >= 3:
-            inter_chart_aspects_raw.append({
-                "planet_1": str(_record[0]),
-                "planet_2": str(_record[1]),
-                "aspect": str(_record[2]),
-            })
-
     # Soft gate: flag when a dyadic question was asked but no second chart loaded
     _needs_chart_b = (
         q_graph.subject_config == "dyadic"
@@ -469,12 +512,10 @@ def build_reading(
         placements=placements,
         aspects=aspects,
         patterns=patterns,
-        switch_points=switch_points,
         dispositors=dispositors,
         dignities=dignities,
         houses=houses,
         sabians=sabians,
-        sect=sect_fact,
         circuit_flows=circuit_flows,
         power_nodes=power_nodes,
         circuit_paths=circuit_paths,
@@ -493,17 +534,7 @@ def build_reading(
         planet_stats=_planet_stats_list,
         planet_profiles=_planet_profiles_list,
         visible_objects=visible_objects,
-        full_chart_placements=full_chart_placements,
-        chart_b_name=chart_b_name,
-        chart_b_date=chart_b_date,
-        chart_b_city=chart_b_city,
-        chart_b_full_placements=chart_b_full_placements,
-        chart_b_aspects=chart_b_aspects,
-        chart_b_patterns=chart_b_patterns,
-        chart_b_dignities=chart_b_dignities,
-        chart_b_dispositors=chart_b_dispositors,
-        chart_b_sect=chart_b_sect,
-        inter_chart_aspects=inter_chart_aspects_raw,
+        **chart_context,
         # ── 5W+H rich comprehension fields ──
         persons=[p.to_dict() for p in q_graph.persons] if q_graph.persons else [],
         story_objects=[o.to_dict() for o in q_graph.story_objects] if q_graph.story_objects else [],
@@ -518,6 +549,7 @@ def build_reading(
         # ── Dev debug fields ──
         debug_q_graph=q_graph.to_dict(),
         debug_comprehension_source=q_graph.source,
+        debug_comprehension_cached=comp_result.from_cache,
         debug_relevant_factors=merged_factors,
         debug_relevant_objects=sorted(relevant_names),
         debug_circuit_summary=_circuit_debug,
@@ -523,6 +523,7 @@ class ReadingPacket:
     # Populated by build_reading() for the dev inner-monologue expander.
     debug_q_graph: Dict[str, Any] = field(default_factory=dict)     # QuestionGraph.to_dict()
     debug_comprehension_source: str = ""                             # "keyword" | "llm"
+    debug_comprehension_cached: bool = False                         # graph from READING_CACHE
     debug_relevant_factors: List[str] = field(default_factory=list) # merged factors list
     debug_relevant_objects: List[str] = field(default_factory=list) # object names selected
     debug_circuit_summary: Dict[str, Any] = field(default_factory=dict)  # circuit stats
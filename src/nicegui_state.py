@@ -10,10 +10,13 @@ Usage:
 """
 from __future__ import annotations
 
+import uuid
 from typing import Any, Dict
 
 from nicegui import app
 
+from src.chart_cache import LIVE_CHARTS
+
 
 # ---------------------------------------------------------------------------
 # Default state template
@@ -42,11 +45,13 @@ _DEFAULTS: Dict[str, Any] = {
 
     # ── Chart results ────────────────────────────────────────────────
     # NOTE: NiceGUI user storage is JSON-backed, so we store the chart
-    # as its serializable dict (via AstrologicalChart.to_json()).
-    # Use get_chart_object() in app.py to reconstruct the Python object.
-    "last_chart_json": None,       # AstrologicalChart.to_json() dict
+    # in its compact packed form (AstrologicalChart.to_compact(), see
+    # src/core/chart_store.py).  Use get_chart_object() to reconstruct the
+    # Python object; full to_json() dicts from older sessions still load.
+    "last_chart_json": None,       # AstrologicalChart.to_compact() dict
     "last_chart_2_json": None,     # outer chart (synastry / transit)
     "last_chart_2": None,          # second chart (synastry / transit)
+    "chart_cache_key": None,       # this session's key in chart_cache.LIVE_CHARTS
     "chart_2_source": None,        # "profile" | "transit" | None
     "chart_ready": False,
 
@@ -112,27 +117,63 @@ def ensure_state() -> Dict[str, Any]:
     return state
 
 
-def get_chart_object(state: Dict[str, Any]):
-    """Reconstruct an AstrologicalChart from the stored JSON dict, or None.
-
-    The chart is stored as ``state["last_chart_json"]`` (a plain dict from
-    ``AstrologicalChart.to_json()``).  This helper deserialises it back into
-    a live Python object on demand.
-    """
-    raw = state.get("last_chart_json")
+def _chart_from_raw(raw: Any):
+    """Deserialise a stored chart dict — packed or legacy ``to_json()``."""
     if raw is None or not isinstance(raw, dict):
         return None
+    from src.core.chart_store import is_packed
     from src.core.models_v2 import AstrologicalChart
+    if is_packed(raw):
+        return AstrologicalChart.from_compact(raw)
     return AstrologicalChart.from_json(raw)
 
 
-def get_chart_2_object(state: Dict[str, Any]):
-    """Reconstruct the second (outer / transit) AstrologicalChart, or None."""
-    raw = state.get("last_chart_2_json")
+def session_key(state: Dict[str, Any]) -> str:
+    """Stable per-session token (stored in *state*) for server-side caches."""
+    key = state.get("chart_cache_key")
+    if not key:
+        key = state["chart_cache_key"] = uuid.uuid4().hex
+    return key
+
+
+def _cached_chart(state: Dict[str, Any], slot: str):
+    """Live chart for ``state[slot]``, served from the per-session cache."""
+    raw = state.get(slot)
     if raw is None or not isinstance(raw, dict):
         return None
-    from src.core.models_v2 import AstrologicalChart
-    return AstrologicalChart.from_json(raw)
+    return LIVE_CHARTS.get(session_key(state), raw, _chart_from_raw)
+
+
+def store_chart(state: Dict[str, Any], slot: str, chart) -> None:
+    """Store *chart* in ``state[slot]`` (packed) and keep the live object cached.
+
+    *slot* is ``"last_chart_json"`` or ``"last_chart_2_json"``.  Seeding the
+    cache means the next get_chart_object() doesn't rebuild a chart that
+    was just computed.  ``chart=None`` clears the slot.
+    """
+    if chart is None:
+        state[slot] = None
+        return
+    raw = chart.to_compact()
+    state[slot] = raw
+    LIVE_CHARTS.put(session_key(state), raw, chart)
+
+
+def get_chart_object(state: Dict[str, Any]):
+    """Reconstruct an AstrologicalChart from the stored chart dict, or None.
+
+    The chart is stored as ``state["last_chart_json"]`` (a packed dict from
+    ``AstrologicalChart.to_compact()``, or a full ``to_json()`` dict from an
+    older session).  The live object is cached per session and keyed by the
+    dict's content (see src/chart_cache.py), so repeated calls between
+    chart changes don't deserialise it again.
+    """
+    return _cached_chart(state, "last_chart_json")
+
+
+def get_chart_2_object(state: Dict[str, Any]):
+    """Reconstruct the second (outer / transit) AstrologicalChart, or None."""
+    return _cached_chart(state, "last_chart_2_json")
 
 
 def get_profile_lat_lon(state: Dict[str, Any]) -> tuple[float | None, float | None]:
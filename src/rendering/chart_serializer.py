@@ -23,6 +23,8 @@ from src.core.models_v2 import (
     ShapeCircuit,
     static_db,
 )
+from src.core.derived_state import ensure_derived_state
+from src.core.houses import assign_houses
 
 # PlanetStats is used by the interactive chart tooltips (when the \"Interactive Chart\" mode is active).
 from src.core.planet_profiles import PlanetStats, PlanetStatsReader
@@ -161,7 +163,12 @@ def _serialize_object(obj: Any, house_system: str, chart: AstrologicalChart, is_
     elif hs in ("whole", "wholesign", "whole sign"):
         house_num = _house_number(obj.whole_sign_house)
     else:
-        house_num = _house_number(obj.placidus_house)
+        # Koch / Campanus / Regiomontanus / Porphyry: assign from the cusp arrays
+        cusps = chart.cusps_for(hs) if chart is not None else None
+        if cusps is not None and obj.longitude is not None:
+            house_num = int(assign_houses([obj.longitude], cusps)[0])
+        else:
+            house_num = _house_number(obj.placidus_house)
 
     # Degree within sign
     deg_in_sign = int(obj.longitude % 30) if obj.longitude is not None else 0
@@ -350,17 +357,11 @@ def _edge_matches(edge: CircuitEdge, a: str, b: str, aspect: str) -> bool:
 
 def _serialize_houses(chart: AstrologicalChart, house_system: str) -> list[dict]:
     """Serialize house cusps for the active system."""
-    hs = (house_system or "placidus").strip().lower().replace(" ", "")
-    cusp_rows = [
-        c for c in chart.house_cusps
-        if (c.house_system or "").strip().lower().replace(" ", "") == hs
-    ]
-    cusp_rows.sort(key=lambda c: c.cusp_number)
+    cusps = chart.cusps_for(house_system)
 
     houses = []
-    for c in cusp_rows:
-        num = c.cusp_number
-        deg = _safe_float(c.absolute_degree)
+    for num, deg in enumerate([] if cusps is None else cusps.tolist(), start=1):
+        deg = _safe_float(deg)
         sign_idx = int(deg // 30) % 12
         sign_name = SIGN_NAMES[sign_idx]
         deg_in_sign = int(deg % 30)
@@ -555,6 +556,8 @@ def serialize_chart_for_rendering(
     dict
         JSON-safe payload for the interactive chart component.
     """
+    # Charts rebuilt from storage carry no strength / circuit state yet
+    ensure_derived_state(chart)
     unknown_time = getattr(chart, "unknown_time", False)
     asc_deg = _get_asc_degree(chart) if not unknown_time else 0.0
 
@@ -790,6 +793,8 @@ def serialize_biwheel_for_rendering(
     dict
         JSON-safe payload for the interactive biwheel chart component.
     """
+    ensure_derived_state(chart_1)
+    ensure_derived_state(chart_2)
     unknown_time_1 = getattr(chart_1, "unknown_time", False)
     unknown_time_2 = getattr(chart_2, "unknown_time", False)
     asc_deg_1 = _get_asc_degree(chart_1) if not unknown_time_1 else 0.0
@@ -687,4 +687,22 @@ def plot_dispositor_graph(plot_data, chart, header_info=None, house_system=None)
 
     plt.subplots_adjust(left=0.02, right=0.98, top=0.92 if header_info else 0.98, bottom=0.05)
     if header_info: _draw_dispositor_header(fig, header_info)
-    return fig
\ No newline at end of file
+    return fig
+
+def render_dispositor_png(plot_data, chart, header_info=None, house_system=None):
+    """:func:`plot_dispositor_graph` as PNG bytes (None if nothing to draw).
+
+    Picklable entry point for rendering in a worker process.
+    """
+    import io
+
+    fig = plot_dispositor_graph(plot_data, chart, header_info=header_info, house_system=house_system)
+    if fig is None:
+        return None
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, format="png", bbox_inches="tight",
+                    facecolor=fig.get_facecolor(), edgecolor="none")
+    finally:
+        plt.close(fig)
+    return buf.getvalue()
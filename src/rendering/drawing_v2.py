@@ -5,7 +5,9 @@ Produces publication-quality natal, transit, and synastry chart images
 as PNG bytes.  Handles zodiac rings, house cusps, object glyphs,
 aspect lines, shape overlays, singleton dots, and compass-mode layout.
 The public entry points are :func:`render_chart` and
-:func:`render_chart_with_shapes`.
+:func:`render_chart_with_shapes`; with ``draw_backdrop=False`` they leave
+out the static wheel (:func:`draw_wheel_backdrop`) so it can be composited
+from a cached raster (:mod:`src.rendering.wheel_layers`).
 """
 from __future__ import annotations
 import re, math
@@ -149,6 +151,29 @@ def group_color_for(idx: int) -> str:
 		return "teal"
 
 
+def _chart_cusps(chart: AstrologicalChart, house_system: str) -> list[float]:
+	"""12 cusp longitudes for *house_system* (any supported system/alias), or []."""
+	if chart is None:
+		return []
+	arr = chart.cusps_for(house_system)
+	return [] if arr is None else [float(c) for c in arr]
+
+def _draw_cusp_lines(ax, cusps: Sequence[float], asc_deg: float, dark_mode: bool) -> None:
+	"""Radial house cusp lines across the full wheel."""
+	line_color = "#A0A0A0" if not dark_mode else "#333333"
+	for deg in cusps:
+		rad = deg_to_rad(deg, asc_deg)
+		ax.plot(
+			[rad, rad],
+			[0, 1.45],  # full radius of the wheel
+			color=line_color,
+			linestyle="solid",
+			linewidth=1.2,
+			zorder=0.5,  # slightly above background, but below zodiac bars (which are zorder=0)
+			solid_capstyle="butt",
+			antialiased=True,
+		)
+
 def draw_house_cusps(
 	ax,
 	chart: AstrologicalChart,
@@ -162,54 +187,14 @@ def draw_house_cusps(
 	draw_labels: bool = True,
 ) -> list[float]:
 	"""Draw house cusp lines and labels on the polar axes."""
-	system_map = {
-		"placidus": "Placidus",
-		"equal": "Equal",
-		"equal house": "Equal",
-		"whole": "Whole Sign",
-		"wholesign": "Whole Sign",
-		"whole sign": "Whole Sign",
-	}
-	# Map all display variants to the canonical key stored in HouseCusp.house_system
-	_canonical = {
-		"placidus": "placidus",
-		"equal": "equal",
-		"equal house": "equal",
-		"whole": "whole",
-		"wholesign": "whole",
-		"whole sign": "whole",
-	}
-	sys_key = (house_system or "placidus").strip().lower()
-	sys_label = system_map.get(sys_key, system_map["placidus"])
-	canonical = _canonical.get(sys_key, sys_key)
-
-	cusps: list[float] = []
-	if chart is not None:
-		cusp_rows = [
-			c for c in chart.house_cusps
-			if (c.house_system or "").strip().lower() == canonical
-		]
-		cusp_rows.sort(key=lambda c: c.cusp_number)
-		cusps = [float(c.absolute_degree) for c in cusp_rows if c is not None]
+	cusps = _chart_cusps(chart, house_system)
 
 	if len(cusps) != 12:
 		start = asc_deg % 360.0
 		cusps = [(start + i * 30.0) % 360.0 for i in range(12)]
 
 	if draw_lines:
-		line_color = "#A0A0A0" if not dark_mode else "#333333"
-		for deg in cusps:
-			rad = deg_to_rad(deg, asc_deg)
-			ax.plot(
-				[rad, rad],
-				[0, 1.45],  # full radius of the wheel
-				color=line_color,
-				linestyle="solid",
-				linewidth=1.2,
-				zorder=0.5,  # slightly above background, but below zodiac bars (which are zorder=0)
-				solid_capstyle="butt",
-				antialiased=True,
-			)
+		_draw_cusp_lines(ax, cusps, asc_deg, dark_mode)
 
 	if draw_labels:
 		lbl_color = "white" if dark_mode else "black"
@@ -680,6 +665,53 @@ def draw_compass_rose(
 		zorder=z_nodal_top,
 	)
 
+# ---------------------------------------------------------------------------
+# Wheel figure + static backdrop
+# ---------------------------------------------------------------------------
+def setup_wheel_axes(fig, ax, dark_mode: bool, *, transparent: bool = False) -> None:
+	"""Apply the shared polar-wheel layout to *ax* / *fig*.
+
+	Every single-wheel renderer and the cached backdrop
+	(:mod:`src.rendering.wheel_layers`) use this, so their axes land on
+	the same pixels.  *transparent* leaves the figure background unpainted
+	for a dynamic layer that is composited over a backdrop.
+	"""
+	if transparent:
+		fig.patch.set_alpha(0.0)
+	elif dark_mode:
+		ax.set_facecolor("black")
+		fig.patch.set_facecolor("black")
+
+	ax.set_theta_zero_location("N")
+	ax.set_theta_direction(-1)
+	ax.set_rlim(0, 1.60)
+	ax.axis("off")
+
+	# Center and fill
+	ax.set_anchor("C")
+	ax.set_aspect("equal", adjustable="box")
+	fig.subplots_adjust(left=0, right=0.85, top=0.95, bottom=0.05)
+
+def draw_wheel_backdrop(
+	ax,
+	asc_deg: float,
+	cusps: Sequence[float],
+	dark_mode: bool,
+	*,
+	degree_markers: bool = True,
+	zodiac_labels: bool = True,
+) -> None:
+	"""Draw the toggle-independent wheel: cusp lines, degree ticks, zodiac ring.
+
+	*cusps* are the 12 house cusps as returned by :func:`draw_house_cusps`
+	(empty for unknown-time charts, which have no cusp lines).
+	"""
+	_draw_cusp_lines(ax, cusps, asc_deg, dark_mode)
+	if degree_markers:
+		draw_degree_markers(ax, asc_deg, dark_mode)
+	if zodiac_labels:
+		draw_zodiac_signs(ax, asc_deg, dark_mode)
+
 # ---------------------------------------------------------------------------
 # High-level renderer
 # ---------------------------------------------------------------------------
@@ -706,6 +738,9 @@ class RenderResult:
 	outer_positions: Optional[Dict[str, float]] = None
 	outer_cusps: Optional[List[float]] = None
 
+	# Rotation of the wheel (0 for unknown-time charts)
+	asc_deg: Optional[float] = None
+
 def render_chart(
 	chart: AstrologicalChart,
 	*,
@@ -724,6 +759,7 @@ def render_chart(
 	patterns: List[List[str]] = None,
 	shapes: List[Dict[str, Any]] = None,
 	singleton_map: Dict[str, Any] = None,
+	draw_backdrop: bool = True,
 ):
 	# Set safe defaults immediately inside the function
 	patterns = patterns or []
@@ -739,19 +775,7 @@ def render_chart(
 	visible_canon = _expand_visible_canon(visible_names)
 
 	fig, ax = plt.subplots(figsize=figsize, dpi=dpi, subplot_kw={"projection": "polar"})
-	if dark_mode:
-		ax.set_facecolor("black")
-		fig.patch.set_facecolor("black")
-
-	ax.set_theta_zero_location("N")
-	ax.set_theta_direction(-1)
-	ax.set_rlim(0, 1.60)  # Match render_chart_with_shapes
-	ax.axis("off")
-
-	# Center and fill - match render_chart_with_shapes
-	ax.set_anchor("C")
-	ax.set_aspect("equal", adjustable="box")
-	fig.subplots_adjust(left=0, right=0.85, top=0.95, bottom=0.05)
+	setup_wheel_axes(fig, ax, dark_mode, transparent=not draw_backdrop)
 
 	# Header and moon phase
 	try:
@@ -763,11 +787,10 @@ def render_chart(
 
 	cusps: list[float] = []
 	if not unknown_time_chart:
-		cusps = draw_house_cusps(ax, chart, asc_deg, house_system, dark_mode)
-	if degree_markers:
-		draw_degree_markers(ax, asc_deg, dark_mode)
-	if zodiac_labels:
-		draw_zodiac_signs(ax, asc_deg, dark_mode)
+		cusps = draw_house_cusps(ax, chart, asc_deg, house_system, dark_mode, draw_lines=False)
+	if draw_backdrop:
+		draw_wheel_backdrop(ax, asc_deg, cusps, dark_mode,
+							degree_markers=degree_markers, zodiac_labels=zodiac_labels)
 
 	draw_planet_labels(ax, positions, asc_deg, label_style=label_style, dark_mode=dark_mode, chart=chart)
 
@@ -849,6 +872,7 @@ def render_chart(
 		shapes=shapes,
 		singleton_map=singleton_map,
 		plot_data={"chart": chart},
+		asc_deg=asc_deg,
 	)
 
 # --- CHART RENDERER (full; calls your new helpers) -------------------------
@@ -860,6 +884,7 @@ def render_chart_with_shapes(
 	figsize=(5.0, 5.0),
 	dpi=144,
 	compass_on: bool = True,
+	draw_backdrop: bool = True,
 ):
 	"""Render the full chart wheel with active pattern/shape overlays."""
 	plt.close('all')  # Kill any background figures before starting
@@ -868,19 +893,7 @@ def render_chart_with_shapes(
 	asc_deg = _get_ascendant_degree(chart)
 	if unknown_time_chart:
 		asc_deg = 0.0
-	if dark_mode:
-		ax.set_facecolor("black")
-		fig.patch.set_facecolor("black")
-
-	ax.set_theta_zero_location("N")
-	ax.set_theta_direction(-1)
-	ax.set_rlim(0, 1.60)
-	ax.axis("off")
-
-	# Center and fill
-	ax.set_anchor("C")
-	ax.set_aspect("equal", adjustable="box")
-	fig.subplots_adjust(left=0, right=0.85, top=0.95, bottom=0.05)
+	setup_wheel_axes(fig, ax, dark_mode, transparent=not draw_backdrop)
 
 	# Header and moon phase
 	try:
@@ -893,9 +906,9 @@ def render_chart_with_shapes(
 	# Base wheel
 	cusps: list[float] = []
 	if not unknown_time_chart:
-		cusps = draw_house_cusps(ax, chart, asc_deg, house_system, dark_mode)
-	draw_degree_markers(ax, asc_deg, dark_mode)
-	draw_zodiac_signs(ax, asc_deg, dark_mode)
+		cusps = draw_house_cusps(ax, chart, asc_deg, house_system, dark_mode, draw_lines=False)
+	if draw_backdrop:
+		draw_wheel_backdrop(ax, asc_deg, cusps, dark_mode)
 	draw_planet_labels(ax, pos, asc_deg, label_style, dark_mode, chart=chart)
 
 	active_parents = set(i for i, show in enumerate(toggles) if show)
@@ -1089,6 +1102,7 @@ def render_chart_with_shapes(
 		singleton_map=singleton_map,
 		out_text=out_text, # Added this to the dataclass above
 		plot_data={"chart": chart},
+		asc_deg=asc_deg,
 	)
 
 # ---------------------------------------------------------------------------
@@ -1936,25 +1950,7 @@ def draw_house_cusps_biwheel(
 	r_inner, r_outer, draw_labels=False, label_frac=0.50
 ):
 	"""Draw house cusps between two radii for biwheel charts."""
-	system_map = {
-		"placidus": "Placidus",
-		"equal": "Equal",
-		"equal house": "Equal",
-		"whole": "Whole Sign",
-		"wholesign": "Whole Sign",
-	}
-	sys_key = (house_system or "placidus").strip().lower()
-	sys_label = system_map.get(sys_key, system_map["placidus"])
-
-	cusps: list[float] = []
-	if chart is not None:
-		system_key = sys_key.replace(" ", "")
-		cusp_rows = [
-			c for c in chart.house_cusps
-			if (c.house_system or "").strip().lower().replace(" ", "") == system_key
-		]
-		cusp_rows.sort(key=lambda c: c.cusp_number)
-		cusps = [float(c.absolute_degree) for c in cusp_rows if c is not None]
+	cusps = _chart_cusps(chart, house_system)
 
 	if len(cusps) != 12:
 		start = asc_deg % 360.0
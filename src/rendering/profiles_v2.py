@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any, List, Dict
 from src.core.models_v2 import AstrologicalChart, ChartObject, ReceptionLink, SabianSymbol
 from collections import defaultdict
+import numpy as np
 import pandas as pd
 import re
 import html
@@ -196,18 +197,88 @@ def load_fixed_star_catalog(path: str | Path = DEFAULT_STAR_CATALOG) -> pd.DataF
     df = df.dropna(subset=["Name", "Longitude"])
     return df
 
+class FixedStarIndex:
+    """
+    Precompiled lookup over a fixed-star catalog.
+
+    Star longitudes are normalised to [0, 360), sorted once, and padded with
+    ±360° copies so an orb window that crosses 0° Aries is still a single
+    contiguous slice.  Each query is two binary searches plus an exact
+    separation check on the (few) candidates in the window.
+    """
+
+    def __init__(self, catalog: pd.DataFrame):
+        lons = np.mod(catalog["Longitude"].to_numpy(dtype=float), 360.0)
+        names = np.array([str(n) for n in catalog["Name"]], dtype=object)
+        order = np.argsort(lons, kind="stable")
+        n = len(order)
+        # Unwrapped copy: [lon - 360, lon, lon + 360] keeps windows contiguous.
+        self._lons = np.concatenate([lons[order] - 360.0, lons[order], lons[order] + 360.0])
+        self._names = np.concatenate([names[order]] * 3)
+        # Catalog row of every entry, used to break separation ties the way
+        # the original row-order scan did.
+        self._rows = np.concatenate([order] * 3)
+        self._raw = np.concatenate([lons[order]] * 3)
+        self._size = n
+
+    def __len__(self) -> int:
+        return self._size
+
+    def query(self, lon_abs: float, orb: float = 1.0) -> List[Dict]:
+        """Return stars within *orb* of *lon_abs*, closest first."""
+        return self.query_many([lon_abs], orb=orb)[0]
+
+    def query_many(self, lons, orb: float = 1.0) -> List[List[Dict]]:
+        """
+        Batch lookup for every longitude in *lons* (e.g. all objects of a chart).
+
+        Returns one hit list per input longitude, in input order, using the
+        same row format as :func:`find_fixed_star_conjunctions`.
+        """
+        points = np.asarray(list(lons), dtype=float)
+        if points.size == 0:
+            return []
+        if self._size == 0:
+            return [[] for _ in range(points.size)]
+        orb = float(orb)
+        # A window wider than the circle would see the padded copies twice.
+        orb_win = min(orb, 180.0)
+        centres = np.mod(points, 360.0)
+        # Small pad so float rounding at the window edge never drops a star;
+        # the exact <= orb test below is what decides membership.
+        lo = np.searchsorted(self._lons, centres - orb_win - 1e-9, side="left")
+        hi = np.searchsorted(self._lons, centres + orb_win + 1e-9, side="right")
+
+        out: List[List[Dict]] = []
+        for lon_abs, start, stop in zip(points, lo, hi):
+            hits = []
+            seen = set()
+            for k in range(start, stop):
+                row = int(self._rows[k])
+                if row in seen:
+                    continue
+                sep = _sep_deg(float(lon_abs), float(self._raw[k]))
+                if sep <= orb:
+                    seen.add(row)
+                    hits.append((sep, row, self._names[k]))
+            hits.sort(key=lambda h: (h[0], h[1]))
+            out.append([
+                {"Name": name, "sep": float(sep), "orb": orb}
+                for sep, _row, name in hits
+            ])
+        return out
+
+
 def find_fixed_star_conjunctions(lon_abs: float, catalog: pd.DataFrame, orb: float = 1.0) -> List[Dict]:
     """
     Return stars conjunct with `lon_abs` within `orb` degrees.
     Output rows: [{"Name": "...", "sep": <deg>, "orb": <orb>}, ...], sorted by smallest separation.
+
+    Thin wrapper over :class:`FixedStarIndex`; the default catalog reuses the
+    module-level ``STAR_INDEX`` so no per-call scan is needed.
     """
-    hits: List[Dict] = []
-    for _, r in catalog.iterrows():
-        sep = _sep_deg(lon_abs, float(r["Longitude"]))
-        if sep <= orb:
-            hits.append({"Name": str(r["Name"]), "sep": float(sep), "orb": float(orb)})
-    hits.sort(key=lambda x: x["sep"])
-    return hits
+    index = STAR_INDEX if catalog is STAR_CATALOG else FixedStarIndex(catalog)
+    return index.query(lon_abs, orb=orb)
 
 
 # Optional: load your default catalog at import-time (matches your snippet)
@@ -222,6 +293,7 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__fil
 star_path = os.path.join(BASE_DIR, "fixed_stars.xlsx") 
 
 STAR_CATALOG = load_fixed_star_catalog(star_path)
+STAR_INDEX = FixedStarIndex(STAR_CATALOG)
 
 
 # ----- Profile ordering helpers -------------------------------------------------
@@ -971,7 +1043,9 @@ __all__ = [
     "sabian_for",
     "load_fixed_star_catalog",
     "find_fixed_star_conjunctions",
+    "FixedStarIndex",
     "STAR_CATALOG",
+    "STAR_INDEX",
     "ordered_objects",
     "ordered_object_rows",
 ]
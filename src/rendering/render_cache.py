@@ -0,0 +1,202 @@
+"""
+Bounded cache of rendered chart PNGs.
+
+Every toggle click in the Circuits / Standard tabs re-renders the wheel
+through matplotlib (a full polar figure plus ``savefig`` at dpi=192), and
+users flip the same toggles back and forth.  :class:`RenderCache` keeps
+the PNG bytes keyed by :func:`render_key` — the content digests of the
+chart(s), the mode and a canonical form of ``RenderToggles`` — in an LRU
+bounded by total bytes.
+
+In-process renders that go through :meth:`RenderCache.get_or_render`
+share one lock, because pyplot's figure bookkeeping is not thread-safe.
+That also lets the cache optionally pre-render likely next states (e.g.
+all circuits on / off) on a single background thread: set
+``ROSETTA_RENDER_PREFETCH=1`` to enable it.  Callers that render in a
+worker process use :meth:`RenderCache.get` / :meth:`RenderCache.put`.
+
+PNG bytes are immutable and keyed by chart content, so entries are shared
+across sessions.
+"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from cachetools import LRUCache
+
+_log = logging.getLogger(__name__)
+
+# Env var that turns on background pre-rendering ("1" / "true" / "yes").
+PREFETCH_ENV = "ROSETTA_RENDER_PREFETCH"
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-safe, order-independent form of a toggle value.
+
+    Toggle dicts are read with ``.get(key, False)`` everywhere, so only the
+    enabled keys matter; ``repr`` keeps ``1`` and ``"1"`` distinct.
+    """
+    if isinstance(value, dict):
+        return sorted(repr(k) for k, v in value.items() if v)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def canonical_toggles(toggles: Any) -> Dict[str, Any]:
+    """``RenderToggles`` (or any dataclass) as a canonical dict."""
+    return {f.name: _canonical(getattr(toggles, f.name))
+            for f in dataclasses.fields(toggles)}
+
+
+def render_key(chart_digests: Sequence[str], mode: str, toggles: Any,
+               extra: Optional[Dict[str, Any]] = None) -> str:
+    """Cache key for one rendered image.
+
+    *extra* carries any other state the renderer reads (biwheel submode,
+    connected-circuit selections, ...).
+    """
+    blob = json.dumps(
+        [list(chart_digests), mode, canonical_toggles(toggles), extra or {}],
+        sort_keys=True, separators=(",", ":"), default=str,
+    )
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _prefetch_from_env() -> bool:
+    return os.environ.get(PREFETCH_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+class RenderCache:
+    """Thread-safe, byte-bounded LRU of rendered PNGs with optional prefetch."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024,
+                 prefetch: Optional[bool] = None) -> None:
+        self._images: LRUCache = LRUCache(maxsize=max_bytes, getsizeof=len)
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self.prefetch_enabled = _prefetch_from_env() if prefetch is None else prefetch
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: set = set()
+        self._prefetched: set = set()
+        self._counts = {"hits": 0, "misses": 0, "prefetched": 0,
+                        "prefetch_hits": 0, "prefetch_errors": 0}
+
+    def _lookup(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            png = self._images.get(key)
+            if png is not None:
+                self._counts["hits"] += 1
+                if key in self._prefetched:
+                    self._prefetched.discard(key)
+                    self._counts["prefetch_hits"] += 1
+            return png
+
+    def _store(self, key: str, png: Optional[bytes]) -> None:
+        if png is None or len(png) > self._images.maxsize:
+            return
+        with self._lock:
+            self._images[key] = png
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached PNG for *key*, or None (counted as a miss).
+
+        For callers that render elsewhere (e.g. in a worker process) and
+        hand the result back with :meth:`put`.
+        """
+        png = self._lookup(key)
+        if png is None:
+            with self._lock:
+                self._counts["misses"] += 1
+        return png
+
+    def put(self, key: str, png: Optional[bytes]) -> None:
+        """Store a PNG rendered outside :meth:`get_or_render`."""
+        self._store(key, png)
+
+    def get_or_render(self, key: str, render: Callable[[], Optional[bytes]]) -> Optional[bytes]:
+        """Return the cached PNG for *key*, rendering (and caching) it on a miss."""
+        png = self._lookup(key)
+        if png is not None:
+            return png
+        with self._render_lock:
+            # A prefetch may have produced it while we waited for the lock.
+            png = self._lookup(key)
+            if png is not None:
+                return png
+            with self._lock:
+                self._counts["misses"] += 1
+            png = render()
+        self._store(key, png)
+        return png
+
+    def prefetch(self, key: str, render: Callable[[], Optional[bytes]]) -> bool:
+        """Queue *render* on the background thread unless *key* is cached or queued.
+
+        Returns True if a job was queued.  No-op when prefetch is disabled.
+        """
+        if not self.prefetch_enabled:
+            return False
+        with self._lock:
+            if key in self._images or key in self._pending:
+                return False
+            self._pending.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="render-prefetch")
+        self._executor.submit(self._prefetch_job, key, render)
+        return True
+
+    def _prefetch_job(self, key: str, render: Callable[[], Optional[bytes]]) -> None:
+        try:
+            with self._render_lock:
+                with self._lock:
+                    if key in self._images:
+                        return
+                png = render()
+            self._store(key, png)
+            if png is not None:
+                with self._lock:
+                    self._prefetched.add(key)
+                    self._counts["prefetched"] += 1
+                    if len(self._prefetched) > 1024:
+                        # Forget prefetched keys the LRU already evicted.
+                        self._prefetched.intersection_update(self._images.keys())
+        except Exception:
+            _log.debug("Prefetch render failed", exc_info=True)
+            with self._lock:
+                self._counts["prefetch_errors"] += 1
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+            self._prefetched.clear()
+            for k in self._counts:
+                self._counts[k] = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Hit/miss and prefetch counters, hit rate and current size."""
+        with self._lock:
+            out: Dict[str, object] = dict(self._counts)
+            total = out["hits"] + out["misses"]
+            out["hit_rate"] = round(out["hits"] / total, 4) if total else None
+            out["entries"] = len(self._images)
+            out["bytes"] = self._images.currsize
+            out["max_bytes"] = self._images.maxsize
+            out["prefetch_enabled"] = self.prefetch_enabled
+            out["prefetch_pending"] = len(self._pending)
+            return out
+
+
+# Shared by every session in the process.
+RENDER_CACHE = RenderCache()
@@ -0,0 +1,193 @@
+"""
+Layered single-wheel rendering: cached static backdrop + dynamic overlay.
+
+Most of a wheel render is spent on parts that never change with the
+toggles — 468 degree tick lines, the zodiac ring and the house cusp lines.
+:func:`render_layered_png` draws those once per
+``(asc_deg, cusps, dark_mode, figsize, dpi, ...)`` into an RGBA raster
+(:class:`BackdropCache`), and per request draws only the dynamic layer
+(header, house numbers, planets, aspects, shapes, compass, earth) on a
+transparent figure with the same axes geometry, alpha-composites it over
+the backdrop with PIL and crops like ``savefig(bbox_inches="tight")``.
+
+Everything in the backdrop sits below every dynamic artist in the full
+renderer as well, so the composite matches it up to sub-pixel placement
+of the tight crop.
+"""
+from __future__ import annotations
+
+import io
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import matplotlib
+from cachetools import LRUCache
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
+from PIL import Image
+
+
+@dataclass(frozen=True)
+class Backdrop:
+    """Rasterised static wheel for one figure geometry."""
+    image: Image.Image            # RGBA, full figure canvas
+    tight_bbox: Optional[Bbox]    # inches, as Figure.get_tightbbox returns
+    facecolor: Tuple[int, int, int, int]
+
+    @property
+    def nbytes(self) -> int:
+        w, h = self.image.size
+        return w * h * 4
+
+
+def backdrop_key(asc_deg: float, cusps: Sequence[float], dark_mode: bool,
+                 figsize: Sequence[float], dpi: int, *,
+                 degree_markers: bool = True, zodiac_labels: bool = True) -> Tuple:
+    """Cache key for a backdrop; angles are rounded to 1e-6°."""
+    return (
+        round(float(asc_deg), 6),
+        tuple(round(float(c), 6) for c in cusps),
+        bool(dark_mode),
+        tuple(float(v) for v in figsize),
+        int(dpi),
+        bool(degree_markers),
+        bool(zodiac_labels),
+    )
+
+
+def _rgba255(color: Any) -> Tuple[int, int, int, int]:
+    return tuple(int(round(c * 255)) for c in matplotlib.colors.to_rgba(color))
+
+
+def _canvas_image(fig: Figure) -> Image.Image:
+    canvas = fig.canvas
+    if not isinstance(canvas, FigureCanvasAgg):
+        canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    buf = canvas.buffer_rgba()
+    return Image.frombuffer("RGBA", (buf.shape[1], buf.shape[0]), bytes(buf), "raw", "RGBA", 0, 1)
+
+
+def render_backdrop(asc_deg: float, cusps: Sequence[float], dark_mode: bool,
+                    figsize: Sequence[float], dpi: int, *,
+                    degree_markers: bool = True, zodiac_labels: bool = True) -> Backdrop:
+    """Draw and rasterise the static wheel (no pyplot; safe off the main thread)."""
+    from src.rendering.drawing_v2 import draw_wheel_backdrop, setup_wheel_axes
+
+    fig = Figure(figsize=tuple(figsize), dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(projection="polar")
+    setup_wheel_axes(fig, ax, dark_mode)
+    draw_wheel_backdrop(ax, asc_deg, cusps, dark_mode,
+                        degree_markers=degree_markers, zodiac_labels=zodiac_labels)
+    image = _canvas_image(fig)
+    return Backdrop(
+        image=image,
+        tight_bbox=fig.get_tightbbox(fig.canvas.get_renderer()),
+        facecolor=_rgba255(fig.get_facecolor()),
+    )
+
+
+class BackdropCache:
+    """Thread-safe LRU of :class:`Backdrop` rasters bounded by total bytes."""
+
+    def __init__(self, max_bytes: int = 96 * 1024 * 1024) -> None:
+        self._items: LRUCache = LRUCache(maxsize=max_bytes, getsizeof=lambda b: b.nbytes)
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "misses": 0}
+
+    def get(self, key: Tuple, build: Callable[[], Backdrop]) -> Backdrop:
+        """Return the backdrop for *key*, rasterising it with *build* on a miss."""
+        with self._lock:
+            backdrop = self._items.get(key)
+            if backdrop is not None:
+                self._counts["hits"] += 1
+                return backdrop
+            self._counts["misses"] += 1
+        backdrop = build()
+        with self._lock:
+            if backdrop.nbytes <= self._items.maxsize:
+                self._items[key] = backdrop
+        return backdrop
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            for k in self._counts:
+                self._counts[k] = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Hit/miss counters, hit rate and current size."""
+        with self._lock:
+            out: Dict[str, object] = dict(self._counts)
+            total = out["hits"] + out["misses"]
+            out["hit_rate"] = round(out["hits"] / total, 4) if total else None
+            out["entries"] = len(self._items)
+            out["bytes"] = self._items.currsize
+            out["max_bytes"] = self._items.maxsize
+            return out
+
+
+# Shared by every session in the process (and per worker process).
+WHEEL_BACKDROPS = BackdropCache()
+
+
+def _union(a: Optional[Bbox], b: Optional[Bbox]) -> Optional[Bbox]:
+    boxes = [bb for bb in (a, b) if bb is not None and bb.width and bb.height]
+    return Bbox.union(boxes) if boxes else None
+
+
+def composite_png(fig, backdrop: Backdrop, pad_inches: Optional[float] = None) -> bytes:
+    """Composite the (transparent) dynamic *fig* over *backdrop* as PNG bytes.
+
+    Crops to the union of both layers' tight bounding boxes plus
+    *pad_inches* (default ``savefig.pad_inches``), filling any area beyond
+    the canvas with the backdrop's face colour — as ``savefig`` would.
+    """
+    overlay = _canvas_image(fig)
+    if overlay.size != backdrop.image.size:
+        raise ValueError(f"layer size mismatch: {overlay.size} vs {backdrop.image.size}")
+    image = Image.alpha_composite(backdrop.image, overlay)
+
+    if pad_inches is None:
+        pad_inches = matplotlib.rcParams["savefig.pad_inches"]
+    tight = _union(backdrop.tight_bbox, fig.get_tightbbox(fig.canvas.get_renderer()))
+    if tight is not None:
+        tight = tight.padded(pad_inches)
+        # Same pixel box savefig uses: anchored at the bottom-left corner,
+        # size truncated to whole pixels.
+        dpi = fig.dpi
+        width = int(tight.width * dpi + 1e-6)
+        height = int(tight.height * dpi + 1e-6)
+        left = round(tight.x0 * dpi)
+        bottom = image.size[1] - round(tight.y0 * dpi)
+        right, top = left + width, bottom - height
+        if (left, top, right, bottom) != (0, 0) + image.size:
+            framed = Image.new("RGBA", (right - left, bottom - top), backdrop.facecolor)
+            framed.paste(image, (-left, -top))
+            image = framed
+
+    out = io.BytesIO()
+    image.save(out, format="PNG")
+    return out.getvalue()
+
+
+def render_layered_png(rr: Any, *, dark_mode: bool, figsize: Sequence[float], dpi: int,
+                       degree_markers: bool = True, zodiac_labels: bool = True,
+                       cache: Optional[BackdropCache] = None) -> bytes:
+    """PNG for a ``RenderResult`` drawn with ``draw_backdrop=False``.
+
+    Looks up (or rasterises) the matching backdrop and composites
+    ``rr.fig`` over it.  The figure is left open for the caller to close.
+    """
+    asc_deg = rr.asc_deg or 0.0
+    cusps = rr.cusps or []
+    key = backdrop_key(asc_deg, cusps, dark_mode, figsize, dpi,
+                       degree_markers=degree_markers, zodiac_labels=zodiac_labels)
+    backdrop = (cache or WHEEL_BACKDROPS).get(key, lambda: render_backdrop(
+        asc_deg, cusps, dark_mode, figsize, dpi,
+        degree_markers=degree_markers, zodiac_labels=zodiac_labels,
+    ))
+    return composite_png(rr.fig, backdrop)
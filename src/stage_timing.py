@@ -0,0 +1,203 @@
+# src/stage_timing.py
+"""
+Lightweight per-stage timing for the chart pipeline.
+
+``compute_chart`` runs a fixed sequence of stages (calculate_chart, edges,
+receptions, sect, clusters, dispositors, shapes, minor links, circuit
+simulation).  A :class:`StageRecorder` wraps each one, recording wall and
+CPU time on the ``ChartResult`` and feeding a process-wide histogram that
+``app.py`` exposes at ``/metrics``.
+
+Setting ``ROSETTA_PROFILE_DIR`` to a directory makes every pipeline run
+also dump a cProfile ``.prof`` file there (inspect with ``snakeviz`` or
+``python -m pstats``).
+
+Usage:
+    rec = StageRecorder("compute_chart")
+    with rec.stage("calculate_chart"):
+        ...
+    result.stage_timings = rec.timings
+"""
+from __future__ import annotations
+
+import bisect
+import cProfile
+import contextlib
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Env var naming a directory for per-request cProfile dumps (unset = off).
+PROFILE_DIR_ENV = "ROSETTA_PROFILE_DIR"
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +Inf).
+BUCKET_BOUNDS_MS: Tuple[float, ...] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000,
+)
+
+
+@dataclass
+class StageTiming:
+    """Wall and CPU time spent in one pipeline stage.
+
+    ``cpu_ms`` is the recording thread's CPU time, so concurrent requests
+    in other threads do not inflate it.
+    """
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    ok: bool = True
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"wall_ms": round(self.wall_ms, 3),
+                "cpu_ms": round(self.cpu_ms, 3),
+                "ok": self.ok}
+
+
+# ---------------------------------------------------------------------------
+# Process-wide histogram
+# ---------------------------------------------------------------------------
+
+class _Histogram:
+    """Fixed-bucket latency histogram (wall ms) plus CPU and error totals."""
+    __slots__ = ("buckets", "count", "wall_sum", "cpu_sum", "errors")
+
+    def __init__(self) -> None:
+        self.buckets: List[int] = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.wall_sum = 0.0
+        self.cpu_sum = 0.0
+        self.errors = 0
+
+    def observe(self, timing: StageTiming) -> None:
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, timing.wall_ms)] += 1
+        self.count += 1
+        self.wall_sum += timing.wall_ms
+        self.cpu_sum += timing.cpu_ms
+        if not timing.ok:
+            self.errors += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the *q*-quantile (None if +Inf/empty)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else None
+        return None
+
+    def to_dict(self) -> Dict[str, object]:
+        bounds = [str(b) for b in BUCKET_BOUNDS_MS] + ["+Inf"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "wall_ms_sum": round(self.wall_sum, 3),
+            "cpu_ms_sum": round(self.cpu_sum, 3),
+            "wall_ms_p50": self.quantile(0.50),
+            "wall_ms_p95": self.quantile(0.95),
+            "buckets": dict(zip(bounds, self.buckets)),
+        }
+
+
+_LOCK = threading.Lock()
+_HISTOGRAMS: Dict[Tuple[str, str], _Histogram] = {}
+
+
+def _observe(pipeline: str, stage: str, timing: StageTiming) -> None:
+    with _LOCK:
+        hist = _HISTOGRAMS.get((pipeline, stage))
+        if hist is None:
+            hist = _HISTOGRAMS[(pipeline, stage)] = _Histogram()
+        hist.observe(timing)
+
+
+def metrics_snapshot() -> Dict[str, Dict[str, Dict[str, object]]]:
+    """Return ``{pipeline: {stage: histogram-dict}}`` for all recorded stages."""
+    with _LOCK:
+        out: Dict[str, Dict[str, Dict[str, object]]] = {}
+        for (pipeline, stage), hist in _HISTOGRAMS.items():
+            out.setdefault(pipeline, {})[stage] = hist.to_dict()
+        return out
+
+
+def reset_metrics() -> None:
+    """Clear the process-wide histograms (tests / admin reset)."""
+    with _LOCK:
+        _HISTOGRAMS.clear()
+
+
+# ---------------------------------------------------------------------------
+# Recorder
+# ---------------------------------------------------------------------------
+
+class StageRecorder:
+    """Collects per-stage timings for one pipeline run."""
+
+    def __init__(self, pipeline: str) -> None:
+        self.pipeline = pipeline
+        self.timings: Dict[str, StageTiming] = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as stage *name*.
+
+        Exceptions propagate unchanged (callers keep their own try/except);
+        the stage is still recorded, with ``ok=False``.
+        """
+        timing = StageTiming()
+        wall0 = time.perf_counter()
+        cpu0 = time.thread_time()
+        try:
+            yield
+        except BaseException:
+            timing.ok = False
+            raise
+        finally:
+            timing.wall_ms = (time.perf_counter() - wall0) * 1000.0
+            timing.cpu_ms = (time.thread_time() - cpu0) * 1000.0
+            self.timings[name] = timing
+            _observe(self.pipeline, name, timing)
+
+    def total_wall_ms(self) -> float:
+        return sum(t.wall_ms for t in self.timings.values())
+
+
+# ---------------------------------------------------------------------------
+# Optional cProfile dump
+# ---------------------------------------------------------------------------
+
+_SAFE_LABEL = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@contextlib.contextmanager
+def maybe_profile(label: str) -> Iterator[Optional[str]]:
+    """Profile the enclosed block when ``ROSETTA_PROFILE_DIR`` is set.
+
+    Yields the path the ``.prof`` file will be written to, or None when
+    profiling is off.  Failure to write the dump is never fatal.
+    """
+    out_dir = os.environ.get(PROFILE_DIR_ENV, "").strip()
+    if not out_dir:
+        yield None
+        return
+
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    fname = f"{_SAFE_LABEL.sub('_', label) or 'run'}-{stamp}-{os.getpid()}-{time.perf_counter_ns()}.prof"
+    path = os.path.join(out_dir, fname)
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        yield path
+    finally:
+        prof.disable()
+        try:
+            os.makedirs(out_dir, exist_ok=True)
+            prof.dump_stats(path)
+        except OSError:
+            import logging
+            logging.getLogger(__name__).warning("Could not write profile to %s", path)
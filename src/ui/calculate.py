@@ -4,9 +4,11 @@ from __future__ import annotations
 import logging
 from typing import Any, Callable
 
-from nicegui import ui
+from nicegui import run, ui
 
 from src.core.static_data import MONTH_NAMES
+from src.nicegui_state import store_chart
+from src.ui.offload import Superseded, offload
 
 _log = logging.getLogger(__name__)
 
@@ -24,6 +26,9 @@ async def on_calculate(
 ) -> None:
     """Run chart calculation: validate → geocode → compute → render.
 
+    Geocoding runs on a thread and ``compute_chart`` on the ephemeris thread
+    (see src/ui/offload.py), so the event loop stays free meanwhile.
+
     Parameters
     ----------
     state, form : dict
@@ -86,7 +91,7 @@ async def on_calculate(
     try:
         # --- Geocode ---
         from src.core.geocoding import geocode_city_with_timezone
-        lat, lon, tz_name, formatted = geocode_city_with_timezone(city)
+        lat, lon, tz_name, formatted = await run.io_bound(geocode_city_with_timezone, city)
         if lat is None or lon is None or tz_name is None:
             status_label.text = f"Could not geocode '{city}'. Please try a more specific city name."
             status_label.classes(replace="text-body2 text-negative")
@@ -110,7 +115,9 @@ async def on_calculate(
             house_system=(state.get("house_system", "placidus") or "placidus").lower(),
             gender=form.get("gender"),
         )
-        result = compute_chart(inputs)
+        result = await offload(state, "chart", compute_chart, inputs, pool="ephemeris")
+        if result is None:  # app shutting down
+            return
 
         if result.error:
             status_label.text = f"Calculation error: {result.error}"
@@ -123,7 +130,7 @@ async def on_calculate(
         await ui.run_javascript("")  # flush UI update
 
         # --- Store result in per-user state ---
-        state["last_chart_json"] = result.chart.to_json() if result.chart else None
+        store_chart(state, "last_chart_json", result.chart)
         state["chart_ready"] = True
         state["name"] = name
         state["city"] = city
@@ -151,6 +158,8 @@ async def on_calculate(
         # Pre-fill save name so user can quickly save
         save_name_input.value = name
 
+    except Superseded:
+        pass
     except Exception as exc:
         _log.exception("Chart calculation failed")
         status_label.text = f"Unexpected error: {exc}"
@@ -6,6 +6,7 @@ references instead of closing over outer-scope variables.
 from __future__ import annotations
 
 import base64
+import functools
 import json
 import logging
 import time
@@ -13,40 +14,22 @@ from typing import Any, Optional
 
 from nicegui import ui
 
+from src.chart_cache import chart_digest
 from src.core.static_data import STANDARD_BASE_BODIES
 from src.nicegui_state import get_chart_object, get_chart_2_object
+from src.rendering.render_cache import RENDER_CACHE, render_key
+from src.ui.offload import Superseded, offload, spawn
 
 _log = logging.getLogger(__name__)
 
 
 # ── pure-data helpers (no UI) ─────────────────────────────────────────────
 
-def render_chart_png(mode: str, state: dict) -> Optional[bytes]:
-    """Render the current chart as PNG bytes in the given mode.
-
-    *mode*: ``"Standard Chart"`` or ``"Circuits"``.
-    Handles both single-chart and biwheel rendering.
-    """
-    from src.chart_adapter import (
-        render_chart_image, render_biwheel_image,
-        RenderToggles, ChartResult,
-        compute_combined_circuits, compute_inter_chart_aspects,
-    )
-
-    chart_obj = get_chart_object(state)
-    if chart_obj is None:
-        return None
-
-    # Check for biwheel mode
-    is_biwheel = (
-        (state.get("synastry_mode") or state.get("transit_mode"))
-        and state.get("last_chart_2_json") is not None
-    )
-    chart_2_obj = get_chart_2_object(state) if is_biwheel else None
-    is_biwheel = is_biwheel and chart_2_obj is not None
+def _render_toggles(mode: str, state: dict):
+    """Build ``RenderToggles`` for *mode* from the per-user state."""
+    from src.chart_adapter import RenderToggles
 
-    # Build toggles from state
-    toggles = RenderToggles(
+    return RenderToggles(
         compass_inner=state.get("compass", True),
         chart_mode=mode,
         pattern_toggles={int(k): v for k, v in state.get("pattern_toggles", {}).items()},
@@ -62,6 +45,169 @@ def render_chart_png(mode: str, state: dict) -> Optional[bytes]:
         synastry_chart2=state.get("synastry_chart2", False),
     )
 
+
+def _render_key(mode: str, state: dict, is_biwheel: bool, toggles) -> str:
+    """Render-cache key: stored chart content + mode + toggles + biwheel extras."""
+    digests = [chart_digest(state["last_chart_json"])]
+    extra: dict = {}
+    if is_biwheel:
+        digests.append(chart_digest(state["last_chart_2_json"]))
+        if mode == "Circuits":
+            extra["submode"] = state.get("circuit_submode", "Combined")
+            if extra["submode"] == "Connected":
+                extra["cc_shapes2"] = state.get("_cc_shapes2", {})
+                extra["cc_edges_inter"] = state.get("_cc_edges_inter", [])
+                extra["cc_shape_toggles"] = sorted(
+                    k for k, v in state.get("cc_shape_toggles", {}).items() if v
+                )
+    return render_key(digests, mode, toggles, extra)
+
+
+# State keys read while rendering; copied to a plain dict for worker processes.
+_RENDER_STATE_KEYS = (
+    "compass", "pattern_toggles", "shape_toggles", "singleton_toggles",
+    "aspect_toggles", "harmonic_toggles", "label_style", "dark_mode",
+    "house_system", "synastry_inter", "synastry_chart1", "synastry_chart2",
+    "circuit_submode", "_cc_shapes2", "_cc_edges_inter", "cc_shape_toggles",
+)
+
+
+def _plain(value: Any) -> Any:
+    """Deep copy of JSON-like state values as builtin dicts / lists (picklable)."""
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_plain(v) for v in value)
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
+
+
+def _render_job(mode: str, state: dict):
+    """Resolve what to render: ``(key, render_state, chart_obj, chart_2_obj, toggles)``.
+
+    None when there is no chart.  *render_state* is a plain snapshot of the
+    state keys the renderer reads.
+    """
+    chart_obj = get_chart_object(state)
+    if chart_obj is None:
+        return None
+
+    # Check for biwheel mode
+    is_biwheel = (
+        (state.get("synastry_mode") or state.get("transit_mode"))
+        and state.get("last_chart_2_json") is not None
+    )
+    chart_2_obj = get_chart_2_object(state) if is_biwheel else None
+    is_biwheel = bool(is_biwheel and chart_2_obj is not None)
+
+    render_state = {k: _plain(state[k]) for k in _RENDER_STATE_KEYS if k in state}
+    toggles = _render_toggles(mode, render_state)
+    key = _render_key(mode, state, is_biwheel, toggles)
+    return key, render_state, chart_obj, chart_2_obj, toggles
+
+
+def render_chart_png(mode: str, state: dict) -> Optional[bytes]:
+    """Render the current chart as PNG bytes in the given mode (in-process).
+
+    *mode*: ``"Standard Chart"`` or ``"Circuits"``.
+    Handles both single-chart and biwheel rendering.  Images are served
+    from ``RENDER_CACHE`` when the same charts were already rendered with
+    the same toggles.  UI handlers use :func:`show_chart_png`, which
+    renders in the process pool instead.
+    """
+    job = _render_job(mode, state)
+    if job is None:
+        return None
+    key, render_state, chart_obj, chart_2_obj, toggles = job
+    png = RENDER_CACHE.get_or_render(
+        key,
+        functools.partial(_render_chart_png, mode, render_state, chart_obj, chart_2_obj, toggles),
+    )
+    if png is not None and mode == "Circuits" and RENDER_CACHE.prefetch_enabled:
+        try:
+            n = _circuit_count(state, chart_obj, chart_2_obj)
+        except Exception:
+            _log.debug("Prefetch skipped", exc_info=True)
+        else:
+            _prefetch_circuit_states(mode, state, chart_obj, chart_2_obj, n)
+    return png
+
+
+async def render_chart_png_async(mode: str, state: dict) -> Optional[bytes]:
+    """:func:`render_chart_png` with cache misses rendered in the process pool.
+
+    Raises ``offload.Superseded`` when a newer render of *mode* was
+    requested meanwhile; the superseded image is still cached.
+    """
+    job = _render_job(mode, state)
+    if job is None:
+        return None
+    key, render_state, chart_obj, chart_2_obj, toggles = job
+    png = RENDER_CACHE.get(key)
+    if png is None:
+        png = await offload(
+            state, f"render:{mode}", _render_chart_png,
+            mode, render_state, chart_obj, chart_2_obj, toggles,
+            on_result=functools.partial(RENDER_CACHE.put, key),
+        )
+    if png is not None and mode == "Circuits" and RENDER_CACHE.prefetch_enabled:
+        try:
+            # Combined circuits run detect_shapes; keep them off the loop too.
+            n = await offload(state, "prefetch", _circuit_count,
+                              state, chart_obj, chart_2_obj, pool="thread")
+        except Exception:  # incl. Superseded: the render itself still shows
+            _log.debug("Prefetch skipped", exc_info=True)
+        else:
+            _prefetch_circuit_states(mode, state, chart_obj, chart_2_obj, n)
+    return png
+
+
+def show_chart_png(container: Any, mode: str, state: dict, form: dict) -> None:
+    """Render *mode* off the event loop, then display it in *container*.
+
+    The container keeps its current image until the new one is ready; if
+    the user changes toggles again meanwhile, only the newest render is
+    shown.
+    """
+    async def _show():
+        png = await render_chart_png_async(mode, state)
+        display_chart_in(container, png, state, form)
+    spawn(_show())
+
+
+def _circuit_count(state: dict, chart_obj, chart_2_obj) -> int:
+    """Number of circuits the Circuits view toggles for these charts."""
+    from src.chart_adapter import compute_combined_circuits
+
+    if chart_2_obj is not None and state.get("circuit_submode", "Combined") == "Combined":
+        return len(compute_combined_circuits(chart_obj, chart_2_obj).get("patterns_combined", []))
+    return len(getattr(chart_obj, "aspect_groups", None) or [])
+
+
+def _prefetch_circuit_states(mode: str, state: dict, chart_obj, chart_2_obj, n: int) -> None:
+    """Queue background renders of the all-circuits-on and all-off states."""
+    # Snapshot the state: the user keeps clicking while the worker renders.
+    snapshot = {k: _plain(state[k]) for k in _RENDER_STATE_KEYS if k in state}
+    snapshot["last_chart_json"] = state.get("last_chart_json")
+    snapshot["last_chart_2_json"] = state.get("last_chart_2_json")
+    for pattern_toggles in ({str(i): True for i in range(n)}, {}):
+        variant = {**snapshot, "pattern_toggles": pattern_toggles}
+        toggles = _render_toggles(mode, variant)
+        RENDER_CACHE.prefetch(
+            _render_key(mode, variant, chart_2_obj is not None, toggles),
+            functools.partial(_render_chart_png, mode, variant, chart_obj, chart_2_obj, toggles),
+        )
+
+
+def _render_chart_png(mode: str, state: dict, chart_obj, chart_2_obj, toggles) -> Optional[bytes]:
+    """Uncached render behind :func:`render_chart_png`."""
+    from src.chart_adapter import (
+        render_chart_image, render_biwheel_image, ChartResult,
+        compute_combined_circuits, compute_inter_chart_aspects,
+    )
+
+    is_biwheel = chart_2_obj is not None
     if is_biwheel:
         try:
             combined_data = None
@@ -496,8 +642,7 @@ def rerender_circuits_chart_only(state: dict, form: dict, cir_chart_container: A
         d3_data = serialize_chart_for_d3("Circuits", state)
         display_d3_chart_in(cir_chart_container, d3_data, state, form)
     else:
-        png = render_chart_png("Circuits", state)
-        display_chart_in(cir_chart_container, png, state, form)
+        show_chart_png(cir_chart_container, "Circuits", state, form)
 
 
 def rerender_active_tab(
@@ -563,16 +708,14 @@ def rerender_active_tab(
             d3_data = serialize_chart_for_d3("Standard Chart", state)
             display_d3_chart_in(std_chart_container, d3_data, state, form)
         else:
-            png = render_chart_png("Standard Chart", state)
-            display_chart_in(std_chart_container, png, state, form)
+            show_chart_png(std_chart_container, "Standard Chart", state, form)
     elif active == "Circuits":
         build_circuit_toggles()
         if state.get("interactive_chart"):
             d3_data = serialize_chart_for_d3("Circuits", state)
             display_d3_chart_in(cir_chart_container, d3_data, state, form)
         else:
-            png = render_chart_png("Circuits", state)
-            display_chart_in(cir_chart_container, png, state, form)
+            show_chart_png(cir_chart_container, "Circuits", state, form)
     elif active == "Rulers":
         render_rulers_graph()
     elif active == "Specs":
@@ -586,18 +729,26 @@ def rerender_active_tab(
 
 
 def refresh_events(state: dict, events_container: Any) -> None:
-    """Update the events panel with nearby events for the current chart."""
+    """Update the events panel with nearby events for the current chart.
+
+    The lookup may generate catalogue years on demand, so it runs on the
+    ephemeris thread (see src/ui/offload.py); the panel keeps its old
+    content until the new one is ready.
+    """
     chart_obj = get_chart_object(state)
-    if chart_obj is None:
+    utc_dt = getattr(chart_obj, "utc_datetime", None) if chart_obj is not None else None
+    if utc_dt is None:
         events_container.content = ""
         return
-    try:
-        utc_dt = getattr(chart_obj, "utc_datetime", None)
-        if utc_dt is None:
-            events_container.content = ""
-            return
+
+    async def _show():
         from src.core.event_lookup_v2 import build_events_html
-        html = build_events_html(utc_dt)
-        events_container.content = html
-    except Exception:
-        events_container.content = ""
+        try:
+            html = await offload(state, "events", build_events_html, utc_dt, pool="ephemeris")
+        except Superseded:
+            raise
+        except Exception:
+            _log.debug("Events lookup failed", exc_info=True)
+            html = ""
+        events_container.content = html or ""
+    spawn(_show())
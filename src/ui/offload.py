@@ -0,0 +1,126 @@
+"""Run chart computation and rendering off the NiceGUI event loop.
+
+``compute_chart``, ``compute_transit_chart``, the events lookup, combined
+circuits and the matplotlib renders are CPU-bound; run on the event loop
+they stall every connected client.  :func:`offload` runs them on one of
+three executors, chosen by *pool*:
+
+- ``"process"`` (default) — NiceGUI's process pool (``run.cpu_bound``, one
+  worker per CPU), for self-contained work such as renders.
+- ``"ephemeris"`` — a single thread in this process, for anything that
+  calls Swiss Ephemeris (chart / transit computation, event lookup).
+  pyswisseph is process-global and not thread-safe, so these jobs run one
+  at a time; running them here keeps the process-wide caches and metrics
+  they fill (``POSITION_CACHE``, stage timings, ``DERIVED_STATES``, the
+  events catalogue) in the server process, where ``/metrics`` and the
+  chat see them.
+- ``"thread"`` — a small thread pool in this process, for CPU work that
+  shares process-wide caches but not Swiss Ephemeris (combined circuits).
+
+On top of that :func:`offload` adds two per-user rules:
+
+- **Concurrency limit** — at most :data:`PER_USER_LIMIT` jobs per session
+  run at once; further requests wait their turn, so one user clicking
+  around can't occupy the whole pool.
+- **Superseding** — jobs carry a *kind* (``"chart"``, ``"transit"``,
+  ``"render:Circuits"``, ...).  A newer request of the same kind from the
+  same session supersedes older ones: those still waiting never start,
+  and those already running have their result dropped (:class:`Superseded`
+  is raised to the caller, which should simply return).
+
+Process-pool callbacks and arguments must be picklable.  Outside a running
+NiceGUI app (tests, scripts) the process pool doesn't exist and those jobs
+run on a thread via ``run.io_bound`` instead.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from cachetools import TTLCache
+from nicegui import background_tasks, run
+
+from src.nicegui_state import session_key
+
+_log = logging.getLogger(__name__)
+
+# Jobs one session may run at once (chart + render can overlap).
+PER_USER_LIMIT = 2
+
+_tickets = itertools.count(1)
+# (session, kind) -> newest ticket; idle entries expire.
+_latest: TTLCache = TTLCache(maxsize=50000, ttl=3600)
+# session -> semaphore, alive for as long as a job holds or waits on it, so
+# a busy session can never be handed a second, fresh semaphore.
+_limits: "weakref.WeakValueDictionary[str, asyncio.Semaphore]" = weakref.WeakValueDictionary()
+
+
+POOLS = ("process", "ephemeris", "thread")
+
+_EPHEMERIS_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rosetta-ephemeris")
+_THREAD_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="rosetta-offload")
+
+
+class Superseded(Exception):
+    """A newer request of the same kind replaced this one."""
+
+
+def _semaphore(session: str) -> asyncio.Semaphore:
+    sem = _limits.get(session)
+    if sem is None:
+        sem = _limits[session] = asyncio.Semaphore(PER_USER_LIMIT)
+    return sem
+
+
+async def _run_job(pool: str, fn: Callable, *args: Any) -> Any:
+    if pool == "process":
+        if run.process_pool is None:
+            return await run.io_bound(fn, *args)
+        return await run.cpu_bound(fn, *args)
+    executor = _EPHEMERIS_POOL if pool == "ephemeris" else _THREAD_POOL
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, functools.partial(fn, *args))
+
+
+async def offload(state: Dict[str, Any], kind: str, fn: Callable, *args: Any,
+                  on_result: Optional[Callable[[Any], None]] = None,
+                  pool: str = "process") -> Any:
+    """Run ``fn(*args)`` off the event loop for the session owning *state*.
+
+    Raises :class:`Superseded` if a newer *kind* request from the same
+    session arrives first.  *on_result* (run on the event loop) still sees
+    the result of a job that finished after being superseded — e.g. to
+    cache a rendered image that is no longer going to be displayed.
+    *pool* is one of :data:`POOLS` (see module docstring).
+    """
+    if pool not in POOLS:
+        raise ValueError(f"unknown offload pool {pool!r}")
+    session = session_key(state)
+    slot: Tuple[str, str] = (session, kind)
+    ticket = next(_tickets)
+    _latest[slot] = ticket
+
+    async with _semaphore(session):
+        if _latest.get(slot) != ticket:
+            raise Superseded(kind)
+        result = await _run_job(pool, fn, *args)
+    if on_result is not None and result is not None:
+        on_result(result)
+    if _latest.get(slot) != ticket:
+        raise Superseded(kind)
+    return result
+
+
+def spawn(coro: Awaitable) -> None:
+    """Schedule *coro* from a synchronous UI callback; :class:`Superseded` is silent."""
+    async def _guarded():
+        try:
+            await coro
+        except Superseded:
+            pass
+    background_tasks.create(_guarded(), name="rosetta-offload")
@@ -6,7 +6,7 @@ from typing import Callable
 
 from nicegui import app, ui
 
-from src.nicegui_state import get_chart_object
+from src.nicegui_state import get_chart_object, store_chart
 
 _log = logging.getLogger(__name__)
 
@@ -21,8 +21,7 @@ def run_startup(
     save_name_input,
     is_my_chart_cb,
     build_circuit_toggles: Callable,
-    display_chart_in: Callable,
-    render_chart_png: Callable,
+    show_chart_png: Callable,
     render_rulers_graph: Callable,
     refresh_specs_tab: Callable,
     refresh_events: Callable,
@@ -45,10 +44,8 @@ def run_startup(
         "My chart" checkbox (checked when self-profile loads).
     build_circuit_toggles : callable
         Rebuilds circuit toggle UI.
-    display_chart_in : callable(container, png_bytes)
-        Renders chart PNG into a container.
-    render_chart_png : callable(mode) -> bytes
-        Generates chart PNG for a given mode.
+    show_chart_png : callable(container, mode)
+        Renders the chart PNG for a mode (off the event loop) into a container.
     render_rulers_graph : callable
         Renders the rulers/dispositor graph.
     refresh_specs_tab : callable
@@ -64,8 +61,8 @@ def run_startup(
     def _render_with_chart():
         """Populate every tab's chart area from whatever is currently in state."""
         build_circuit_toggles()
-        display_chart_in(std_chart_container, render_chart_png("Standard Chart"))
-        display_chart_in(cir_chart_container, render_chart_png("Circuits"))
+        show_chart_png(std_chart_container, "Standard Chart")
+        show_chart_png(cir_chart_container, "Circuits")
         render_rulers_graph()
         refresh_specs_tab()
         refresh_events()
@@ -126,7 +123,7 @@ def run_startup(
             )
             if _fixed_name:
                 _cached_chart.display_name = _fixed_name
-                state["last_chart_json"] = _cached_chart.to_json()
+                store_chart(state, "last_chart_json", _cached_chart)
         _render_with_chart()
     else:
         # Auto-load is on but nothing cached — try loading self profile.
@@ -143,8 +140,8 @@ def run_startup(
                         from src.db.profile_helpers import apply_profile
                         apply_profile(_pname, _pdata, state)
                         _chart_tmp = state.pop("last_chart", None)
-                        if _chart_tmp is not None and hasattr(_chart_tmp, "to_json"):
-                            state["last_chart_json"] = _chart_tmp.to_json()
+                        if _chart_tmp is not None and hasattr(_chart_tmp, "to_compact"):
+                            store_chart(state, "last_chart_json", _chart_tmp)
                         state["is_my_chart"] = True
 
                         _real_name = (
@@ -153,7 +150,7 @@ def run_startup(
                         _chart_fix = get_chart_object(state)
                         if _chart_fix is not None:
                             _chart_fix.display_name = _real_name
-                            state["last_chart_json"] = _chart_fix.to_json()
+                            store_chart(state, "last_chart_json", _chart_fix)
 
                         form["name"] = _real_name
                         form["city"] = state.get("city", "")
@@ -8,7 +8,7 @@ from typing import Any, Callable
 from nicegui import ui
 
 from src.core.static_data import MONTH_NAMES
-from src.nicegui_state import ensure_state, get_chart_object
+from src.nicegui_state import ensure_state, get_chart_object, store_chart
 from src.ui.auth import get_user_id
 
 _log = logging.getLogger(__name__)
@@ -220,8 +220,8 @@ def build(
             apply_profile(selected, prof_data, _state)
 
             _chart_obj = _state.pop("last_chart", None)
-            if _chart_obj is not None and hasattr(_chart_obj, "to_json"):
-                _state["last_chart_json"] = _chart_obj.to_json()
+            if _chart_obj is not None and hasattr(_chart_obj, "to_compact"):
+                store_chart(_state, "last_chart_json", _chart_obj)
 
             form["name"] = _state.get("birth_name") or _state.get("name") or selected
             form["city"] = _state.get("city", "")
@@ -4,12 +4,12 @@ from __future__ import annotations
 import logging
 from typing import Any, Callable
 
-from nicegui import run, ui
+from nicegui import ui
 
 from config import get_secret
 from src.mcp.chat_pipeline import (
     CHAT_MEMORY, CHAT_DEV_TRACE, CHAT_PERSONS, CHAT_LOCATIONS,
-    run_pipeline,
+    PipelineStream,
 )
 from src.nicegui_state import get_chart_object, get_chart_2_object
 from src.ui.auth import get_user_id
@@ -232,6 +232,8 @@ def build(
             parts.append(f"{meta['confidence']:.0%}")
         if meta.get("voice"):
             parts.append(meta["voice"])
+        if meta.get("cached"):
+            parts.append("cached")
         return " · ".join(parts)
 
     def _render_dev_trace(trace: dict):
@@ -274,6 +276,14 @@ def build(
         if s5:
             parts.append(f"<b>Synthesis:</b> {esc(str(s5.get('model', '')))} "
                          f"({s5.get('prompt_tokens', 0)}+{s5.get('completion_tokens', 0)} tok)")
+        rc = trace.get("reading_cache", {})
+        if rc:
+            rc_stats = rc.get("stats", {})
+            parts.append(
+                f"<b>Reading cache:</b> comprehension {esc(str(rc.get('comprehension', '')))}, "
+                f"synthesis {esc(str(rc.get('synthesis', '')))} "
+                f"(graph hit rate {rc_stats.get('graph_hit_rate', 0):.0%}, "
+                f"{rc_stats.get('entries', 0)} cached)")
         chat_dev_content.content = "<br>".join(parts) if parts else "<em>Empty trace.</em>"
 
     def _get_api_key() -> str:
@@ -325,21 +335,38 @@ def build(
         _agent_notes = state.get("mcp_agent_notes", "")
         _pending_q = state.get("mcp_pending_question", "")
 
+        stream = PipelineStream(
+            prompt, chart_obj, chart_b, hs,
+            uid=uid,
+            api_key=_api_key,
+            model=_model,
+            mode=_mode,
+            voice=_voice,
+            agent_notes=_agent_notes,
+            pending_q=_pending_q,
+        )
+        # The reply renders into a live bubble as it streams; once done it
+        # is swapped for a regular bubble with the caption.
+        live_bubble = None
+        streamed = ""
         try:
-            response_text, meta, state_updates = await run.io_bound(
-                run_pipeline, prompt, chart_obj, chart_b, hs,
-                uid=uid,
-                api_key=_api_key,
-                model=_model,
-                mode=_mode,
-                voice=_voice,
-                agent_notes=_agent_notes,
-                pending_q=_pending_q,
-            )
+            async for delta in stream:
+                if live_bubble is None:
+                    with chat_messages_col:
+                        with ui.chat_message(name="Rosetta", sent=False).classes(
+                            "w-full"
+                        ) as live_bubble:
+                            live_text = ui.label("").style("white-space: pre-wrap")
+                    chat_scroll.scroll_to(percent=100)
+                streamed += delta
+                live_text.set_text(streamed)
+            response_text, meta, state_updates = stream.outcome
         except Exception as exc:
             response_text = f"Error: {exc}"
             meta = {}
             state_updates = {}
+        if live_bubble is not None:
+            live_bubble.delete()
 
         for k, v in state_updates.items():
             state[k] = v
@@ -9,6 +9,7 @@ from nicegui import ui
 
 from src.core.static_data import SHAPE_NODE_COUNTS
 from src.nicegui_state import get_chart_object, get_chart_2_object
+from src.ui.offload import Superseded, offload, spawn
 
 _log = logging.getLogger(__name__)
 
@@ -184,13 +185,17 @@ def build(
             """Join a list of names using glyph-or-text formatting."""
             return ", ".join(_fmt(n) for n in names)
 
-        is_biwheel = bool(
-            (state.get("synastry_mode") or state.get("transit_mode"))
-            and state.get("last_chart_2_json")
-        )
+        def _biwheel_submode():
+            """Circuit submode while a biwheel is showing, else None."""
+            if not ((state.get("synastry_mode") or state.get("transit_mode"))
+                    and state.get("last_chart_2_json")):
+                return None
+            return state.get("circuit_submode", "Combined")
+
+        submode = _biwheel_submode()
+        is_biwheel = submode is not None
         chart1_name = state.get("current_profile") or "Chart 1"
         chart2_name = "Transits" if state.get("transit_mode") else "Chart 2"
-        submode = state.get("circuit_submode", "Combined") if is_biwheel else None
 
         # ==============================================================
         # COMBINED CIRCUITS (biwheel)
@@ -202,59 +207,71 @@ def build(
                 cir_patterns_container.clear()
                 cir_singletons_container.clear()
                 return
-            combined = compute_combined_circuits(chart_obj, chart_2_obj)
-            shapes_combined = combined.get("shapes_combined", [])
-            singleton_map = combined.get("singleton_map_combined", {})
-
-            shapes_by_type: dict = {}
-            for sh in shapes_combined:
-                s_type = sh.get("type", "Shape") if isinstance(sh, dict) else getattr(sh, "shape_type", "Shape")
-                shapes_by_type.setdefault(s_type, []).append(sh)
 
-            sorted_types = sorted(
-                shapes_by_type.keys(),
-                key=lambda t: (-SHAPE_NODE_COUNTS.get(t, 1), t),
-            )
+            async def _show_combined():
+                # detect_shapes over the merged chart: off the event loop.
+                combined = await offload(state, "combined", compute_combined_circuits,
+                                         chart_obj, chart_2_obj, pool="thread")
+                if combined is None:
+                    return
+                # A later build may have switched panels (no chart, Connected,
+                # single chart) without claiming the "combined" ticket.
+                if get_chart_object(state) is None or _biwheel_submode() != "Combined":
+                    return
+                shapes_combined = combined.get("shapes_combined", [])
+                singleton_map = combined.get("singleton_map_combined", {})
+
+                shapes_by_type: dict = {}
+                for sh in shapes_combined:
+                    s_type = sh.get("type", "Shape") if isinstance(sh, dict) else getattr(sh, "shape_type", "Shape")
+                    shapes_by_type.setdefault(s_type, []).append(sh)
+
+                sorted_types = sorted(
+                    shapes_by_type.keys(),
+                    key=lambda t: (-SHAPE_NODE_COUNTS.get(t, 1), t),
+                )
 
-            cir_patterns_container.clear()
-            with cir_patterns_container:
-                if sorted_types:
-                    ui.label("Combined Shapes").classes("text-subtitle2 q-mb-xs")
-                    half = (len(sorted_types) + 1) // 2
-                    with ui.row().classes("w-full gap-4 items-start"):
-                        for col_types in (sorted_types[:half], sorted_types[half:]):
-                            with ui.column().classes("flex-1"):
-                                for s_type in col_types:
-                                    type_shapes = shapes_by_type[s_type]
-                                    with ui.expansion(
-                                        f"{s_type} – {len(type_shapes)} found"
-                                    ).classes("w-full q-mb-xs"):
-                                        for sh in type_shapes:
-                                            sid = sh.get("id", "") if isinstance(sh, dict) else getattr(sh, "shape_id", "")
-                                            s_members = sh.get("members", []) if isinstance(sh, dict) else getattr(sh, "members", [])
-                                            s_on = state.get("shape_toggles", {}).get(str(sid), False)
-                                            m1 = [m for m in s_members if not str(m).endswith("_2")]
-                                            m2 = [str(m)[:-2] for m in s_members if str(m).endswith("_2")]
-                                            parts = f"{chart1_name}: {_fmt_list(m1)}"
-                                            if m2:
-                                                parts += f"; {chart2_name}: {_fmt_list(m2)}"
-                                            scb = ui.checkbox(parts, value=s_on)
-                                            scb.on_value_change(functools.partial(_on_shape_toggle, str(sid)))
-                else:
-                    ui.label("No shapes detected in combined charts.").classes("text-body2 text-grey q-pa-md")
+                cir_patterns_container.clear()
+                with cir_patterns_container:
+                    if sorted_types:
+                        ui.label("Combined Shapes").classes("text-subtitle2 q-mb-xs")
+                        half = (len(sorted_types) + 1) // 2
+                        with ui.row().classes("w-full gap-4 items-start"):
+                            for col_types in (sorted_types[:half], sorted_types[half:]):
+                                with ui.column().classes("flex-1"):
+                                    for s_type in col_types:
+                                        type_shapes = shapes_by_type[s_type]
+                                        with ui.expansion(
+                                            f"{s_type} – {len(type_shapes)} found"
+                                        ).classes("w-full q-mb-xs"):
+                                            for sh in type_shapes:
+                                                sid = sh.get("id", "") if isinstance(sh, dict) else getattr(sh, "shape_id", "")
+                                                s_members = sh.get("members", []) if isinstance(sh, dict) else getattr(sh, "members", [])
+                                                s_on = state.get("shape_toggles", {}).get(str(sid), False)
+                                                m1 = [m for m in s_members if not str(m).endswith("_2")]
+                                                m2 = [str(m)[:-2] for m in s_members if str(m).endswith("_2")]
+                                                parts = f"{chart1_name}: {_fmt_list(m1)}"
+                                                if m2:
+                                                    parts += f"; {chart2_name}: {_fmt_list(m2)}"
+                                                scb = ui.checkbox(parts, value=s_on)
+                                                scb.on_value_change(functools.partial(_on_shape_toggle, str(sid)))
+                    else:
+                        ui.label("No shapes detected in combined charts.").classes("text-body2 text-grey q-pa-md")
 
-            cir_singletons_container.clear()
-            with cir_singletons_container:
-                if singleton_map:
-                    ui.label("Singletons").classes("text-subtitle2 q-mb-xs")
-                    with ui.row().classes("gap-4 flex-wrap"):
-                        for planet in sorted(singleton_map.keys()):
-                            s_on = state.get("singleton_toggles", {}).get(planet, False)
-                            lbl = _fmt(planet.replace("_2", "") if planet.endswith("_2") else planet)
-                            if planet.endswith("_2"):
-                                lbl = f"{lbl} ({chart2_name})"
-                            cb = ui.checkbox(lbl, value=s_on)
-                            cb.on_value_change(functools.partial(_on_singleton_toggle, planet))
+                cir_singletons_container.clear()
+                with cir_singletons_container:
+                    if singleton_map:
+                        ui.label("Singletons").classes("text-subtitle2 q-mb-xs")
+                        with ui.row().classes("gap-4 flex-wrap"):
+                            for planet in sorted(singleton_map.keys()):
+                                s_on = state.get("singleton_toggles", {}).get(planet, False)
+                                lbl = _fmt(planet.replace("_2", "") if planet.endswith("_2") else planet)
+                                if planet.endswith("_2"):
+                                    lbl = f"{lbl} ({chart2_name})"
+                                cb = ui.checkbox(lbl, value=s_on)
+                                cb.on_value_change(functools.partial(_on_singleton_toggle, planet))
+
+            spawn(_show_combined())
             return  # done with Combined mode
 
         # ==============================================================
@@ -378,7 +395,7 @@ def build(
                         )
 
     # ── Show All / Hide All handlers ───────────────────────────────────
-    def _on_show_all():
+    async def _on_show_all():
         """Enable all circuit, shape, and singleton toggles."""
         chart_obj = get_chart_object(state)
         if chart_obj is None:
@@ -393,7 +410,13 @@ def build(
             from src.chart_adapter import compute_combined_circuits
             chart_2_obj = get_chart_2_object(state)
             if chart_2_obj:
-                combined = compute_combined_circuits(chart_obj, chart_2_obj)
+                try:
+                    combined = await offload(state, "combined", compute_combined_circuits,
+                                             chart_obj, chart_2_obj, pool="thread")
+                except Superseded:
+                    return
+                if combined is None:
+                    return
                 shapes_c = combined.get("shapes_combined", [])
                 singleton_map_c = combined.get("singleton_map_combined", {})
                 state["shape_toggles"] = {
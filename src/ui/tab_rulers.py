@@ -2,13 +2,13 @@
 from __future__ import annotations
 
 import base64
-import io
 import logging
 from typing import Any, Callable
 
 from nicegui import ui
 
 from src.nicegui_state import get_chart_object
+from src.ui.offload import Superseded, offload, spawn
 
 _log = logging.getLogger(__name__)
 
@@ -87,11 +87,11 @@ def build(
 
     # ── Graph ─────────────────────────────────────────────────────────
     def _render_rulers_graph():
-        """Render the dispositor graph image and annotations."""
-        import matplotlib
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
+        """Render the dispositor graph image (off the event loop)."""
+        spawn(_render_rulers_graph_async())
 
+    async def _render_rulers_graph_async():
+        """Build the dispositor graph in the process pool and show it."""
         chart_obj = get_chart_object(state)
         if chart_obj is None:
             rulers_chart_container.clear()
@@ -145,27 +145,18 @@ def build(
             header_info = None
 
         try:
-            from src.rendering.dispositor_graph import plot_dispositor_graph
+            from src.rendering.dispositor_graph import render_dispositor_png
 
-            fig = plot_dispositor_graph(
-                scope_data, chart=chart_obj,
-                header_info=header_info, house_system=house_sys,
+            png_bytes = await offload(
+                state, "render:rulers", render_dispositor_png,
+                scope_data, chart_obj, header_info, house_sys,
             )
-            if fig is None:
+            if png_bytes is None:
                 rulers_chart_container.clear()
                 with rulers_chart_container:
                     ui.label("Graph returned empty.").classes("text-body2 text-grey")
                 return
 
-            buf = io.BytesIO()
-            fig.savefig(
-                buf, format="png", bbox_inches="tight",
-                facecolor=fig.get_facecolor(), edgecolor="none",
-            )
-            plt.close(fig)
-            buf.seek(0)
-            png_bytes = buf.read()
-
             b64 = base64.b64encode(png_bytes).decode()
             rulers_chart_container.clear()
             with rulers_chart_container:
@@ -174,6 +165,8 @@ def build(
                     f'style="width:100%; max-width:1000px; '
                     f'image-rendering:auto; display:block; margin:0 auto" />'
                 )
+        except Superseded:
+            raise
         except Exception as exc:
             _log.exception("Dispositor graph render failed")
             rulers_chart_container.clear()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import datetime as _dt
+import functools
 import logging
 from typing import Any, Callable, Optional
 
@@ -10,7 +11,8 @@ from dateutil.relativedelta import relativedelta
 from nicegui import ui
 
 from src.core.static_data import MONTH_NAMES
-from src.nicegui_state import get_chart_object
+from src.nicegui_state import get_chart_object, store_chart
+from src.ui.offload import Superseded, offload
 
 _log = logging.getLogger(__name__)
 
@@ -144,13 +146,13 @@ def build(
                 gender=form.get("gender"),
             )
             try:
-                result = compute_chart(inputs)
+                result = await offload(state, "chart", compute_chart, inputs, pool="ephemeris")
+                if result is None:  # app shutting down
+                    return
                 if result.error:
                     ui.notify(f"Chart error: {result.error}", type="negative")
                     return
-                state["last_chart_json"] = (
-                    result.chart.to_json() if result.chart else None
-                )
+                store_chart(state, "last_chart_json", result.chart)
                 state["chart_ready"] = True
                 state["year"] = now.year
                 state["month_name"] = MONTH_NAMES[now.month - 1]
@@ -162,6 +164,8 @@ def build(
                     f"Chart set to now: {now:%B %d, %Y %I:%M %p}",
                     type="positive",
                 )
+            except Superseded:
+                pass
             except Exception as exc:
                 ui.notify(f"Chart calculation failed: {exc}", type="negative")
 
@@ -232,8 +236,11 @@ def build(
         else:
             transit_dt_label.text = ""
 
-    def _compute_and_store_transit(utc: _dt.datetime):
-        """Compute a transit chart for *utc* and store it in state."""
+    async def _compute_and_store_transit(utc: _dt.datetime):
+        """Compute a transit chart for *utc* (off the event loop) and store it.
+
+        Rapid ◀/▶ clicks supersede each other; only the newest is shown.
+        """
         from src.chart_adapter import compute_transit_chart
         lat = state.get("current_lat")
         lon = state.get("current_lon")
@@ -244,40 +251,47 @@ def build(
         if lat is None or lon is None:
             return
 
-        result = compute_transit_chart(
-            lat=lat, lon=lon, tz_name=tz_name,
-            city=city, house_system=house_sys,
-            transit_utc=utc,
-        )
-        if result.chart is not None:
-            state["last_chart_2_json"] = result.chart.to_json()
+        try:
+            result = await offload(
+                state, "transit", functools.partial(
+                    compute_transit_chart,
+                    lat=lat, lon=lon, tz_name=tz_name,
+                    city=city, house_system=house_sys,
+                    transit_utc=utc,
+                ),
+                pool="ephemeris",
+            )
+        except Superseded:
+            return
+        if result is not None and result.chart is not None:
+            store_chart(state, "last_chart_2_json", result.chart)
             state["transit_dt_iso"] = utc.isoformat()
             state["transit_mode"] = True
             state["synastry_mode"] = False
             _update_transit_label()
             rerender_active_tab()
 
-    def on_transit_toggle(e):
+    async def on_transit_toggle(e):
         """Enable or disable transit overlay mode."""
         state["transit_mode"] = e.value
         transit_nav_row.set_visibility(e.value)
         if e.value:
             if not state.get("last_chart_2_json"):
                 now_utc = _dt.datetime.now(_dt.timezone.utc).replace(tzinfo=None)
-                _compute_and_store_transit(now_utc)
+                await _compute_and_store_transit(now_utc)
             else:
                 rerender_active_tab()
         else:
             rerender_active_tab()
 
-    def _on_transit_now():
+    async def _on_transit_now():
         """Set the transit time to the current UTC moment."""
         now_utc = _dt.datetime.now(_dt.timezone.utc).replace(tzinfo=None)
-        _compute_and_store_transit(now_utc)
+        await _compute_and_store_transit(now_utc)
 
     transit_now_btn.on_click(_on_transit_now)
 
-    def _nav_transit(direction: int):
+    async def _nav_transit(direction: int):
         """Step the transit time forward or backward by one day."""
         iso = state.get("transit_dt_iso")
         if not iso:
@@ -299,7 +313,7 @@ def build(
         else:
             new_dt = now_utc + _dt.timedelta(days=direction)
 
-        _compute_and_store_transit(new_dt)
+        await _compute_and_store_transit(new_dt)
 
     transit_back_btn.on_click(lambda: _nav_transit(-1))
     transit_fwd_btn.on_click(lambda: _nav_transit(1))
@@ -336,8 +350,8 @@ def build(
             temp: dict = {}
             apply_profile(selected, prof_data, temp)
             chart2_obj = temp.pop("last_chart", None)
-            if chart2_obj is not None and hasattr(chart2_obj, "to_json"):
-                state["last_chart_2_json"] = chart2_obj.to_json()
+            if chart2_obj is not None and hasattr(chart2_obj, "to_compact"):
+                store_chart(state, "last_chart_2_json", chart2_obj)
                 state["synastry_mode"] = True
                 state["transit_mode"] = False
                 state["chart_2_profile_name"] = selected
@@ -19,6 +19,16 @@ def ephe_path():
     return path
 
 
+# ---------------------------------------------------------------------------
+# Reading cache — emptied per test so repeated questions still hit the LLM.
+# ---------------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def _empty_reading_cache():
+    """Clear the process-wide chat reading cache before each test."""
+    from src.mcp.reading_cache import READING_CACHE
+    READING_CACHE.clear()
+
+
 # ---------------------------------------------------------------------------
 # Reusable chart — session-scoped because calculate_chart is expensive.
 # ---------------------------------------------------------------------------
@@ -0,0 +1,223 @@
+# tests/fixtures/fake_openai.py
+"""
+Local stand-in for an OpenAI-compatible chat completions endpoint.
+
+Serves ``POST /v1/chat/completions`` on 127.0.0.1 with canned replies for
+the chat pipeline's three calls, after an injected *latency*.  The reply
+is picked from the system prompt: the grammar parser gets a grammar
+diagram, the comprehension layer a comprehension JSON, anything else a
+short prose reading.  Streamed requests (``"stream": true``) get the
+reply word by word as server-sent events, *chunk_delay* apart.  Every
+request is recorded with its start / end time so tests can check which
+calls overlapped.
+
+Used by the chat pipeline tests and ``scripts/bench_chat_turn.py``::
+
+    with FakeOpenAIServer(latency=0.2) as server, server.redirect():
+        ...
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional
+
+GRAMMAR_REPLY = {
+    "subject": "my partner",
+    "verb": "does affect",
+    "verb_tense": "present",
+    "direct_object": "my career",
+    "indirect_object": "",
+    "prepositional_phrases": [],
+    "modifiers": [{"word": "my", "modifies": "career", "type": "possessive"}],
+    "clauses": [],
+    "sentence_type": "interrogative",
+    "raw_parse_tree": "[S [NP my partner] [VP does affect [NP my career]]]",
+    "confidence": 0.9,
+}
+
+COMPREHENSION_REPLY = {
+    "intent_context": "weighing a career move",
+    "querent_state": {"emotional_tone": "curious"},
+    "answer_aim": {"aim_type": "exploratory"},
+    "domains": ["career"],
+    "question_type": "relationship",
+    "temporal_dimension": "natal",
+    "subject_config": "single",
+    "paraphrase": "How does my partner influence my career?",
+    "comprehension_confidence": 0.9,
+    "ambiguities": [],
+    "contradictions": [],
+}
+
+PROSE_REPLY = "Your Midheaven and Saturn tell a story of slow, steady building."
+
+USAGE = {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120}
+
+
+@dataclass
+class RecordedCall:
+    kind: str                 # "grammar" | "comprehension" | "synthesis"
+    body: Dict[str, Any]
+    started: float
+    finished: float = 0.0
+    connection: int = 0       # id of the TCP connection that carried it
+
+
+def classify(body: Dict[str, Any]) -> str:
+    system = next((m.get("content", "") for m in body.get("messages", [])
+                   if m.get("role") == "system"), "")
+    if system.startswith("You are a grammatical parser"):
+        return "grammar"
+    if "comprehension layer" in system:
+        return "comprehension"
+    return "synthesis"
+
+
+def _reply_text(kind: str) -> str:
+    if kind == "grammar":
+        return json.dumps(GRAMMAR_REPLY)
+    if kind == "comprehension":
+        return json.dumps(COMPREHENSION_REPLY)
+    return PROSE_REPLY
+
+
+class FakeOpenAIServer:
+    """Threaded HTTP server speaking enough of the chat completions API."""
+
+    def __init__(self, latency: float = 0.0, chunk_delay: float = 0.0) -> None:
+        self.latency = latency
+        self.chunk_delay = chunk_delay
+        self.calls: List[RecordedCall] = []
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def calls_of(self, kind: str) -> List[RecordedCall]:
+        return [c for c in self.calls if c.kind == kind]
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):  # keep test output quiet
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                call = RecordedCall(kind=classify(body), body=body,
+                                    started=time.perf_counter(),
+                                    connection=id(self.connection))
+                with server._lock:
+                    server.calls.append(call)
+                time.sleep(server.latency)
+                text = _reply_text(call.kind)
+                if body.get("stream"):
+                    self._stream(body, text)
+                    call.finished = time.perf_counter()
+                    return
+                payload = json.dumps({
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get("model", "fake"),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": USAGE,
+                }).encode("utf-8")
+                call.finished = time.perf_counter()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _stream(self, body, text):
+                """Server-sent events, one word per chunk, chunked encoding."""
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                def event(choices, usage=None):
+                    data = {"id": "chatcmpl-fake", "object": "chat.completion.chunk",
+                            "created": int(time.time()),
+                            "model": body.get("model", "fake"),
+                            "choices": choices, "usage": usage}
+                    self._chunk(f"data: {json.dumps(data)}\n\n")
+
+                for i, word in enumerate(text.split(" ")):
+                    delta = word if i == 0 else " " + word
+                    event([{"index": 0, "delta": {"content": delta},
+                            "finish_reason": None}])
+                    time.sleep(server.chunk_delay)
+                event([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+                if (body.get("stream_options") or {}).get("include_usage"):
+                    event([], USAGE)
+                self._chunk("data: [DONE]\n\n", last=True)
+
+            def _chunk(self, data: str, last: bool = False) -> None:
+                raw = data.encode("utf-8")
+                frame = f"{len(raw):x}\r\n".encode("ascii") + raw + b"\r\n"
+                # Like real servers, the terminating chunk rides in the
+                # same segment as [DONE].
+                self.wfile.write(frame + (b"0\r\n\r\n" if last else b""))
+                self.wfile.flush()
+
+        return Handler
+
+    def start(self) -> "FakeOpenAIServer":
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @contextlib.contextmanager
+    def redirect(self) -> Iterator[None]:
+        """Send every OpenRouter call to this server while active.
+
+        Sets ``ROSETTA_LLM_BASE_URL`` and empties the shared client
+        registry on the way in and out, so no pooled client keeps
+        pointing at the other endpoint.
+        """
+        from src.mcp.llm_clients import BASE_URL_ENV, LLM_CLIENTS
+
+        previous = os.environ.get(BASE_URL_ENV)
+        os.environ[BASE_URL_ENV] = self.base_url
+        LLM_CLIENTS.clear()
+        try:
+            yield
+        finally:
+            if previous is None:
+                os.environ.pop(BASE_URL_ENV, None)
+            else:
+                os.environ[BASE_URL_ENV] = previous
+            LLM_CLIENTS.clear()
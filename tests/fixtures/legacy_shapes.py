@@ -0,0 +1,412 @@
+"""
+Frozen copy of the pre-index ``patterns_v2._detect_shapes_for_members``.
+
+It enumerates ``combinations(R, 5)`` / ``combinations(R, 4)`` /
+``permutations(R, 4)`` and probes every pair with ``has_edge`` /
+``aspect_ok``.  Kept only as the reference for the differential test in
+tests/test_patterns_v2.py and for scripts/bench_shapes.py — do not use it
+from application code.
+"""
+from __future__ import annotations
+
+from itertools import combinations, permutations
+
+from src.core.patterns_v2 import (
+    ASPECTS,
+    _add_shape,
+    _cluster_conjunctions_for_detection,
+)
+
+
+def detect_shapes_for_members_bruteforce(pos, members, parent_idx, sid_start, major_edges_all, widen_orb=False):
+    """
+    Detect shapes for this parent using ONLY the provided major edge list.
+    - Strict mode uses only edges present in major_edges_all.
+    - widen_orb is ignored for now (no new edges invented).
+    """
+    if not members:
+        return [], sid_start
+
+    # 1) Conjunction clustering
+    rep_pos, rep_map, rep_anchor = _cluster_conjunctions_for_detection(pos, list(members))
+    R = list(rep_pos.keys())
+
+    # 2) Build an edge lookup by FILTERING the precomputed master list
+    edge_lookup = {}
+    members_set = set(members)
+    for (u, v), asp in major_edges_all:
+        if u in members_set and v in members_set:
+            ru = rep_anchor.get(u, u)
+            rv = rep_anchor.get(v, v)
+            if ru == rv:
+                continue  # skip self-edges (within same conj cluster)
+            edge_key = frozenset((ru, rv))
+            edge_lookup.setdefault(edge_key, []).append(asp)
+
+    # 3) Shape bookkeeping
+    shapes = []
+    seen = set()
+    sid = sid_start
+
+    def has_edge(a, b, aspect):
+        """True iff edge exists in master list, or (if widen_orb) it's close enough to qualify as approx."""
+        key = frozenset((a, b))
+        if aspect in edge_lookup.get(key, []):
+            return True
+
+        if widen_orb:
+            # Expanded orb check for approximate edges
+            d1, d2 = pos.get(a), pos.get(b)
+            if d1 is None or d2 is None:
+                return False
+            angle = abs(d1 - d2) % 360
+            if angle > 180:
+                angle = 360 - angle
+            data = ASPECTS[aspect]
+            widened_orb = data["orb"] * 1.5  # expand by 50%, adjust as you like
+            if abs(angle - data["angle"]) <= widened_orb:
+                return True
+        return False
+
+    def has_edge_loose(a, b, aspect, bonus=1.0):
+        """
+        When widen_orb=True, allow 'near misses' by checking angles directly
+        using representative positions and a wider orb. Returns True if the
+        pair is within (orb + bonus). This does NOT touch major_edges_all.
+        """
+        if not widen_orb:
+            return False
+        if aspect not in ("Opposition", "Trine", "Sextile", "Square", "Conjunction"):
+            return False
+
+        # Use representative (cluster) degrees, not raw planet degrees
+        da = rep_pos.get(a)
+        db = rep_pos.get(b)
+        if da is None or db is None:
+            return False
+
+        angle = abs((da - db) % 360)
+        if angle > 180:
+            angle = 360 - angle
+
+        target = ASPECTS[aspect]["angle"]
+        base_orb = ASPECTS[aspect]["orb"]
+        return abs(angle - target) <= (base_orb + bonus)
+
+    def add_once(sh_type, node_list, candidate_edges, suppresses=None, approx_bonus=2.0):
+        """Register a shape if not already seen; validates edges and delegates to _add_shape."""
+        nonlocal sid
+        key = (sh_type, tuple(sorted(node_list)))
+        if key in seen:
+            return False
+
+        specs = []
+        for (x, y), asp in candidate_edges:
+            is_forced_approx = asp.endswith("_approx")
+            asp_clean = asp.replace("_approx", "")
+
+            # Strict edge present in filtered master list?
+            if has_edge(x, y, asp_clean):
+                specs.append(((x, y), asp_clean))
+            # Allow explicitly provided approximate edges to pass through
+            elif is_forced_approx:
+                specs.append(((x, y), asp))
+            # Otherwise, if we're in widen_orb mode, allow an approximate edge
+            elif has_edge_loose(x, y, asp_clean, bonus=approx_bonus):
+                specs.append(((x, y), f"{asp_clean}_approx"))
+
+        if not specs:
+            return False
+
+        sid = _add_shape(
+            shapes, sh_type, parent_idx, sid,
+            node_list, specs, rep_map, rep_anchor, suppresses
+        )
+        seen.add(key)
+        return True
+
+    # -----------------------
+    # SHAPE DETECTION LOGIC
+    # (unchanged from your version; uses has_edge/add_once)
+    # -----------------------
+    def aspect_ok(a, b, aspect, slack=0.75):
+        """Return True if the aspect exists or is very close within slack degrees."""
+        if has_edge(a, b, aspect):
+            return True
+
+        da = rep_pos.get(a, pos.get(a))
+        db = rep_pos.get(b, pos.get(b))
+        if da is None or db is None:
+            return False
+
+        angle = abs((da - db) % 360)
+        if angle > 180:
+            angle = 360 - angle
+
+        data = ASPECTS[aspect]
+        return abs(angle - data["angle"]) <= (data["orb"] + slack)
+
+    def aspect_ok(a, b, aspect, slack=0.75):
+        """Return True if the aspect exists or is very close within slack degrees."""
+        if has_edge(a, b, aspect):
+            return True
+
+        da = rep_pos.get(a, pos.get(a))
+        db = rep_pos.get(b, pos.get(b))
+        if da is None or db is None:
+            return False
+
+        angle = abs((da - db) % 360)
+        if angle > 180:
+            angle = 360 - angle
+
+        data = ASPECTS[aspect]
+        return abs(angle - data["angle"]) <= (data["orb"] + slack)
+
+    # Envelope (5 nodes, chain of 4 Sextiles, with Oppositions and Trines)
+    for quint in combinations(R, 5):
+        opp_pairs = [
+            pair
+            for pair in combinations(quint, 2)
+            if aspect_ok(pair[0], pair[1], "Opposition")
+        ]
+        if len(opp_pairs) < 2:
+            continue
+
+        added = False
+        for opp1, opp2 in combinations(opp_pairs, 2):
+            if set(opp1) & set(opp2):
+                continue  # oppositions must be disjoint
+
+            center_candidates = set(quint) - set(opp1) - set(opp2)
+            if len(center_candidates) != 1:
+                continue
+
+            c = next(iter(center_candidates))
+
+            for pair_primary, pair_secondary in ((opp1, opp2), (opp2, opp1)):
+                for a, d in (pair_primary, pair_primary[::-1]):
+                    for b, e in (pair_secondary, pair_secondary[::-1]):
+                        sextile_specs = [
+                            ((a, b), "Sextile"),
+                            ((b, c), "Sextile"),
+                            ((c, d), "Sextile"),
+                            ((d, e), "Sextile"),
+                        ]
+                        if not all(has_edge(x, y, asp) for (x, y), asp in sextile_specs):
+                            continue
+
+                        diag_specs = []
+                        diag_checks = [
+                            ((a, d), "Opposition"),
+                            ((b, e), "Opposition"),
+                            ((a, e), "Trine"),
+                            ((b, d), "Trine"),
+                        ]
+                        valid_diag = True
+                        for (x, y), asp in diag_checks:
+                            if not aspect_ok(x, y, asp):
+                                valid_diag = False
+                                break
+                            label = asp if has_edge(x, y, asp) else f"{asp}_approx"
+                            diag_specs.append(((x, y), label))
+                        if not valid_diag:
+                            continue
+
+                        suppresses = {
+                            "Sextile Wedge": {frozenset([a, b, c]), frozenset([c, d, e])},
+                            "Kite": {frozenset([a, b, c, e]), frozenset([a, c, d, e])},
+                            "Cradle": {frozenset([a, b, c, d]), frozenset([b, c, d, e])},
+                            "Wedge": {
+                                frozenset([a, b, d]), frozenset([c, d, e]),
+                                frozenset([a, c, d]), frozenset([a, b, e]),
+                                frozenset([a, d, e]), frozenset([b, c, e]),
+                                frozenset([b, d, e]),
+                            },
+                        }
+                        keep = {
+                            "Sextile Wedge": {frozenset([b, c, d])},
+                            "Mystic Rectangle": {frozenset([a, b, d, e])},
+                            "Grand Trine": {frozenset([a, c, e])},
+                        }
+                        candidate_edges = sextile_specs + diag_specs
+                        add_once(
+                            "Envelope",
+                            (a, b, c, d, e),
+                            candidate_edges,
+                            {"suppress": suppresses, "keep": keep},
+                        )
+                        added = True
+                        break
+                    if added:
+                        break
+                if added:
+                    break
+            if added:
+                break
+
+    # Grand Cross
+    for quad in combinations(R, 4):
+        a, b, c, d = quad
+        if (has_edge(a, c, "Opposition") and has_edge(b, d, "Opposition") and
+            has_edge(a, b, "Square") and has_edge(b, c, "Square") and
+            has_edge(c, d, "Square") and has_edge(d, a, "Square")):
+
+            suppresses = {"T-Square": {
+                frozenset([a, b, c]), frozenset([b, c, d]),
+                frozenset([c, d, a]), frozenset([d, a, b]),
+            }}
+            candidate_edges = [
+                ((a, c), "Opposition"), ((b, d), "Opposition"),
+                ((a, b), "Square"), ((b, c), "Square"),
+                ((c, d), "Square"), ((d, a), "Square"),
+            ]
+            add_once("Grand Cross", (a, b, c, d), candidate_edges,
+                     {"suppress": suppresses})
+
+    # Mystic Rectangle
+    for quad in combinations(R, 4):
+        a, b, c, d = quad
+        sextile_specs = [
+            ((a, b), "Sextile"),
+            ((c, d), "Sextile"),
+        ]
+        if not all(has_edge(x, y, asp) for (x, y), asp in sextile_specs):
+            continue
+
+        diag_checks = [
+            ((a, c), "Opposition"),
+            ((b, d), "Opposition"),
+            ((a, d), "Trine"),
+            ((b, c), "Trine"),
+        ]
+        diag_specs = []
+        valid_diag = True
+        for (x, y), asp in diag_checks:
+            if not aspect_ok(x, y, asp):
+                valid_diag = False
+                break
+            label = asp if has_edge(x, y, asp) else f"{asp}_approx"
+            diag_specs.append(((x, y), label))
+        if not valid_diag:
+            continue
+
+        suppresses = {"Wedge": {
+            frozenset([a, b, c]), frozenset([a, b, d]),
+            frozenset([b, c, d]), frozenset([a, c, d]),
+        }}
+        candidate_edges = sextile_specs + diag_specs
+        add_once("Mystic Rectangle", (a, b, c, d), candidate_edges,
+                 {"suppress": suppresses})
+
+    # Cradle
+    for quad in permutations(R, 4):
+        a, b, c, d = quad
+        if (has_edge(a, b, "Sextile") and has_edge(b, c, "Sextile") and
+            has_edge(c, d, "Sextile") and has_edge(a, d, "Opposition") and
+            has_edge(a, c, "Trine") and has_edge(b, d, "Trine")):
+
+            suppresses = {
+                "Wedge": {frozenset([a, b, d]), frozenset([a, c, d])},
+                "Sextile Wedge": {frozenset([a, b, c]), frozenset([b, c, d])},
+            }
+            candidate_edges = [
+                ((a, b), "Sextile"), ((b, c), "Sextile"), ((c, d), "Sextile"),
+                ((a, d), "Opposition"), ((a, c), "Trine"), ((b, d), "Trine"),
+            ]
+            add_once("Cradle", (a, b, c, d), candidate_edges,
+                     {"suppress": suppresses})
+            break
+
+    # Kite
+    for quad in combinations(R, 4):
+        for trio in combinations(quad, 3):
+            a, b, c = trio
+            apex = list(set(quad) - set(trio))[0]
+            if (has_edge(a, b, "Trine") and has_edge(b, c, "Trine") and has_edge(a, c, "Trine")):
+                for t in (a, b, c):
+                    if has_edge(apex, t, "Opposition"):
+                        # a,b,c are the grand-trine nodes, t is the one opposed by apex
+                        rest = [x for x in (a, b, c) if x != t]
+
+                        suppress_wedges = {
+                            frozenset([apex, t, rest[0]]),  # wedge using apex–t opposition + trines/sextiles
+                            frozenset([apex, t, rest[1]]),
+                        }
+
+                        suppress_sextile_wedge = {
+                            frozenset([apex, rest[0], rest[1]])  # apex sextiles to both, those two are trine
+                        }
+
+                        suppresses = {
+                            "Wedge": suppress_wedges,
+                            "Sextile Wedge": suppress_sextile_wedge,
+                            "Grand Trine": {frozenset([a, b, c])},
+                        }
+
+                        candidate_edges = [
+                            ((a, b), "Trine"), ((b, c), "Trine"), ((a, c), "Trine"),
+                            ((apex, t), "Opposition"),
+                            ((apex, rest[0]), "Sextile"), ((apex, rest[1]), "Sextile"),
+                        ]
+                        add_once("Kite", (a, b, c, apex), candidate_edges,
+                                 {"suppress": suppresses})
+                        break
+
+    # Grand Trine
+    for trio in combinations(R, 3):
+        a, b, c = trio
+        tri_specs = [
+            ((a, b), "Trine"),
+            ((b, c), "Trine"),
+            ((a, c), "Trine"),
+        ]
+        valid_tri = True
+        candidate_edges = []
+        for (x, y), asp in tri_specs:
+            if has_edge(x, y, asp):
+                candidate_edges.append(((x, y), asp))
+            elif aspect_ok(x, y, asp):
+                candidate_edges.append(((x, y), f"{asp}_approx"))
+            else:
+                valid_tri = False
+                break
+        if not valid_tri:
+            continue
+        add_once("Grand Trine", (a, b, c), candidate_edges)
+
+    # T-Square
+    for trio in combinations(R, 3):
+        for apex in trio:
+            a, b = [n for n in trio if n != apex]
+            if (has_edge(a, b, "Opposition") and
+                has_edge(apex, a, "Square") and has_edge(apex, b, "Square")):
+                candidate_edges = [
+                    ((a, b), "Opposition"),
+                    ((apex, a), "Square"),
+                    ((apex, b), "Square"),
+                ]
+                add_once("T-Square", (a, b, apex), candidate_edges)
+                break
+
+    # Wedge
+    for trio in combinations(R, 3):
+        pairs = list(combinations(trio, 2))
+        opp = [p for p in pairs if has_edge(p[0], p[1], "Opposition")]
+        tri = [p for p in pairs if has_edge(p[0], p[1], "Trine")]
+        sex = [p for p in pairs if has_edge(p[0], p[1], "Sextile")]
+        if len(opp) == 1 and len(tri) == 1 and len(sex) == 1:
+            candidate_edges = [(opp[0], "Opposition"), (tri[0], "Trine"), (sex[0], "Sextile")]
+            add_once("Wedge", trio, candidate_edges)
+
+    # Sextile Wedge
+    for trio in combinations(R, 3):
+        pairs = list(combinations(trio, 2))
+        tri = [p for p in pairs if has_edge(p[0], p[1], "Trine")]
+        sex = [p for p in pairs if has_edge(p[0], p[1], "Sextile")]
+        opp = [p for p in pairs if has_edge(p[0], p[1], "Opposition")]
+        if len(tri) == 1 and len(sex) == 2 and not opp:
+            candidate_edges = [(tri[0], "Trine"), (sex[0], "Sextile"), (sex[1], "Sextile")]
+            add_once("Sextile Wedge", trio, candidate_edges)
+
+    return shapes, sid
@@ -16,6 +16,26 @@ from src.core.calc_v2 import (
     analyze_dispositors,
     _resolve_dignity,
     _sign_index,
+    _sep_deg,
+    _within_orb,
+    _applying_or_separating,
+    _ASPECTS_ALL,
+    separation_matrix,
+    compute_aspect_pass,
+    build_aspect_edges,
+    build_aspect_table,
+    build_conjunction_clusters,
+    calculate_chart,
+    chart_aspect_pass,
+    chart_object_names,
+    chart_positions,
+    chart_separation_matrix,
+)
+from src.core.models_v2 import (
+    AstrologicalChart,
+    ChartDerivedCache,
+    derived_cache_stats,
+    reset_derived_cache_stats,
 )
 
 
@@ -310,3 +330,142 @@ class TestCalculateChart:
         """Each object should have a numeric longitude."""
         for obj in sample_chart.objects:
             assert isinstance(obj.longitude, (int, float))
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Batched aspect kernel
+# ═══════════════════════════════════════════════════════════════════════
+
+class TestAspectKernel:
+    LONS = [0.0, 59.0, 121.5, 179.0, 358.5, 225.0, 90.2]
+    SPEEDS = [1.0, -0.5, 0.1, 13.0, 0.0, -0.2, 0.9]
+
+    def test_separation_matrix_matches_scalar(self):
+        sep = separation_matrix(self.LONS)
+        for i, a in enumerate(self.LONS):
+            for j, b in enumerate(self.LONS):
+                assert sep[i, j] == _sep_deg(a, b)
+
+    def test_best_aspect_matches_scalar_loop(self):
+        names = [f"P{i}" for i in range(len(self.LONS))]
+        ap = compute_aspect_pass(names, self.LONS, self.SPEEDS)
+        for i, (a, sa) in enumerate(zip(self.LONS, self.SPEEDS)):
+            for j, (b, sb) in enumerate(zip(self.LONS, self.SPEEDS)):
+                best_name, best_delta = None, None
+                for name, spec in _ASPECTS_ALL.items():
+                    hit, delta = _within_orb(a, b, spec["angle"], spec["orb"])
+                    if hit and (best_delta is None or delta < best_delta):
+                        best_name, best_delta = name, delta
+                k = ap.main.best[i, j]
+                if best_name is None:
+                    assert k == -1
+                    continue
+                assert ap.main.aspect_names[k] == best_name
+                assert ap.main.delta[i, j] == best_delta
+                expect = _applying_or_separating(a, sa, b, sb, _ASPECTS_ALL[best_name]["angle"])
+                assert bool(ap.main.applying[i, j]) == (expect == "Applying")
+
+    def test_empty_input(self):
+        ap = compute_aspect_pass([], [], [])
+        assert ap.sep.shape == (0, 0)
+        assert ap.main.best.shape == (0, 0)
+
+
+@pytest.mark.integration
+class TestAspectBuildersShareKernel:
+    def test_edges_from_chart_and_dataframe_agree(self, sample_chart):
+        from_chart = build_aspect_edges(sample_chart)
+        from_df = build_aspect_edges(sample_chart.to_dataframe())
+        assert [e[:2] for e in from_chart[0]] == [e[:2] for e in from_df[0]]
+        assert [e[2]["aspect"] for e in from_chart[2]] == [e[2]["aspect"] for e in from_df[2]]
+
+    def test_edges_are_upper_pairs_in_object_order(self, sample_chart):
+        order = {o.object_name.name: i for i, o in enumerate(sample_chart.objects)}
+        major, minor, harmonic = build_aspect_edges(sample_chart)
+        for edges in (major, minor, harmonic):
+            keys = [(order[a], order[b]) for a, b, _ in edges]
+            assert all(i < j for i, j in keys)
+            assert keys == sorted(keys)
+
+    def test_table_cells_match_edges(self, sample_chart):
+        df = sample_chart.to_dataframe()
+        table = build_aspect_table(df)
+        major, minor, _ = build_aspect_edges(sample_chart)
+        names = list(table.index)
+        n = len(names)
+        for a, b, meta in major + minor:
+            i, j = names.index(a), names.index(b)
+            if j <= n - i - 1:
+                assert table.iat[i, j].startswith(meta["aspect"] + " (")
+        assert all(table.iat[i, i] == "X" for i in range(n) if i <= n - i - 1)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Per-chart derived-data cache
+# ═══════════════════════════════════════════════════════════════════════
+
+@pytest.mark.integration
+class TestChartDerivedCache:
+    @pytest.fixture
+    def chart(self, ephe_path):
+        """A fresh chart per test — these tests mutate cache counters."""
+        _df, _asp, _plot, chart = calculate_chart(
+            year=1985, month=3, day=2, hour=6, minute=15,
+            tz_offset=0, lat=51.5, lon=-0.12, input_is_ut=True,
+        )
+        return chart
+
+    def test_calculate_chart_primes_edges(self, chart):
+        before = chart.derived.hits
+        build_aspect_edges(chart)
+        assert chart.derived.hits == before + 1
+        assert "edges:False" in chart.derived.stats()["keys"]
+
+    def test_cached_edges_equal_fresh_edges(self, chart):
+        cached = build_aspect_edges(chart)
+        fresh = build_aspect_edges(chart, aspect_pass=chart_aspect_pass(chart))
+        assert cached == fresh
+
+    def test_returned_lists_are_copies(self, chart):
+        major, _, _ = build_aspect_edges(chart)
+        major.clear()
+        assert build_aspect_edges(chart)[0]
+
+    def test_moved_object_recomputes(self, chart):
+        major_before = build_aspect_edges(chart)[0]
+        recomputes = chart.derived.recomputes
+        chart.objects[0].longitude = (chart.objects[0].longitude + 90.0) % 360.0
+        major_after = build_aspect_edges(chart)[0]
+        assert chart.derived.recomputes > recomputes
+        assert major_after != major_before
+
+    def test_separation_matrix_shape(self, chart):
+        names, sep = chart_separation_matrix(chart)
+        assert names == chart_object_names(chart)
+        assert sep.shape == (len(names), len(names))
+        assert (sep >= 0).all() and (sep <= 180).all()
+
+    def test_positions_match_dataframe_scan(self, chart):
+        from src.core.patterns_v2 import positions_from_dataframe
+        assert chart_positions(chart) == positions_from_dataframe(chart.to_dataframe())
+
+    def test_clusters_accept_chart_or_dataframe(self, chart):
+        major, _, _ = build_aspect_edges(chart)
+        rows_chart, _, _ = build_conjunction_clusters(chart, major)
+        rows_df, _, _ = build_conjunction_clusters(chart.to_dataframe(), major)
+        assert rows_chart == rows_df
+
+    def test_global_stats_count_hits(self, chart):
+        reset_derived_cache_stats()
+        build_aspect_edges(chart)
+        build_aspect_edges(chart)
+        stats = derived_cache_stats()
+        assert stats["edges:False"]["hits"] == 2
+        assert stats["edges:False"]["recomputes"] == 0
+
+    def test_not_serialised(self, chart):
+        data = chart.to_json()
+        assert "derived" not in data
+        restored = AstrologicalChart.from_json(data)
+        assert isinstance(restored.derived, ChartDerivedCache)
+        assert restored.derived.stats()["keys"] == []
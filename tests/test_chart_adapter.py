@@ -12,6 +12,7 @@ from src.chart_adapter import (
     ChartResult,
     RenderToggles,
     compute_chart,
+    compute_charts,
     compute_transit_chart,
     compute_combined_circuits,
     compute_inter_chart_aspects,
@@ -198,6 +199,67 @@ class TestComputeChartIntegration:
         assert len(result.patterns) > 0
         assert result.utc_datetime is not None
 
+    def test_stage_timings_recorded(self):
+        """Every pipeline stage reports wall/CPU time on the result."""
+        inputs = ChartInputs(
+            name="Timed", year=1990, month=6, day=15,
+            hour_24=14, minute=30, lat=40.7128, lon=-74.006,
+            tz_name="America/New_York",
+        )
+        result = compute_chart(inputs)
+        assert list(result.stage_timings) == [
+            "calculate_chart", "aspect_edges", "receptions", "sect",
+            "conj_clusters", "dispositors", "pattern_inputs", "shapes",
+            "minor_links", "circuit_sim",
+        ]
+        assert all(t.ok and t.wall_ms >= 0 for t in result.stage_timings.values())
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# compute_charts — batch API
+# ═══════════════════════════════════════════════════════════════════════
+
+def _batch_inputs():
+    good = [
+        ChartInputs(name=f"B{i}", year=1980 + i, month=3, day=10,
+                    hour_24=9, minute=15, lat=51.5, lon=-0.12,
+                    tz_name="Europe/London")
+        for i in range(4)
+    ]
+    bad = ChartInputs(name="Bad", tz_name="INVALID/TIMEZONE")
+    return good[:2] + [bad] + good[2:]
+
+
+class TestComputeCharts:
+    """Batch computation: ordering, per-item errors, in-process fallback."""
+
+    def test_in_process_matches_single(self):
+        inputs = _batch_inputs()
+        out = list(compute_charts(inputs, workers=1))
+        assert [i for i, _ in out] == list(range(len(inputs)))
+        assert "Time parsing failed" in out[2][1].error
+        single = compute_chart(inputs[0])
+        assert out[0][1].positions == single.positions
+
+    def test_pool_ordered(self):
+        inputs = _batch_inputs()
+        out = list(compute_charts(iter(inputs), workers=2, max_pending=2))
+        assert [i for i, _ in out] == list(range(len(inputs)))
+        assert out[2][1].error is not None
+        for idx in (0, 1, 3, 4):
+            res = out[idx][1]
+            assert res.error is None
+            assert res.chart.display_name == inputs[idx].name
+            assert res.shapes and res.stage_timings
+
+    def test_pool_completion_order_covers_all(self):
+        inputs = _batch_inputs()
+        out = list(compute_charts(inputs, workers=2, ordered=False))
+        assert sorted(i for i, _ in out) == list(range(len(inputs)))
+
+    def test_empty_input(self):
+        assert list(compute_charts([], workers=2)) == []
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # compute_transit_chart
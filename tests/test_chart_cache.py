@@ -0,0 +1,98 @@
+"""Tests for src/chart_cache.py — per-session live chart cache."""
+from types import SimpleNamespace
+
+import pytest
+
+from src.chart_cache import LiveChartCache, chart_digest
+
+
+class _Builder:
+    """Counts builds and returns a fresh object per call."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, raw):
+        self.calls += 1
+        return SimpleNamespace(objects=[None] * 3, raw=raw)
+
+
+@pytest.fixture()
+def cache():
+    return LiveChartCache()
+
+
+@pytest.fixture()
+def build():
+    return _Builder()
+
+
+def test_digest_is_content_based():
+    assert chart_digest({"a": 1, "b": [1, 2]}) == chart_digest({"b": [1, 2], "a": 1})
+    assert chart_digest({"a": 1}) != chart_digest({"a": 2})
+
+
+def test_repeat_lookups_build_once(cache, build):
+    raw = {"format": "rosetta.chart", "data": "abc"}
+    first = cache.get("s1", raw, build)
+    for _ in range(5):
+        assert cache.get("s1", dict(raw), build) is first
+    assert build.calls == 1
+    assert cache.stats()["hits"] == 5
+
+
+def test_put_seeds_freshly_computed_chart(cache, build):
+    raw, chart = {"data": "fresh"}, SimpleNamespace(objects=[])
+    cache.put("s1", raw, chart)
+    assert cache.get("s1", raw, build) is chart
+    assert build.calls == 0
+
+
+def test_changed_chart_rebuilds_and_supersedes(build):
+    cache = LiveChartCache(per_session=2)
+    a = cache.get("s1", {"v": 1}, build)
+    cache.get("s1", {"v": 2}, build)
+    cache.get("s1", {"v": 3}, build)
+    assert build.calls == 3
+    assert cache.stats()["entries"] == 2
+    assert cache.get("s1", {"v": 1}, build) is not a
+    assert build.calls == 4
+
+
+def test_swapping_two_charts_stays_warm(cache, build):
+    c1, c2 = {"v": 1}, {"v": 2}
+    cache.get("s1", c1, build)
+    cache.get("s1", c2, build)
+    cache.get("s1", c2, build)
+    cache.get("s1", c1, build)
+    assert build.calls == 2
+
+
+def test_sessions_do_not_share_objects(cache, build):
+    raw = {"v": 1}
+    assert cache.get("s1", raw, build) is not cache.get("s2", raw, build)
+    cache.invalidate("s1")
+    cache.get("s1", raw, build)
+    assert build.calls == 3
+
+
+def test_memory_cap_evicts_least_recent(build):
+    cache = LiveChartCache(max_bytes=3 * 4096 * 2)
+    cache.get("s1", {"v": 1}, build)
+    cache.get("s2", {"v": 1}, build)
+    cache.get("s1", {"v": 1}, build)
+    cache.get("s3", {"v": 1}, build)
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= stats["max_bytes"]
+    cache.get("s1", {"v": 1}, build)
+    assert build.calls == 3
+
+
+def test_ttl_expires_idle_entries(build):
+    clock = [0.0]
+    cache = LiveChartCache(ttl=10.0, timer=lambda: clock[0])
+    cache.get("s1", {"v": 1}, build)
+    clock[0] = 11.0
+    cache.get("s1", {"v": 1}, build)
+    assert build.calls == 2
@@ -0,0 +1,92 @@
+"""Tests for src/core/chart_store.py — packed session-storage chart format."""
+import datetime as dt
+import json
+
+import pytest
+
+from src.chart_adapter import ChartInputs, compute_chart, compute_transit_chart
+from src.core.chart_store import (
+    STORE_VERSION,
+    ChartStoreError,
+    is_packed,
+    pack_chart,
+    unpack_chart,
+)
+from src.core.models_v2 import AstrologicalChart
+
+
+@pytest.fixture(scope="module")
+def natal():
+    return compute_chart(ChartInputs(
+        name="Store", year=1990, month=7, day=1, hour_24=12, minute=0,
+        city="New York", lat=40.71, lon=-74.01, tz_name="America/New_York",
+    )).chart
+
+
+@pytest.fixture(scope="module")
+def transit():
+    return compute_transit_chart(
+        lat=51.5, lon=-0.12, tz_name="Europe/London",
+        transit_utc=dt.datetime(2024, 3, 20, 12, 0, tzinfo=dt.timezone.utc),
+    ).chart
+
+
+def _roundtrip(chart, compress=True):
+    return unpack_chart(json.loads(json.dumps(pack_chart(chart, compress=compress))))
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_envelope_is_json_and_tagged(natal, compress):
+    packed = pack_chart(natal, compress=compress)
+    assert is_packed(packed)
+    assert packed["version"] == STORE_VERSION
+    json.dumps(packed)
+
+
+def test_packed_is_much_smaller_than_to_json(natal):
+    full = len(json.dumps(natal.to_json()))
+    assert len(json.dumps(pack_chart(natal, compress=False))) * 5 < full
+    assert len(json.dumps(pack_chart(natal))) * 10 < full
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_roundtrip_rebuilds_derived_data(natal, compress):
+    back = _roundtrip(natal, compress)
+    before, after = natal.to_json(), back.to_json()
+    for key in ("objects", "house_cusps", "cusp_arrays", "edges_major", "edges_minor",
+                "edges_harmonic", "aspect_groups", "shapes", "filaments", "singleton_map",
+                "conj_clusters_rows", "dispositor_summary_rows", "dispositor_chains_rows",
+                "sect", "display_datetime", "utc_datetime", "display_name", "city"):
+        assert after[key] == before[key], key
+    assert back.aspect_df.equals(natal.aspect_df)
+    assert list(back.df_positions["Object"]) == list(natal.df_positions["Object"])
+
+
+def test_transit_roundtrip_skips_natal_artifacts(transit):
+    back = _roundtrip(transit)
+    assert back.edges_major == transit.edges_major
+    assert back.aspect_groups == transit.aspect_groups
+    assert not back.dispositor_summary_rows
+    assert not back.filaments
+
+
+def test_unpack_without_derive_keeps_core_only(natal):
+    back = unpack_chart(pack_chart(natal), derive=False)
+    assert [o.object_name.name for o in back.objects] == [o.object_name.name for o in natal.objects]
+    assert back.edges_major == []
+    assert back.df_positions is None
+
+
+def test_model_methods_delegate(natal):
+    back = AstrologicalChart.from_compact(natal.to_compact())
+    assert back.edges_major == natal.edges_major
+
+
+def test_rejects_foreign_and_future_payloads(natal):
+    with pytest.raises(ChartStoreError):
+        unpack_chart(natal.to_json())
+    packed = pack_chart(natal)
+    with pytest.raises(ChartStoreError):
+        unpack_chart({**packed, "version": STORE_VERSION + 1})
+    with pytest.raises(ChartStoreError):
+        unpack_chart({**packed, "encoding": "bz2"})
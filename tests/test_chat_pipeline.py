@@ -407,3 +407,152 @@ class TestRunPipeline:
         assert isinstance(text, str)
         assert isinstance(meta, dict)
         assert isinstance(updates, dict)
+
+
+# ---------------------------------------------------------------------------
+# End-to-end turn against a local fake OpenAI-compatible server
+# ---------------------------------------------------------------------------
+
+class TestRunPipelineFakeServer:
+    """Full turn (no mocks) with injected LLM latency."""
+
+    LATENCY = 0.25
+
+    def test_turn_overlaps_grammar_and_comprehension(self, sample_chart):
+        pytest.importorskip("openai")
+        from src.mcp.chat_pipeline import run_pipeline
+        from tests.fixtures.fake_openai import FakeOpenAIServer, PROSE_REPLY
+
+        with FakeOpenAIServer(latency=self.LATENCY) as server, server.redirect():
+            text, meta, _ = run_pipeline(**_run_defaults(
+                question="How does my partner affect my career?", chart=sample_chart))
+
+        assert text == PROSE_REPLY
+        assert meta["backend"] == "openrouter"
+        (grammar,) = server.calls_of("grammar")
+        (llm,) = server.calls_of("comprehension")
+        (synth,) = server.calls_of("synthesis")
+        # Two round trips on the critical path instead of three.
+        assert grammar.started < llm.finished and llm.started < grammar.finished
+        assert synth.started >= max(grammar.finished, llm.finished)
+
+    def test_pipeline_stream_yields_deltas_before_synthesis_ends(self, sample_chart):
+        pytest.importorskip("openai")
+        import asyncio
+        import time
+
+        from src.mcp.chat_pipeline import PipelineStream
+        from tests.fixtures.fake_openai import FakeOpenAIServer, PROSE_REPLY
+
+        async def turn():
+            stream = PipelineStream(**_run_defaults(chart=sample_chart))
+            arrivals = [(time.perf_counter(), d) async for d in stream]
+            return arrivals, stream.outcome
+
+        with FakeOpenAIServer(chunk_delay=0.02) as server, server.redirect():
+            arrivals, (text, meta, _) = asyncio.run(turn())
+
+        assert "".join(d for _, d in arrivals) == text == PROSE_REPLY
+        assert meta["total_tokens"] == 120
+        (synth,) = server.calls_of("synthesis")
+        assert synth.body["stream"] is True
+        assert arrivals[0][0] < synth.finished
+
+
+    def test_repeat_turn_hits_reading_cache(self, sample_chart, monkeypatch):
+        pytest.importorskip("openai")
+        from src.mcp.chat_pipeline import CHAT_DEV_TRACE, run_pipeline
+        from src.mcp.reading_cache import SYNTHESIS_ENV
+        from tests.fixtures.fake_openai import FakeOpenAIServer, PROSE_REPLY
+
+        monkeypatch.setenv(SYNTHESIS_ENV, "1")
+        with FakeOpenAIServer() as server, server.redirect():
+            run_pipeline(**_run_defaults(chart=sample_chart))
+            assert CHAT_DEV_TRACE["test-user"]["reading_cache"]["comprehension"] == "miss"
+            calls = len(server.calls)
+            deltas = []
+            # A new session: the first turn added "partner" to this one's
+            # known persons, which is part of the comprehension key.
+            text, meta, _ = run_pipeline(**_run_defaults(
+                chart=sample_chart, question="what does my moon mean", uid="other-user"),
+                on_delta=deltas.append)
+
+        assert len(server.calls) == calls
+        assert text == PROSE_REPLY and deltas == [PROSE_REPLY] and meta["cached"]
+        trace = CHAT_DEV_TRACE["other-user"]["reading_cache"]
+        assert (trace["comprehension"], trace["synthesis"]) == ("hit", "hit")
+        assert trace["stats"]["graph_hit_rate"] == 0.5
+
+    def test_house_system_change_misses_synthesis_cache(self, sample_chart, monkeypatch):
+        pytest.importorskip("openai")
+        from src.mcp.chat_pipeline import CHAT_DEV_TRACE, run_pipeline
+        from src.mcp.reading_cache import SYNTHESIS_ENV
+        from tests.fixtures.fake_openai import FakeOpenAIServer
+
+        monkeypatch.setenv(SYNTHESIS_ENV, "1")
+        with FakeOpenAIServer() as server, server.redirect():
+            run_pipeline(**_run_defaults(chart=sample_chart))
+            _, meta, _ = run_pipeline(**_run_defaults(
+                chart=sample_chart, house_system="whole_sign"))
+            assert len(server.calls_of("synthesis")) == 2
+
+        assert not meta.get("cached")
+        assert CHAT_DEV_TRACE["test-user"]["reading_cache"]["synthesis"] == "miss"
+
+    def test_known_person_change_misses_synthesis_cache(self, sample_chart, monkeypatch):
+        pytest.importorskip("openai")
+        from src.mcp.chat_pipeline import CHAT_DEV_TRACE, CHAT_PERSONS, run_pipeline
+        from src.mcp.reading_cache import SYNTHESIS_ENV
+        from tests.fixtures.fake_openai import FakeOpenAIServer
+
+        monkeypatch.setenv(SYNTHESIS_ENV, "1")
+        with FakeOpenAIServer() as server, server.redirect():
+            run_pipeline(**_run_defaults(chart=sample_chart))
+            CHAT_PERSONS["test-user"] = [{"name": "Sam", "relationship_to_querent": "friend"}]
+            _, meta, _ = run_pipeline(**_run_defaults(chart=sample_chart))
+            assert len(server.calls_of("synthesis")) == 2
+
+        assert not meta.get("cached")
+        assert CHAT_DEV_TRACE["test-user"]["reading_cache"]["synthesis"] == "miss"
+
+
+class TestRunPipelineStreaming:
+    """run_pipeline(on_delta=...) and PipelineStream with mocked synthesis."""
+
+    @patch(_SYNTH)
+    @patch(_BUILD)
+    def test_on_delta_receives_deltas(self, mock_build, mock_synth, mock_packet):
+        from src.mcp.chat_pipeline import run_pipeline
+        from src.mcp.prose_synthesizer import SynthesisResult, SynthesisStream
+        mock_build.return_value = mock_packet
+        mock_synth.return_value = SynthesisStream.of(
+            SynthesisResult(text="Fiery Moon.", model="m", total_tokens=7,
+                            backend="openrouter"))
+        deltas = []
+
+        text, meta, _ = run_pipeline(**_run_defaults(), on_delta=deltas.append)
+
+        assert deltas == ["Fiery Moon."] and text == "Fiery Moon."
+        assert meta["total_tokens"] == 7
+        assert mock_synth.call_args.kwargs["stream"] is True
+
+    @patch(_SYNTH)
+    @patch(_BUILD)
+    async def test_stream_without_synthesis_yields_nothing(
+            self, mock_build, mock_synth, mock_packet):
+        from src.mcp.chat_pipeline import PipelineStream
+        mock_build.return_value = mock_packet
+
+        stream = PipelineStream(**_run_defaults(api_key=""))
+        assert [d async for d in stream] == []
+        text, meta, _ = stream.outcome
+        assert meta["backend"] == "fallback"
+        mock_synth.assert_not_called()
+
+    @patch("src.mcp.agent_memory.AgentMemory", side_effect=RuntimeError("boom"))
+    async def test_stream_propagates_pipeline_crash(self, mock_memory):
+        from src.mcp.chat_pipeline import PipelineStream
+
+        with pytest.raises(RuntimeError, match="boom"):
+            async for _ in PipelineStream(**_run_defaults()):
+                pass
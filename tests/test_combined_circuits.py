@@ -0,0 +1,114 @@
+"""Tests for src/core/combined_circuits.py — incremental biwheel engine."""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.calc_v2 import calculate_chart
+from src.core.combined_circuits import CombinedCircuitEngine
+from src.core.models_v2 import static_db
+from src.core.patterns_v2 import connected_components_from_edges, detect_shapes
+
+
+def _full_rebuild(chart_1, chart_2):
+    """The non-incremental computation: every pair, DFS components, fresh shapes."""
+    aspects = {k: v for k, v in static_db.ASPECTS.items()
+               if v.get("aspect_type") in ("Major", "Minor")}
+    pos = {o.object_name.name: o.longitude for o in chart_1.objects if o.object_name}
+    for o in chart_2.objects:
+        if o.object_name:
+            pos[f"{o.object_name.name}_2"] = o.longitude
+    bodies = list(pos)
+    edges = []
+    for i in range(len(bodies)):
+        for j in range(i + 1, len(bodies)):
+            ang = abs(pos[bodies[i]] - pos[bodies[j]]) % 360
+            if ang > 180:
+                ang = 360 - ang
+            for name, data in aspects.items():
+                if abs(ang - data["angle"]) <= data["orb"]:
+                    edges.append(((bodies[i], bodies[j]), name))
+                    break
+    patterns = connected_components_from_edges(bodies, edges)
+    return pos, patterns, detect_shapes(pos, patterns, edges), edges
+
+
+def _transit(day, hour):
+    return calculate_chart(2024, 3, day, hour, 0, 0, 40.7, -74.0, input_is_ut=True)[3]
+
+
+@pytest.fixture(scope="module")
+def natal():
+    return calculate_chart(1985, 7, 20, 14, 30, 0, 40.7, -74.0, input_is_ut=True)[3]
+
+
+class TestCombinedCircuitEngine:
+    def test_matches_full_rebuild_while_scrubbing(self, natal):
+        engine = CombinedCircuitEngine()
+        for day, hour in [(1, 0), (1, 1), (1, 2), (3, 12), (1, 1)]:
+            chart_2 = _transit(day, hour)
+            got = engine.compute(natal, chart_2)
+            pos, patterns, shapes, edges = _full_rebuild(natal, chart_2)
+            assert got["pos_combined"] == pos
+            assert got["combined_edges"] == edges
+            assert got["patterns_combined"] == patterns
+            assert [s.to_dict() for s in got["shapes_combined"]] == [s.to_dict() for s in shapes]
+            connected = {n for (u, v), _ in edges for n in (u, v)}
+            assert set(got["singleton_map_combined"]) == set(pos) - connected
+
+    def test_reuses_chart1_state(self, natal):
+        engine = CombinedCircuitEngine()
+        engine.compute(natal, _transit(1, 0))
+        engine.compute(natal, _transit(1, 1))
+        stats = engine.stats()
+        assert stats["base_misses"] == 1
+        assert stats["base_hits"] == 1
+        assert stats["pairs_reused"] > 0
+
+    def test_unchanged_components_hit_cache(self, natal):
+        engine = CombinedCircuitEngine()
+        chart_2 = _transit(2, 6)
+        first = engine.compute(natal, chart_2)
+        misses = engine.stats()["component_misses"]
+        second = engine.compute(natal, chart_2)
+        stats = engine.stats()
+        assert stats["component_misses"] == misses
+        assert stats["component_hits"] >= len(first["patterns_combined"])
+        assert [s.to_dict() for s in second["shapes_combined"]] == \
+            [s.to_dict() for s in first["shapes_combined"]]
+
+    def test_base_lru_is_bounded(self, natal):
+        engine = CombinedCircuitEngine(max_bases=2)
+        chart_2 = _transit(1, 0)
+        for day in (1, 2, 3):
+            engine.compute(_transit(day, 5), chart_2)
+        assert engine.stats()["bases"] == 2
+
+    def test_shape_detection_runs_outside_engine_lock(self, natal, monkeypatch):
+        import src.core.combined_circuits as combined_circuits
+
+        engine = CombinedCircuitEngine()
+        held = []
+
+        def _detect(*args, **kwargs):
+            held.append(engine._lock.locked())
+            return detect_shapes(*args, **kwargs)
+
+        monkeypatch.setattr(combined_circuits, "detect_shapes", _detect)
+        engine.compute(natal, _transit(1, 0))
+        assert held == [False]
+
+    def test_concurrent_calls_match_sequential(self, natal):
+        charts = [_transit(day, hour) for day in (1, 2) for hour in (0, 6, 12)]
+        expected = [CombinedCircuitEngine().compute(natal, c) for c in charts]
+        engine = CombinedCircuitEngine()
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            got = list(pool.map(lambda c: engine.compute(natal, c), charts * 3))
+        for i, result in enumerate(got):
+            want = expected[i % len(charts)]
+            assert result["combined_edges"] == want["combined_edges"]
+            assert [s.to_dict() for s in result["shapes_combined"]] == \
+                [s.to_dict() for s in want["shapes_combined"]]
+        stats = engine.stats()
+        assert stats["calls"] == len(got)
+        assert stats["base_hits"] + stats["base_misses"] == len(got)
+        assert stats["bases"] == 1
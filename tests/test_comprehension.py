@@ -0,0 +1,94 @@
+"""Tests for src/mcp/comprehension.py — grammar + comprehension LLM calls."""
+import time
+
+import pytest
+
+pytest.importorskip("openai")
+
+from src.mcp.comprehension import comprehend  # noqa: E402
+from tests.fixtures.fake_openai import FakeOpenAIServer  # noqa: E402
+
+_QUESTION = "How does my partner affect my career?"
+_LATENCY = 0.3
+
+
+@pytest.fixture(scope="module")
+def server(sample_chart):
+    with FakeOpenAIServer(latency=_LATENCY) as srv, srv.redirect():
+        # Warm the pooled client, SSL context and term registry so timings
+        # below measure the pipeline, not first-use setup.
+        comprehend("warm up", sample_chart, api_key="k")
+        yield srv
+
+
+@pytest.fixture()
+def fresh(server):
+    server.calls.clear()
+    return server
+
+
+def _overlap(a, b) -> bool:
+    return a.started < b.finished and b.started < a.finished
+
+
+def test_speculative_overlaps_grammar_and_comprehension(fresh, sample_chart):
+    t0 = time.perf_counter()
+    result = comprehend(_QUESTION, sample_chart, api_key="k", speculative=True)
+    elapsed = time.perf_counter() - t0
+
+    (grammar,), (llm,) = fresh.calls_of("grammar"), fresh.calls_of("comprehension")
+    assert _overlap(grammar, llm)
+    assert elapsed < 2 * _LATENCY
+    # The speculative prompt can't carry the parse...
+    assert "GRAMMAR_PARSE" not in llm.body["messages"][1]["content"]
+    # ...but the grammar's deterministic WHO is still merged in.
+    graph = result.graph
+    assert graph.source == "llm"
+    assert [p.relationship_to_querent for p in graph.persons] == ["partner"]
+    assert graph.grammar is not None and graph.grammar.confidence > 0
+    assert graph.paraphrase == "How does my partner influence my career?"
+
+
+def test_serial_feeds_grammar_into_prompt(fresh, sample_chart):
+    result = comprehend(_QUESTION, sample_chart, api_key="k", speculative=False)
+
+    (grammar,), (llm,) = fresh.calls_of("grammar"), fresh.calls_of("comprehension")
+    assert llm.started >= grammar.finished
+    prompt = llm.body["messages"][1]["content"]
+    assert "GRAMMAR_PARSE" in prompt and "PRE_EXTRACTED_5WH" in prompt
+    assert [p.relationship_to_querent for p in result.graph.persons] == ["partner"]
+
+
+def test_env_switches_speculation_off(fresh, sample_chart, monkeypatch):
+    monkeypatch.setenv("ROSETTA_SPECULATIVE_COMPREHENSION", "0")
+    comprehend(_QUESTION, sample_chart, api_key="k")
+    (grammar,), (llm,) = fresh.calls_of("grammar"), fresh.calls_of("comprehension")
+    assert not _overlap(grammar, llm)
+
+
+def test_no_key_makes_no_calls(fresh, sample_chart):
+    result = comprehend("Tell me about my career", sample_chart)
+    assert result.graph.source != "llm"
+    assert fresh.calls == []
+
+
+def test_repeat_question_served_from_cache(fresh, sample_chart):
+    first = comprehend(_QUESTION, sample_chart, api_key="k")
+    calls = len(fresh.calls)
+    again = comprehend("how does my partner affect my career", sample_chart, api_key="k")
+
+    assert not first.from_cache and again.from_cache
+    assert len(fresh.calls) == calls
+    assert again.graph.paraphrase == first.graph.paraphrase
+    assert again.graph is not first.graph
+
+
+def test_cache_respects_session_context(fresh, sample_chart):
+    from src.mcp.comprehension_models import PersonProfile
+
+    comprehend(_QUESTION, sample_chart, api_key="k")
+    other = comprehend(_QUESTION, sample_chart, api_key="k",
+                       known_persons=[PersonProfile(name="Sam", relationship_to_querent="partner")])
+    answer = comprehend(_QUESTION, sample_chart, api_key="k",
+                        pending_clarification="my wife")
+    assert not other.from_cache and not answer.from_cache
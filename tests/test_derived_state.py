@@ -0,0 +1,162 @@
+"""Tests for src/core/derived_state.py — memoised strength / circuit state."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.chart_adapter import ChartInputs, compute_chart
+from src.core.derived_state import DERIVED_STATES, ensure_derived_state
+from src.core.models_v2 import AstrologicalChart
+
+_INPUTS = ChartInputs(
+    name="Derived", year=1987, month=3, day=9, hour_24=6, minute=45,
+    city="London", lat=51.5, lon=-0.12, tz_name="Europe/London",
+)
+
+
+@pytest.fixture(scope="module")
+def natal():
+    return compute_chart(_INPUTS).chart
+
+
+@pytest.fixture()
+def counted(monkeypatch):
+    """Count calls into dignity scoring and the circuit simulation."""
+    import src.core.circuit_sim as circuit_sim
+    import src.core.dignity_calc as dignity_calc
+
+    calls = {"score": 0, "simulate": 0}
+    score, simulate = dignity_calc.score_and_attach, circuit_sim.simulate_circuit
+
+    def _score(*args, **kwargs):
+        calls["score"] += 1
+        return score(*args, **kwargs)
+
+    def _simulate(*args, **kwargs):
+        calls["simulate"] += 1
+        return simulate(*args, **kwargs)
+
+    monkeypatch.setattr(dignity_calc, "score_and_attach", _score)
+    monkeypatch.setattr(circuit_sim, "simulate_circuit", _simulate)
+    DERIVED_STATES.clear()
+    yield calls
+    DERIVED_STATES.clear()
+
+
+def _powers(sim):
+    return {name: round(node.effective_power, 6) for name, node in sim.node_map.items()}
+
+
+def test_rehydrated_chart_matches_pipeline(natal, counted):
+    back = AstrologicalChart.from_compact(natal.to_compact())
+    assert back.circuit_simulation is None and not back.planetary_states
+
+    state = ensure_derived_state(back)
+    assert state.circuit_simulation is back.circuit_simulation
+    assert _powers(back.circuit_simulation) == _powers(natal.circuit_simulation)
+    assert {k: v.power_index for k, v in back.planetary_states.items()} == \
+        {k: v.power_index for k, v in natal.planetary_states.items()}
+    assert back.mutual_receptions == natal.mutual_receptions
+    for obj in back.objects:
+        original = natal.get_object(obj.object_name.name)
+        assert (obj.planetary_state is None) == (original.planetary_state is None)
+        assert obj.station == original.station
+    assert counted == {"score": 1, "simulate": 1}
+
+
+def test_copies_share_one_computation(natal, counted):
+    first = AstrologicalChart.from_compact(natal.to_compact())
+    second = AstrologicalChart.from_json(natal.to_json())
+    ensure_derived_state(first)
+    ensure_derived_state(first)
+    ensure_derived_state(second)
+    assert second.circuit_simulation is first.circuit_simulation
+    assert counted == {"score": 1, "simulate": 1}
+    stats = DERIVED_STATES.stats()
+    assert (stats["misses"], stats["hits"], stats["entries"]) == (1, 1, 1)
+
+
+def test_compute_chart_seeds_cache(counted):
+    chart = compute_chart(_INPUTS).chart
+    assert DERIVED_STATES.stats()["seeded"] == 1
+    before = dict(counted)
+
+    back = AstrologicalChart.from_compact(chart.to_compact())
+    ensure_derived_state(back)
+    assert back.circuit_simulation is chart.circuit_simulation
+    assert counted == before
+    assert DERIVED_STATES.stats()["hits"] == 1
+
+
+def test_chat_turns_never_rescore(natal, counted):
+    from src.mcp.circuit_query import query_circuit
+    from src.mcp.comprehension import comprehend
+    from src.mcp.reading_engine import build_reading
+
+    back = AstrologicalChart.from_compact(natal.to_compact())
+    for _ in range(2):
+        packet = build_reading("Which is my strongest planet?", back)
+        assert packet.power_nodes
+    assert counted == {"score": 1, "simulate": 1}
+
+    reading = query_circuit(comprehend("Tell me about my career", back).graph, back)
+    assert not any("not available" in s.lower() for s in reading.narrative_seeds)
+    assert counted == {"score": 1, "simulate": 1}
+
+
+def test_concurrent_first_access_computes_once(natal, counted):
+    back = AstrologicalChart.from_compact(natal.to_compact())
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        sims = list(pool.map(lambda _: ensure_derived_state(back).circuit_simulation, range(16)))
+    assert all(sim is sims[0] for sim in sims)
+    assert counted["simulate"] == 1
+
+
+def test_different_charts_compute_in_parallel(natal, counted, monkeypatch):
+    import src.core.circuit_sim as circuit_sim
+
+    other = compute_chart(ChartInputs(
+        name="Other", year=1992, month=11, day=2, hour_24=18, minute=5,
+        city="London", lat=51.5, lon=-0.12, tz_name="Europe/London",
+    )).chart
+    DERIVED_STATES.clear()
+    both_inside = threading.Barrier(2, timeout=10)
+    simulate = circuit_sim.simulate_circuit
+
+    def _rendezvous(chart):
+        both_inside.wait()  # breaks (and fails) if the two are serialised
+        return simulate(chart)
+
+    monkeypatch.setattr(circuit_sim, "simulate_circuit", _rendezvous)
+    charts = [AstrologicalChart.from_compact(c.to_compact()) for c in (natal, other)]
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        states = list(pool.map(ensure_derived_state, charts))
+    assert all(state is not None for state in states)
+    assert DERIVED_STATES.stats()["misses"] == 2
+
+
+def test_biwheel_serializer_fills_both_charts(natal, counted):
+    from src.rendering.chart_serializer import serialize_biwheel_for_rendering
+
+    inner, outer = (AstrologicalChart.from_compact(natal.to_compact()) for _ in range(2))
+    serialize_biwheel_for_rendering(inner, outer)
+    assert inner.circuit_simulation is not None
+    assert outer.circuit_simulation is not None
+
+
+def test_failure_is_reported_not_cached(natal, counted, monkeypatch, caplog):
+    import src.core.circuit_sim as circuit_sim
+
+    def _boom(chart):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(circuit_sim, "simulate_circuit", _boom)
+    back = AstrologicalChart.from_compact(natal.to_compact())
+    assert ensure_derived_state(back) is None
+    assert "Could not rebuild" in caplog.text
+    stats = DERIVED_STATES.stats()
+    assert (stats["failures"], stats["entries"]) == (1, 0)
+
+
+def test_ignores_non_charts():
+    assert ensure_derived_state(object()) is None
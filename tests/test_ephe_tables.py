@@ -0,0 +1,109 @@
+"""Tests for src/core/ephe_tables.py — precomputed ephemeris tables."""
+import random
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from src.core.ephe_tables import (
+    EphemerisTable,
+    error_bound,
+    load_table,
+    longitudes_at,
+)
+from src.core.static_data import EPHE_MAJOR_OBJECTS
+
+JD0 = swe.julday(2024, 1, 1, 0.0)
+
+
+def _reference(name, jd):
+    ident = EPHE_MAJOR_OBJECTS[name]
+    if ident == -1:
+        return (swe.calc_ut(jd, swe.TRUE_NODE)[0][0] + 180.0) % 360.0
+    return swe.calc_ut(jd, ident)[0][0]
+
+
+def _sep(a, b):
+    return abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+@pytest.fixture(scope="module")
+def daily():
+    return EphemerisTable.build(JD0, JD0 + 400, step_days=1.0)
+
+
+class TestInterpolationErrorBound:
+    def test_daily_within_bound(self, daily):
+        rng = random.Random(5)
+        jds = [rng.uniform(JD0, JD0 + 400) for _ in range(60)]
+        bound = error_bound(1.0)
+        for name in daily.bodies:
+            for jd in jds:
+                assert _sep(float(daily.interpolate(name, jd)[0]), _reference(name, jd)) <= bound, name
+
+    def test_six_hourly_within_bound(self):
+        table = EphemerisTable.build(JD0, JD0 + 30, step_days=0.25)
+        rng = random.Random(6)
+        bound = error_bound(0.25)
+        for name in table.bodies:
+            for _ in range(20):
+                jd = rng.uniform(JD0, JD0 + 30)
+                assert _sep(float(table.interpolate(name, jd)[0]), _reference(name, jd)) <= bound, name
+
+    def test_exact_at_samples_and_speed(self, daily):
+        lon, spd = daily.interpolate("Mars", JD0 + 10)
+        ref = swe.calc_ut(JD0 + 10, swe.MARS)[0]
+        assert lon == pytest.approx(ref[0], abs=1e-9)
+        assert spd == pytest.approx(ref[3], abs=1e-9)
+        _, moon_spd = daily.interpolate("Moon", JD0 + 10.5)
+        assert moon_spd == pytest.approx(swe.calc_ut(JD0 + 10.5, swe.MOON)[0][3], abs=0.01)
+
+    def test_vectorised_matches_scalar(self, daily):
+        jds = np.array([JD0 + 0.3, JD0 + 55.9, JD0 + 399.99])
+        lons, _ = daily.interpolate("Moon", jds)
+        for jd, lon in zip(jds, lons):
+            assert lon == pytest.approx(float(daily.interpolate("Moon", float(jd))[0]))
+
+    def test_south_node_opposes_north(self, daily):
+        n = float(daily.interpolate("North Node", JD0 + 3.3)[0])
+        s = float(daily.interpolate("South Node", JD0 + 3.3)[0])
+        assert _sep(n + 180.0, s) < 1e-9
+
+
+class TestSpanAndStorage:
+    def test_outside_span_raises(self, daily):
+        assert not daily.covers(JD0 - 1)
+        with pytest.raises(ValueError):
+            daily.interpolate("Sun", JD0 + 401)
+
+    def test_end_of_span_inclusive(self, daily):
+        assert daily.covers(JD0 + 400)
+        lon, _ = daily.interpolate("Sun", JD0 + 400)
+        assert lon == pytest.approx(_reference("Sun", JD0 + 400), abs=1e-9)
+
+    def test_save_load_memmap(self, daily, tmp_path):
+        path = str(tmp_path / "t")
+        daily.save(path)
+        loaded = EphemerisTable.load(path)
+        assert isinstance(loaded.data, np.memmap)
+        assert loaded.meta == daily.meta
+        assert loaded.longitudes(JD0 + 7.25) == daily.longitudes(JD0 + 7.25)
+
+    def test_load_table_missing_returns_none(self, tmp_path):
+        assert load_table(str(tmp_path / "absent")) is None
+
+    def test_load_table_picks_up_table_built_later(self, daily, tmp_path):
+        path = str(tmp_path / "later")
+        assert load_table(path) is None
+        daily.save(path)
+        loaded = load_table(path)
+        assert loaded is not None and loaded is load_table(path)
+        assert loaded.meta == daily.meta
+
+    def test_longitudes_at_falls_back_outside_span(self, daily):
+        jd = JD0 - 100
+        out = longitudes_at(jd, ["Sun", "South Node"], table=daily)
+        assert out["Sun"] == pytest.approx(_reference("Sun", jd))
+        assert out["South Node"] == pytest.approx(_reference("South Node", jd))
+        inside = longitudes_at(JD0 + 1.5, ["Venus"], table=daily)
+        assert inside["Venus"] == pytest.approx(_reference("Venus", JD0 + 1.5), abs=error_bound(1.0))
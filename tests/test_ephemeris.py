@@ -0,0 +1,101 @@
+"""Tests for src/core/ephemeris.py — managed Swiss Ephemeris session."""
+from unittest.mock import patch
+
+import pytest
+import swisseph as swe
+
+from src.core.calc_v2 import calculate_chart
+from src.core.ephemeris import EPHEMERIS, EphemerisSession, configured_ephe_path
+
+
+def _chart(year=1990):
+    return calculate_chart(year, 6, 15, 14, 30, 0, 40.7128, -74.006, input_is_ut=True)
+
+
+class TestEnsure:
+    def test_idempotent_for_same_path(self):
+        s = EphemerisSession()
+        with patch.object(swe, "set_ephe_path") as set_path, \
+                patch.object(swe, "close") as close:
+            s.ensure("/tmp/a")
+            s.ensure("/tmp/a")
+            s.ensure("/tmp/a")
+        assert set_path.call_count == 1
+        close.assert_not_called()
+        assert s.stats()["opens"] == 1
+
+    def test_path_change_reopens(self):
+        s = EphemerisSession()
+        with patch.object(swe, "set_ephe_path") as set_path, \
+                patch.object(swe, "close") as close:
+            s.ensure("/tmp/a")
+            s.ensure("/tmp/b")
+        assert [c.args[0] for c in set_path.call_args_list] == ["/tmp/a", "/tmp/b"]
+        assert close.call_count == 1
+        assert s.path == "/tmp/b"
+
+    def test_default_is_configured_path(self, monkeypatch):
+        monkeypatch.setenv("SE_EPHE_PATH", "/tmp/from-env")
+        assert configured_ephe_path() == "/tmp/from-env"
+        s = EphemerisSession()
+        with patch.object(swe, "set_ephe_path"):
+            assert s.ensure() == "/tmp/from-env"
+
+
+class TestHandleGuard:
+    def test_checkpoint_releases_over_bound(self):
+        s = EphemerisSession(max_handles=2)
+        with patch.object(s, "open_handles", return_value=5), \
+                patch.object(swe, "close") as close:
+            s._path = "/tmp/a"
+            assert s.checkpoint() == 5
+        close.assert_called_once()
+        assert s.path is None
+        assert s.stats()["handle_high_water"] == 5
+
+    def test_checkpoint_keeps_handles_within_bound(self):
+        s = EphemerisSession(max_handles=8)
+        with patch.object(s, "open_handles", return_value=4), \
+                patch.object(swe, "close") as close:
+            s.checkpoint()
+        close.assert_not_called()
+
+    def test_checkpoint_scans_every_n_charts(self):
+        s = EphemerisSession(check_every=4, check_interval=3600)
+        with patch.object(s, "open_handles", return_value=3) as scan:
+            for _ in range(9):
+                assert s.checkpoint() == 3
+        # first call, then every fourth
+        assert scan.call_count == 3
+        assert s.stats()["scans"] == 3
+
+    def test_checkpoint_scans_after_interval(self):
+        s = EphemerisSession(check_every=1000, check_interval=30)
+        clock = [100.0]
+        with patch.object(s, "open_handles", return_value=3) as scan, \
+                patch("src.core.ephemeris.time.monotonic", lambda: clock[0]):
+            s.checkpoint()
+            clock[0] += 10
+            s.checkpoint()
+            clock[0] += 25
+            s.checkpoint()
+            s.checkpoint(force=True)
+        assert scan.call_count == 3
+
+
+class TestAcrossCharts:
+    def test_handles_stay_bounded(self):
+        counts = []
+        for i in range(8):
+            _chart(1950 + i * 9)
+            counts.append(EPHEMERIS.open_handles())
+        if counts[0] < 0:
+            pytest.skip("open descriptors not listable on this platform")
+        assert max(counts) <= EPHEMERIS.max_handles
+        assert counts[-1] == counts[1]
+
+    def test_positions_unchanged_after_release(self):
+        df_a = _chart()[0]
+        EPHEMERIS.release()
+        df_b = _chart()[0]
+        assert df_a["Longitude"].tolist() == df_b["Longitude"].tolist()
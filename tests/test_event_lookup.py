@@ -7,10 +7,12 @@ from src.core.event_lookup_v2 import (
     _parse_ts,
     _is_exact_time,
     _format_delta,
+    build_events_html,
     find_nearby_events,
     WINDOWS,
     EXCLUDED,
 )
+from src.core.events_catalogue import EventCatalogue, _year_catalogue, catalogue_for, load_catalogue
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -189,3 +191,81 @@ class TestFindNearbyEvents:
             assert isinstance(ev, dict)
             assert isinstance(delta_seconds, (int, float))
             assert isinstance(exact, bool)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# EventCatalogue
+# ═══════════════════════════════════════════════════════════════════════
+
+def _summary(results):
+    return [(ev_dt, etype, ev.get("meta", {}).get("subtype", "") or etype.title(), delta, exact)
+            for ev_dt, etype, ev, delta, exact in results]
+
+
+# Mixed kinds, one excluded and one date-only, around the March 2024 equinox.
+_LIST_EVENTS = [
+    {"type": "eclipse", "timestamp_ut": "2024-03-25T07:00:00Z",
+     "meta": {"time_listed": True, "subtype": "Penumbral Lunar Eclipse"}},
+    {"type": "ingress", "timestamp_ut": "2024-03-20T03:06:00Z",
+     "meta": {"time_listed": True, "subtype": "Sun enters Aries"}},
+    {"type": "lunation", "timestamp_ut": "2024-04-08T18:21:00Z",
+     "meta": {"time_listed": True, "subtype": "New Moon"}},
+    {"type": "opposition", "timestamp_ut": "2024-03-20T12:00:00Z", "meta": {}},
+    {"type": "station", "timestamp_ut": "2024-04-01T00:00:00Z",
+     "meta": {"time_listed": False, "subtype": "Mercury stations retrograde"}},
+]
+
+
+@pytest.fixture(scope="module")
+def generated():
+    return _year_catalogue(2024)
+
+
+class TestEventCatalogue:
+    def test_matches_list_scan(self):
+        cat = EventCatalogue.from_records(_LIST_EVENTS)
+        for hours in range(-24 * 30, 24 * 30, 7):
+            target = datetime(2024, 3, 25, 0, 0, 1, 250000, tzinfo=timezone.utc) + timedelta(hours=hours)
+            assert _summary(find_nearby_events(target, cat)) == _summary(find_nearby_events(target, _LIST_EVENTS))
+
+    def test_matches_generated_records(self, generated):
+        records = [generated.record(i) for i in range(len(generated))]
+        for day in range(0, 366, 5):
+            target = datetime(2024, 1, 1, 7, 30, tzinfo=timezone.utc) + timedelta(days=day)
+            assert find_nearby_events(target, generated) == find_nearby_events(target, records)
+
+    def test_save_load_roundtrip(self, generated, tmp_path):
+        path = str(tmp_path / "events")
+        generated.save(path)
+        loaded = EventCatalogue.load(path)
+        assert loaded.rows() == generated.rows()
+
+    def test_known_events_2024(self, generated):
+        rows = {(label, ts) for ts, _, label, _ in generated.rows()}
+        def near(label, when):
+            target = when.replace(tzinfo=timezone.utc).timestamp()
+            return any(lab == label and abs(ts - target) < 120 for lab, ts in rows)
+        assert near("Total Solar Eclipse", datetime(2024, 4, 8, 18, 17))
+        assert near("Sun enters Aries", datetime(2024, 3, 20, 3, 6))
+        assert near("Mercury stations retrograde", datetime(2024, 4, 1, 22, 14))
+        assert near("Full Moon", datetime(2024, 3, 25, 7, 0))
+
+    def test_build_html_uses_generated_catalogue(self, tmp_path):
+        html = build_events_html(datetime(2024, 3, 20, 12, 0), events_path=str(tmp_path / "missing.jsonl"))
+        assert "Sun enters Aries" in html
+        assert "Total Solar Eclipse" not in html  # 19 days later, outside the 7-day window
+
+    def test_prebuilt_catalogue_preferred_over_generation(self, generated, tmp_path, monkeypatch, caplog):
+        import src.core.events_catalogue as events_catalogue
+
+        monkeypatch.setattr(events_catalogue, "EPHE_TABLE_DIR", str(tmp_path))
+        catalogue_for(datetime(2024, 6, 1))
+        assert "No events catalogue" in caplog.text
+
+        # built while the process runs: picked up without a restart
+        generated.save(str(tmp_path / "events"))
+        built = load_catalogue()
+        assert built is not None
+        assert catalogue_for(datetime(2024, 6, 1)) is built
+        # outside the built span it still falls back to generating
+        assert catalogue_for(datetime(2030, 6, 1)) is not built
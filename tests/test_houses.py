@@ -0,0 +1,73 @@
+"""Tests for src/core/houses.py — vectorised house engine."""
+import random
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from src.core.calc_v2 import _house_of_degree, calculate_chart
+from src.core.houses import (
+    HOUSE_SYSTEM_CODES,
+    assign_houses,
+    canonical_house_system,
+    compute_cusps,
+)
+from src.core.models_v2 import AstrologicalChart
+from src.core.positions import PositionProvider
+
+
+class TestAssignHouses:
+    def test_matches_linear_scan(self):
+        rng = random.Random(5)
+        jd = swe.julday(1990, 6, 15, 12.0)
+        prov = PositionProvider(jd)
+        for _ in range(40):
+            lat, lon = rng.uniform(-60, 60), rng.uniform(-180, 180)
+            cusps = compute_cusps(prov, lat, lon)
+            lons = [rng.uniform(0, 360) for _ in range(30)] + [float(c) for c in cusps["koch"]]
+            for arr in cusps.values():
+                expected = [_house_of_degree(d, list(arr)) for d in lons]
+                assert assign_houses(lons, arr).tolist() == expected
+
+    def test_on_cusp_belongs_to_opening_house(self):
+        cusps = (350.0 + 30.0 * np.arange(12)) % 360.0
+        assert assign_houses([350.0, 20.0, 349.999], cusps).tolist() == [1, 2, 12]
+
+
+class TestComputeCusps:
+    def test_swe_systems_match_houses_ex(self):
+        jd = swe.julday(2001, 3, 4, 5.5)
+        prov = PositionProvider(jd)
+        cusps = compute_cusps(prov, 40.7, -74.0)
+        for name in ("placidus", "koch", "campanus", "regiomontanus", "porphyry"):
+            raw, _ = swe.houses_ex(jd, 40.7, -74.0, HOUSE_SYSTEM_CODES[name])
+            np.testing.assert_allclose(cusps[name], np.asarray(raw[:12]) % 360.0)
+
+    def test_whole_sign_starts_at_asc_sign(self):
+        jd = swe.julday(2001, 3, 4, 5.5)
+        prov = PositionProvider(jd)
+        _, ascmc = swe.houses_ex(jd, 40.7, -74.0, b"P")
+        cusps = compute_cusps(prov, 40.7, -74.0, systems=("Whole Sign", "equal"))
+        assert cusps["whole"][0] == int(ascmc[0] // 30) * 30.0
+        assert cusps["equal"][0] == pytest.approx(ascmc[0])
+
+    def test_unknown_system_raises(self):
+        with pytest.raises(ValueError):
+            compute_cusps(PositionProvider(2451545.0), 0.0, 0.0, systems=("topocentric",))
+
+    @pytest.mark.parametrize("name,key", [
+        ("Whole Sign", "whole"), ("wholesign", "whole"), ("Koch", "koch"),
+        (None, "placidus"), ("Equal House", "equal"),
+    ])
+    def test_canonical_names(self, name, key):
+        assert canonical_house_system(name) == key
+
+
+class TestChartCusps:
+    def test_all_systems_on_chart_and_json_roundtrip(self):
+        chart = calculate_chart(1985, 7, 20, 14, 30, -4.0, 40.7128, -74.0060)[3]
+        koch = chart.cusps_for("Koch")
+        assert len(koch) == 12
+        restored = AstrologicalChart.from_json(chart.to_json())
+        assert restored.cusps_for("koch") == pytest.approx(koch)
+        assert restored.cusps_for("placidus") == pytest.approx(chart.cusps_for("placidus"))
@@ -0,0 +1,92 @@
+"""Tests for src/mcp/llm_clients.py — pooled LLM client registry."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("openai")
+
+from src.mcp.grammar_parse import parse_grammar  # noqa: E402
+from src.mcp.comprehension import _request_comprehension  # noqa: E402
+from src.mcp.llm_clients import (  # noqa: E402
+    LLM_CLIENTS, RETRIES_ENV, TIMEOUT_ENV, LLMClientRegistry, client_key,
+)
+from src.stage_timing import metrics_snapshot, reset_metrics  # noqa: E402
+from tests.fixtures.fake_openai import FakeOpenAIServer  # noqa: E402
+
+_MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeOpenAIServer() as srv, srv.redirect():
+        yield srv
+
+
+@pytest.fixture()
+def fresh(server):
+    server.calls.clear()
+    LLM_CLIENTS.clear()
+    reset_metrics()
+    return server
+
+
+def test_key_hashes_api_key():
+    key = client_key("http://x/v1", "sk-secret", {"X-Title": "R"})
+    assert "sk-secret" not in repr(key)
+    assert key == client_key("http://x/v1", "sk-secret", {"X-Title": "R"})
+    assert key != client_key("http://x/v1", "sk-other", {"X-Title": "R"})
+    assert key != client_key("http://y/v1", "sk-secret", {"X-Title": "R"})
+
+
+def test_registry_shares_clients(fresh):
+    assert LLM_CLIENTS.openrouter("k1") is LLM_CLIENTS.openrouter("k1")
+    assert LLM_CLIENTS.openrouter("k1") is not LLM_CLIENTS.openrouter("k2")
+    assert LLM_CLIENTS.stats()["clients"] == 2
+
+
+def test_turn_calls_reuse_one_connection(fresh):
+    parse_grammar("How does my partner affect my career?", api_key="k")
+    _request_comprehension("Question: career?", api_key="k")
+    parse_grammar("And my health?", api_key="k")
+
+    assert len({c.connection for c in fresh.calls}) == 1
+    stats = LLM_CLIENTS.stats()
+    assert (stats["requests"], stats["new_connections"]) == (3, 1)
+    assert stats["reuse_rate"] == pytest.approx(2 / 3, abs=1e-3)
+
+    llm = metrics_snapshot()["llm"]
+    assert llm["grammar"]["count"] == 2
+    assert llm["comprehension"]["count"] == 1
+
+
+def test_timeouts_and_retries_from_env(monkeypatch):
+    monkeypatch.setenv(TIMEOUT_ENV, "7.5")
+    monkeypatch.setenv(RETRIES_ENV, "0")
+    registry = LLMClientRegistry()
+    client = registry.get("k", "http://127.0.0.1:9/v1")
+    assert client.timeout.read == 7.5
+    assert client.max_retries == 0
+    registry.clear()
+
+
+def test_timed_records_errors(fresh):
+    with pytest.raises(RuntimeError):
+        with LLM_CLIENTS.timed("synthesis"):
+            raise RuntimeError("boom")
+    assert metrics_snapshot()["llm"]["synthesis"]["errors"] == 1
+
+
+def test_async_clients_pool_per_loop(fresh):
+    async def turn():
+        client = LLM_CLIENTS.openrouter_async("k")
+        assert client is LLM_CLIENTS.openrouter_async("k")
+        for _ in range(3):
+            await client.chat.completions.create(model="m", messages=_MESSAGES)
+        return client
+
+    first = asyncio.run(turn())
+    second = asyncio.run(turn())
+    assert first is not second
+
+    stats = LLM_CLIENTS.stats()
+    assert (stats["requests"], stats["new_connections"]) == (6, 2)
@@ -206,6 +206,27 @@ class TestGetChartObject:
             MockChart.from_json.assert_called_once_with(chart_dict)
             assert result is sentinel
 
+    def test_packed_dict_calls_from_compact(self):
+        sentinel = object()
+        packed = {"format": "rosetta.chart", "version": 1, "encoding": "json", "data": {}}
+        with patch("src.core.models_v2.AstrologicalChart") as MockChart:
+            MockChart.from_compact.return_value = sentinel
+            result = self.fn({"last_chart_json": packed})
+            MockChart.from_compact.assert_called_once_with(packed)
+            MockChart.from_json.assert_not_called()
+            assert result is sentinel
+
+    def test_repeat_calls_reuse_live_object(self):
+        state = {"last_chart_json": {"objects": [], "house_cusps": []}}
+        with patch("src.core.models_v2.AstrologicalChart") as MockChart:
+            MockChart.from_json.side_effect = lambda d: object()
+            first = self.fn(state)
+            assert self.fn(state) is first
+            assert MockChart.from_json.call_count == 1
+            state["last_chart_json"] = {"objects": [], "house_cusps": [], "city": "x"}
+            assert self.fn(state) is not first
+            assert MockChart.from_json.call_count == 2
+
 
 class TestGetChart2Object:
     """Tests for get_chart_2_object() — JSON → AstrologicalChart (Chart 2)."""
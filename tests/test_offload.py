@@ -0,0 +1,115 @@
+"""Tests for src/ui/offload.py — per-user off-loop job runner."""
+import asyncio
+import threading
+
+import pytest
+
+from src.ui import offload as offload_mod
+from src.ui.offload import Superseded, offload
+
+
+def _blocking(gate: threading.Event, value):
+    gate.wait(5)
+    return value
+
+
+async def test_runs_on_thread_outside_app():
+    main = threading.get_ident()
+    assert await offload({}, "chart", threading.get_ident) != main
+
+
+async def test_on_result_receives_value():
+    seen = []
+    assert await offload({}, "render:Circuits", sum, [1, 2], on_result=seen.append) == 3
+    assert seen == [3]
+
+
+async def test_newer_request_supersedes_running_one():
+    state, gate, seen = {}, threading.Event(), []
+    first = asyncio.create_task(
+        offload(state, "chart", _blocking, gate, "old", on_result=seen.append))
+    await asyncio.sleep(0.05)
+    second = asyncio.create_task(offload(state, "chart", _blocking, gate, "new"))
+    await asyncio.sleep(0.05)
+    gate.set()
+    with pytest.raises(Superseded):
+        await first
+    assert await second == "new"
+    # The dropped job's result still reaches on_result (e.g. to be cached).
+    assert seen == ["old"]
+
+
+async def test_other_kinds_and_sessions_are_independent():
+    state_a, state_b = {}, {}
+    results = await asyncio.gather(
+        offload(state_a, "chart", str, 1),
+        offload(state_a, "transit", str, 2),
+        offload(state_b, "chart", str, 3),
+    )
+    assert results == ["1", "2", "3"]
+
+
+async def test_waiting_job_superseded_before_start(monkeypatch):
+    monkeypatch.setattr(offload_mod, "PER_USER_LIMIT", 1)
+    state, gate, started = {}, threading.Event(), []
+
+    def record(value):
+        started.append(value)
+        return value
+
+    busy = asyncio.create_task(offload(state, "render:Circuits", _blocking, gate, "busy"))
+    await asyncio.sleep(0.05)
+    queued = asyncio.create_task(offload(state, "chart", record, "queued"))
+    await asyncio.sleep(0.01)
+    latest = asyncio.create_task(offload(state, "chart", record, "latest"))
+    await asyncio.sleep(0.01)
+    gate.set()
+    assert await busy == "busy"
+    with pytest.raises(Superseded):
+        await queued
+    assert await latest == "latest"
+    assert started == ["latest"]
+
+
+async def test_ephemeris_jobs_share_one_thread():
+    def name():
+        return threading.current_thread().name
+
+    names = await asyncio.gather(*(offload({}, f"chart{i}", name, pool="ephemeris")
+                                   for i in range(4)))
+    assert len(set(names)) == 1 and names[0].startswith("rosetta-ephemeris")
+    assert (await offload({}, "combined", name, pool="thread")).startswith("rosetta-offload")
+
+
+async def test_chart_job_fills_server_process_caches():
+    from src.chart_adapter import ChartInputs, compute_chart
+    from src.core.derived_state import DERIVED_STATES
+    from src.stage_timing import metrics_snapshot, reset_metrics
+
+    DERIVED_STATES.clear()
+    reset_metrics()
+    inputs = ChartInputs(year=1990, month=6, day=15, hour_24=14, minute=30,
+                         lat=40.7, lon=-74.0, tz_name="America/New_York")
+    result = await offload({}, "chart", compute_chart, inputs, pool="ephemeris")
+    assert result.chart is not None
+    assert DERIVED_STATES.stats()["seeded"] == 1
+    assert "compute_chart" in metrics_snapshot()
+    DERIVED_STATES.clear()
+
+
+async def test_unknown_pool_rejected():
+    with pytest.raises(ValueError):
+        await offload({}, "chart", str, 1, pool="gpu")
+
+
+async def test_limit_survives_while_jobs_hold_it(monkeypatch):
+    monkeypatch.setattr(offload_mod, "PER_USER_LIMIT", 1)
+    state, gate = {}, threading.Event()
+    busy = asyncio.create_task(offload(state, "render:Circuits", _blocking, gate, "busy"))
+    await asyncio.sleep(0.05)
+    sem = offload_mod._semaphore(offload_mod.session_key(state))
+    assert sem.locked()
+    gate.set()
+    assert await busy == "busy"
+    del sem
+    assert offload_mod.session_key(state) not in offload_mod._limits
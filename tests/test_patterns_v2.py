@@ -209,6 +209,108 @@ class TestGenerateComboGroups:
         assert groups == []
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# Special-shape pass (Yod / Wide Yod / Unnamed) — longitude index
+# ═══════════════════════════════════════════════════════════════════════
+
+class TestLongitudeIndex:
+    def test_near_is_superset_of_aspect_match(self):
+        import random
+
+        from src.core.patterns_v2 import _LongitudeIndex
+
+        rng = random.Random(3)
+        pos = {f"P{i}": rng.uniform(0, 360) for i in range(60)}
+        pos["Edge"] = 359.999
+        index = _LongitudeIndex(pos)
+        for name in pos:
+            for asp in ("Quincunx", "Sesquisquare", "Trine", "Opposition"):
+                exact = {c for c in pos if c != name and aspect_match(pos, name, c, asp)}
+                assert exact <= index.near(name, asp)
+
+    def test_yod_across_zero_degrees(self):
+        pos = {"A": 355.0, "B": 55.0, "C": 205.0}
+        edges = [(("A", "B"), "Sextile")]
+        shapes = detect_shapes(pos, [{"A", "B"}], edges)
+        yod = next(s for s in shapes if s.shape_type == "Yod")
+        assert set(yod.members) == {"A", "B", "C"}
+        assert yod.parent == 0
+
+    def test_special_parent_prefers_full_containment(self):
+        pos = {"A": 0.0, "B": 60.0, "C": 210.0, "D": 300.0}
+        edges = [(("A", "B"), "Sextile"), (("C", "D"), "Square")]
+        patterns = [{"C", "D"}, {"A", "B", "C"}]
+        shapes = detect_shapes(pos, patterns, edges)
+        yod = next(s for s in shapes if s.shape_type == "Yod")
+        assert yod.parent == 1
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Indexed shape matcher vs. the combinations() brute force
+# ═══════════════════════════════════════════════════════════════════════
+
+# Offsets (degrees) of planted Envelope / Grand Cross / Mystic Rectangle /
+# Kite / Cradle / Yod skeletons.
+_TEMPLATES = [
+    [0, 60, 120, 180, 240], [0, 90, 180, 270], [0, 60, 180, 240],
+    [0, 120, 240, 180], [0, 60, 120, 180], [0, 150, 210],
+]
+
+
+def _planted_inputs(rng, n, jitter):
+    pos = {}
+    while len(pos) < n:
+        base = rng.uniform(0, 360)
+        for off in rng.choice(_TEMPLATES)[: n - len(pos)]:
+            pos[f"B{len(pos)}"] = (base + off + rng.uniform(-jitter, jitter)) % 360
+    names = list(pos)
+    edges = []
+    for i, p1 in enumerate(names):
+        for p2 in names[i + 1:]:
+            for asp in ("Conjunction", "Sextile", "Square", "Trine", "Opposition",
+                        "Quincunx", "Sesquisquare"):
+                if aspect_match(pos, p1, p2, asp):
+                    edges.append(((p1, p2), asp))
+                    break
+    return pos, connected_components_from_edges(names, edges), edges
+
+
+class TestShapeIndexDifferential:
+    def test_members_match_bruteforce(self):
+        import random
+
+        from src.core.patterns_v2 import _detect_shapes_for_members
+        from tests.fixtures.legacy_shapes import detect_shapes_for_members_bruteforce
+
+        rng = random.Random(20240611)
+        n_shapes = 0
+        for _ in range(60):
+            pos, patterns, edges = _planted_inputs(
+                rng, rng.randint(4, 16), rng.choice([0.3, 1.5, 2.8, 3.6, 4.5]))
+            for idx, mems in enumerate(patterns):
+                for widen in (False, True):
+                    got, sid = _detect_shapes_for_members(pos, mems, idx, 0, edges, widen)
+                    want, want_sid = detect_shapes_for_members_bruteforce(
+                        pos, mems, idx, 0, edges, widen)
+                    assert got == want
+                    assert sid == want_sid
+                    n_shapes += len(got)
+        assert n_shapes > 100
+
+    def test_detect_shapes_matches_bruteforce(self, sample_chart):
+        from unittest.mock import patch
+
+        import src.core.patterns_v2 as patterns_mod
+        from tests.fixtures.legacy_shapes import detect_shapes_for_members_bruteforce
+
+        pos, patterns, edges = patterns_mod.prepare_pattern_inputs(sample_chart)
+        got = detect_shapes(pos, patterns, edges)
+        with patch.object(patterns_mod, "_detect_shapes_for_members",
+                          detect_shapes_for_members_bruteforce):
+            want = detect_shapes(pos, patterns, edges)
+        assert [s.to_dict() for s in got] == [s.to_dict() for s in want]
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Integration: detect_shapes with sample_chart fixture
 # ═══════════════════════════════════════════════════════════════════════
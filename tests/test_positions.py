@@ -0,0 +1,119 @@
+"""Tests for src/core/positions.py — per-JD position provider."""
+import random
+from unittest.mock import patch
+
+import pytest
+import swisseph as swe
+
+from src.core.calc_v2 import MAJOR_OBJECTS, calculate_chart
+from src.core.houses import HOUSE_SYSTEM_CODES
+from src.core.positions import (
+    JD_QUANTUM,
+    BodyPositionCache,
+    PositionProvider,
+    ecliptic_to_equatorial,
+)
+
+_BODIES = [v for v in MAJOR_OBJECTS.values() if isinstance(v, int) and v >= 0]
+
+
+class TestEclipticToEquatorial:
+    def test_vernal_point(self):
+        ra, decl = ecliptic_to_equatorial(0.0, 0.0, 23.44)
+        assert ra == pytest.approx(0.0)
+        assert decl == pytest.approx(0.0)
+
+    def test_solstice_declination_equals_obliquity(self):
+        ra, decl = ecliptic_to_equatorial(90.0, 0.0, 23.44)
+        assert ra == pytest.approx(90.0)
+        assert decl == pytest.approx(23.44)
+
+
+class TestPositionProvider:
+    def test_matches_swisseph_equatorial(self):
+        rng = random.Random(11)
+        for _ in range(20):
+            jd = rng.uniform(2415020.5, 2469807.5)
+            prov = PositionProvider(jd)
+            for body in _BODIES:
+                eq, _ = swe.calc_ut(jd, body, swe.FLG_EQUATORIAL)
+                ra, decl = prov.equatorial(body)
+                assert decl == pytest.approx(eq[1], abs=1e-9)
+                assert ra == pytest.approx(eq[0], abs=1e-9)
+
+    def test_ecliptic_memoised(self):
+        prov = PositionProvider(2451545.0)
+        with patch.object(swe, "calc_ut", wraps=swe.calc_ut) as calc:
+            a = prov.ecliptic(swe.TRUE_NODE)
+            b = prov.ecliptic(swe.TRUE_NODE)
+            prov.declination(swe.TRUE_NODE)
+            prov.declination(swe.MOON)
+        assert a is b
+        # TRUE_NODE once, ECL_NUT once, MOON once
+        assert calc.call_count == 3
+        assert prov.swe_calls == 3
+
+    def test_houses_memoised(self):
+        prov = PositionProvider(2451545.0)
+        first = prov.houses(40.7, -74.0, b'P')
+        assert prov.houses(40.7, -74.0, b'P') is first
+        assert prov.houses(40.7, -74.0, b'E') is not first
+        assert prov.swe_calls == 2
+
+
+class TestCalculateChartCalls:
+    def test_one_calc_per_body(self):
+        with patch.object(swe, "calc_ut", wraps=swe.calc_ut) as calc, \
+                patch.object(swe, "houses_ex", wraps=swe.houses_ex) as houses:
+            calculate_chart(1990, 6, 15, 14, 30, 0, 40.7128, -74.006, input_is_ut=True)
+        flags = [c.args[2] if len(c.args) > 2 else 0 for c in calc.call_args_list]
+        assert not any(f & swe.FLG_EQUATORIAL for f in flags)
+        # one per body + the obliquity lookup
+        assert calc.call_count == len(set(_BODIES)) + 1
+        # one table per swe-backed system (Equal / Whole derive from the ASC)
+        swe_systems = set(HOUSE_SYSTEM_CODES) - {"equal", "whole"}
+        assert houses.call_count == len(swe_systems)
+
+
+class TestBodyPositionCache:
+    def test_bodies_shared_across_locations(self):
+        cache = BodyPositionCache()
+        jd = 2460000.25
+        a = PositionProvider(jd, cache=cache)
+        a.ecliptic(swe.MARS)
+        a.houses(40.7, -74.0)
+        b = PositionProvider(jd + 1e-9, cache=cache)   # same quantised moment
+        assert b.ecliptic(swe.MARS) is a.ecliptic(swe.MARS)
+        b.houses(51.5, -0.1)
+        assert b.swe_calls == 1                        # only the new house table
+        st = cache.stats()
+        assert st["body_hits"] == 1 and st["body_misses"] == 1
+        assert st["house_misses"] == 2 and st["house_hits"] == 0
+        assert st["body_hit_rate"] == 0.5
+
+    def test_flags_and_moments_are_distinct_keys(self):
+        cache = BodyPositionCache()
+        PositionProvider(2460000.0, cache=cache).ecliptic(swe.SUN)
+        PositionProvider(2460000.0, flags=swe.FLG_SWIEPH, cache=cache).ecliptic(swe.SUN)
+        PositionProvider(2460000.0 + 2 * JD_QUANTUM, cache=cache).ecliptic(swe.SUN)
+        assert cache.stats()["body_misses"] == 3
+
+    def test_lru_bound_and_clear(self):
+        cache = BodyPositionCache(maxsize=2)
+        prov = PositionProvider(2460000.0, cache=cache)
+        for body in (swe.SUN, swe.MOON, swe.MARS):
+            prov.ecliptic(body)
+        assert cache.stats()["body_entries"] == 2
+        cache.clear()
+        assert cache.stats()["body_entries"] == 0
+        assert cache.stats()["body_hit_rate"] is None
+
+    def test_cached_chart_matches_uncached(self):
+        cache = BodyPositionCache()
+        args = (2024, 3, 20, 3, 6, 0)
+        plain = calculate_chart(*args, 40.7128, -74.006, input_is_ut=True)[0]
+        calculate_chart(*args, 51.5, -0.12, input_is_ut=True, position_cache=cache)
+        cached = calculate_chart(*args, 40.7128, -74.006, input_is_ut=True,
+                                 position_cache=cache)[0]
+        assert cache.stats()["body_hits"] > 0
+        assert plain.equals(cached)
@@ -0,0 +1,92 @@
+"""Tests for src/rendering/profiles_v2.py — fixed-star catalogue lookups."""
+import pandas as pd
+import pytest
+
+import src.core  # noqa: F401 — load core first (calc_v2 ↔ profiles_v2 import cycle)
+from src.rendering.profiles_v2 import (
+    FixedStarIndex,
+    STAR_CATALOG,
+    STAR_INDEX,
+    _sep_deg,
+    find_fixed_star_conjunctions,
+)
+
+
+def _scan(lon_abs, catalog, orb=1.0):
+    """Reference implementation: the original row-by-row catalogue scan."""
+    hits = []
+    for _, r in catalog.iterrows():
+        sep = _sep_deg(lon_abs, float(r["Longitude"]))
+        if sep <= orb:
+            hits.append({"Name": str(r["Name"]), "sep": float(sep), "orb": float(orb)})
+    hits.sort(key=lambda x: x["sep"])
+    return hits
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# FixedStarIndex
+# ═══════════════════════════════════════════════════════════════════════
+
+class TestFixedStarIndex:
+    @pytest.fixture
+    def catalog(self):
+        return pd.DataFrame({
+            "Name": ["Alpha", "Beta", "Gamma", "Delta", "Epsilon"],
+            "Longitude": [359.6, 0.3, 120.0, 120.5, 240.0],
+        })
+
+    def test_simple_window(self, catalog):
+        hits = FixedStarIndex(catalog).query(120.2, orb=1.0)
+        assert [h["Name"] for h in hits] == ["Gamma", "Delta"]
+
+    def test_wraps_across_aries(self, catalog):
+        hits = FixedStarIndex(catalog).query(0.0, orb=1.0)
+        assert [h["Name"] for h in hits] == ["Beta", "Alpha"]
+        hits = FixedStarIndex(catalog).query(359.9, orb=0.5)
+        assert {h["Name"] for h in hits} == {"Alpha", "Beta"}
+
+    def test_orb_boundary_inclusive(self, catalog):
+        hits = FixedStarIndex(catalog).query(241.0, orb=1.0)
+        assert [h["Name"] for h in hits] == ["Epsilon"]
+
+    def test_no_hits(self, catalog):
+        assert FixedStarIndex(catalog).query(60.0, orb=1.0) == []
+
+    def test_query_many_preserves_input_order(self, catalog):
+        idx = FixedStarIndex(catalog)
+        out = idx.query_many([240.0, 60.0, 0.0], orb=1.0)
+        assert len(out) == 3
+        assert out[0][0]["Name"] == "Epsilon"
+        assert out[1] == []
+        assert out[0] == idx.query(240.0)
+
+    def test_empty_inputs(self, catalog):
+        assert FixedStarIndex(catalog).query_many([], orb=1.0) == []
+        empty = FixedStarIndex(catalog.iloc[0:0])
+        assert len(empty) == 0
+        assert empty.query_many([10.0, 20.0]) == [[], []]
+
+    def test_matches_full_scan_on_real_catalog(self):
+        star_lons = [float(x) for x in STAR_CATALOG["Longitude"].iloc[::7]]
+        probes = [i * 7.3 for i in range(50)] + [lon + 0.999 for lon in star_lons]
+        for lon in probes:
+            assert STAR_INDEX.query(lon, orb=1.0) == _scan(lon, STAR_CATALOG, orb=1.0)
+        for lon in probes[::5]:
+            assert STAR_INDEX.query(lon, orb=2.5) == _scan(lon, STAR_CATALOG, orb=2.5)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# find_fixed_star_conjunctions (thin wrapper)
+# ═══════════════════════════════════════════════════════════════════════
+
+class TestFindFixedStarConjunctions:
+    def test_default_catalog_uses_index(self):
+        lon = float(STAR_CATALOG["Longitude"].iloc[0])
+        hits = find_fixed_star_conjunctions(lon, STAR_CATALOG, orb=1.0)
+        assert hits == STAR_INDEX.query(lon, orb=1.0)
+        assert hits[0]["sep"] == pytest.approx(0.0)
+
+    def test_custom_catalog(self):
+        cat = pd.DataFrame({"Name": ["Solo"], "Longitude": [10.0]})
+        hits = find_fixed_star_conjunctions(10.4, cat, orb=0.5)
+        assert hits == [{"Name": "Solo", "sep": pytest.approx(0.4), "orb": 0.5}]
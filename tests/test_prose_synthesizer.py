@@ -0,0 +1,65 @@
+"""Tests for src/mcp/prose_synthesizer.py — backends and streaming."""
+import pytest
+
+from src.mcp.prose_synthesizer import SynthesisResult, SynthesisStream, synthesize
+from src.mcp.reading_engine import build_reading
+
+
+@pytest.fixture(scope="module")
+def packet(sample_chart):
+    return build_reading("Tell me about my career", sample_chart)
+
+
+@pytest.fixture(scope="module")
+def server():
+    pytest.importorskip("openai")
+    from tests.fixtures.fake_openai import FakeOpenAIServer
+
+    with FakeOpenAIServer() as srv, srv.redirect():
+        yield srv
+
+
+def test_fallback_streams_single_delta(packet):
+    whole = synthesize(packet, backend="fallback")
+    stream = synthesize(packet, backend="fallback", stream=True)
+    assert isinstance(stream, SynthesisStream)
+    assert list(stream) == [whole.text]
+    assert stream.result == whole
+
+
+def test_stream_of_empty_result():
+    stream = SynthesisStream.of(SynthesisResult(text="", backend="fallback"))
+    assert list(stream) == []
+    assert stream.result.backend == "fallback"
+
+
+class TestOpenRouterStreaming:
+    """Against the local fake OpenAI-compatible server."""
+
+    def test_deltas_then_usage(self, server, packet):
+        from tests.fixtures.fake_openai import PROSE_REPLY, USAGE
+
+        stream = synthesize(packet, backend="openrouter", api_key="k", stream=True)
+        deltas = list(stream)
+        assert len(deltas) > 1
+        assert "".join(deltas) == PROSE_REPLY
+        result = stream.result
+        assert result.text == PROSE_REPLY and result.backend == "openrouter"
+        assert (result.prompt_tokens, result.completion_tokens, result.total_tokens) == (
+            USAGE["prompt_tokens"], USAGE["completion_tokens"], USAGE["total_tokens"])
+
+    def test_non_streaming_unchanged(self, server, packet):
+        from tests.fixtures.fake_openai import PROSE_REPLY
+
+        result = synthesize(packet, backend="openrouter", api_key="k")
+        assert isinstance(result, SynthesisResult)
+        assert result.text == PROSE_REPLY and result.total_tokens == 120
+
+    def test_streams_keep_connection_alive(self, server, packet):
+        from src.mcp.llm_clients import LLM_CLIENTS
+
+        LLM_CLIENTS.clear()
+        for _ in range(3):
+            synthesize(packet, backend="openrouter", api_key="k", stream=True).collect()
+        stats = LLM_CLIENTS.stats()
+        assert (stats["requests"], stats["new_connections"]) == (3, 1)
@@ -0,0 +1,115 @@
+"""Tests for src/mcp/reading_cache.py — chat reading cache."""
+import sqlite3
+import time
+
+import pytest
+
+from src.chart_cache import chart_fingerprint
+from src.mcp.comprehension_models import PersonProfile
+from src.mcp.reading_cache import (
+    ReadingCache, graph_key, normalize_question, synthesis_key,
+)
+
+
+@pytest.mark.parametrize("variant", [
+    "Tell me about my career",
+    "  tell me  about my CAREER?! ",
+    "“Tell me about my career.”",
+])
+def test_normalize_question_variants(variant):
+    assert normalize_question(variant) == "tell me about my career"
+
+
+def test_normalize_keeps_inner_meaning():
+    assert normalize_question("Is it me, or him?") != normalize_question("Is it me or him")
+
+
+def test_keys_separate_inputs():
+    base = graph_key("fp", "Career?", "m")
+    assert base == graph_key("fp", "career", "m")
+    assert base != graph_key("fp2", "career", "m")
+    assert base != graph_key("fp", "career", "other-model")
+    assert base != graph_key("fp", "career", "m",
+                             known_persons=[PersonProfile(name="Sam")])
+    synth = synthesis_key(["fp"], "career", mode="natal", voice="Plain", model="m")
+    assert synth == synthesis_key(["fp"], "Career!", mode="natal", voice="plain", model="m")
+    assert synth != synthesis_key(["fp"], "career", mode="natal", voice="Circuit", model="m")
+    assert synth != synthesis_key(["fp", "fp2"], "career", mode="natal", voice="plain", model="m")
+    assert synth == synthesis_key(["fp"], "career", mode="natal", voice="plain", model="m",
+                                  house_system="Placidus")
+    assert synth != synthesis_key(["fp"], "career", mode="natal", voice="plain", model="m",
+                                  house_system="whole_sign")
+    assert synth != synthesis_key(["fp"], "career", mode="natal", voice="plain", model="m",
+                                  agent_notes="User prefers short answers.")
+    assert synth != synthesis_key(["fp"], "career", mode="natal", voice="plain", model="m",
+                                  known_persons=[PersonProfile(name="Sam")])
+    assert synth != synthesis_key(["fp"], "career", mode="natal", voice="plain", model="m",
+                                  known_locations=[{"name": "Lisbon"}])
+
+
+def test_chart_fingerprint_ignores_display_fields(sample_chart):
+    import copy
+
+    renamed = copy.copy(sample_chart)
+    renamed.display_name = "Someone else"
+    assert chart_fingerprint(renamed) == chart_fingerprint(sample_chart)
+
+
+def test_hits_are_independent_copies():
+    cache = ReadingCache(enabled=True)
+    value = {"factors": ["Sun"]}
+    cache.put("graph", "k", value)
+    value["factors"].append("late mutation")
+    first = cache.get("graph", "k")
+    first["factors"].append("caller mutation")
+    assert cache.get("graph", "k") == {"factors": ["Sun"]}
+    stats = cache.stats()
+    assert (stats["graph_hits"], stats["graph_stores"], stats["graph_hit_rate"]) == (2, 1, 1.0)
+
+
+def test_miss_and_disabled():
+    cache = ReadingCache(enabled=False)
+    cache.put("graph", "k", 1)
+    assert cache.get("graph", "k") is None
+    assert cache.stats()["graph_stores"] == 0
+
+    live = ReadingCache(enabled=True)
+    assert live.get("synthesis", "nope") is None
+    assert live.stats()["synthesis_misses"] == 1
+
+
+def test_memory_ttl_expires():
+    cache = ReadingCache(ttl=0.05, enabled=True)
+    cache.put("graph", "k", 1)
+    time.sleep(0.1)
+    assert cache.get("graph", "k") is None
+
+
+def test_disk_tier_shared_between_caches(tmp_path):
+    path = str(tmp_path / "readings.sqlite")
+    ReadingCache(path=path, enabled=True).put("synthesis", "k", "reading")
+
+    other = ReadingCache(path=path, enabled=True)
+    assert other.get("synthesis", "k") == "reading"
+    assert other.get("synthesis", "k") == "reading"
+    stats = other.stats()
+    assert (stats["synthesis_disk_hits"], stats["synthesis_hits"]) == (1, 1)
+    assert stats["disk_entries"] == 1
+
+
+def test_disk_tier_honours_ttl(tmp_path):
+    path = str(tmp_path / "readings.sqlite")
+    ReadingCache(path=path, enabled=True).put("graph", "k", 1)
+    time.sleep(0.05)
+    assert ReadingCache(path=path, ttl=0.01, enabled=True).get("graph", "k") is None
+
+
+def test_unreadable_entry_is_dropped(tmp_path):
+    path = str(tmp_path / "readings.sqlite")
+    cache = ReadingCache(path=path, enabled=True)
+    cache.put("graph", "k", 1)
+    with sqlite3.connect(path) as db:
+        db.execute("UPDATE readings SET payload = ? WHERE key = 'k'", (b"not a pickle",))
+    fresh = ReadingCache(path=path, enabled=True)
+    assert fresh.get("graph", "k") is None
+    assert fresh.stats()["disk_entries"] == 0
@@ -0,0 +1,135 @@
+"""Tests for src/rendering/render_cache.py — rendered PNG cache."""
+import threading
+
+import pytest
+
+from src.chart_adapter import RenderToggles
+from src.rendering.render_cache import RenderCache, canonical_toggles, render_key
+
+
+class _Renderer:
+    """Counts renders; returns *size* bytes tagged with the call number."""
+
+    def __init__(self, size=100):
+        self.calls = 0
+        self.size = size
+
+    def __call__(self):
+        self.calls += 1
+        return bytes([self.calls % 256]) * self.size
+
+
+def test_toggle_dicts_canonicalise_to_enabled_keys():
+    a = RenderToggles(pattern_toggles={0: True, 1: False}, shape_toggles={"s2": True, "s1": True})
+    b = RenderToggles(pattern_toggles={0: True}, shape_toggles={"s1": True, "s2": True})
+    assert canonical_toggles(a) == canonical_toggles(b)
+    assert render_key(["d"], "Circuits", a) == render_key(["d"], "Circuits", b)
+
+
+def test_key_separates_charts_modes_toggles_and_extras():
+    t = RenderToggles()
+    base = render_key(["d1"], "Circuits", t)
+    assert base != render_key(["d2"], "Circuits", t)
+    assert base != render_key(["d1"], "Standard Chart", t)
+    assert base != render_key(["d1"], "Circuits", RenderToggles(dark_mode=True))
+    assert base != render_key(["d1"], "Circuits", RenderToggles(pattern_toggles={"0": True}))
+    assert render_key(["d1"], "Circuits", RenderToggles(pattern_toggles={0: True})) != \
+        render_key(["d1"], "Circuits", RenderToggles(pattern_toggles={"0": True}))
+    assert base != render_key(["d1"], "Circuits", t, {"submode": "Connected"})
+
+
+def test_hit_skips_render():
+    cache, render = RenderCache(prefetch=False), _Renderer()
+    first = cache.get_or_render("k", render)
+    assert cache.get_or_render("k", render) is first
+    assert render.calls == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_failed_render_is_not_cached():
+    cache = RenderCache(prefetch=False)
+    assert cache.get_or_render("k", lambda: None) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_byte_budget_evicts_least_recent():
+    cache, render = RenderCache(max_bytes=250, prefetch=False), _Renderer(size=100)
+    cache.get_or_render("a", render)
+    cache.get_or_render("b", render)
+    cache.get_or_render("a", render)
+    cache.get_or_render("c", render)
+    assert cache.stats()["bytes"] <= 250
+    cache.get_or_render("a", render)
+    cache.get_or_render("b", render)
+    assert render.calls == 4
+
+
+def test_get_put_for_external_renders():
+    cache = RenderCache(prefetch=False)
+    assert cache.get("k") is None
+    cache.put("k", b"png")
+    cache.put("none", None)
+    assert cache.get("k") == b"png"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_prefetch_disabled_is_noop():
+    cache = RenderCache(prefetch=False)
+    assert cache.prefetch("k", _Renderer()) is False
+
+
+def test_prefetch_fills_cache_and_counts_hits():
+    cache, render = RenderCache(prefetch=True), _Renderer()
+    done = threading.Event()
+
+    def job():
+        png = render()
+        done.set()
+        return png
+
+    assert cache.prefetch("k", job) is True
+    assert done.wait(5)
+    cache._executor.shutdown(wait=True)
+    assert cache.prefetch("k", job) is False
+    cache.get_or_render("k", render)
+    assert render.calls == 1
+    stats = cache.stats()
+    assert stats["prefetched"] == 1
+    assert stats["prefetch_hits"] == 1
+
+
+def test_prefetch_errors_are_counted():
+    cache = RenderCache(prefetch=True)
+
+    def boom():
+        raise RuntimeError("render failed")
+
+    cache.prefetch("k", boom)
+    cache._executor.shutdown(wait=True)
+    assert cache.stats()["prefetch_errors"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.slow
+def test_render_chart_png_serves_repeat_toggles_from_cache(monkeypatch):
+    from src.chart_adapter import ChartInputs, compute_chart
+    from src.ui import chart_display
+
+    cache = RenderCache(prefetch=False)
+    monkeypatch.setattr(chart_display, "RENDER_CACHE", cache)
+    chart = compute_chart(ChartInputs(
+        year=1990, month=7, day=1, hour_24=12, lat=40.71, lon=-74.01,
+        tz_name="America/New_York",
+    )).chart
+    state = {"last_chart_json": chart.to_compact(), "pattern_toggles": {"0": True}}
+
+    png = chart_display.render_chart_png("Circuits", state)
+    assert png and png.startswith(b"\x89PNG")
+    state["pattern_toggles"] = {}
+    chart_display.render_chart_png("Circuits", state)
+    state["pattern_toggles"] = {"0": True, "1": False}
+    assert chart_display.render_chart_png("Circuits", state) == png
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["hits"] == 1
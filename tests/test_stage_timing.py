@@ -0,0 +1,119 @@
+"""Tests for src/stage_timing.py — per-stage pipeline timers."""
+import os
+import threading
+import time
+
+import pytest
+
+from src.stage_timing import (
+    BUCKET_BOUNDS_MS,
+    PROFILE_DIR_ENV,
+    StageRecorder,
+    StageTiming,
+    maybe_profile,
+    metrics_snapshot,
+    reset_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_metrics():
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# StageRecorder
+# ═══════════════════════════════════════════════════════════════════════
+
+class TestStageRecorder:
+    def test_records_wall_and_cpu(self):
+        rec = StageRecorder("pipe")
+        with rec.stage("busy"):
+            sum(i * i for i in range(20000))
+        t = rec.timings["busy"]
+        assert isinstance(t, StageTiming)
+        assert t.ok is True
+        assert t.wall_ms > 0
+        assert t.cpu_ms >= 0
+
+    def test_cpu_excludes_other_threads(self):
+        stop = threading.Event()
+
+        def _spin():
+            while not stop.is_set():
+                sum(i * i for i in range(1000))
+
+        worker = threading.Thread(target=_spin)
+        worker.start()
+        try:
+            rec = StageRecorder("pipe")
+            with rec.stage("idle"):
+                time.sleep(0.2)
+        finally:
+            stop.set()
+            worker.join()
+        assert rec.timings["idle"].cpu_ms < 50
+
+    def test_exception_propagates_and_marks_failed(self):
+        rec = StageRecorder("pipe")
+        with pytest.raises(ValueError):
+            with rec.stage("boom"):
+                raise ValueError("x")
+        assert rec.timings["boom"].ok is False
+        assert metrics_snapshot()["pipe"]["boom"]["errors"] == 1
+
+    def test_stage_order_preserved(self):
+        rec = StageRecorder("pipe")
+        for name in ("a", "b", "c"):
+            with rec.stage(name):
+                pass
+        assert list(rec.timings) == ["a", "b", "c"]
+        assert rec.total_wall_ms() == pytest.approx(
+            sum(t.wall_ms for t in rec.timings.values()))
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Histogram snapshot
+# ═══════════════════════════════════════════════════════════════════════
+
+class TestMetricsSnapshot:
+    def test_aggregates_across_runs(self):
+        for _ in range(3):
+            rec = StageRecorder("pipe")
+            with rec.stage("s"):
+                pass
+        h = metrics_snapshot()["pipe"]["s"]
+        assert h["count"] == 3
+        assert sum(h["buckets"].values()) == 3
+        assert list(h["buckets"])[-1] == "+Inf"
+        assert len(h["buckets"]) == len(BUCKET_BOUNDS_MS) + 1
+        assert h["wall_ms_p95"] == BUCKET_BOUNDS_MS[0]
+
+    def test_reset(self):
+        rec = StageRecorder("pipe")
+        with rec.stage("s"):
+            pass
+        reset_metrics()
+        assert metrics_snapshot() == {}
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# maybe_profile
+# ═══════════════════════════════════════════════════════════════════════
+
+class TestMaybeProfile:
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv(PROFILE_DIR_ENV, raising=False)
+        with maybe_profile("x") as path:
+            assert path is None
+
+    def test_dumps_when_env_set(self, monkeypatch, tmp_path):
+        out = tmp_path / "profiles"
+        monkeypatch.setenv(PROFILE_DIR_ENV, str(out))
+        with maybe_profile("compute chart/1") as path:
+            sum(range(1000))
+        assert path is not None and os.path.exists(path)
+        assert os.path.dirname(path) == str(out)
+        assert "/" not in os.path.basename(path)[:-5]
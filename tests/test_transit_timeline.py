@@ -0,0 +1,110 @@
+"""Tests for src/core/transit_timeline.py — streaming transit events."""
+import datetime as dt
+import itertools
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+import src.core.transit_timeline as tl
+from src.core.calc_v2 import calculate_chart, chart_positions
+from src.core.transit_timeline import iter_transit_events, jd_to_datetime, to_jd
+
+
+@pytest.fixture(scope="module")
+def natal():
+    return calculate_chart(1985, 7, 20, 14, 30, 0, 40.7, -74.0, input_is_ut=True)[3]
+
+
+def _minutes_apart(a: dt.datetime, b: dt.datetime) -> float:
+    return abs((a - b).total_seconds()) / 60.0
+
+
+class TestTimeHelpers:
+    def test_roundtrip(self):
+        when = dt.datetime(2024, 3, 20, 3, 6, 24, tzinfo=dt.timezone.utc)
+        assert jd_to_datetime(to_jd(when)) == when
+
+    def test_naive_is_utc(self):
+        assert to_jd(dt.datetime(2000, 1, 1, 12)) == pytest.approx(2451545.0)
+
+
+class TestStationsAndIngresses:
+    def test_mercury_stations_2024(self):
+        events = list(iter_transit_events(
+            None, dt.datetime(2024, 3, 1), dt.datetime(2024, 5, 1),
+            bodies=["Mercury"], kinds=["station"]))
+        assert [e.retrograde for e in events] == [True, False]
+        assert _minutes_apart(events[0].when, dt.datetime(2024, 4, 1, 22, 14, tzinfo=dt.timezone.utc)) < 2
+        assert _minutes_apart(events[1].when, dt.datetime(2024, 4, 25, 12, 54, tzinfo=dt.timezone.utc)) < 2
+
+    def test_sun_enters_aries(self):
+        events = list(iter_transit_events(
+            None, dt.datetime(2024, 3, 1), dt.datetime(2024, 4, 1),
+            bodies=["Sun"], kinds=["ingress"]))
+        assert [e.sign for e in events] == ["Aries"]
+        assert _minutes_apart(events[0].when, dt.datetime(2024, 3, 20, 3, 6, tzinfo=dt.timezone.utc)) < 2
+
+    def test_retrograde_ingress_goes_backwards(self):
+        events = list(iter_transit_events(
+            None, dt.datetime(2024, 8, 1), dt.datetime(2024, 9, 15),
+            bodies=["Mercury"], kinds=["ingress"]))
+        assert [(e.sign, e.retrograde) for e in events] == [("Leo", True), ("Virgo", False)]
+
+
+class TestAspects:
+    def test_hits_are_exact_and_complete(self, natal):
+        start, end = dt.datetime(2024, 1, 1), dt.datetime(2024, 7, 1)
+        events = list(iter_transit_events(
+            natal, start, end, bodies=["Mars"], aspects=["Square", "Trine"],
+            targets=["Sun", "Moon"], kinds=["aspect"]))
+        pos = chart_positions(natal)
+        for e in events:
+            lon, _ = tl._lon_speed(e.jd_ut, "Mars")
+            angle = float(swe.difdeg2n(lon, pos[e.target]))
+            assert abs(abs(angle) - (90 if e.aspect == "Square" else 120)) < 1e-4
+
+        # Brute force: hourly samples, count sign changes of each offset.
+        jds = np.arange(to_jd(start), to_jd(end), 1 / 24)
+        lons = np.array([tl._lon_speed(j, "Mars")[0] for j in jds])
+        expected = 0
+        for target in ("Sun", "Moon"):
+            for angle in (90, -90, 120, -120):
+                f = (lons - pos[target] - angle + 180) % 360 - 180
+                expected += int(tl._crossings(f).sum())
+        assert len(events) == expected
+
+    def test_time_ordered(self, natal):
+        events = list(iter_transit_events(natal, dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 1)))
+        jds = [e.jd_ut for e in events]
+        assert jds == sorted(jds)
+        assert {e.kind for e in events} == {"aspect", "ingress", "station"}
+
+    def test_explicit_target_points(self):
+        events = list(iter_transit_events(
+            None, dt.datetime(2024, 1, 1), dt.datetime(2024, 2, 1), bodies=["Sun"],
+            targets={"Point": 300.0}, aspects=["Conjunction"], kinds=["aspect"]))
+        assert len(events) == 1
+        assert events[0].longitude == pytest.approx(300.0, abs=1e-5)
+
+
+class TestStreaming:
+    def test_lazy_chunks(self, natal):
+        with patch.object(tl, "_body_events", wraps=tl._body_events) as spy:
+            gen = iter_transit_events(natal, dt.datetime(2024, 1, 1), dt.datetime(2054, 1, 1))
+            first = list(itertools.islice(gen, 5))
+        assert len(first) == 5
+        assert spy.call_count == len(tl.TIMELINE_BODIES)
+
+    def test_unknown_kind(self, natal):
+        with pytest.raises(ValueError):
+            list(iter_transit_events(natal, 2460310.5, 2460311.5, kinds=["eclipse"]))
+
+    def test_to_dict(self):
+        event = next(iter_transit_events(
+            None, dt.datetime(2024, 3, 1), dt.datetime(2024, 4, 1),
+            bodies=["Sun"], kinds=["ingress"]))
+        d = event.to_dict()
+        assert d["kind"] == "ingress"
+        assert d["timestamp_ut"].startswith("2024-03-20T03:0")
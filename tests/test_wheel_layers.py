@@ -0,0 +1,74 @@
+"""Tests for src/rendering/wheel_layers.py — layered wheel rendering."""
+import io
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.chart_adapter import ChartInputs, RenderToggles, compute_chart, render_chart_image
+from src.rendering.wheel_layers import (
+    BackdropCache, WHEEL_BACKDROPS, backdrop_key, render_backdrop,
+)
+
+
+def _pixels(png: bytes) -> np.ndarray:
+    return np.asarray(Image.open(io.BytesIO(png)).convert("RGBA")).astype(int)
+
+
+@pytest.fixture(scope="module")
+def chart_result():
+    return compute_chart(ChartInputs(
+        name="Layers", year=1990, month=6, day=15, hour_24=14, minute=30,
+        lat=40.7128, lon=-74.006, tz_name="America/New_York",
+    ))
+
+
+def test_key_separates_geometry():
+    base = backdrop_key(10.0, [10.0] * 12, False, (8, 8), 192)
+    assert base == backdrop_key(10.0 + 1e-9, [10.0] * 12, False, (8.0, 8.0), 192)
+    assert base != backdrop_key(11.0, [10.0] * 12, False, (8, 8), 192)
+    assert base != backdrop_key(10.0, [], False, (8, 8), 192)
+    assert base != backdrop_key(10.0, [10.0] * 12, True, (8, 8), 192)
+    assert base != backdrop_key(10.0, [10.0] * 12, False, (8, 8), 144)
+
+
+def test_cache_builds_once_and_respects_budget():
+    backdrop = render_backdrop(0.0, [], False, (2, 2), 50)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return backdrop
+
+    cache = BackdropCache()
+    assert cache.get("k", build) is backdrop
+    assert cache.get("k", build) is backdrop
+    assert len(calls) == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+    tiny = BackdropCache(max_bytes=backdrop.nbytes - 1)
+    tiny.get("k", build)
+    assert tiny.stats()["entries"] == 0
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode, dark", [("Standard Chart", False), ("Circuits", True)])
+def test_layered_matches_full_render(chart_result, mode, dark):
+    toggles = RenderToggles(chart_mode=mode, dark_mode=dark, pattern_toggles={0: True})
+    with patch("src.rendering.drawing_v2.draw_center_earth"):
+        full = _pixels(render_chart_image(chart_result, toggles, layered=False))
+        layered = _pixels(render_chart_image(chart_result, toggles))
+    assert layered.shape == full.shape
+    # Only anti-aliasing from the sub-pixel crop offset may differ.
+    assert (np.abs(layered - full).max(axis=2) > 32).mean() < 0.02
+
+
+def test_toggle_changes_reuse_backdrop(chart_result):
+    WHEEL_BACKDROPS.clear()
+    with patch("src.rendering.drawing_v2.draw_center_earth"):
+        for toggles in ({}, {0: True}, {0: True, 1: True}):
+            render_chart_image(chart_result, RenderToggles(
+                pattern_toggles=toggles, figsize=(4.0, 4.0), dpi=72))
+    stats = WHEEL_BACKDROPS.stats()
+    assert (stats["misses"], stats["hits"]) == (1, 2)